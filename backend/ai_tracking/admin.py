@@ -7,7 +7,8 @@ from django.utils.html import format_html
 from django.urls import reverse
 from django.utils import timezone
 
-from .models import AIModelPrice, AIUsageLog, AIBudgetAlert, AIPromptConfig
+from .models import AIModelPrice, AIUsageLog, AIUsageRollup, AIBudgetAlert, AIPromptConfig
+from .services.price_cache import clear_price_cache
 
 
 @admin.register(AIModelPrice)
@@ -76,6 +77,7 @@ class AIModelPriceAdmin(admin.ModelAdmin):
     def mark_as_stale(self, request, queryset):
         """Mark selected prices as stale."""
         updated = queryset.update(is_stale=True)
+        clear_price_cache()
         self.message_user(request, f"{updated} prices marked as stale.")
 
     mark_as_stale.short_description = "Mark as stale"
@@ -83,6 +85,7 @@ class AIModelPriceAdmin(admin.ModelAdmin):
     def mark_as_verified(self, request, queryset):
         """Mark selected prices as verified."""
         updated = queryset.update(is_stale=False, last_verified=timezone.now())
+        clear_price_cache()
         self.message_user(request, f"{updated} prices marked as verified.")
 
     mark_as_verified.short_description = "Mark as verified"
@@ -102,12 +105,14 @@ class AIUsageLogAdmin(admin.ModelAdmin):
         "cost_display",
         "duration_display",
         "was_successful",
+        "cache_hit",
         "error_code_display",
     ]
     list_filter = [
         "provider",
         "model_name",
         "was_successful",
+        "cache_hit",
         "store_full_data",
         "created_at",
     ]
@@ -139,6 +144,8 @@ class AIUsageLogAdmin(admin.ModelAdmin):
         "error_code",
         "error_traceback",
         "was_successful",
+        "cache_hit",
+        "saved_cost",
     ]
 
     date_hierarchy = "created_at"
@@ -170,6 +177,8 @@ class AIUsageLogAdmin(admin.ModelAdmin):
                     "total_cost",
                     "cost_per_token",
                     "duration_ms",
+                    "cache_hit",
+                    "saved_cost",
                 )
             },
         ),
@@ -233,6 +242,36 @@ class AIUsageLogAdmin(admin.ModelAdmin):
     error_code_display.short_description = "Error Type"
 
 
+@admin.register(AIUsageRollup)
+class AIUsageRollupAdmin(admin.ModelAdmin):
+    """Admin interface for hourly and daily usage rollups."""
+
+    list_display = [
+        "bucket",
+        "granularity",
+        "provider",
+        "model_name",
+        "user",
+        "task_description",
+        "call_count",
+        "failed_count",
+        "total_cost",
+        "cache_hits",
+        "saved_cost",
+    ]
+    list_filter = ["granularity", "provider", "model_name", "bucket"]
+    search_fields = ["task_description", "user__username"]
+    date_hierarchy = "bucket"
+
+    def has_add_permission(self, request):
+        """Rollups are maintained automatically."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Rollups should not be edited."""
+        return False
+
+
 @admin.register(AIBudgetAlert)
 class AIBudgetAlertAdmin(admin.ModelAdmin):
     """Admin interface for budget alerts."""
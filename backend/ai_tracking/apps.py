@@ -9,3 +9,6 @@ class AiTrackingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "ai_tracking"
     verbose_name = "AI Usage Tracking"
+
+    def ready(self):
+        import ai_tracking.signals  # noqa: F401
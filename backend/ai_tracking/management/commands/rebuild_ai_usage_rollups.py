@@ -0,0 +1,44 @@
+"""
+Management command to rebuild AI usage rollups from the raw usage logs.
+
+Rollups are maintained as logs are written; this command backfills logs
+written before rollups existed, or repairs a range after manual changes
+to the logs.
+
+Usage:
+    python manage.py rebuild_ai_usage_rollups
+    python manage.py rebuild_ai_usage_rollups --since 2026-01-01
+"""
+
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from ai_tracking.services.usage_rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild hourly and daily AI usage rollups from usage logs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            help="Rebuild from this date (YYYY-MM-DD); required once rollups exist",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            day = parse_date(options["since"])
+            if day is None:
+                raise CommandError(f"Invalid date: {options['since']}")
+            since = timezone.make_aware(datetime.combine(day, time()))
+
+        try:
+            written = rebuild_rollups(since)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} usage rollups"))
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-18 22:31
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_tracking", "0005_alter_aibudgetalert_email_recipients"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="aiusagelog",
+            name="created_at",
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.30 on 2026-10-18 22:35
+
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("ai_tracking", "0006_usage_log_created_at_default"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AIUsageRollup",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("granularity", models.CharField(choices=[("hour", "Hourly"), ("day", "Daily")], max_length=10)),
+                ("bucket", models.DateTimeField(help_text="Start of the hour or day")),
+                ("provider", models.CharField(max_length=50)),
+                ("model_name", models.CharField(max_length=100)),
+                ("task_description", models.CharField(max_length=255)),
+                ("call_count", models.PositiveIntegerField(default=0, help_text="Successful calls")),
+                ("failed_count", models.PositiveIntegerField(default=0, help_text="Failed calls")),
+                ("input_tokens", models.BigIntegerField(default=0)),
+                ("output_tokens", models.BigIntegerField(default=0)),
+                (
+                    "total_cost",
+                    models.DecimalField(
+                        decimal_places=6, default=Decimal("0"), help_text="Total cost in USD", max_digits=14
+                    ),
+                ),
+                ("total_duration_ms", models.BigIntegerField(default=0)),
+                (
+                    "timed_calls",
+                    models.PositiveIntegerField(default=0, help_text="Successful calls with a recorded duration"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="ai_usage_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "AI Usage Rollup",
+                "verbose_name_plural": "AI Usage Rollups",
+                "ordering": ["-bucket"],
+                "indexes": [
+                    models.Index(fields=["granularity", "bucket"], name="ai_tracking_granula_77125d_idx"),
+                    models.Index(fields=["granularity", "user", "bucket"], name="ai_tracking_granula_5dddde_idx"),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="aiusagerollup",
+            constraint=models.UniqueConstraint(
+                fields=("granularity", "bucket", "provider", "model_name", "user", "task_description"),
+                name="ai_usage_rollup_key",
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-18 22:39
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_tracking", "0007_aiusagerollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aiusagelog",
+            name="cache_hit",
+            field=models.BooleanField(default=False, help_text="Served from the response cache without an API call"),
+        ),
+        migrations.AddField(
+            model_name="aiusagelog",
+            name="saved_cost",
+            field=models.DecimalField(
+                decimal_places=6,
+                default=Decimal("0"),
+                help_text="Cost of the API call a cache hit avoided (USD)",
+                max_digits=10,
+            ),
+        ),
+        migrations.AddField(
+            model_name="aiusagerollup",
+            name="cache_hits",
+            field=models.PositiveIntegerField(default=0, help_text="Successful calls served from the response cache"),
+        ),
+        migrations.AddField(
+            model_name="aiusagerollup",
+            name="saved_cost",
+            field=models.DecimalField(
+                decimal_places=6, default=Decimal("0"), help_text="Cost avoided by cache hits (USD)", max_digits=14
+            ),
+        ),
+    ]
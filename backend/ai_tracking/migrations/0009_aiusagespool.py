@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_tracking", "0008_response_cache_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AIUsageSpool",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("spool_id", models.CharField(max_length=100, unique=True)),
+                ("imported_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "AI Usage Spool",
+                "verbose_name_plural": "AI Usage Spools",
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:06
+
+from django.db import migrations, models
+from django.db.models import Count, F
+
+
+KEY_FIELDS = ("granularity", "bucket", "provider", "model_name", "user_key", "task_description")
+COUNTERS = (
+    "call_count",
+    "failed_count",
+    "input_tokens",
+    "output_tokens",
+    "total_cost",
+    "total_duration_ms",
+    "timed_calls",
+    "cache_hits",
+    "saved_cost",
+)
+
+
+def fill_user_key(apps, schema_editor):
+    """Key rollups by user ID and merge rows duplicated while user was NULL."""
+    AIUsageRollup = apps.get_model("ai_tracking", "AIUsageRollup")
+    AIUsageRollup.objects.filter(user__isnull=False).update(user_key=F("user_id"))
+
+    duplicates = (
+        AIUsageRollup.objects.values(*KEY_FIELDS)
+        .annotate(rows=Count("id"))
+        .filter(rows__gt=1)
+        .order_by()
+    )
+    for key in duplicates:
+        key.pop("rows")
+        rollups = list(AIUsageRollup.objects.filter(**key).order_by("id"))
+        keep = rollups[0]
+        for rollup in rollups[1:]:
+            for name in COUNTERS:
+                setattr(keep, name, getattr(keep, name) + getattr(rollup, name))
+        keep.save(update_fields=COUNTERS)
+        AIUsageRollup.objects.filter(id__in=[r.id for r in rollups[1:]]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_tracking", "0009_aiusagespool"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="aiusagerollup",
+            name="ai_usage_rollup_key",
+        ),
+        migrations.AddField(
+            model_name="aiusagerollup",
+            name="user_key",
+            field=models.BigIntegerField(default=0, editable=False, help_text="User ID, or 0 for calls without a user"),
+        ),
+        migrations.RunPython(fill_user_key, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="aiusagerollup",
+            constraint=models.UniqueConstraint(
+                fields=("granularity", "bucket", "provider", "model_name", "user_key", "task_description"),
+                name="ai_usage_rollup_key",
+            ),
+        ),
+    ]
@@ -0,0 +1,106 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:40
+
+from datetime import timedelta
+
+from django.db import migrations
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+
+GRANULARITIES = ("hour", "day")
+COUNTERS = (
+    "call_count",
+    "failed_count",
+    "input_tokens",
+    "output_tokens",
+    "total_cost",
+    "total_duration_ms",
+    "timed_calls",
+    "cache_hits",
+    "saved_cost",
+)
+
+
+def day_start(moment):
+    return timezone.localtime(moment).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def backfill_rollups(apps, schema_editor):
+    """
+    Roll up usage logs written before rollups were recorded.
+
+    Analytics and budget alerts read only from rollups, so without this
+    they miss all earlier usage. Every day up to and including the day of
+    the oldest rollup (which was only partly recorded) is rebuilt from the
+    logs; later days were fully recorded as logs were written.
+    """
+    AIUsageLog = apps.get_model("ai_tracking", "AIUsageLog")
+    AIUsageRollup = apps.get_model("ai_tracking", "AIUsageRollup")
+
+    oldest_log = AIUsageLog.objects.order_by("created_at").values_list("created_at", flat=True).first()
+    if oldest_log is None:
+        return
+    since = day_start(oldest_log)
+
+    oldest_rollup = AIUsageRollup.objects.order_by("bucket").values_list("bucket", flat=True).first()
+    until = None
+    if oldest_rollup is not None:
+        until = day_start(oldest_rollup) + timedelta(days=1)
+        if until <= since:
+            return
+
+    logs = AIUsageLog.objects.filter(created_at__gte=since)
+    rollups = AIUsageRollup.objects.filter(bucket__gte=since)
+    if until is not None:
+        logs = logs.filter(created_at__lt=until)
+        rollups = rollups.filter(bucket__lt=until)
+    rollups.delete()
+
+    success = Q(was_successful=True)
+    timed = success & Q(duration_ms__isnull=False)
+    cached = success & Q(cache_hit=True)
+    for granularity in GRANULARITIES:
+        rows = (
+            logs.annotate(bucket=Trunc("created_at", granularity))
+            .values("bucket", "provider", "model_name", "user_id", "task_description")
+            .annotate(
+                agg_call_count=Count("id", filter=success),
+                agg_failed_count=Count("id", filter=~success),
+                agg_input_tokens=Sum("input_tokens", filter=success),
+                agg_output_tokens=Sum("output_tokens", filter=success),
+                agg_total_cost=Sum("total_cost", filter=success),
+                agg_total_duration_ms=Sum("duration_ms", filter=timed),
+                agg_timed_calls=Count("id", filter=timed),
+                agg_cache_hits=Count("id", filter=cached),
+                agg_saved_cost=Sum("saved_cost", filter=success),
+            )
+            .order_by()
+        )
+        AIUsageRollup.objects.bulk_create(
+            [
+                AIUsageRollup(
+                    granularity=granularity,
+                    bucket=row["bucket"],
+                    provider=row["provider"],
+                    model_name=row["model_name"],
+                    user_id=row["user_id"],
+                    user_key=row["user_id"] or 0,
+                    task_description=row["task_description"],
+                    **{name: row[f"agg_{name}"] or 0 for name in COUNTERS},
+                )
+                for row in rows
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_tracking", "0010_rollup_user_key"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -136,8 +136,8 @@ class AIUsageLog(models.Model):
         default=False, help_text="Whether full prompt/response were stored"
     )
 
-    # Performance tracking
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Performance tracking (set at call time, as logs are written in batches)
+    created_at = models.DateTimeField(default=timezone.now, editable=False, db_index=True)
     duration_ms = models.IntegerField(
         null=True, blank=True, help_text="API call duration in milliseconds"
     )
@@ -152,6 +152,17 @@ class AIUsageLog(models.Model):
     )
     was_successful = models.BooleanField(default=True)
 
+    # Response cache
+    cache_hit = models.BooleanField(
+        default=False, help_text="Served from the response cache without an API call"
+    )
+    saved_cost = models.DecimalField(
+        max_digits=10,
+        decimal_places=6,
+        default=Decimal("0"),
+        help_text="Cost of the API call a cache hit avoided (USD)",
+    )
+
     class Meta:
         ordering = ["-created_at"]
         indexes = [
@@ -181,6 +192,108 @@ class AIUsageLog(models.Model):
         return self.total_cost / total
 
 
+class AIUsageRollup(models.Model):
+    """
+    Hourly and daily usage totals per user, provider, model and task.
+
+    Updated incrementally as usage logs are written, so analytics and budget
+    checks don't scan AIUsageLog, and old logs can be deleted without losing
+    trends.
+    """
+
+    GRANULARITY_CHOICES = [
+        ("hour", "Hourly"),
+        ("day", "Daily"),
+    ]
+
+    granularity = models.CharField(max_length=10, choices=GRANULARITY_CHOICES)
+    bucket = models.DateTimeField(help_text="Start of the hour or day")
+
+    # Rollup key
+    provider = models.CharField(max_length=50)
+    model_name = models.CharField(max_length=100)
+    user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="ai_usage_rollups",
+    )
+    # NULLs never collide in a unique constraint, so the key uses the user's
+    # ID (0 without a user), which also survives the user being deleted
+    user_key = models.BigIntegerField(
+        default=0, editable=False, help_text="User ID, or 0 for calls without a user"
+    )
+    task_description = models.CharField(max_length=255)
+
+    # Totals (tokens, cost and duration cover successful calls only)
+    call_count = models.PositiveIntegerField(default=0, help_text="Successful calls")
+    failed_count = models.PositiveIntegerField(default=0, help_text="Failed calls")
+    input_tokens = models.BigIntegerField(default=0)
+    output_tokens = models.BigIntegerField(default=0)
+    total_cost = models.DecimalField(
+        max_digits=14, decimal_places=6, default=Decimal("0"), help_text="Total cost in USD"
+    )
+    total_duration_ms = models.BigIntegerField(default=0)
+    timed_calls = models.PositiveIntegerField(
+        default=0, help_text="Successful calls with a recorded duration"
+    )
+    cache_hits = models.PositiveIntegerField(
+        default=0, help_text="Successful calls served from the response cache"
+    )
+    saved_cost = models.DecimalField(
+        max_digits=14,
+        decimal_places=6,
+        default=Decimal("0"),
+        help_text="Cost avoided by cache hits (USD)",
+    )
+
+    class Meta:
+        ordering = ["-bucket"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "granularity",
+                    "bucket",
+                    "provider",
+                    "model_name",
+                    "user_key",
+                    "task_description",
+                ],
+                name="ai_usage_rollup_key",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["granularity", "bucket"]),
+            models.Index(fields=["granularity", "user", "bucket"]),
+        ]
+        verbose_name = "AI Usage Rollup"
+        verbose_name_plural = "AI Usage Rollups"
+
+    def __str__(self):
+        return f"{self.granularity} {self.bucket} - {self.provider}/{self.model_name} - ${self.total_cost}"
+
+
+class AIUsageSpool(models.Model):
+    """
+    Usage log spool files whose records are in the database.
+
+    Written in the same transaction as the logs, so a spool file that is
+    still on disk after its import (the process died before deleting it) is
+    deleted instead of being imported again.
+    """
+
+    spool_id = models.CharField(max_length=100, unique=True)
+    imported_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "AI Usage Spool"
+        verbose_name_plural = "AI Usage Spools"
+
+    def __str__(self):
+        return self.spool_id
+
+
 class AIPromptConfig(models.Model):
     """
     Configuration for controlling tracking behavior per prompt type.
@@ -363,10 +476,8 @@ class AIBudgetAlert(models.Model):
         else:  # monthly
             start_date = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-        # Build query
-        query = AIUsageLog.objects.filter(
-            created_at__gte=start_date, was_successful=True
-        )
+        # Build query (periods start at midnight, so daily rollups cover them)
+        query = AIUsageRollup.objects.filter(granularity="day", bucket__gte=start_date)
 
         # Apply optional filters
         if self.provider:
@@ -86,6 +86,8 @@ class AIUsageLogSerializer(serializers.ModelSerializer):
             "duration_ms",
             "error_message",
             "was_successful",
+            "cache_hit",
+            "saved_cost",
         ]
         read_only_fields = fields
 
@@ -117,6 +119,7 @@ class AIUsageLogListSerializer(serializers.ModelSerializer):
             "created_at",
             "duration_ms",
             "was_successful",
+            "cache_hit",
         ]
         read_only_fields = fields
 
@@ -178,6 +181,9 @@ class AnalyticsSummarySerializer(serializers.Serializer):
     avg_cost_per_call = serializers.DecimalField(max_digits=10, decimal_places=6)
     avg_duration_ms = serializers.FloatField()
     success_rate = serializers.FloatField()
+    cache_hits = serializers.IntegerField()
+    cache_hit_rate = serializers.FloatField()
+    saved_cost = serializers.DecimalField(max_digits=10, decimal_places=2)
 
 
 class AnalyticsGroupSerializer(serializers.Serializer):
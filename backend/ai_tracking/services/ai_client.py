@@ -15,6 +15,8 @@ from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 from asgiref.sync import sync_to_async
 
+from .response_cache import get_response_cache, make_cache_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,10 +80,10 @@ class AIClient:
             raise ValueError(f"Unsupported provider: {self.provider}")
 
     def _get_current_price(self):
-        """Fetch current pricing from database."""
-        from ai_tracking.models import AIModelPrice
+        """Fetch current pricing from the cached price table."""
+        from .price_cache import get_cached_price
 
-        price = AIModelPrice.get_current_price(self.provider, self.model)
+        price = get_cached_price(self.provider, self.model)
         if not price:
             logger.warning(
                 f"No pricing found for {self.provider}/{self.model}. "
@@ -121,14 +123,23 @@ class AIClient:
         error_code="",
         error_traceback="",
         was_successful=True,
+        cache_hit=False,
+        saved_cost=Decimal("0"),
     ):
-        """Create usage log entry in database."""
+        """
+        Record a usage log entry.
+
+        Entries go through the buffered usage log writer (unless
+        AI_TRACKING["BUFFER_USAGE_LOGS"] is off), so the returned AIUsageLog
+        is saved when the buffer is flushed.
+        """
         from ai_tracking.models import AIUsageLog
+        from .usage_buffer import get_usage_buffer
 
         log_data = {
             "provider": self.provider,
             "model_name": self.model,
-            "user": self.user,
+            "user_id": self.user.pk if self.user else None,
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
             "total_cost": cost,
@@ -140,11 +151,15 @@ class AIClient:
             "error_code": error_code,
             "error_traceback": error_traceback,
             "was_successful": was_successful,
+            "cache_hit": cache_hit,
+            "saved_cost": saved_cost,
         }
 
-        # Add content object if provided
+        # Add content object if provided (content types are cached by Django)
         if content_object:
-            log_data["content_type"] = ContentType.objects.get_for_model(content_object)
+            log_data["content_type_id"] = ContentType.objects.get_for_model(
+                content_object
+            ).pk
             log_data["object_id"] = content_object.pk
 
         # Store prompt/response if configured
@@ -152,7 +167,67 @@ class AIClient:
             log_data["prompt"] = prompt
             log_data["response"] = response
 
-        return AIUsageLog.objects.create(**log_data)
+        if not self.tracking_settings.get("BUFFER_USAGE_LOGS", True):
+            return AIUsageLog.objects.create(**log_data)
+
+        log_data["created_at"] = timezone.now()
+        return get_usage_buffer().add(log_data)
+
+    def _response_cache_key(self, prompt, task_description, params):
+        """Cache key of a call, identifying the prompt by its prompt type."""
+        return make_cache_key(
+            self.provider,
+            self.model,
+            self.prompt_type or task_description,
+            prompt,
+            params,
+        )
+
+    def _cached_call_result(
+        self,
+        cached,
+        prompt,
+        task_description,
+        content_object,
+        metadata,
+        store_full_data,
+        prompt_config,
+        start_time,
+    ):
+        """
+        Build the result of a call served from the response cache.
+
+        The hit is logged with zero tokens and cost, recording the cost of
+        the original call as saved_cost.
+        """
+        log = None
+        if not prompt_config or prompt_config.is_active:
+            log = self._log_usage(
+                input_tokens=0,
+                output_tokens=0,
+                cost=Decimal("0"),
+                task_description=task_description,
+                content_object=content_object,
+                metadata=metadata,
+                prompt=str(prompt) if store_full_data else "",
+                response=str(cached["response"]) if store_full_data else "",
+                store_full_data=store_full_data,
+                duration_ms=int((time.time() - start_time) * 1000),
+                was_successful=True,
+                cache_hit=True,
+                saved_cost=cached["cost"],
+            )
+
+        return {
+            "response": cached["response"],
+            "usage": {
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "total_cost": Decimal("0"),
+            },
+            "log": log,
+            "cached": True,
+        }
 
     def call(
         self,
@@ -161,6 +236,7 @@ class AIClient:
         content_object=None,
         store_full_data=None,
         metadata=None,
+        cache_response=False,
         **kwargs,
     ):
         """
@@ -172,6 +248,8 @@ class AIClient:
             content_object: Optional Django model instance to link
             store_full_data: Whether to store full prompt/response (overrides default)
             metadata: Additional context data (dict)
+            cache_response: Reuse the response of an identical earlier call
+                from the response cache, and cache this one (opt-in)
             **kwargs: Provider-specific parameters
 
         Returns:
@@ -182,7 +260,8 @@ class AIClient:
                     'output_tokens': int,
                     'total_cost': Decimal
                 },
-                'log': AIUsageLog instance
+                'log': AIUsageLog instance (saved once the usage buffer flushes),
+                'cached': True if served from the response cache
             }
         """
         from ai_tracking.models import AIPromptConfig
@@ -205,6 +284,22 @@ class AIClient:
         if store_full_data is None:
             store_full_data = self.store_prompts_default or self.store_responses_default
 
+        cache_key = None
+        if cache_response:
+            cache_key = self._response_cache_key(prompt, task_description, kwargs)
+            cached = get_response_cache().get(cache_key)
+            if cached is not None:
+                return self._cached_call_result(
+                    cached,
+                    prompt,
+                    task_description,
+                    content_object,
+                    metadata,
+                    store_full_data,
+                    prompt_config,
+                    start_time,
+                )
+
         try:
             # Make the actual API call
             if self.provider == "openai":
@@ -224,6 +319,11 @@ class AIClient:
             # Calculate cost
             cost = self._calculate_cost(input_tokens, output_tokens)
 
+            if cache_key:
+                get_response_cache().set(
+                    cache_key, result["response"], input_tokens, output_tokens, cost
+                )
+
             # Update prompt config with latest call data
             if prompt_config:
                 prompt_config.last_prompt = str(prompt)
@@ -265,6 +365,7 @@ class AIClient:
                     "total_cost": cost,
                 },
                 "log": log,
+                "cached": False,
             }
 
         except Exception as e:
@@ -326,6 +427,7 @@ class AIClient:
         content_object=None,
         store_full_data=None,
         metadata=None,
+        cache_response=False,
         **kwargs,
     ):
         """
@@ -355,6 +457,22 @@ class AIClient:
         if store_full_data is None:
             store_full_data = self.store_prompts_default or self.store_responses_default
 
+        cache_key = None
+        if cache_response:
+            cache_key = self._response_cache_key(prompt, task_description, kwargs)
+            cached = get_response_cache().get(cache_key)
+            if cached is not None:
+                return await sync_to_async(self._cached_call_result)(
+                    cached,
+                    prompt,
+                    task_description,
+                    content_object,
+                    metadata,
+                    store_full_data,
+                    prompt_config,
+                    start_time,
+                )
+
         try:
             # Make the actual API call
             if self.provider == "openai":
@@ -374,6 +492,11 @@ class AIClient:
             # Calculate cost
             cost = self._calculate_cost(input_tokens, output_tokens)
 
+            if cache_key:
+                get_response_cache().set(
+                    cache_key, result["response"], input_tokens, output_tokens, cost
+                )
+
             # Update prompt config with latest call data (async)
             if prompt_config:
                 prompt_config.last_prompt = str(prompt)
@@ -415,6 +538,7 @@ class AIClient:
                     "total_cost": cost,
                 },
                 "log": log,
+                "cached": False,
             }
 
         except Exception as e:
@@ -0,0 +1,63 @@
+"""
+In-process cache of the AI model price table.
+
+AIClient prices every call; loading the whole (small) table once and
+keeping it for a while avoids a query per call. The cache is cleared when
+a price is saved or deleted in this process, and other processes pick up
+changes after AI_TRACKING["PRICE_CACHE_TTL"] seconds.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+
+
+DEFAULT_PRICE_CACHE_TTL = 300
+
+_price_table: Optional[Dict[Tuple[str, str], object]] = None
+_price_table_expires = 0.0
+_price_table_lock = threading.Lock()
+
+
+def _load_price_table():
+    from ai_tracking.models import AIModelPrice
+
+    table = {}
+    for price in AIModelPrice.objects.order_by("-effective_date"):
+        # The first (most recent) price per model wins
+        table.setdefault((price.provider, price.model_name), price)
+    return table
+
+
+def get_cached_price(provider: str, model_name: str):
+    """
+    Get the current price of a model through the in-process price table.
+
+    Args:
+        provider: Provider name (e.g. 'openai')
+        model_name: Model name (e.g. 'gpt-4o-mini')
+
+    Returns:
+        The most recent AIModelPrice, or None if the model has no price
+    """
+    global _price_table, _price_table_expires
+
+    table = _price_table
+    if table is None or time.monotonic() >= _price_table_expires:
+        table = _load_price_table()
+        ttl = getattr(settings, "AI_TRACKING", {}).get(
+            "PRICE_CACHE_TTL", DEFAULT_PRICE_CACHE_TTL
+        )
+        with _price_table_lock:
+            _price_table = table
+            _price_table_expires = time.monotonic() + ttl
+    return table.get((provider, model_name))
+
+
+def clear_price_cache():
+    """Forget the cached price table."""
+    global _price_table
+    with _price_table_lock:
+        _price_table = None
@@ -0,0 +1,172 @@
+"""
+Shared cache of AI responses.
+
+AIClient.call(..., cache_response=True) looks the call up here before
+calling the provider. Entries live in the configured Django cache, so every
+web and Celery worker shares them. They are keyed by provider, model, prompt
+type and a digest of the prompt and call parameters, and expire after
+AI_TRACKING["RESPONSE_CACHE_TTL"] seconds; the cache backend evicts them
+earlier under memory pressure. Responses larger than
+AI_TRACKING["RESPONSE_CACHE_MAX_ENTRY_SIZE"] characters are not cached.
+
+Only opt in for calls whose answer may be reused for identical input, such
+as analysis prompts; sampling parameters are part of the key but a cached
+response is returned regardless of temperature.
+"""
+
+import hashlib
+import json
+import threading
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+CACHE_PREFIX = "ai_response_cache"
+DEFAULT_TTL = 3600
+DEFAULT_MAX_ENTRY_SIZE = 65536
+COST_UNITS = Decimal("1000000")  # Saved cost is counted in millionths of a USD
+
+
+def _tracking_setting(name, default):
+    return getattr(settings, "AI_TRACKING", {}).get(name, default)
+
+
+def make_cache_key(
+    provider: str, model: str, prompt_id: str, prompt: Any, params: Dict[str, Any]
+) -> str:
+    """
+    Build the cache key of an AI call.
+
+    Args:
+        provider: Provider name
+        model: Model name
+        prompt_id: Prompt type (or task description) the prompt was built from
+        prompt: The prompt text or messages
+        params: Provider-specific call parameters
+
+    Returns:
+        Cache key string
+    """
+    inputs = json.dumps(
+        {"prompt": prompt, "params": params}, sort_keys=True, default=str
+    )
+    digest = hashlib.sha256(inputs.encode("utf-8")).hexdigest()
+    return f"{provider}:{model}:{prompt_id}:{digest}"
+
+
+class ResponseCache:
+    """AI responses in the shared cache, with hit and saving counters."""
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_entry_size: Optional[int] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a response may be reused
+            max_entry_size: Largest cached response, in characters
+        """
+        self.ttl = ttl or _tracking_setting("RESPONSE_CACHE_TTL", DEFAULT_TTL)
+        self.max_entry_size = max_entry_size or _tracking_setting(
+            "RESPONSE_CACHE_MAX_ENTRY_SIZE", DEFAULT_MAX_ENTRY_SIZE
+        )
+
+    @staticmethod
+    def _entry_key(key: str) -> str:
+        return f"{CACHE_PREFIX}:{key}"
+
+    @staticmethod
+    def _counter_key(name: str) -> str:
+        return f"{CACHE_PREFIX}:stats:{name}"
+
+    def _count(self, name: str, delta: int = 1):
+        counter_key = self._counter_key(name)
+        try:
+            cache.incr(counter_key, delta)
+        except ValueError:
+            cache.add(counter_key, 0, None)
+            cache.incr(counter_key, delta)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a response and count the hit or miss.
+
+        Args:
+            key: Key from make_cache_key()
+
+        Returns:
+            Dict with response, input_tokens, output_tokens and cost of the
+            original call, or None on a miss
+        """
+        entry = cache.get(self._entry_key(key))
+        if entry is None:
+            self._count("misses")
+            return None
+
+        self._count("hits")
+        saved = int(entry["cost"] * COST_UNITS)
+        if saved:
+            self._count("saved_cost", saved)
+        return entry
+
+    def set(
+        self,
+        key: str,
+        response: Any,
+        input_tokens: int,
+        output_tokens: int,
+        cost: Decimal,
+    ) -> bool:
+        """
+        Store the response of a successful call.
+
+        Returns:
+            False if the response is too large to cache
+        """
+        if len(str(response)) > self.max_entry_size:
+            return False
+
+        cache.set(
+            self._entry_key(key),
+            {
+                "response": response,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cost": cost,
+            },
+            self.ttl,
+        )
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate and money saved across all processes."""
+        names = ("hits", "misses", "saved_cost")
+        found = cache.get_many([self._counter_key(name) for name in names])
+        hits, misses, saved = (found.get(self._counter_key(name), 0) for name in names)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": (hits / lookups) * 100 if lookups else 0.0,
+            "saved_cost": Decimal(saved) / COST_UNITS,
+        }
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache()
+    return _response_cache
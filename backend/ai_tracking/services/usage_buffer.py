@@ -0,0 +1,301 @@
+"""
+Buffered writer for AI usage logs.
+
+AIClient hands usage records to the process-wide UsageLogBuffer instead of
+inserting one row per call. Records are written with bulk_create once
+USAGE_LOG_BATCH_SIZE of them are buffered, every USAGE_LOG_FLUSH_INTERVAL
+seconds, when a request or Celery task finishes, and at exit.
+
+Every record is also appended to a spool file before it is buffered. Spool
+files are named after a random owner ID chosen per buffer and stay locked
+(flock) while their owner has them open, so spool files left behind by a
+crashed process (or a failed flush) are imported by the next flush instead
+of being lost, whatever host or container wrote them. Each import records
+the spool's ID in AIUsageSpool in the same transaction as the logs, so a
+spool still on disk after its import is deleted rather than imported twice.
+"""
+
+import atexit
+import fcntl
+import json
+import logging
+import os
+import threading
+import uuid
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.utils.dateparse import parse_datetime
+
+from .usage_rollups import record_usage
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+
+def _tracking_setting(name, default):
+    return getattr(settings, "AI_TRACKING", {}).get(name, default)
+
+
+class UsageLogBuffer:
+    """Batches AIUsageLog records, spooling them to disk until written."""
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        spool_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            batch_size: Number of buffered records that triggers a flush
+            flush_interval: Seconds between timed flushes (0 disables the timer)
+            spool_dir: Directory for spool files
+        """
+        self.batch_size = batch_size or _tracking_setting(
+            "USAGE_LOG_BATCH_SIZE", DEFAULT_BATCH_SIZE
+        )
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else _tracking_setting("USAGE_LOG_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL)
+        )
+        self.spool_dir = Path(
+            spool_dir
+            or _tracking_setting(
+                "USAGE_LOG_SPOOL_DIR", Path(settings.BASE_DIR) / "build" / "ai-usage"
+            )
+        )
+
+        self.owner_id = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._records: List[Any] = []  # Unsaved AIUsageLog instances
+        self._spool_file = None
+        self._spool_path: Optional[Path] = None
+        self._spool_counter = 0
+        self._timer: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def add(self, record: Dict[str, Any]):
+        """
+        Buffer a usage record.
+
+        Args:
+            record: AIUsageLog field values, with foreign keys given as
+                user_id/content_type_id and a created_at timestamp
+
+        Returns:
+            The unsaved AIUsageLog instance, which gets its primary key when
+            the buffer is flushed
+        """
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            try:
+                self._open_spool().write(line)
+                self._spool_file.flush()
+            except OSError as e:
+                logger.warning(f"Could not spool AI usage record: {e}")
+            log = self._to_log(record)
+            self._records.append(log)
+            should_flush = len(self._records) >= self.batch_size
+            self._start_timer()
+
+        if should_flush:
+            self.flush()
+        return log
+
+    def flush(self) -> int:
+        """
+        Write buffered and orphaned spooled records to the database.
+
+        Returns:
+            Number of records written
+        """
+        with self._flush_lock:
+            with self._lock:
+                records, self._records = self._records, []
+                spool_path = self._close_spool()
+
+            written = 0
+            if records:
+                try:
+                    self._import(records, spool_path)
+                    written += len(records)
+                except Exception as e:
+                    # The spool file keeps the records for the next flush
+                    logger.error(f"Failed to write {len(records)} AI usage logs: {e}")
+                else:
+                    if spool_path:
+                        spool_path.unlink(missing_ok=True)
+
+            return written + self._recover()
+
+    @staticmethod
+    def _import(records: List[Any], spool_path: Optional[Path]):
+        """
+        Write records and mark their spool as imported in one transaction.
+
+        Raises:
+            IntegrityError: If the spool was already imported
+        """
+        from ai_tracking.models import AIUsageLog, AIUsageSpool
+
+        with transaction.atomic():
+            if spool_path:
+                AIUsageSpool.objects.create(spool_id=spool_path.stem)
+            AIUsageLog.objects.bulk_create(records)
+            record_usage(records)
+
+    def _recover(self) -> int:
+        """Import spool files that no live buffer holds open."""
+        from ai_tracking.models import AIUsageSpool
+
+        written = 0
+        for path in sorted(self.spool_dir.glob("usage-*.jsonl")):
+            if path == self._spool_path:
+                continue
+            try:
+                f = open(path, encoding="utf-8")
+            except OSError:
+                continue  # Imported by another process meanwhile
+            with f:
+                try:
+                    # Owners hold the lock while writing; holding it here
+                    # also keeps other processes from importing it now
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    continue
+
+                if AIUsageSpool.objects.filter(spool_id=path.stem).exists():
+                    # Imported, but its owner died before deleting it
+                    path.unlink(missing_ok=True)
+                    continue
+
+                records = []
+                for line in f:
+                    try:
+                        records.append(self._to_log(json.loads(line)))
+                    except ValueError:
+                        break  # Partially written last line
+                try:
+                    self._import(records, path)
+                except IntegrityError:
+                    path.unlink(missing_ok=True)
+                    continue
+                except Exception as e:
+                    logger.error(f"Failed to recover AI usage logs from {path}: {e}")
+                    break
+                path.unlink(missing_ok=True)
+            written += len(records)
+            logger.info(f"Recovered {len(records)} AI usage logs from {path.name}")
+        return written
+
+    @staticmethod
+    def _to_log(record: Dict[str, Any]):
+        from ai_tracking.models import AIUsageLog
+
+        fields = dict(record)
+        for name in ("total_cost", "saved_cost"):
+            if name in fields:
+                fields[name] = Decimal(str(fields[name]))
+        if isinstance(fields.get("created_at"), str):
+            fields["created_at"] = parse_datetime(fields["created_at"])
+        return AIUsageLog(**fields)
+
+    def _open_spool(self):
+        if self._spool_file is None:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            self._spool_counter += 1
+            self._spool_path = (
+                self.spool_dir / f"usage-{self.owner_id}-{self._spool_counter}.jsonl"
+            )
+            self._spool_file = open(self._spool_path, "a", encoding="utf-8")
+            # Released when the file is closed, or by the OS if the process dies
+            fcntl.flock(self._spool_file.fileno(), fcntl.LOCK_EX)
+        return self._spool_file
+
+    def _close_spool(self) -> Optional[Path]:
+        path = self._spool_path
+        if self._spool_file is not None:
+            self._spool_file.close()
+        self._spool_file = None
+        self._spool_path = None
+        return path
+
+    def _start_timer(self):
+        if self._timer is not None or not self.flush_interval:
+            return
+        self._timer = threading.Thread(
+            target=self._run_timer, name="ai-usage-flush", daemon=True
+        )
+        self._timer.start()
+
+    def _run_timer(self):
+        while not self._stopped.wait(self.flush_interval):
+            if self._records:
+                try:
+                    self.flush()
+                finally:
+                    connection.close()
+
+    def abandon(self):
+        """
+        Drop a copy of the buffer inherited through fork.
+
+        The parent still owns the records and the spool file, so the child
+        neither writes them nor keeps the spool's lock alive.
+        """
+        self._stopped.set()
+        self._records = []
+        if self._spool_file is not None:
+            self._spool_file.close()
+        self._spool_file = None
+        self._spool_path = None
+
+    def close(self):
+        """Stop the timer and write what is buffered."""
+        self._stopped.set()
+        self.flush()
+
+
+_usage_buffer = None
+_usage_buffer_lock = threading.Lock()
+
+
+def get_usage_buffer() -> UsageLogBuffer:
+    """Return the process-wide usage log buffer."""
+    global _usage_buffer
+    if _usage_buffer is None:
+        with _usage_buffer_lock:
+            if _usage_buffer is None:
+                _usage_buffer = UsageLogBuffer()
+                atexit.register(_usage_buffer.close)
+    return _usage_buffer
+
+
+def _forget_usage_buffer():
+    """Give forked worker processes a buffer (and spool file) of their own."""
+    global _usage_buffer
+    if _usage_buffer is not None:
+        _usage_buffer.abandon()
+    _usage_buffer = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_usage_buffer)
+
+
+def flush_usage_buffer(**kwargs):
+    """Flush the usage buffer if it has been used (signal receiver)."""
+    if _usage_buffer is not None and _usage_buffer._records:
+        _usage_buffer.flush()
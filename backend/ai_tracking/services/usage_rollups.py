@@ -0,0 +1,190 @@
+"""
+Incremental hourly and daily rollups of AI usage logs.
+
+record_usage() adds newly written logs to their AIUsageRollup rows; it is
+called for single logs by a post_save signal and for batches by the usage
+log buffer. rebuild_rollups() recomputes rollups from the raw logs, e.g.
+to backfill logs written before rollups existed.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+
+GRANULARITIES = ("hour", "day")
+COUNTERS = (
+    "call_count",
+    "failed_count",
+    "input_tokens",
+    "output_tokens",
+    "total_cost",
+    "total_duration_ms",
+    "timed_calls",
+    "cache_hits",
+    "saved_cost",
+)
+
+
+def bucket_start(moment: datetime, granularity: str) -> datetime:
+    """Return the start of the hour or day (in the current time zone) of a moment."""
+    if timezone.is_aware(moment):
+        moment = timezone.localtime(moment)
+    moment = moment.replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        moment = moment.replace(hour=0)
+    return moment
+
+
+def is_day_aligned(moment: datetime) -> bool:
+    return bucket_start(moment, "day") == moment
+
+
+def _log_counters(log) -> Dict[str, object]:
+    if not log.was_successful:
+        return {"failed_count": 1}
+    timed = log.duration_ms is not None
+    return {
+        "call_count": 1,
+        "input_tokens": log.input_tokens or 0,
+        "output_tokens": log.output_tokens or 0,
+        "total_cost": Decimal(log.total_cost or 0),
+        "total_duration_ms": log.duration_ms if timed else 0,
+        "timed_calls": 1 if timed else 0,
+        "cache_hits": 1 if log.cache_hit else 0,
+        "saved_cost": Decimal(log.saved_cost or 0),
+    }
+
+
+def record_usage(logs: Iterable) -> None:
+    """
+    Add saved usage logs to the hourly and daily rollups.
+
+    Args:
+        logs: AIUsageLog instances that were just written
+    """
+    deltas = defaultdict(lambda: defaultdict(int))
+    for log in logs:
+        counters = _log_counters(log)
+        for granularity in GRANULARITIES:
+            key = (
+                granularity,
+                bucket_start(log.created_at or timezone.now(), granularity),
+                log.provider,
+                log.model_name,
+                log.user_id,
+                (log.task_description or "")[:255],
+            )
+            for name, value in counters.items():
+                deltas[key][name] += value
+
+    for key, delta in deltas.items():
+        _apply(key, delta)
+
+
+def _apply(key, delta):
+    from ai_tracking.models import AIUsageRollup
+
+    granularity, bucket, provider, model_name, user_id, task_description = key
+    lookup = {
+        "granularity": granularity,
+        "bucket": bucket,
+        "provider": provider,
+        "model_name": model_name,
+        "user_key": user_id or 0,
+        "task_description": task_description,
+    }
+    increments = {name: F(name) + value for name, value in delta.items() if value}
+    rollups = AIUsageRollup.objects.filter(**lookup)
+    if rollups.update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            AIUsageRollup.objects.create(user_id=user_id, **lookup, **delta)
+    except IntegrityError:
+        # Created concurrently since the update above
+        rollups.update(**increments)
+
+
+def rebuild_rollups(since: Optional[datetime] = None) -> int:
+    """
+    Recompute rollups from the raw usage logs.
+
+    Rollups from the start of the day of `since` are replaced; older
+    rollups, whose logs may have been deleted, are kept.
+
+    Args:
+        since: Rebuild from this moment on. May only be omitted while there
+            are no rollups yet, to backfill from the oldest log.
+
+    Returns:
+        Number of rollup rows written
+
+    Raises:
+        ValueError: If since is omitted but rollups already exist
+    """
+    from ai_tracking.models import AIUsageLog, AIUsageRollup
+
+    logs = AIUsageLog.objects.all()
+    if since is None:
+        if AIUsageRollup.objects.exists():
+            # The oldest remaining log may be from a partially pruned day
+            raise ValueError("Rollups exist; pass the date to rebuild from")
+        oldest = logs.order_by("created_at").values_list("created_at", flat=True).first()
+        if oldest is None:
+            return 0
+        since = oldest
+    since = bucket_start(since, "day")
+    logs = logs.filter(created_at__gte=since)
+
+    success = Q(was_successful=True)
+    timed = success & Q(duration_ms__isnull=False)
+    cached = success & Q(cache_hit=True)
+    written = 0
+    with transaction.atomic():
+        AIUsageRollup.objects.filter(bucket__gte=since).delete()
+        for granularity in GRANULARITIES:
+            rows = (
+                logs.annotate(bucket=Trunc("created_at", granularity))
+                .values("bucket", "provider", "model_name", "user_id", "task_description")
+                .annotate(
+                    agg_call_count=Count("id", filter=success),
+                    agg_failed_count=Count("id", filter=~success),
+                    agg_input_tokens=Sum("input_tokens", filter=success),
+                    agg_output_tokens=Sum("output_tokens", filter=success),
+                    agg_total_cost=Sum("total_cost", filter=success),
+                    agg_total_duration_ms=Sum("duration_ms", filter=timed),
+                    agg_timed_calls=Count("id", filter=timed),
+                    agg_cache_hits=Count("id", filter=cached),
+                    agg_saved_cost=Sum("saved_cost", filter=success),
+                )
+                .order_by()
+            )
+            rollups = [
+                AIUsageRollup(
+                    granularity=granularity,
+                    bucket=row["bucket"],
+                    provider=row["provider"],
+                    model_name=row["model_name"],
+                    user_id=row["user_id"],
+                    user_key=row["user_id"] or 0,
+                    task_description=row["task_description"],
+                    **{name: row[f"agg_{name}"] or 0 for name in COUNTERS},
+                )
+                for row in rows
+            ]
+            AIUsageRollup.objects.bulk_create(rollups, batch_size=1000)
+            written += len(rollups)
+
+    logger.info(f"Rebuilt {written} AI usage rollups since {since}")
+    return written
@@ -0,0 +1,31 @@
+"""
+Keep the cached price table and usage rollups current, and flush buffered
+usage logs.
+"""
+
+from celery.signals import task_postrun
+from django.core.signals import request_finished
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import AIModelPrice, AIUsageLog
+from .services.price_cache import clear_price_cache
+from .services.usage_buffer import flush_usage_buffer
+from .services.usage_rollups import record_usage
+
+
+@receiver([post_save, post_delete], sender=AIModelPrice)
+def invalidate_price_cache(sender, **kwargs):
+    clear_price_cache()
+
+
+@receiver(post_save, sender=AIUsageLog)
+def add_log_to_rollups(sender, instance, created, raw=False, **kwargs):
+    # Batches written with bulk_create are added by the usage log buffer
+    if created and not raw:
+        record_usage([instance])
+
+
+# Write usage logs batched during a request or Celery task when it ends
+request_finished.connect(flush_usage_buffer, dispatch_uid="ai_usage_flush_request")
+task_postrun.connect(flush_usage_buffer, dispatch_uid="ai_usage_flush_task")
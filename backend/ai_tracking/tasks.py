@@ -66,12 +66,15 @@ def cleanup_old_usage_logs(days=90):
     """
     Optional task to clean up old usage logs.
 
+    Analytics and budget alerts read the hourly and daily usage rollups,
+    which are kept, so deleting old logs does not lose trends.
+
     Args:
         days: Delete logs older than this many days (default 90)
     """
     from datetime import timedelta
     from django.utils import timezone
-    from ai_tracking.models import AIUsageLog
+    from ai_tracking.models import AIUsageLog, AIUsageSpool
 
     cutoff_date = timezone.now() - timedelta(days=days)
 
@@ -79,6 +82,8 @@ def cleanup_old_usage_logs(days=90):
     deleted_count = AIUsageLog.objects.filter(
         created_at__lt=cutoff_date, store_full_data=False
     ).delete()[0]
+    # Spool files are deleted right after import; old markers are not needed
+    AIUsageSpool.objects.filter(imported_at__lt=cutoff_date).delete()
 
 
     return {"deleted_count": deleted_count, "cutoff_date": str(cutoff_date)}
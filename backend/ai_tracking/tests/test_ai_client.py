@@ -0,0 +1,210 @@
+"""
+Tests for AIClient price caching, buffered usage logging and response caching
+"""
+
+import json
+import shutil
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from ai_tracking.models import AIModelPrice, AIUsageLog, AIUsageRollup, AIUsageSpool
+from ai_tracking.services.ai_client import AIClient
+from ai_tracking.services.price_cache import clear_price_cache
+from ai_tracking.services.response_cache import ResponseCache, make_cache_key
+from ai_tracking.services.usage_buffer import UsageLogBuffer, flush_usage_buffer
+
+User = get_user_model()
+
+FAKE_RESULT = {"response": "ok", "usage": {"input_tokens": 1000, "output_tokens": 500}}
+
+
+class AIClientTrackingTestCase(TestCase):
+    """Tests for the cached price table, usage log buffer and response cache."""
+
+    def setUp(self):
+        """Set up test data."""
+        clear_price_cache()
+        self.addCleanup(clear_price_cache)
+        self.user = User.objects.create_user(username="aiuser", password="testpass")
+        AIModelPrice.objects.create(
+            provider="openai",
+            model_name="test-model",
+            input_price_per_1k=Decimal("0.001000"),
+            output_price_per_1k=Decimal("0.002000"),
+        )
+
+        self.spool_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.spool_dir, ignore_errors=True)
+        self.buffer = UsageLogBuffer(
+            batch_size=3, flush_interval=0, spool_dir=self.spool_dir
+        )
+        cache.clear()
+        self.response_cache = ResponseCache(ttl=60)
+        for patcher in (
+            patch(
+                "ai_tracking.services.usage_buffer.get_usage_buffer",
+                return_value=self.buffer,
+            ),
+            patch("ai_tracking.services.usage_buffer._usage_buffer", self.buffer),
+            patch(
+                "ai_tracking.services.ai_client.get_response_cache",
+                return_value=self.response_cache,
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.client = AIClient(provider="openai", model="test-model", user=self.user)
+
+    def _call(self, **kwargs):
+        with patch.object(AIClient, "_call_openai", return_value=FAKE_RESULT):
+            return self.client.call("Hello", "Greeting", **kwargs)
+
+    def test_price_table_is_cached_and_invalidated(self):
+        """Test that prices are read once and refreshed when they change."""
+        self.assertEqual(self.client._calculate_cost(1000, 1000), Decimal("0.003"))
+        with self.assertNumQueries(0):
+            self.client._calculate_cost(1000, 1000)
+
+        AIModelPrice.objects.get(model_name="test-model").delete()
+        self.assertEqual(self.client._calculate_cost(1000, 1000), Decimal("0"))
+
+    def test_usage_logs_are_written_in_batches(self):
+        """Test that logs are buffered until the batch size is reached."""
+        first = self._call()
+        self._call()
+        self.assertEqual(AIUsageLog.objects.count(), 0)
+        self.assertIsNone(first["log"].pk)
+
+        self._call()
+
+        self.assertEqual(AIUsageLog.objects.count(), 3)
+        log = AIUsageLog.objects.get(pk=first["log"].pk)
+        self.assertEqual(log.user, self.user)
+        self.assertEqual(log.total_cost, Decimal("0.002"))
+        self.assertEqual(log.created_at, first["log"].created_at)
+        self.assertEqual(list(self.spool_dir.iterdir()), [])
+        daily = AIUsageRollup.objects.get(granularity="day")
+        self.assertEqual(daily.call_count, 3)
+
+    def test_request_finished_flushes_buffer(self):
+        """Test that logs buffered during a request are written when it ends."""
+        self._call()
+        flush_usage_buffer(sender=self.__class__)  # request_finished receiver
+        self.assertEqual(AIUsageLog.objects.count(), 1)
+
+    def _spool_record(self, task_description):
+        return {
+            "provider": "openai",
+            "model_name": "test-model",
+            "user_id": self.user.pk,
+            "input_tokens": 10,
+            "output_tokens": 5,
+            "total_cost": "0.000020",
+            "task_description": task_description,
+            "created_at": "2026-01-01T12:00:00+00:00",
+        }
+
+    def test_spool_of_crashed_process_is_recovered(self):
+        """Test that records spooled by a dead process are imported."""
+        # Nothing holds the file's lock, as after its owner died
+        spool = self.spool_dir / "usage-deadbeef-1.jsonl"
+        spool.write_text(
+            json.dumps(self._spool_record("Lost in a crash")) + "\n" + '{"provider": "op'
+        )
+
+        self.assertEqual(self.buffer.flush(), 1)
+
+        log = AIUsageLog.objects.get(task_description="Lost in a crash")
+        self.assertEqual(log.created_at.year, 2026)
+        self.assertTrue(AIUsageSpool.objects.filter(spool_id=spool.stem).exists())
+        self.assertEqual(list(self.spool_dir.iterdir()), [])
+
+    def test_spool_left_after_import_is_not_imported_again(self):
+        """Test that a crash between commit and unlink does not duplicate logs."""
+        self._call()
+        with patch.object(Path, "unlink"):
+            self.buffer.flush()
+        self.assertEqual(len(list(self.spool_dir.iterdir())), 1)
+
+        self.assertEqual(self.buffer.flush(), 0)
+
+        self.assertEqual(AIUsageLog.objects.count(), 1)
+        self.assertEqual(AIUsageRollup.objects.get(granularity="day").call_count, 1)
+        self.assertEqual(list(self.spool_dir.iterdir()), [])
+
+    def test_open_spool_of_live_buffer_is_skipped(self):
+        """Test that another buffer never imports a spool its owner holds."""
+        self._call()
+        other = UsageLogBuffer(batch_size=3, flush_interval=0, spool_dir=self.spool_dir)
+
+        self.assertEqual(other.flush(), 0)
+
+        self.assertEqual(AIUsageLog.objects.count(), 0)
+        self.assertEqual(self.buffer.flush(), 1)
+
+    def test_cached_responses_are_logged_as_zero_cost(self):
+        """Test that a cache hit skips the API and records the saving."""
+        first = self._call(cache_response=True, temperature=0.3)
+        with patch.object(AIClient, "_call_openai") as api:
+            second = self.client.call(
+                "Hello", "Greeting", cache_response=True, temperature=0.3
+            )
+        api.assert_not_called()
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["response"], "ok")
+        self.assertEqual(second["usage"]["total_cost"], Decimal("0"))
+
+        self.buffer.flush()
+        hit = AIUsageLog.objects.get(cache_hit=True)
+        self.assertEqual(hit.total_cost, Decimal("0"))
+        self.assertEqual(hit.input_tokens, 0)
+        self.assertEqual(hit.saved_cost, Decimal("0.002"))
+        daily = AIUsageRollup.objects.get(granularity="day")
+        self.assertEqual(daily.cache_hits, 1)
+        self.assertEqual(daily.saved_cost, Decimal("0.002"))
+
+        stats = self.response_cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 50.0)
+        self.assertEqual(stats["saved_cost"], Decimal("0.002"))
+
+    def test_response_cache_is_opt_in_and_keyed_by_inputs(self):
+        """Test that uncached calls and different parameters miss the cache."""
+        self._call()
+        self._call(cache_response=True, temperature=0.3)
+        second = self._call(cache_response=True, temperature=0.9)
+        self.assertFalse(second["cached"])
+        self.assertNotEqual(
+            make_cache_key("openai", "test-model", "Greeting", "Hello", {"a": 1}),
+            make_cache_key("openai", "test-model", "Other", "Hello", {"a": 1}),
+        )
+
+    def test_response_cache_limits(self):
+        """Test the entry size limit and expiry."""
+        response_cache = ResponseCache(ttl=60, max_entry_size=10)
+        response_cache.set("c", "c", 1, 1, Decimal("0.01"))
+        self.assertIsNotNone(response_cache.get("c"))
+
+        self.assertFalse(response_cache.set("big", "x" * 11, 1, 1, Decimal("0.01")))
+        self.assertIsNone(response_cache.get("big"))
+
+        with patch("time.time", return_value=10**10):
+            self.assertIsNone(response_cache.get("c"))
+
+    def test_response_cache_is_shared_between_processes(self):
+        """Test that entries and counters live in the shared cache."""
+        ResponseCache(ttl=60).set("k", "ok", 1, 1, Decimal("0.004"))
+
+        other = ResponseCache(ttl=60)
+        self.assertEqual(other.get("k")["response"], "ok")
+        stats = ResponseCache(ttl=60).stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["saved_cost"], Decimal("0.004"))
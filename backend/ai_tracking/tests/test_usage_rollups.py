@@ -0,0 +1,147 @@
+"""
+Tests for AI usage rollups
+"""
+
+from decimal import Decimal
+from datetime import timedelta
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from ai_tracking.models import AIUsageLog, AIUsageRollup, AIBudgetAlert
+from ai_tracking.services.usage_rollups import rebuild_rollups
+from ai_tracking.views import AnalyticsViewSet
+
+User = get_user_model()
+
+
+class AIUsageRollupTestCase(TestCase):
+    """Tests for incremental rollups and the analytics that read them."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(username="rollupuser", password="testpass")
+        self.now = timezone.now()
+        for i in range(3):
+            self._log(total_cost=Decimal("1.50"), duration_ms=100 * (i + 1))
+        self._log(was_successful=False, total_cost=Decimal("0"))
+        # Same task two days ago
+        self._log(
+            total_cost=Decimal("4.00"), created_at=self.now - timedelta(days=2)
+        )
+
+    def _log(self, **fields):
+        defaults = {
+            "provider": "openai",
+            "model_name": "gpt-4o-mini",
+            "user": self.user,
+            "input_tokens": 100,
+            "output_tokens": 50,
+            "task_description": "Summarize",
+            "created_at": self.now,
+        }
+        return AIUsageLog.objects.create(**{**defaults, **fields})
+
+    def _get(self, action, **params):
+        request = APIRequestFactory().get("/analytics/", params)
+        force_authenticate(request, user=self.user)
+        return AnalyticsViewSet.as_view({"get": action})(request)
+
+    def test_logs_update_hourly_and_daily_rollups(self):
+        """Test that each written log is added to its hour and day rows."""
+        today = AIUsageRollup.objects.get(
+            granularity="day", bucket=self.now.replace(hour=0, minute=0, second=0, microsecond=0)
+        )
+        self.assertEqual(today.call_count, 3)
+        self.assertEqual(today.failed_count, 1)
+        self.assertEqual(today.total_cost, Decimal("4.50"))
+        self.assertEqual(today.input_tokens, 300)
+        self.assertEqual(today.total_duration_ms, 600)
+        self.assertEqual(AIUsageRollup.objects.filter(granularity="hour").count(), 2)
+
+    def test_analytics_survive_log_cleanup(self):
+        """Test that analytics read rollups, so deleting logs keeps history."""
+        AIUsageLog.objects.all().delete()
+
+        summary = self._get("summary").data
+        self.assertEqual(summary["total_calls"], 4)
+        self.assertEqual(Decimal(summary["total_cost"]), Decimal("8.50"))
+        self.assertEqual(summary["success_rate"], 80.0)
+        self.assertEqual(summary["avg_duration_ms"], 200.0)
+
+        since_yesterday = (self.now - timedelta(days=1)).date().isoformat()
+        recent = self._get("summary", date_from=since_yesterday).data
+        self.assertEqual(recent["total_calls"], 3)
+
+        by_task = self._get("top_tasks").data
+        self.assertEqual(by_task[0]["group_key"], "Summarize")
+        self.assertEqual(by_task[0]["total_calls"], 4)
+
+        trends = self._get("trends", period="weekly").data
+        self.assertEqual(sum(item["total_calls"] for item in trends), 4)
+
+    def test_budget_spend_reads_daily_rollups(self):
+        """Test that budget checks use rollups rather than the raw logs."""
+        alert = AIBudgetAlert.objects.create(
+            name="Daily", budget_amount=Decimal("5.00"), period="daily"
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(alert.get_current_spend(), Decimal("4.50"))
+
+    def test_rebuild_matches_incremental_rollups(self):
+        """Test that rebuilding from logs reproduces the incremental rows."""
+        fields = ("granularity", "bucket", "call_count", "failed_count", "total_cost")
+        incremental = sorted(AIUsageRollup.objects.values_list(*fields))
+
+        with self.assertRaises(ValueError):
+            rebuild_rollups()
+        rebuild_rollups(since=self.now - timedelta(days=7))
+
+        self.assertEqual(sorted(AIUsageRollup.objects.values_list(*fields)), incremental)
+
+    def test_migration_backfills_logs_from_before_rollups(self):
+        """Test that the backfill migration rolls up earlier and partly recorded days."""
+        from importlib import import_module
+        from django.apps import apps
+
+        backfill = import_module(
+            "ai_tracking.migrations.0011_backfill_usage_rollups"
+        ).backfill_rollups
+        fields = ("granularity", "bucket", "call_count", "failed_count", "total_cost")
+        incremental = sorted(AIUsageRollup.objects.values_list(*fields))
+
+        # Rollups started being recorded partway through today
+        today = self.now.replace(hour=0, minute=0, second=0, microsecond=0)
+        AIUsageRollup.objects.filter(bucket__lt=today).delete()
+        AIUsageRollup.objects.filter(granularity="day").update(call_count=1)
+
+        backfill(apps, None)
+
+        self.assertEqual(sorted(AIUsageRollup.objects.values_list(*fields)), incremental)
+
+    def test_rollups_without_user_share_one_row(self):
+        """Test that calls without a user hit the unique key like any other."""
+        self._log(user=None, total_cost=Decimal("1.00"))
+        self._log(user=None, total_cost=Decimal("1.00"))
+
+        rollup = AIUsageRollup.objects.get(granularity="day", user__isnull=True)
+        self.assertEqual(rollup.call_count, 2)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            AIUsageRollup.objects.create(
+                granularity=rollup.granularity,
+                bucket=rollup.bucket,
+                provider=rollup.provider,
+                model_name=rollup.model_name,
+                task_description=rollup.task_description,
+            )
+
+    def test_deleting_user_keeps_their_rollups(self):
+        """Test that a deleted user's rollups don't collide with anonymous ones."""
+        self._log(user=None, total_cost=Decimal("1.00"))
+        self.user.delete()
+
+        self.assertEqual(
+            AIUsageRollup.objects.filter(granularity="day", user__isnull=True).count(), 3
+        )
@@ -4,45 +4,79 @@ Analytics Views
 API endpoints for AI usage analytics and reporting.
 """
 
+from datetime import datetime, time
 from decimal import Decimal
-from datetime import timedelta
-from django.db.models import Sum, Count, Avg, Q
-from django.db.models.functions import TruncDate, TruncWeek, TruncMonth
+from django.db.models import DateField, DecimalField, Sum
+from django.db.models.functions import NullIf, TruncDate, TruncWeek, TruncMonth
+from django.utils.dateparse import parse_date, parse_datetime
 from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from ai_tracking.models import AIUsageLog
+from ai_tracking.models import AIUsageRollup
 from ai_tracking.serializers import (
     AnalyticsSummarySerializer,
     AnalyticsGroupSerializer,
     AnalyticsTrendSerializer,
 )
+from ai_tracking.services.usage_rollups import bucket_start, is_day_aligned
+
+
+def _parse_moment(value):
+    """Parse a date or datetime query parameter into an aware datetime."""
+    if not value:
+        return None
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            return None
+        moment = datetime.combine(day, time())
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def _group_totals(queryset):
+    """Annotate grouped rollups with the totals of their successful calls."""
+    return queryset.annotate(
+        agg_total_cost=Sum("total_cost"),
+        agg_total_calls=Sum("call_count"),
+        agg_total_tokens=Sum("input_tokens") + Sum("output_tokens"),
+        agg_avg_cost_per_call=Sum("total_cost")
+        / NullIf(Sum("call_count"), 0, output_field=DecimalField()),
+    ).filter(agg_total_calls__gt=0)
 
 
 class AnalyticsViewSet(viewsets.ViewSet):
     """
     ViewSet for AI usage analytics.
 
-    Provides aggregated data and insights about AI usage and costs.
+    Provides aggregated data and insights about AI usage and costs. Reads
+    the hourly and daily AIUsageRollup tables rather than the raw logs, so
+    date filters apply at hour resolution.
     """
 
     permission_classes = [IsAuthenticated]
 
-    def _get_base_queryset(self, request):
-        """Get base queryset with filters applied."""
-        queryset = AIUsageLog.objects.filter(was_successful=True)
+    def _get_base_queryset(self, request, granularity=None):
+        """Get rollup queryset with filters applied."""
+        date_from = _parse_moment(request.query_params.get("date_from"))
+        date_to = _parse_moment(request.query_params.get("date_to"))
 
-        # Date range filtering
-        date_from = request.query_params.get("date_from")
-        date_to = request.query_params.get("date_to")
+        # Daily rollups answer day-aligned ranges; others need hourly ones
+        if granularity is None:
+            aligned = all(d is None or is_day_aligned(d) for d in (date_from, date_to))
+            granularity = "day" if aligned else "hour"
+        queryset = AIUsageRollup.objects.filter(granularity=granularity)
 
+        # Date range filtering (buckets overlapping the range)
         if date_from:
-            queryset = queryset.filter(created_at__gte=date_from)
+            queryset = queryset.filter(bucket__gte=bucket_start(date_from, granularity))
         if date_to:
-            queryset = queryset.filter(created_at__lte=date_to)
+            queryset = queryset.filter(bucket__lt=date_to)
 
         # Provider filtering
         provider = request.query_params.get("provider")
@@ -79,36 +113,44 @@ class AnalyticsViewSet(viewsets.ViewSet):
         queryset = self._get_base_queryset(request)
 
         # Calculate aggregates
-        aggregates = queryset.aggregate(
+        totals = queryset.aggregate(
             agg_total_cost=Sum("total_cost"),
-            agg_total_calls=Count("id"),
+            agg_total_calls=Sum("call_count"),
+            agg_failed_calls=Sum("failed_count"),
             agg_total_input_tokens=Sum("input_tokens"),
             agg_total_output_tokens=Sum("output_tokens"),
-            agg_avg_cost_per_call=Avg("total_cost"),
-            agg_avg_duration_ms=Avg("duration_ms"),
+            agg_total_duration_ms=Sum("total_duration_ms"),
+            agg_timed_calls=Sum("timed_calls"),
+            agg_cache_hits=Sum("cache_hits"),
+            agg_saved_cost=Sum("saved_cost"),
         )
+        total_cost = totals["agg_total_cost"] or Decimal("0")
+        total_calls = totals["agg_total_calls"] or 0
+        timed_calls = totals["agg_timed_calls"] or 0
+        cache_hits = totals["agg_cache_hits"] or 0
 
         # Calculate success rate
-        total_logs = AIUsageLog.objects.filter(
-            created_at__gte=request.query_params.get("date_from")
-            or timezone.now() - timedelta(days=30)
-        ).count()
-
+        all_calls = total_calls + (totals["agg_failed_calls"] or 0)
         success_rate = 100.0
-        if total_logs > 0:
-            success_rate = (aggregates["agg_total_calls"] / total_logs) * 100
+        if all_calls > 0:
+            success_rate = (total_calls / all_calls) * 100
 
         # Build response
         data = {
-            "total_cost": aggregates["agg_total_cost"] or Decimal("0"),
-            "total_calls": aggregates["agg_total_calls"] or 0,
-            "total_input_tokens": aggregates["agg_total_input_tokens"] or 0,
-            "total_output_tokens": aggregates["agg_total_output_tokens"] or 0,
-            "total_tokens": (aggregates["agg_total_input_tokens"] or 0)
-            + (aggregates["agg_total_output_tokens"] or 0),
-            "avg_cost_per_call": aggregates["agg_avg_cost_per_call"] or Decimal("0"),
-            "avg_duration_ms": aggregates["agg_avg_duration_ms"] or 0,
+            "total_cost": total_cost,
+            "total_calls": total_calls,
+            "total_input_tokens": totals["agg_total_input_tokens"] or 0,
+            "total_output_tokens": totals["agg_total_output_tokens"] or 0,
+            "total_tokens": (totals["agg_total_input_tokens"] or 0)
+            + (totals["agg_total_output_tokens"] or 0),
+            "avg_cost_per_call": total_cost / total_calls if total_calls else Decimal("0"),
+            "avg_duration_ms": (
+                totals["agg_total_duration_ms"] / timed_calls if timed_calls else 0
+            ),
             "success_rate": success_rate,
+            "cache_hits": cache_hits,
+            "cache_hit_rate": (cache_hits / total_calls) * 100 if total_calls else 0.0,
+            "saved_cost": totals["agg_saved_cost"] or Decimal("0"),
         }
 
         serializer = AnalyticsSummarySerializer(data)
@@ -130,13 +172,7 @@ class AnalyticsViewSet(viewsets.ViewSet):
 
         # Group by user
         results = (
-            queryset.values("user__username")
-            .annotate(
-                agg_total_cost=Sum("total_cost"),
-                agg_total_calls=Count("id"),
-                agg_total_tokens=Sum("input_tokens") + Sum("output_tokens"),
-                agg_avg_cost_per_call=Avg("total_cost"),
-            )
+            _group_totals(queryset.values("user__username"))
             .order_by("-agg_total_cost")[:20]
         )
 
@@ -167,13 +203,7 @@ class AnalyticsViewSet(viewsets.ViewSet):
 
         # Group by model
         results = (
-            queryset.values("provider", "model_name")
-            .annotate(
-                agg_total_cost=Sum("total_cost"),
-                agg_total_calls=Count("id"),
-                agg_total_tokens=Sum("input_tokens") + Sum("output_tokens"),
-                agg_avg_cost_per_call=Avg("total_cost"),
-            )
+            _group_totals(queryset.values("provider", "model_name"))
             .order_by("-agg_total_cost")[:20]
         )
 
@@ -202,13 +232,7 @@ class AnalyticsViewSet(viewsets.ViewSet):
 
         # Group by provider
         results = (
-            queryset.values("provider")
-            .annotate(
-                agg_total_cost=Sum("total_cost"),
-                agg_total_calls=Count("id"),
-                agg_total_tokens=Sum("input_tokens") + Sum("output_tokens"),
-                agg_avg_cost_per_call=Avg("total_cost"),
-            )
+            _group_totals(queryset.values("provider"))
             .order_by("-agg_total_cost")
         )
 
@@ -243,21 +267,22 @@ class AnalyticsViewSet(viewsets.ViewSet):
         # Determine truncation function
         period = request.query_params.get("period", "daily")
         if period == "weekly":
-            trunc_func = TruncWeek
+            date = TruncWeek("bucket", output_field=DateField())
         elif period == "monthly":
-            trunc_func = TruncMonth
+            date = TruncMonth("bucket", output_field=DateField())
         else:
-            trunc_func = TruncDate
+            date = TruncDate("bucket")
 
         # Group by date
         results = (
-            queryset.annotate(date=trunc_func("created_at"))
+            queryset.annotate(date=date)
             .values("date")
             .annotate(
                 agg_total_cost=Sum("total_cost"),
-                agg_total_calls=Count("id"),
+                agg_total_calls=Sum("call_count"),
                 agg_total_tokens=Sum("input_tokens") + Sum("output_tokens"),
             )
+            .filter(agg_total_calls__gt=0)
             .order_by("date")
         )
 
@@ -285,13 +310,7 @@ class AnalyticsViewSet(viewsets.ViewSet):
 
         # Group by task description
         results = (
-            queryset.values("task_description")
-            .annotate(
-                agg_total_cost=Sum("total_cost"),
-                agg_total_calls=Count("id"),
-                agg_total_tokens=Sum("input_tokens") + Sum("output_tokens"),
-                agg_avg_cost_per_call=Avg("total_cost"),
-            )
+            _group_totals(queryset.values("task_description"))
             .order_by("-agg_total_cost")[:20]
         )
 
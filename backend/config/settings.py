@@ -43,6 +43,13 @@ else:
     SIMPLIFIED_LAYOUT_CACHE_TIMEOUT = 3600  # 1 hour
     LAYOUT_CACHE_ENABLED = True
 
+# Precompiled layout serialization (see the build_layout_artifacts command)
+LAYOUT_ARTIFACT_DIR = BASE_DIR / "build" / "layouts"
+
+# Layout, widget type and path pattern registries are discovered on first
+# lookup; set to populate them at startup instead (e.g. on web workers)
+REGISTRY_EAGER_DISCOVERY = config("REGISTRY_EAGER_DISCOVERY", default=False, cast=bool)
+
 # Theme CSS caching configuration
 if DEBUG:
     # Disable theme CSS caching in development for immediate updates
@@ -60,6 +67,8 @@ DEFAULT_TENANT_ID = config(
     "DEFAULT_TENANT_ID", default=None, cast=lambda x: x if x else None
 )  # UUID string or identifier
 REQUIRE_TENANT = config("REQUIRE_TENANT", default=not DEBUG, cast=bool)
+# Seconds a resolved tenant is cached in each process (cleared on tenant changes)
+TENANT_CACHE_TTL = config("TENANT_CACHE_TTL", default=60, cast=int)
 
 # Security check for production secret key
 if not DEBUG and SECRET_KEY == "dev-secret-key-change-in-production-12345":
@@ -242,6 +251,12 @@ CHANNEL_LAYERS = {
     },
 }
 
+# AI task progress events (SSE streams replay up to TASK_EVENT_BUFFER_SIZE
+# buffered events after the client's Last-Event-ID)
+TASK_EVENT_BUFFER_SIZE = 100
+TASK_SSE_HEARTBEAT_INTERVAL = 15  # Seconds between heartbeat comments
+TASK_SSE_MAX_DURATION = 300  # Seconds before a stream closes and the client reconnects
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -400,6 +415,15 @@ DATA_UPLOAD_MAX_NUMBER_FIELDS = 1000  # Allow more form fields
 # Media file settings
 MEDIA_FILE_MAX_SIZE = 100 * 1024 * 1024  # 100MB per file
 MEDIA_MAX_FILES_PER_UPLOAD = 50  # Allow up to 50 files per upload
+
+# Background ZIP import settings (media library)
+MEDIA_ZIP_IMPORT_MAX_SIZE = 2 * 1024 * 1024 * 1024  # 2GB per archive
+MEDIA_ZIP_IMPORT_MAX_UNCOMPRESSED_SIZE = 10 * 1024 * 1024 * 1024  # 10GB
+MEDIA_ZIP_IMPORT_MAX_FILES = 5000
+MEDIA_ZIP_IMPORT_UPLOAD_WORKERS = 8  # Concurrent uploads per import
+MEDIA_ZIP_IMPORT_BATCH_SIZE = 50  # Members hashed/inserted per batch
+MEDIA_COLLECTION_MANIFEST_TIMEOUT = 24 * 3600  # Cached gallery manifests
+
 MEDIA_ALLOWED_TYPES = [
     "image/jpeg",
     "image/png",
@@ -418,6 +442,23 @@ MEDIA_ALLOWED_TYPES = [
 # Content Import Configuration
 # Proxy asset token expiration time (in seconds)
 CONTENT_IMPORT_PROXY_TOKEN_MAX_AGE = 3600  # 1 hour
+# Shared media download pool used by imports and content migrations
+MEDIA_DOWNLOAD_MAX_WORKERS = 16
+MEDIA_DOWNLOAD_MAX_PER_HOST = 4  # Concurrent requests per source host
+MEDIA_DOWNLOAD_HOST_DELAY = 0.1  # Seconds between request starts per host
+# Concurrent page tree crawling (PAGE_IMPORT_CRAWL_DIR holds resumable checkpoints)
+PAGE_IMPORT_CRAWL_MAX_WORKERS = 8
+PAGE_IMPORT_CRAWL_MAX_PER_HOST = 4  # Concurrent requests per crawled host
+# On-disk LRU cache for assets served by the import proxy
+# (CONTENT_IMPORT_ASSET_CACHE_DIR defaults to a directory in the system temp dir)
+CONTENT_IMPORT_ASSET_CACHE_MAX_BYTES = 512 * 1024 * 1024
+CONTENT_IMPORT_ASSET_CACHE_DEFAULT_TTL = 600  # When the origin sends no Cache-Control
+
+# External REST data connections
+DATA_CONNECTION_REST_RETRIES = 3
+DATA_CONNECTION_REST_BACKOFF = 0.5  # Seconds, doubled on each retry
+DATA_CONNECTION_VALIDATOR_TIMEOUT = 24 * 3600  # Keep ETag/Last-Modified bodies a day
+DATA_STREAM_STALE_TTL = 24 * 3600  # Serve expired stream data while refreshing it
 
 # API Documentation with drf-spectacular
 SPECTACULAR_SETTINGS = {
@@ -665,6 +706,16 @@ AI_TRACKING = {
         default="admin@example.com",
     ),
     "BUDGET_CHECK_ENABLED": config("AI_BUDGET_CHECK_ENABLED", default=True, cast=bool),
+    "PRICE_CACHE_TTL": 300,  # Seconds other processes may use a changed price
+    # Usage logs are written in batches and spooled to disk until then
+    # (USAGE_LOG_SPOOL_DIR defaults to BASE_DIR/build/ai-usage and must not
+    # be shared between hosts)
+    "BUFFER_USAGE_LOGS": config("AI_BUFFER_USAGE_LOGS", default=True, cast=bool),
+    "USAGE_LOG_BATCH_SIZE": 50,
+    "USAGE_LOG_FLUSH_INTERVAL": 5.0,  # Seconds
+    # Shared cache (CACHES["default"]) for AIClient.call(..., cache_response=True)
+    "RESPONSE_CACHE_TTL": 3600,  # Seconds
+    "RESPONSE_CACHE_MAX_ENTRY_SIZE": 65536,  # Characters
 }
 
 # OpenAI Configuration for Content Import
@@ -4,6 +4,8 @@ from .playwright_service import PlaywrightService
 from .openai_service import OpenAIService
 from .content_parser import ContentParser, ContentSegment
 from .media_downloader import MediaDownloader, MediaDownloadResult
+from .download_pool import MediaDownloadPool, get_download_pool
+from .asset_cache import AssetCache, get_asset_cache
 from .widget_creator import create_widgets
 
 
@@ -14,5 +16,9 @@ __all__ = [
     "ContentSegment",
     "MediaDownloader",
     "MediaDownloadResult",
+    "MediaDownloadPool",
+    "get_download_pool",
+    "AssetCache",
+    "get_asset_cache",
     "create_widgets",
 ]
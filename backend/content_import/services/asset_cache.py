@@ -0,0 +1,383 @@
+"""Disk-backed LRU cache for assets served through the content-import proxy."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_ENTRY_BYTES = 25 * 1024 * 1024
+DEFAULT_TTL = 600  # Freshness for responses without Cache-Control or Expires
+READ_CHUNK_SIZE = 64 * 1024
+EVICT_TO_RATIO = 0.9  # Evict down to this share of max_bytes
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into a dict of lower-cased directives."""
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def freshness_lifetime(headers, default_ttl: int) -> Optional[int]:
+    """
+    Return how many seconds a response may be reused without revalidation.
+
+    Args:
+        headers: Response headers
+        default_ttl: Lifetime for responses that do not specify one
+
+    Returns:
+        Lifetime in seconds (0 means revalidate on every use), or None if the
+        response must not be stored by a shared cache
+    """
+    directives = parse_cache_control(headers.get("Cache-Control"))
+    if "no-store" in directives or "private" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    for name in ("s-maxage", "max-age"):
+        if name in directives:
+            try:
+                return max(0, int(directives[name]))
+            except (TypeError, ValueError):
+                return 0
+
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            return max(0, int(parsedate_to_datetime(expires).timestamp() - time.time()))
+        except (TypeError, ValueError):
+            return 0
+    return default_ttl
+
+
+@dataclass
+class CachedAsset:
+    """Metadata of a cached asset body on disk."""
+
+    url: str
+    path: Path
+    content_type: str
+    size: int
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def iter_chunks(self, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Open the body and return an iterator over its chunks.
+
+        The file is opened right away, so an entry evicted since get() raises
+        OSError here rather than while streaming.
+        """
+        f = open(self.path, "rb")
+
+        def read():
+            with f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+
+        return read()
+
+
+@dataclass
+class FetchedAsset:
+    """An asset body that is read in chunks, from the cache or upstream."""
+
+    url: str
+    content_type: str
+    chunks: Iterator[bytes]
+    size: Optional[int] = None
+    from_cache: bool = False
+    _buffer: bytes = field(default=b"", repr=False)
+
+    @classmethod
+    def from_entry(cls, entry: CachedAsset) -> "FetchedAsset":
+        return cls(
+            url=entry.url,
+            content_type=entry.content_type,
+            chunks=entry.iter_chunks(),
+            size=entry.size,
+            from_cache=True,
+        )
+
+    def peek(self, size: int) -> bytes:
+        """Return at least `size` leading bytes (or the whole body) without consuming them."""
+        parts = [self._buffer]
+        buffered = len(self._buffer)
+        while buffered < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            parts.append(chunk)
+            buffered += len(chunk)
+        self._buffer = b"".join(parts)
+        return self._buffer
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._buffer:
+            buffer, self._buffer = self._buffer, b""
+            yield buffer
+        yield from self.chunks
+
+    def read(self) -> bytes:
+        return b"".join(self)
+
+
+class AssetCache:
+    """
+    LRU cache of proxied asset bodies on local disk, keyed by URL.
+
+    Each entry is a body file and a JSON metadata file holding the content
+    type, validators (ETag/Last-Modified) and expiry derived from the
+    upstream Cache-Control or Expires headers. Bodies are written while they
+    stream to the client and renamed into place once complete. Hits touch the
+    body's mtime, and once the cache grows past max_bytes the least recently
+    used entries are removed.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        max_entry_bytes: Optional[int] = None,
+        default_ttl: Optional[int] = None,
+    ):
+        self.directory = Path(
+            directory
+            or getattr(
+                settings,
+                "CONTENT_IMPORT_ASSET_CACHE_DIR",
+                Path(tempfile.gettempdir()) / "content-import-assets",
+            )
+        )
+        self.max_bytes = max_bytes or getattr(
+            settings, "CONTENT_IMPORT_ASSET_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES
+        )
+        self.max_entry_bytes = max_entry_bytes or getattr(
+            settings, "CONTENT_IMPORT_ASSET_CACHE_MAX_ENTRY_BYTES", DEFAULT_MAX_ENTRY_BYTES
+        )
+        self.default_ttl = (
+            default_ttl
+            if default_ttl is not None
+            else getattr(settings, "CONTENT_IMPORT_ASSET_CACHE_DEFAULT_TTL", DEFAULT_TTL)
+        )
+
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        shard = self.directory / key[:2]
+        return shard / f"{key}.body", shard / f"{key}.json"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+
+    def get(self, url: str) -> Optional[CachedAsset]:
+        """Return the cached entry for a URL, fresh or stale, if any."""
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text("utf-8"))
+            os.utime(body_path)  # Mark as recently used
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+
+        return CachedAsset(
+            url=url,
+            path=body_path,
+            content_type=meta.get("content_type", ""),
+            size=meta.get("size", 0),
+            expires_at=meta.get("expires_at", 0),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    def _write_meta(self, url: str, meta_path: Path, **meta):
+        self._write_atomic(
+            meta_path, json.dumps({"url": url, **meta}).encode("utf-8")
+        )
+
+    def refresh(self, entry: CachedAsset, headers) -> None:
+        """Extend a stale entry after the origin answered 304 Not Modified."""
+        lifetime = freshness_lifetime(headers, self.default_ttl)
+        entry.expires_at = time.time() + (lifetime or 0)
+        entry.etag = headers.get("ETag") or entry.etag
+        entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+        try:
+            self._write_meta(
+                entry.url,
+                self._paths(entry.url)[1],
+                content_type=entry.content_type,
+                size=entry.size,
+                expires_at=entry.expires_at,
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+            )
+        except OSError as e:
+            logger.warning(f"Failed to refresh cached asset {entry.url}: {e}")
+
+    def stream(self, url: str, response) -> Iterator[bytes]:
+        """
+        Yield a streamed upstream response body, storing it if cacheable.
+
+        Args:
+            url: URL the response was fetched from (the cache key)
+            response: requests response opened with stream=True
+
+        Yields:
+            Body chunks as they arrive
+        """
+        headers = response.headers
+        lifetime = freshness_lifetime(headers, self.default_ttl)
+        has_validators = bool(headers.get("ETag") or headers.get("Last-Modified"))
+        if response.status_code != 200 or lifetime is None or (
+            lifetime == 0 and not has_validators
+        ):
+            try:
+                yield from response.iter_content(READ_CHUNK_SIZE)
+            finally:
+                response.close()
+            return
+
+        body_path, meta_path = self._paths(url)
+        tmp = tmp_name = None
+        try:
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=body_path.parent, suffix=".tmp")
+            tmp = os.fdopen(fd, "wb")
+        except OSError as e:
+            logger.warning(f"Asset cache unavailable, not caching {url}: {e}")
+
+        size = 0
+        try:
+            for chunk in response.iter_content(READ_CHUNK_SIZE):
+                if tmp is not None:
+                    size += len(chunk)
+                    if size > self.max_entry_bytes:
+                        tmp.close()
+                        os.unlink(tmp_name)
+                        tmp = None
+                    else:
+                        tmp.write(chunk)
+                yield chunk
+
+            if tmp is not None:
+                tmp.close()
+                tmp = None
+                os.replace(tmp_name, body_path)
+                self._write_meta(
+                    url,
+                    meta_path,
+                    content_type=headers.get("content-type", ""),
+                    size=size,
+                    expires_at=time.time() + lifetime,
+                    etag=headers.get("ETag"),
+                    last_modified=headers.get("Last-Modified"),
+                )
+                self._added(size)
+        finally:
+            response.close()
+            if tmp is not None:
+                tmp.close()
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def _added(self, size: int):
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan()[0]
+            else:
+                self._size += size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _scan(self):
+        entries = []
+        total = 0
+        for path in self.directory.glob("*/*.body"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        return total, entries
+
+    def _evict(self):
+        """Remove least recently used entries until under the size limit."""
+        total, entries = self._scan()
+        target = self.max_bytes * EVICT_TO_RATIO
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                for stale in (path, path.with_suffix(".json")):
+                    try:
+                        stale.unlink()
+                    except OSError:
+                        pass
+                total -= size
+        self._size = total
+
+    def delete(self, url: str) -> None:
+        for path in self._paths(url):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.directory.glob("*/*"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._size = 0
+
+
+_asset_cache = None
+_asset_cache_lock = threading.Lock()
+
+
+def get_asset_cache() -> AssetCache:
+    """Return the process-wide asset cache."""
+    global _asset_cache
+    if _asset_cache is None:
+        with _asset_cache_lock:
+            if _asset_cache is None:
+                _asset_cache = AssetCache()
+    return _asset_cache
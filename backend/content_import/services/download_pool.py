@@ -0,0 +1,286 @@
+"""Shared HTTP download pool for importing remote media."""
+
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from django.core.cache import cache
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_PER_HOST = 4
+DEFAULT_HOST_DELAY = 0.1  # Minimum seconds between request starts per host
+DEFAULT_PREFETCH_MAX_BYTES = 256 * 1024 * 1024  # Bodies held per prefetched batch
+URL_MEMO_TIMEOUT = 7 * 24 * 3600
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class DownloadTooLarge(Exception):
+    """Raised when a response body exceeds the allowed size."""
+
+
+@dataclass
+class FetchedMedia:
+    """Body and headers of a downloaded media URL."""
+
+    url: str
+    content: bytes
+    content_type: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def file_hash(self) -> str:
+        return hashlib.sha256(self.content).hexdigest()
+
+
+class PrefetchedMedia:
+    """
+    Bodies prefetched for one batch, bounded by their total size.
+
+    Each batch gets its own store from ``MediaDownloadPool.prefetch`` and
+    passes it to ``fetch``, so concurrent batches never see or drop each
+    other's bodies. Consumed bodies are released immediately; a body that
+    does not fit the byte budget is not kept and ``fetch`` downloads it
+    again when the URL is consumed.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes or getattr(
+            settings, "MEDIA_PREFETCH_MAX_BYTES", DEFAULT_PREFETCH_MAX_BYTES
+        )
+        self._lock = threading.Lock()
+        self._entries: Dict[str, object] = {}
+        self.size = 0
+
+    @property
+    def full(self) -> bool:
+        with self._lock:
+            return self.size >= self.max_bytes
+
+    def add(self, url: str, result) -> bool:
+        """
+        Store a prefetched body or the exception raised while fetching it.
+
+        Returns:
+            False if the body does not fit the remaining budget
+        """
+        size = len(result.content) if isinstance(result, FetchedMedia) else 0
+        with self._lock:
+            if self.size + size > self.max_bytes:
+                return False
+            self._entries[url] = result
+            self.size += size
+        return True
+
+    def pop(self, url: str):
+        """Remove and return the stored result of a URL, if any."""
+        with self._lock:
+            result = self._entries.pop(url, None)
+            if isinstance(result, FetchedMedia):
+                self.size -= len(result.content)
+        return result
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+def get_url_memo_key(namespace_id, url: str) -> str:
+    """Return the cache key mapping a source URL to an imported MediaFile."""
+    url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return f"media_url_memo_{namespace_id}_{url_hash}"
+
+
+class MediaDownloadPool:
+    """
+    Thread-safe downloader with connection reuse and per-host limits.
+
+    A single ``requests.Session`` keeps connections alive across downloads.
+    Each host gets a semaphore bounding concurrent requests and a minimum
+    delay between request starts so bulk imports stay polite to the source.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        host_delay: Optional[float] = None,
+    ):
+        self.max_workers = max_workers or getattr(
+            settings, "MEDIA_DOWNLOAD_MAX_WORKERS", DEFAULT_MAX_WORKERS
+        )
+        self.max_per_host = max_per_host or getattr(
+            settings, "MEDIA_DOWNLOAD_MAX_PER_HOST", DEFAULT_MAX_PER_HOST
+        )
+        self.host_delay = (
+            host_delay
+            if host_delay is not None
+            else getattr(settings, "MEDIA_DOWNLOAD_HOST_DELAY", DEFAULT_HOST_DELAY)
+        )
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers, pool_maxsize=self.max_per_host
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = (
+            "Mozilla/5.0 (compatible; EASY-CMS-Importer/1.0)"
+        )
+
+        self._lock = threading.Lock()
+        self._host_semaphores: Dict[str, threading.Semaphore] = {}
+        self._host_next_start: Dict[str, float] = {}
+
+    def _host_slot(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.max_per_host)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+
+    def _wait_for_host(self, host: str):
+        """Reserve the next start time for a host and sleep until it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_start.get(host, now))
+            self._host_next_start[host] = start + self.host_delay
+        if start > now:
+            time.sleep(start - now)
+
+    def fetch(
+        self,
+        url: str,
+        timeout: int = 30,
+        max_bytes: Optional[int] = None,
+        prefetched: Optional[PrefetchedMedia] = None,
+    ) -> FetchedMedia:
+        """
+        Download a URL, reusing a prefetched body when available.
+
+        Args:
+            url: Absolute URL to download
+            timeout: Request timeout in seconds
+            max_bytes: Optional size limit for the body
+            prefetched: Optional store from ``prefetch`` to consume first
+
+        Returns:
+            FetchedMedia with the response body
+
+        Raises:
+            requests.RequestException: On network or HTTP errors
+            DownloadTooLarge: If the body exceeds max_bytes
+        """
+        result = prefetched.pop(url) if prefetched is not None else None
+        if result is not None:
+            if isinstance(result, Exception):
+                raise result
+            if max_bytes and len(result.content) > max_bytes:
+                raise DownloadTooLarge(f"{url} exceeds {max_bytes} bytes")
+            return result
+
+        host = urlparse(url).netloc
+        with self._host_slot(host):
+            self._wait_for_host(host)
+            with self.session.get(url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+
+                declared = int(response.headers.get("content-length", 0) or 0)
+                if max_bytes and declared > max_bytes:
+                    raise DownloadTooLarge(f"{url} declares {declared} bytes")
+
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(READ_CHUNK_SIZE):
+                    size += len(chunk)
+                    if max_bytes and size > max_bytes:
+                        raise DownloadTooLarge(f"{url} exceeds {max_bytes} bytes")
+                    chunks.append(chunk)
+
+                return FetchedMedia(
+                    url=url,
+                    content=b"".join(chunks),
+                    content_type=response.headers.get("content-type", ""),
+                    headers=dict(response.headers),
+                )
+
+    def prefetch(
+        self,
+        urls: Iterable[str],
+        timeout: int = 30,
+        max_bytes: Optional[int] = None,
+        budget: Optional[int] = None,
+    ) -> PrefetchedMedia:
+        """
+        Download URLs concurrently so later ``fetch`` calls return immediately.
+
+        Failures are stored and re-raised by ``fetch`` for that URL. Once the
+        batch holds ``budget`` bytes, remaining URLs are left for ``fetch``
+        to download on demand.
+
+        Args:
+            urls: URLs to download
+            timeout: Request timeout in seconds
+            max_bytes: Optional size limit per body
+            budget: Total bytes the store may hold (defaults to
+                MEDIA_PREFETCH_MAX_BYTES)
+
+        Returns:
+            PrefetchedMedia to pass to ``fetch``
+        """
+        store = PrefetchedMedia(max_bytes=budget)
+        unique_urls = [url for url in dict.fromkeys(urls) if url]
+        if not unique_urls:
+            return store
+
+        def _fetch(url):
+            if store.full:
+                return
+            try:
+                result = self.fetch(url, timeout=timeout, max_bytes=max_bytes)
+            except Exception as e:
+                result = e
+            store.add(url, result)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(unique_urls))
+        ) as executor:
+            list(executor.map(_fetch, unique_urls))
+
+        return store
+
+    @staticmethod
+    def get_memoized_media_id(namespace_id, url: str) -> Optional[str]:
+        """Return the MediaFile ID previously imported from this URL, if any."""
+        return cache.get(get_url_memo_key(namespace_id, url))
+
+    @staticmethod
+    def memoize_media_id(namespace_id, url: str, media_id) -> None:
+        """Remember which MediaFile a URL was imported as."""
+        cache.set(get_url_memo_key(namespace_id, url), str(media_id), URL_MEMO_TIMEOUT)
+
+
+_download_pool = None
+_download_pool_lock = threading.Lock()
+
+
+def get_download_pool() -> MediaDownloadPool:
+    """Return the process-wide download pool."""
+    global _download_pool
+    if _download_pool is None:
+        with _download_pool_lock:
+            if _download_pool is None:
+                _download_pool = MediaDownloadPool()
+    return _download_pool
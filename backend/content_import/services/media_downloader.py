@@ -3,7 +3,6 @@
 import os
 import logging
 import tempfile
-import requests
 from typing import Dict, Any, Optional, List
 from urllib.parse import urljoin, urlparse
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -13,6 +12,7 @@ from file_manager.services.upload_service import FileUploadService
 from file_manager.models import MediaFile, MediaTag
 from content.models import Namespace
 from .openai_service import OpenAIService
+from .download_pool import MediaDownloadPool, PrefetchedMedia, get_download_pool
 
 
 logger = logging.getLogger(__name__)
@@ -56,7 +56,12 @@ class MediaDownloader:
     """Download and import media files from external sources."""
 
     def __init__(
-        self, user: User, namespace: Namespace, page_metadata: Dict[str, Any] = None
+        self,
+        user: User,
+        namespace: Namespace,
+        page_metadata: Dict[str, Any] = None,
+        download_pool: Optional[MediaDownloadPool] = None,
+        prefetched: Optional[PrefetchedMedia] = None,
     ):
         """
         Initialize media downloader.
@@ -65,14 +70,73 @@ class MediaDownloader:
             user: User performing the import
             namespace: Namespace for imported media
             page_metadata: Dictionary with page title and tags for context
+            download_pool: Optional download pool (defaults to the shared pool)
+            prefetched: Optional bodies prefetched for the current batch
         """
         self.user = user
         self.namespace = namespace
         self.page_metadata = page_metadata or {}
         self.upload_service = FileUploadService()
         self.openai_service = OpenAIService(user=user)
+        self.download_pool = download_pool or get_download_pool()
+        self.prefetched = prefetched
         self.total_downloaded = 0
 
+    def _get_memoized_media(self, url: str) -> Optional[MediaFile]:
+        """
+        Return the MediaFile previously imported from a URL, if it still exists.
+
+        Args:
+            url: Absolute source URL
+
+        Returns:
+            MediaFile or None
+        """
+        media_id = self.download_pool.get_memoized_media_id(self.namespace.id, url)
+        if not media_id:
+            return None
+        return MediaFile.objects.filter(
+            id=media_id, namespace=self.namespace, is_deleted=False
+        ).first()
+
+    def _remember(self, url: str, media_file: Optional[MediaFile]):
+        """Record the URL -> MediaFile mapping so the URL is never refetched."""
+        if media_file is not None:
+            self.download_pool.memoize_media_id(self.namespace.id, url, media_file.id)
+
+    def _reuse_existing_image(
+        self, existing_file: MediaFile, image_data: Dict[str, Any]
+    ) -> MediaFile:
+        """
+        Update metadata and layout hints on an already imported image.
+
+        Args:
+            existing_file: MediaFile being reused
+            image_data: Dictionary with image information for this usage
+
+        Returns:
+            The reused MediaFile
+        """
+        # Update metadata even when reusing
+        use_provided_tags = image_data.get("use_provided_tags", False)
+        self._update_media_metadata(
+            existing_file,
+            title=image_data.get("title") if use_provided_tags else None,
+            description=image_data.get("context"),
+            tags=(self.page_metadata.get("tags", []) if use_provided_tags else None),
+        )
+
+        # Still apply AI layout analysis for this usage
+        if self.openai_service.is_available():
+            layout_config = self.openai_service.analyze_image_layout(
+                img_element_html=image_data.get("html", ""),
+                surrounding_html=image_data.get("parent_html", ""),
+                parent_classes=image_data.get("parent_classes", ""),
+            )
+            existing_file._import_layout_config = layout_config
+
+        return existing_file
+
     def _extract_original_url(self, url: str) -> str:
         """
         Extract original URL from proxy URL if applicable.
@@ -128,13 +192,28 @@ class MediaDownloader:
         if src.startswith("data:"):
             return None
 
+        # URLs imported before are never fetched again
+        memoized_file = self._get_memoized_media(src)
+        if memoized_file:
+            return self._reuse_existing_image(memoized_file, image_data)
+
         try:
             # Download image to check hash
-            response = requests.get(src, timeout=30, stream=True)
-            response.raise_for_status()
+            fetched = self.download_pool.fetch(
+                src, timeout=30, max_bytes=MAX_FILE_SIZE, prefetched=self.prefetched
+            )
+            content = fetched.content
+
+            # Check if image already exists by hash (before decoding the image)
+            file_hash = fetched.file_hash
+
+            existing_file = MediaFile.objects.filter(
+                file_hash=file_hash, namespace=self.namespace
+            ).first()
 
-            # Read content
-            content = response.content
+            if existing_file:
+                self._remember(src, existing_file)
+                return self._reuse_existing_image(existing_file, image_data)
 
             # Extract image dimensions for deduplication
             from PIL import Image
@@ -148,47 +227,7 @@ class MediaDownloader:
             except Exception as e:
                 logger.warning(f"Could not extract dimensions from image: {e}")
 
-            # Check if image already exists by hash
-            import hashlib
-
-            file_hash = hashlib.sha256(content).hexdigest()
-
-            existing_file = MediaFile.objects.filter(
-                file_hash=file_hash, namespace=self.namespace
-            ).first()
-
-            if existing_file:
-                # Update metadata even when reusing
-                use_provided_tags = image_data.get("use_provided_tags", False)
-                self._update_media_metadata(
-                    existing_file,
-                    title=image_data.get("title") if use_provided_tags else None,
-                    description=image_data.get("context"),
-                    tags=(
-                        self.page_metadata.get("tags", [])
-                        if use_provided_tags
-                        else None
-                    ),
-                )
-
-                # Still apply AI layout analysis for this usage
-                if self.openai_service.is_available():
-                    layout_config = self.openai_service.analyze_image_layout(
-                        img_element_html=image_data.get("html", ""),
-                        surrounding_html=image_data.get("parent_html", ""),
-                        parent_classes=image_data.get("parent_classes", ""),
-                    )
-                    existing_file._import_layout_config = layout_config
-
-                return existing_file
-
-            # Check size
-            content_length = int(
-                response.headers.get("content-length", 0) or len(content)
-            )
-            if content_length > MAX_FILE_SIZE:
-                logger.warning(f"Image too large: {content_length} bytes")
-                return None
+            content_length = len(content)
 
             # Check total size limit
             if self.total_downloaded + content_length > MAX_TOTAL_SIZE:
@@ -249,41 +288,10 @@ class MediaDownloader:
                             logger.info(
                                 f"Reusing existing file {existing_slug_file.title} (new file is not larger)"
                             )
-
-                            # Update metadata even when reusing
-                            use_provided_tags = image_data.get(
-                                "use_provided_tags", False
-                            )
-                            self._update_media_metadata(
-                                existing_slug_file,
-                                title=(
-                                    image_data.get("title")
-                                    if use_provided_tags
-                                    else None
-                                ),
-                                description=image_data.get("context"),
-                                tags=(
-                                    self.page_metadata.get("tags", [])
-                                    if use_provided_tags
-                                    else None
-                                ),
+                            self._remember(src, existing_slug_file)
+                            return self._reuse_existing_image(
+                                existing_slug_file, image_data
                             )
-
-                            # Still apply AI layout analysis for this usage
-                            if self.openai_service.is_available():
-                                layout_config = (
-                                    self.openai_service.analyze_image_layout(
-                                        img_element_html=image_data.get("html", ""),
-                                        surrounding_html=image_data.get(
-                                            "parent_html", ""
-                                        ),
-                                        parent_classes=image_data.get(
-                                            "parent_classes", ""
-                                        ),
-                                    )
-                                )
-                                existing_slug_file._import_layout_config = layout_config
-                            return existing_slug_file
                     else:
                         # Different dimensions - generate unique slug
                         proposed_slug = self._generate_unique_slug(proposed_slug)
@@ -332,7 +340,7 @@ class MediaDownloader:
             uploaded_file = SimpleUploadedFile(
                 filename,
                 content,  # Use the raw content we downloaded
-                content_type=response.headers.get("content-type", "image/jpeg"),
+                content_type=fetched.content_type or "image/jpeg",
             )
 
             # Upload to media manager (creates PendingMediaFile)
@@ -421,6 +429,7 @@ class MediaDownloader:
                 # Store layout config for later use
                 media_file._import_layout_config = layout_config
 
+                self._remember(src, media_file)
                 return media_file
 
         except Exception as e:
@@ -453,36 +462,37 @@ class MediaDownloader:
         # Extract original URL if this is a proxy URL
         url = self._extract_original_url(url)
 
-        try:
-            # Download file to check hash
-            response = requests.get(url, timeout=60, stream=True)
-            response.raise_for_status()
-
-            # Read content
-            content = response.content
-
-            # Check if file already exists by hash
-            import hashlib
-
-            file_hash = hashlib.sha256(content).hexdigest()
+        # URLs imported before are never fetched again
+        existing_file = self._get_memoized_media(url)
+        if existing_file is None:
+            try:
+                # Download file to check hash
+                fetched = self.download_pool.fetch(
+                    url,
+                    timeout=60,
+                    max_bytes=MAX_FILE_SIZE,
+                    prefetched=self.prefetched,
+                )
+            except Exception as e:
+                logger.error(f"Failed to download file from {url}: {e}")
+                return None
 
             existing_file = MediaFile.objects.filter(
-                file_hash=file_hash, namespace=self.namespace
+                file_hash=fetched.file_hash, namespace=self.namespace
             ).first()
 
-            if existing_file:
-                # Update metadata even when reusing
-                page_tags = self.page_metadata.get("tags", [])
-                if page_tags:
-                    self._add_tags(existing_file, page_tags)
+        if existing_file:
+            # Update metadata even when reusing
+            page_tags = self.page_metadata.get("tags", [])
+            if page_tags:
+                self._add_tags(existing_file, page_tags)
 
-                return existing_file
+            self._remember(url, existing_file)
+            return existing_file
 
-            # Check size
-            content_length = int(response.headers.get("content-length", 0))
-            if content_length > MAX_FILE_SIZE:
-                logger.warning(f"File too large: {content_length} bytes")
-                return None
+        try:
+            content = fetched.content
+            content_length = len(content)
 
             # Check total size limit
             if self.total_downloaded + content_length > MAX_TOTAL_SIZE:
@@ -499,9 +509,7 @@ class MediaDownloader:
             uploaded_file = SimpleUploadedFile(
                 filename,
                 content,
-                content_type=response.headers.get(
-                    "content-type", "application/octet-stream"
-                ),
+                content_type=fetched.content_type or "application/octet-stream",
             )
 
             # Generate metadata with AI
@@ -568,6 +576,7 @@ class MediaDownloader:
                 # Always add "imported" tag
                 self._add_tags(media_file, ["imported"])
 
+                self._remember(url, media_file)
                 return media_file
 
         except Exception as e:
@@ -134,6 +134,7 @@ Determine based on:
                 temperature=0.3,
                 max_tokens=150,
                 store_full_data=True,  # Store prompts and responses for analysis
+                cache_response=True,  # Re-imported content repeats the same prompts
             )
 
             layout = json.loads(content)
@@ -309,6 +310,7 @@ Confidence should be 0.0-1.0 based on how clear the content is."""
                 max_tokens=400,
                 response_format={"type": "json_object"},
                 store_full_data=True,  # Store prompts and responses for analysis
+                cache_response=True,  # Re-imported content repeats the same prompts
             )
 
             metadata = json.loads(content)
@@ -594,6 +596,7 @@ Respond with ONLY valid JSON (no markdown) in this format:
                 temperature=0.3,
                 max_tokens=200,
                 store_full_data=True,  # Store prompts and responses for analysis
+                cache_response=True,  # Re-imported content repeats the same prompts
             )
 
             result = json.loads(content)
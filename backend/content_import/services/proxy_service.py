@@ -1,19 +1,70 @@
 """Proxy service for fetching and rewriting external web pages."""
 
+import hashlib
+import json
 import re
 import logging
+import threading
 import requests
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional
 from urllib.parse import urljoin, urlparse, urlunparse
 from bs4 import BeautifulSoup
+from django.conf import settings
+from django.core.cache import cache
 from django.urls import reverse
 from ..utils.token_signing import sign_proxy_token
-from ..utils.image_resolution import parse_srcset
+from ..utils.image_resolution import parse_srcset, find_highest_resolution
+from .asset_cache import FetchedAsset, get_asset_cache
 
 
 logger = logging.getLogger(__name__)
 
 
+# Proxied assets are requested by the browser dozens at a time per page
+PROXY_POOL_MAXSIZE = 32
+DEFAULT_CSS_REWRITE_TIMEOUT = 900
+CONTENT_TYPES_BY_EXTENSION = [
+    (".js", "application/javascript"),
+    ((".jpg", ".jpeg"), "image/jpeg"),
+    (".png", "image/png"),
+    (".gif", "image/gif"),
+    (".svg", "image/svg+xml"),
+    (".webp", "image/webp"),
+]
+
+_proxy_session = None
+_proxy_session_lock = threading.Lock()
+
+
+def get_proxy_session() -> requests.Session:
+    """Return the process-wide HTTP session used for proxied pages and assets."""
+    global _proxy_session
+    if _proxy_session is None:
+        with _proxy_session_lock:
+            if _proxy_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=PROXY_POOL_MAXSIZE, pool_maxsize=PROXY_POOL_MAXSIZE
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _proxy_session = session
+    return _proxy_session
+
+
+def guess_asset_content_type(url: str, content_type: Optional[str]) -> str:
+    """Fall back to URL-based detection when the origin sends no useful type."""
+    if content_type and content_type != "application/octet-stream":
+        return content_type
+    if url.endswith(".css") or "css" in url:
+        return "text/css"
+    for extensions, guessed in CONTENT_TYPES_BY_EXTENSION:
+        if url.endswith(extensions):
+            return guessed
+    return content_type or "application/octet-stream"
+
+
 class ProxyService:
     """Service for proxying external web pages with URL rewriting."""
 
@@ -48,7 +99,7 @@ class ProxyService:
         """
         try:
             # Fetch the page
-            response = requests.get(
+            response = get_proxy_session().get(
                 url,
                 timeout=30,
                 headers={
@@ -168,6 +219,10 @@ class ProxyService:
         """
         Rewrite url() references in CSS.
 
+        The result is cached by a hash of the CSS source, base URL and proxy
+        host. The rewritten URLs carry signed tokens, so the cache timeout
+        stays well below the token max age.
+
         Args:
             css: CSS content
             base_url: Base URL for resolving relative URLs
@@ -176,6 +231,17 @@ class ProxyService:
         Returns:
             CSS with rewritten URLs
         """
+        if "url(" not in css:
+            return css
+
+        source = "\n".join([self._proxy_origin(request), base_url, css])
+        cache_key = (
+            "content_import_css_"
+            + hashlib.sha256(source.encode("utf-8")).hexdigest()
+        )
+        rewritten = cache.get(cache_key)
+        if rewritten is not None:
+            return rewritten
 
         def replace_url(match):
             url = match.group(1).strip("'\"")
@@ -183,7 +249,31 @@ class ProxyService:
             proxy_url = self._create_proxy_url(absolute_url, request)
             return f"url('{proxy_url}')"
 
-        return re.sub(r'url\(["\']?([^)"\']+)["\']?\)', replace_url, css)
+        rewritten = re.sub(r'url\(["\']?([^)"\']+)["\']?\)', replace_url, css)
+
+        token_max_age = getattr(settings, "CONTENT_IMPORT_PROXY_TOKEN_MAX_AGE", 3600)
+        cache.set(
+            cache_key,
+            rewritten,
+            min(DEFAULT_CSS_REWRITE_TIMEOUT, token_max_age // 4),
+        )
+        return rewritten
+
+    @staticmethod
+    def _proxy_origin(request=None) -> str:
+        """Scheme and host that proxy URLs are built for ("" for relative URLs)."""
+        if not request:
+            return ""
+
+        scheme = "https" if request.is_secure() else "http"
+        host = request.get_host()
+
+        # In development, replace Docker internal hostname with localhost for frontend access
+        if host.startswith("backend:"):
+            host = host.replace("backend:", "localhost:")
+            logger.debug(f"Replaced Docker hostname with localhost: {host}")
+
+        return f"{scheme}://{host}"
 
     def _create_proxy_url(self, url: str, request=None, srcset_metadata=None) -> str:
         """
@@ -208,20 +298,12 @@ class ProxyService:
 
         signed_token = sign_proxy_token(url, metadata)
 
-        # Build absolute URL if request is available (needed for iframe srcDoc)
-        if request:
-            scheme = "https" if request.is_secure() else "http"
-            host = request.get_host()
-
-            # In development, replace Docker internal hostname with localhost for frontend access
-            if host.startswith("backend:"):
-                host = host.replace("backend:", "localhost:")
-                logger.debug(f"Replaced Docker hostname with localhost: {host}")
-
-            return f"{scheme}://{host}{self.base_proxy_url}?url={quote(url)}&token={quote(signed_token)}"
-
-        # Fallback to relative URL
-        return f"{self.base_proxy_url}?url={quote(url)}&token={quote(signed_token)}"
+        # Build absolute URL if request is available (needed for iframe srcDoc),
+        # falling back to a relative URL
+        return (
+            f"{self._proxy_origin(request)}{self.base_proxy_url}"
+            f"?url={quote(url)}&token={quote(signed_token)}"
+        )
 
     def _inject_base_tag(self, soup: BeautifulSoup, request):
         """
@@ -647,6 +729,123 @@ class ProxyService:
                 soup.insert(0, soup.new_tag("head"))
             soup.head.append(script)
 
+    def resolve_asset(self, url: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Determine an asset's content type and the URL to actually serve.
+
+        For raster images this looks for the highest resolution variant
+        (from srcset metadata or URL patterns). Results are memoized for the
+        asset cache's default TTL so repeat visits skip the HEAD requests.
+
+        Args:
+            url: The asset URL
+            metadata: Optional token metadata (e.g. srcset information)
+
+        Returns:
+            Dictionary with:
+                - content_type: Content type of the asset
+                - url: URL to fetch (the original or a higher resolution one)
+                - resolution: find_highest_resolution() result, or None
+        """
+        source = json.dumps([url, metadata], sort_keys=True, default=str)
+        cache_key = (
+            "content_import_asset_info_"
+            + hashlib.sha256(source.encode("utf-8")).hexdigest()
+        )
+        info = cache.get(cache_key)
+        if info is not None:
+            return info
+
+        entry = get_asset_cache().get(url)
+        if entry:
+            content_type = entry.content_type
+        else:
+            head = get_proxy_session().head(url, timeout=10)
+            content_type = head.headers.get("content-type", "application/octet-stream")
+        content_type = guess_asset_content_type(url, content_type)
+
+        info = {"content_type": content_type, "url": url, "resolution": None}
+        if content_type.startswith("image/") and not content_type.startswith("image/svg"):
+            try:
+                resolution = find_highest_resolution(
+                    base_url=url,
+                    srcset=(metadata or {}).get("srcset"),
+                    check_patterns=True,
+                    max_checks=10,
+                )
+                info["url"] = resolution["url"]
+                info["resolution"] = resolution
+                logger.info(
+                    f"High-res detection: {url} -> {resolution['url']} "
+                    f"({resolution['multiplier']}x from {resolution['source']})"
+                )
+            except Exception as e:
+                logger.warning(f"High-res detection failed for {url}: {e}, using original")
+
+        cache.set(cache_key, info, get_asset_cache().default_ttl)
+        return info
+
+    def open_asset(self, url: str, timeout: int = 30) -> FetchedAsset:
+        """
+        Open an asset for streaming, serving it from the disk cache when possible.
+
+        Fresh cache entries are read from disk. Stale entries with an ETag or
+        Last-Modified are revalidated with a conditional request. Otherwise
+        the body is streamed from the origin and written to the cache as it
+        is read.
+
+        Args:
+            url: The asset URL
+            timeout: Request timeout in seconds
+
+        Returns:
+            FetchedAsset whose chunks stream the body
+
+        Raises:
+            requests.RequestException: If fetching fails
+        """
+        asset_cache = get_asset_cache()
+        entry = asset_cache.get(url)
+        if entry and entry.is_fresh:
+            try:
+                return FetchedAsset.from_entry(entry)
+            except OSError:
+                entry = None
+
+        headers = {}
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        response = get_proxy_session().get(
+            url, timeout=timeout, stream=True, headers=headers
+        )
+        if entry and response.status_code == 304:
+            response.close()
+            asset_cache.refresh(entry, response.headers)
+            try:
+                return FetchedAsset.from_entry(entry)
+            except OSError:
+                response = get_proxy_session().get(url, timeout=timeout, stream=True)
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+
+        size = response.headers.get("content-length")
+        if response.headers.get("content-encoding"):
+            # requests decodes compressed bodies, so the length would not match
+            size = None
+        return FetchedAsset(
+            url=url,
+            content_type=response.headers.get("content-type", ""),
+            chunks=asset_cache.stream(url, response),
+            size=int(size) if size and size.isdigit() else None,
+        )
+
     def fetch_asset(self, url: str) -> bytes:
         """
         Fetch an asset (image, CSS, JS, etc.) from external URL.
@@ -661,9 +860,7 @@ class ProxyService:
             Exception: If fetching fails
         """
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.content
+            return self.open_asset(url).read()
         except Exception as e:
             logger.error(f"Failed to fetch asset {url}: {e}")
             raise Exception(f"Asset fetch failed: {str(e)}")
@@ -0,0 +1,137 @@
+"""
+Tests for the proxy asset cache and streaming.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from ..services.asset_cache import AssetCache, freshness_lifetime
+from ..services.proxy_service import ProxyService
+
+
+def _fake_response(body=b"data", headers=None, status_code=200):
+    """Build a streamed response mock yielding the body in two chunks."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"content-type": "image/png", **(headers or {})}
+    response.raise_for_status.return_value = None
+    half = len(body) // 2
+    response.iter_content.side_effect = lambda chunk_size: iter([body[:half], body[half:]])
+    return response
+
+
+class AssetCacheTestCase(SimpleTestCase):
+    """Test cases for the disk-backed asset cache used by the proxy."""
+
+    def setUp(self):
+        cache.clear()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.asset_cache = AssetCache(directory=self.directory, default_ttl=600)
+        self.session = MagicMock()
+
+        for target, value in (
+            ("get_asset_cache", self.asset_cache),
+            ("get_proxy_session", self.session),
+        ):
+            patcher = patch(
+                f"content_import.services.proxy_service.{target}", return_value=value
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.service = ProxyService()
+
+    def test_asset_is_streamed_then_served_from_disk(self):
+        """Test that a miss streams chunks and the next request skips the network."""
+        self.session.get.return_value = _fake_response(
+            b"png-bytes", {"Cache-Control": "max-age=3600"}
+        )
+
+        asset = self.service.open_asset("https://example.com/a.png")
+        self.assertFalse(asset.from_cache)
+        self.assertEqual(list(asset), [b"png-", b"bytes"])
+
+        cached = self.service.open_asset("https://example.com/a.png")
+        self.assertTrue(cached.from_cache)
+        self.assertEqual(cached.read(), b"png-bytes")
+        self.assertEqual(cached.content_type, "image/png")
+        self.assertEqual(self.session.get.call_count, 1)
+
+    def test_stale_asset_is_revalidated(self):
+        """Test that a stale entry is revalidated with its ETag."""
+        self.session.get.return_value = _fake_response(
+            b"style", {"content-type": "text/css", "ETag": '"v1"', "Cache-Control": "no-cache"}
+        )
+        self.service.open_asset("https://example.com/a.css").read()
+
+        self.session.get.return_value = _fake_response(b"", status_code=304)
+        asset = self.service.open_asset("https://example.com/a.css")
+
+        self.assertTrue(asset.from_cache)
+        self.assertEqual(asset.read(), b"style")
+        self.assertEqual(
+            self.session.get.call_args.kwargs["headers"]["If-None-Match"], '"v1"'
+        )
+
+    def test_no_store_response_is_not_cached(self):
+        """Test that Cache-Control: no-store is respected."""
+        self.session.get.return_value = _fake_response(
+            b"secret", {"Cache-Control": "no-store"}
+        )
+        self.assertEqual(self.service.open_asset("https://example.com/s.png").read(), b"secret")
+        self.assertIsNone(self.asset_cache.get("https://example.com/s.png"))
+
+    def test_peek_does_not_consume_body(self):
+        """Test that reading image headers leaves the full body for the client."""
+        self.session.get.return_value = _fake_response(b"0123456789")
+        asset = self.service.open_asset("https://example.com/p.png")
+
+        self.assertEqual(asset.peek(3), b"01234")
+        self.assertEqual(asset.read(), b"0123456789")
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test that the cache evicts the oldest entries past its size limit."""
+        small_cache = AssetCache(directory=self.directory, max_bytes=25, default_ttl=600)
+        for name in ("a", "b"):
+            url = f"https://example.com/{name}.png"
+            list(small_cache.stream(url, _fake_response(b"x" * 10)))
+        # Use "a" so "b" becomes least recently used
+        entry = small_cache.get("https://example.com/a.png")
+        os.utime(entry.path, (time.time() + 10, time.time() + 10))
+
+        list(small_cache.stream("https://example.com/c.png", _fake_response(b"x" * 10)))
+
+        self.assertIsNotNone(small_cache.get("https://example.com/a.png"))
+        self.assertIsNone(small_cache.get("https://example.com/b.png"))
+        self.assertIsNotNone(small_cache.get("https://example.com/c.png"))
+
+    def test_rewritten_css_is_cached_by_source(self):
+        """Test that url() rewriting runs once per distinct CSS source."""
+        css = "body { background: url('/bg.png'); }"
+        with patch.object(
+            ProxyService, "_create_proxy_url", return_value="/proxied"
+        ) as create_proxy_url:
+            first = self.service._rewrite_css_urls(css, "https://example.com/")
+            second = self.service._rewrite_css_urls(css, "https://example.com/")
+
+        self.assertEqual(first, "body { background: url('/proxied'); }")
+        self.assertEqual(second, first)
+        self.assertEqual(create_proxy_url.call_count, 1)
+
+    def test_freshness_lifetime(self):
+        """Test Cache-Control and Expires handling."""
+        self.assertEqual(freshness_lifetime({"Cache-Control": "public, max-age=60"}, 600), 60)
+        self.assertEqual(freshness_lifetime({"Cache-Control": "s-maxage=5, max-age=60"}, 600), 5)
+        self.assertEqual(freshness_lifetime({"Cache-Control": "no-cache"}, 600), 0)
+        self.assertIsNone(freshness_lifetime({"Cache-Control": "private"}, 600))
+        self.assertEqual(
+            freshness_lifetime({"Expires": "Thu, 01 Jan 1970 00:00:00 GMT"}, 600), 0
+        )
+        self.assertEqual(freshness_lifetime({}, 600), 600)
@@ -0,0 +1,145 @@
+"""
+Tests for the shared media download pool.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from ..services.download_pool import DownloadTooLarge, MediaDownloadPool
+
+
+def _fake_response(body=b"data", headers=None, delay=0.0, tracker=None):
+    """Build a context-manager response mock that records concurrency."""
+    response = MagicMock()
+    response.headers = headers or {"content-type": "image/png"}
+    response.raise_for_status.return_value = None
+
+    def iter_content(chunk_size):
+        if tracker is not None:
+            tracker.enter()
+        try:
+            time.sleep(delay)
+            yield body
+        finally:
+            if tracker is not None:
+                tracker.exit()
+
+    response.iter_content.side_effect = iter_content
+    response.__enter__.return_value = response
+    response.__exit__.return_value = False
+    return response
+
+
+class ConcurrencyTracker:
+    """Track the highest number of simultaneous requests."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def enter(self):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def exit(self):
+        with self.lock:
+            self.current -= 1
+
+
+class MediaDownloadPoolTestCase(SimpleTestCase):
+    """Test cases for MediaDownloadPool."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_prefetch_serves_later_fetches_without_network(self):
+        """Prefetched bodies are returned by fetch without another request."""
+        pool = MediaDownloadPool(max_workers=4, max_per_host=2, host_delay=0)
+        pool.session.get = MagicMock(side_effect=lambda *a, **k: _fake_response())
+
+        prefetched = pool.prefetch(
+            ["https://a.test/1.png", "https://a.test/2.png", "https://a.test/1.png"]
+        )
+        self.assertEqual(pool.session.get.call_count, 2)
+
+        fetched = pool.fetch("https://a.test/1.png", prefetched=prefetched)
+        self.assertEqual(fetched.content, b"data")
+        self.assertEqual(fetched.content_type, "image/png")
+        self.assertEqual(pool.session.get.call_count, 2)
+        self.assertEqual(len(prefetched), 1)
+
+    def test_prefetched_batches_are_isolated(self):
+        """A batch only consumes the bodies it prefetched itself."""
+        pool = MediaDownloadPool(max_workers=2, max_per_host=2, host_delay=0)
+        pool.session.get = MagicMock(side_effect=lambda *a, **k: _fake_response())
+
+        first = pool.prefetch(["https://a.test/1.png"])
+        second = pool.prefetch(["https://a.test/2.png"])
+
+        pool.fetch("https://a.test/1.png", prefetched=second)
+        self.assertEqual(pool.session.get.call_count, 3)
+        self.assertEqual(len(first), 1)
+
+    def test_prefetch_is_bounded_by_bytes(self):
+        """Bodies beyond the batch budget are downloaded again on fetch."""
+        pool = MediaDownloadPool(max_workers=1, max_per_host=1, host_delay=0)
+        pool.session.get = MagicMock(
+            side_effect=lambda *a, **k: _fake_response(body=b"x" * 10)
+        )
+
+        prefetched = pool.prefetch(
+            [f"https://a.test/{i}.png" for i in range(3)], budget=15
+        )
+        self.assertEqual(len(prefetched), 1)
+        self.assertLessEqual(prefetched.size, 15)
+
+        for i in range(3):
+            pool.fetch(f"https://a.test/{i}.png", prefetched=prefetched)
+        self.assertEqual(len(prefetched), 0)
+        self.assertEqual(prefetched.size, 0)
+
+    def test_per_host_concurrency_limit(self):
+        """No more than max_per_host requests run against one host at a time."""
+        tracker = ConcurrencyTracker()
+        pool = MediaDownloadPool(max_workers=8, max_per_host=2, host_delay=0)
+        pool.session.get = MagicMock(
+            side_effect=lambda *a, **k: _fake_response(delay=0.05, tracker=tracker)
+        )
+
+        pool.prefetch([f"https://a.test/{i}.png" for i in range(8)])
+
+        self.assertEqual(pool.session.get.call_count, 8)
+        self.assertLessEqual(tracker.peak, 2)
+
+    def test_size_limit(self):
+        """Bodies larger than max_bytes are rejected."""
+        pool = MediaDownloadPool(max_workers=1, max_per_host=1, host_delay=0)
+        pool.session.get = MagicMock(return_value=_fake_response(body=b"x" * 20))
+
+        with self.assertRaises(DownloadTooLarge):
+            pool.fetch("https://a.test/big.png", max_bytes=10)
+
+    def test_prefetch_errors_are_raised_on_fetch(self):
+        """A failed prefetch is re-raised when the URL is consumed."""
+        pool = MediaDownloadPool(max_workers=1, max_per_host=1, host_delay=0)
+        pool.session.get = MagicMock(side_effect=ConnectionError("boom"))
+
+        prefetched = pool.prefetch(["https://a.test/broken.png"])
+
+        with self.assertRaises(ConnectionError):
+            pool.fetch("https://a.test/broken.png", prefetched=prefetched)
+
+    def test_url_memo(self):
+        """URL to media ID mappings are remembered per namespace."""
+        MediaDownloadPool.memoize_media_id(1, "https://a.test/1.png", "media-1")
+
+        self.assertEqual(
+            MediaDownloadPool.get_memoized_media_id(1, "https://a.test/1.png"), "media-1"
+        )
+        self.assertIsNone(MediaDownloadPool.get_memoized_media_id(2, "https://a.test/1.png"))
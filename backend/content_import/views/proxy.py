@@ -1,23 +1,25 @@
 """Proxy views for serving external web pages."""
 
 import logging
-import requests
 from urllib.parse import unquote
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.core.signing import SignatureExpired, BadSignature
 from django.conf import settings
 
 from ..services.proxy_service import ProxyService
 from ..utils.token_signing import verify_proxy_token
-from ..utils.image_resolution import find_highest_resolution, get_image_dimensions
+from ..utils.image_resolution import get_image_dimensions
 
 
 logger = logging.getLogger(__name__)
 
+# Enough of an image body for PIL to read its dimensions from the header
+IMAGE_HEADER_BYTES = 64 * 1024
+
 
 class ProxyPageView(APIView):
     """Proxy an external webpage with URL rewriting."""
@@ -121,73 +123,29 @@ class ProxyAssetView(APIView):
 
         # Token is valid, fetch the asset
         try:
-            # Determine content type first
-            initial_response = requests.head(url, timeout=10)
-            content_type = initial_response.headers.get(
-                "content-type", "application/octet-stream"
-            )
+            proxy_service = ProxyService()
 
-            # Fallback to URL-based detection if needed
-            if content_type == "application/octet-stream" or not content_type:
-                if url.endswith(".css") or "css" in url:
-                    content_type = "text/css"
-                elif url.endswith(".js"):
-                    content_type = "application/javascript"
-                elif url.endswith((".jpg", ".jpeg")):
-                    content_type = "image/jpeg"
-                elif url.endswith(".png"):
-                    content_type = "image/png"
-                elif url.endswith(".gif"):
-                    content_type = "image/gif"
-                elif url.endswith(".svg"):
-                    content_type = "image/svg+xml"
-                elif url.endswith(".webp"):
-                    content_type = "image/webp"
-
-            # High-resolution detection for images
-            resolution_info = None
-            final_url = url
-
-            is_image = content_type and content_type.startswith("image/")
-            if is_image and not content_type.startswith("image/svg"):
-                # Extract srcset from metadata
-                srcset_data = None
-                if metadata and "srcset" in metadata:
-                    srcset_data = metadata["srcset"]
-
-                # Find highest resolution version
-                try:
-                    resolution_info = find_highest_resolution(
-                        base_url=url,
-                        srcset=srcset_data,
-                        check_patterns=True,
-                        max_checks=10,
-                    )
-                    final_url = resolution_info["url"]
-                    logger.info(
-                        f"High-res detection: {url} -> {final_url} "
-                        f"({resolution_info['multiplier']}x from {resolution_info['source']})"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"High-res detection failed for {url}: {e}, using original"
-                    )
-                    resolution_info = None
-
-            # Fetch the final asset (potentially high-res version)
-            asset_response = requests.get(final_url, timeout=30)
-            asset_response.raise_for_status()
-            asset_bytes = asset_response.content
-
-            # Get image dimensions if it's an image
+            # Content type and high-resolution variant for images (memoized)
+            asset_info = proxy_service.resolve_asset(url, metadata)
+            content_type = asset_info["content_type"]
+            resolution_info = asset_info["resolution"]
+
+            # Stream the final asset (potentially high-res version), from the
+            # disk cache when possible
+            asset = proxy_service.open_asset(asset_info["url"])
+
+            # Get image dimensions from the start of the body if it's an image
             dimensions = None
-            if is_image and resolution_info:
-                dimensions = get_image_dimensions(asset_bytes)
+            if resolution_info:
+                dimensions = get_image_dimensions(asset.peek(IMAGE_HEADER_BYTES))
                 if dimensions:
                     resolution_info["dimensions"] = dimensions
 
             # Create response with custom headers
-            response = HttpResponse(asset_bytes, content_type=content_type)
+            response = StreamingHttpResponse(asset, content_type=content_type)
+            if asset.size is not None:
+                response["Content-Length"] = str(asset.size)
+            response["X-Proxy-Cache"] = "HIT" if asset.from_cache else "MISS"
 
             # Add resolution headers for images
             if resolution_info:
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.24 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+def mark_existing_jobs_exhausted(apps, schema_editor):
+    """Jobs created before paged iteration fetched their whole source upfront."""
+    MigrationJob = apps.get_model("content_migration", "MigrationJob")
+    MigrationJob.objects.update(source_exhausted=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content_migration", "0004_alter_migrationplan_config_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="migrationjob",
+            name="source_cursor",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="migrationjob",
+            name="pending_cursors",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="migrationjob",
+            name="source_exhausted",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(mark_existing_jobs_exhausted, migrations.RunPython.noop),
+    ]
@@ -81,6 +81,12 @@ class MigrationJob(models.Model):
     processed_items = models.IntegerField(default=0)
     failed_items = models.IntegerField(default=0)
     skipped_items = models.IntegerField(default=0)
+
+    # Source iteration checkpoint: the next cursor to dispatch, cursors
+    # dispatched but not yet recorded, and whether the source has no more pages
+    source_cursor = models.JSONField(default=dict, blank=True)
+    pending_cursors = models.JSONField(default=list, blank=True)
+    source_exhausted = models.BooleanField(default=False)
     
     error_log = models.JSONField(default=list, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
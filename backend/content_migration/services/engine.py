@@ -1,10 +1,20 @@
 import logging
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
+from django.db import transaction
+from django.db.models import F, Func, JSONField, Value
 from django.utils import timezone
 from ..models import MigrationJob, MigrationTask, MigrationPlan
 
 logger = logging.getLogger(__name__)
 
+# MigrationJob counter for each final MigrationTask status
+STATUS_COUNTERS = {
+    "COMPLETED": "processed_items",
+    "FAILED": "failed_items",
+    "SKIPPED": "skipped_items",
+}
+
 
 class MigrationEngine:
     """
@@ -36,11 +46,9 @@ class MigrationEngine:
     def register_handler(self, step_type: str, handler: Any):
         self.step_handlers[step_type] = handler
 
-    def process_item(self, source_item: Dict[str, Any]) -> bool:
-        """
-        Process a single item from the source.
-        Returns True if successful, False otherwise.
-        """
+    @staticmethod
+    def get_source_id(source_item: Dict[str, Any]) -> str:
+        """Return the stable source identifier for an item."""
         source_id = str(source_item.get("id", source_item.get("uid", "")))
         if not source_id:
             # Fallback to hash if no ID
@@ -50,67 +58,228 @@ class MigrationEngine:
             source_id = hashlib.md5(
                 json.dumps(source_item, sort_keys=True).encode()
             ).hexdigest()
+        return source_id
 
-        task, created = MigrationTask.objects.get_or_create(
-            job=self.job,
-            source_id=source_id,
+    def process_item(self, source_item: Dict[str, Any]) -> bool:
+        """
+        Process a single item from the source.
+        Returns True if successful (or already completed), False otherwise.
+        """
+        if self.process_batch([source_item])["completed"]:
+            return True
+        return MigrationTask.objects.filter(
+            job=self.job, source_id=self.get_source_id(source_item), status="COMPLETED"
+        ).exists()
+
+    def process_batch(self, source_items: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Process a batch of source items with batch-level bookkeeping.
+
+        Existing task status is loaded in one query, task rows are written
+        with a single upsert and job counters are updated atomically once
+        per batch, so concurrent batch workers never lose updates.
+
+        Returns:
+            Counts of completed, failed and skipped items in this batch.
+            Skipped includes duplicates within the batch and items that were
+            already completed; the job counters count each item only once.
+        """
+        items_by_id: Dict[str, Dict[str, Any]] = {}
+        duplicates = 0
+        for source_item in source_items:
+            source_id = self.get_source_id(source_item)
+            if source_id in items_by_id:
+                duplicates += 1
+                continue
+            items_by_id[source_id] = source_item
+
+        existing_status = dict(
+            MigrationTask.objects.filter(
+                job=self.job, source_id__in=list(items_by_id)
+            ).values_list("source_id", "status")
         )
+        reprocess = self.plan.config.get("reprocess_existing", False)
 
-        if task.status == "COMPLETED" and not self.plan.config.get(
-            "reprocess_existing", False
-        ):
-            self.job.skipped_items += 1
-            self.job.save(update_fields=["skipped_items"])
-            return True
+        counts = {"completed": 0, "failed": 0, "skipped": duplicates}
+        runs = []
+        for source_id, source_item in items_by_id.items():
+            if existing_status.get(source_id) == "COMPLETED" and not reprocess:
+                counts["skipped"] += 1
+                continue
+            runs.append(self._start_run(source_id, source_item))
+
+        self._run_workflow(runs)
+
+        tasks = []
+        errors = []
+        for run in runs:
+            task = run.task
+            # The job instance is only needed while steps run
+            task.context_data = {k: v for k, v in run.context.items() if k != "job"}
+            task.completed_at = timezone.now()
+            tasks.append(task)
 
-        task.status = "PENDING"
-        task.started_at = timezone.now()
-        task.context_data = {
+            if task.status == "COMPLETED":
+                counts["completed"] += 1
+            elif task.status == "SKIPPED":
+                counts["skipped"] += 1
+            else:
+                counts["failed"] += 1
+                errors.append(
+                    {
+                        "source_id": task.source_id,
+                        "error": task.error_message,
+                        "timestamp": task.completed_at.isoformat(),
+                    }
+                )
+
+        self._record_batch(tasks, errors)
+        return counts
+
+    def _start_run(self, source_id: str, source_item: Dict[str, Any]) -> "_ItemRun":
+        """Create the unsaved task and initial context for an item."""
+        task = MigrationTask(
+            job=self.job,
+            source_id=source_id,
+            status="PENDING",
+            started_at=timezone.now(),
+        )
+        context = {
             "source": source_item,
             "variables": {},
             "job": self.job,  # Pass job for tenant/plan access in steps
         }
-        task.save()
+        return _ItemRun(task=task, context=context)
 
-        try:
-            for step_config in self.plan.workflow:
-                step_type = step_config.get("type")
-                config = step_config.get("config", {})
-
-                handler = self.step_handlers.get(step_type)
-                if not handler:
-                    raise ValueError(f"Unknown step type: {step_type}")
+    def _run_workflow(self, runs: List["_ItemRun"]):
+        """
+        Run the plan workflow for a batch, one step at a time.
 
-                result = handler.execute(task.context_data, config)
+        Every item finishes a step before any item starts the next one, so
+        steps implementing ``execute_batch`` (e.g. media imports) can do
+        their I/O for the whole batch concurrently.
+        """
+        active = list(runs)
+        for step_config in self.plan.workflow:
+            if not active:
+                break
 
-                if result is None:  # Step indicated to stop (e.g., condition not met)
-                    task.status = "SKIPPED"
-                    self.job.skipped_items += 1
-                    break
+            step_type = step_config.get("type")
+            config = step_config.get("config", {})
 
-                task.context_data = result
+            handler = self.step_handlers.get(step_type)
+            if not handler:
+                error = ValueError(f"Unknown step type: {step_type}")
+                results = [error] * len(active)
             else:
-                # If loop finished without break
-                task.status = "COMPLETED"
-                self.job.processed_items += 1
-
-        except Exception as e:
-            logger.exception(f"Error processing item {source_id}")
-            task.status = "FAILED"
-            task.error_message = str(e)
-            self.job.failed_items += 1
-            self.job.error_log.append(
-                {
-                    "source_id": source_id,
-                    "error": str(e),
-                    "timestamp": timezone.now().isoformat(),
-                }
+                results = self._execute_step(
+                    handler, [run.context for run in active], config
+                )
+
+            still_active = []
+            for run, result in zip(active, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Error processing item {run.task.source_id}",
+                        exc_info=result,
+                    )
+                    run.task.status = "FAILED"
+                    run.task.error_message = str(result)
+                elif result is None:  # Step indicated to stop (e.g., condition not met)
+                    run.task.status = "SKIPPED"
+                else:
+                    run.context = result
+                    still_active.append(run)
+            active = still_active
+
+        # Items that passed every step
+        for run in active:
+            run.task.status = "COMPLETED"
+
+    @staticmethod
+    def _execute_step(
+        handler: Any, contexts: List[Dict[str, Any]], config: Dict[str, Any]
+    ) -> List[Any]:
+        """Run one step for several contexts, returning a result or exception each."""
+        execute_batch = getattr(handler, "execute_batch", None)
+        if execute_batch is not None:
+            return execute_batch(contexts, config)
+
+        results = []
+        for context in contexts:
+            try:
+                results.append(handler.execute(context, config))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _record_batch(self, tasks: List[MigrationTask], errors: List[Dict]):
+        """
+        Persist task rows and job counters for a processed batch.
+
+        Counters follow task status transitions, so an item that is
+        processed again (after a retry or resume) moves between counters
+        instead of being counted twice. Only the batch's own task rows are
+        locked; the job row is changed by a single atomic update at the end,
+        so workers recording different pages do not wait for each other.
+        """
+        source_ids = [task.source_id for task in tasks]
+        with transaction.atomic():
+            if tasks:
+                # Make sure every task row exists, then lock them, so a batch
+                # racing on the same items reads the statuses this one wrote
+                MigrationTask.objects.bulk_create(
+                    [
+                        MigrationTask(job=self.job, source_id=source_id)
+                        for source_id in source_ids
+                    ],
+                    ignore_conflicts=True,
+                )
+            previous_status = dict(
+                MigrationTask.objects.select_for_update()
+                .filter(job=self.job, source_id__in=source_ids)
+                .values_list("source_id", "status")
             )
+            deltas = dict.fromkeys(STATUS_COUNTERS.values(), 0)
+            for task in tasks:
+                previous = previous_status.get(task.source_id)
+                if previous == task.status:
+                    continue
+                if previous in STATUS_COUNTERS:
+                    deltas[STATUS_COUNTERS[previous]] -= 1
+                deltas[STATUS_COUNTERS[task.status]] += 1
+
+            if tasks:
+                MigrationTask.objects.bulk_create(
+                    tasks,
+                    update_conflicts=True,
+                    unique_fields=["job", "source_id"],
+                    update_fields=[
+                        "status",
+                        "context_data",
+                        "error_message",
+                        "started_at",
+                        "completed_at",
+                    ],
+                )
+
+            # Last statement of the transaction, so the job row is only held
+            # while committing
+            updates = {name: F(name) + delta for name, delta in deltas.items()}
+            if errors:
+                updates["error_log"] = JSONAppend(
+                    F("error_log"), Value(errors, output_field=JSONField())
+                )
+            MigrationJob.objects.filter(pk=self.job.pk).update(**updates)
 
-        task.completed_at = timezone.now()
-        task.save()
-        self.job.save(
-            update_fields=[
+            # Batches update the job row one after another, so exactly one
+            # observes the final totals and marks the job complete.
+            complete_job_if_finished(self.job.pk)
+
+        self.job.refresh_from_db(
+            fields=[
+                "status",
+                "completed_at",
                 "processed_items",
                 "failed_items",
                 "skipped_items",
@@ -118,4 +287,44 @@ class MigrationEngine:
             ]
         )
 
-        return task.status == "COMPLETED"
+
+def complete_job_if_finished(job_id) -> bool:
+    """
+    Mark a running job complete once every source item has been recorded.
+
+    A job is finished when the source is exhausted, no dispatched page is
+    still outstanding and the counters cover every fetched item.
+
+    Args:
+        job_id: Primary key of the MigrationJob
+
+    Returns:
+        True if this call completed the job
+    """
+    return bool(
+        MigrationJob.objects.filter(
+            pk=job_id,
+            status="RUNNING",
+            source_exhausted=True,
+            pending_cursors=[],
+            total_items__lte=F("processed_items")
+            + F("failed_items")
+            + F("skipped_items"),
+        ).update(status="COMPLETED", completed_at=timezone.now())
+    )
+
+
+@dataclass
+class _ItemRun:
+    """Unsaved task and working context for one item in a batch."""
+
+    task: MigrationTask
+    context: Dict[str, Any]
+
+
+class JSONAppend(Func):
+    """Concatenate JSON arrays (PostgreSQL ``jsonb || jsonb``)."""
+
+    arg_joiner = " || "
+    template = "%(expressions)s"
+    output_field = JSONField()
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 class BaseStep:
     def execute(self, context: Dict[str, Any], config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -7,3 +7,49 @@ class BaseStep:
         """
         raise NotImplementedError("Subclasses must implement execute()")
 
+
+class MediaPrefetchMixin:
+    """
+    Batch support for steps that download media.
+
+    ``execute_batch`` downloads every media URL referenced by the batch
+    concurrently through the shared download pool (skipping URLs already
+    imported), then runs ``execute`` per item against the prefetched bodies.
+    The batch's bodies are handed to ``execute`` as
+    ``context["prefetched_media"]`` and released when the batch finishes.
+    """
+
+    prefetch_timeout = 60
+
+    def get_media_urls(self, context: Dict[str, Any], config: Dict[str, Any]) -> List[str]:
+        """Return the absolute media URLs this step will download for a context."""
+        raise NotImplementedError("Subclasses must implement get_media_urls()")
+
+    def execute_batch(self, contexts: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Any]:
+        from content_import.services.download_pool import get_download_pool
+        from content_import.services.media_downloader import MAX_FILE_SIZE
+
+        pool = get_download_pool()
+        urls = []
+        job = contexts[0].get("job") if contexts else None
+        if job:
+            # All contexts in a batch belong to the same job
+            namespace = job.plan.target_object_type.get_effective_namespace()
+            for context in contexts:
+                for url in self.get_media_urls(context, config):
+                    if not pool.get_memoized_media_id(namespace.id, url):
+                        urls.append(url)
+
+        prefetched = pool.prefetch(
+            urls, timeout=self.prefetch_timeout, max_bytes=MAX_FILE_SIZE
+        )
+        results = []
+        for context in contexts:
+            context["prefetched_media"] = prefetched
+            try:
+                results.append(self.execute(context, config))
+            except Exception as e:
+                results.append(e)
+            finally:
+                context.pop("prefetched_media", None)
+        return results
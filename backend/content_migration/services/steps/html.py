@@ -1,10 +1,12 @@
-from .base import BaseStep
-from typing import Any, Dict, Optional
+from .base import BaseStep, MediaPrefetchMixin
+from typing import Any, Dict, List, Optional
 from bs4 import BeautifulSoup
 from content_import.services.media_downloader import MediaDownloader
 from urllib.parse import urljoin
 
-class ProcessHTMLStep(BaseStep):
+FILE_LINK_EXTENSIONS = [".pdf", ".doc", ".docx", ".xls", ".xlsx", ".zip"]
+
+class ProcessHTMLStep(MediaPrefetchMixin, BaseStep):
     """
     Processes HTML content, downloads media, and rewrites URLs.
     config: {
@@ -14,6 +16,21 @@ class ProcessHTMLStep(BaseStep):
         "tags": ["imported"]
     }
     """
+    def get_media_urls(self, context: Dict[str, Any], config: Dict[str, Any]) -> List[str]:
+        html_content = context.get("variables", {}).get(config.get("html_var", "content"))
+        if not html_content or not config.get("download_media", True):
+            return []
+
+        soup = BeautifulSoup(html_content, "html.parser")
+        base_url = config.get("base_url", "")
+        urls = [urljoin(base_url, img["src"]) for img in soup.find_all("img") if img.get("src")]
+        urls.extend(
+            urljoin(base_url, a["href"])
+            for a in soup.find_all("a")
+            if a.get("href") and any(a["href"].lower().endswith(ext) for ext in FILE_LINK_EXTENSIONS)
+        )
+        return urls
+
     def execute(self, context: Dict[str, Any], config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         variables = context.get("variables", {})
         job = context.get("job")
@@ -31,6 +48,7 @@ class ProcessHTMLStep(BaseStep):
             downloader = MediaDownloader(
                 user=job.created_by or job.plan.created_by,
                 namespace=namespace,
+                prefetched=context.get("prefetched_media"),
                 page_metadata={"tags": config.get("tags", [])}
             )
             
@@ -59,7 +77,7 @@ class ProcessHTMLStep(BaseStep):
                 href = a.get("href")
                 if not href: continue
                 
-                if any(href.lower().endswith(ext) for ext in [".pdf", ".doc", ".docx", ".xls", ".xlsx", ".zip"]):
+                if any(href.lower().endswith(ext) for ext in FILE_LINK_EXTENSIONS):
                     full_url = urljoin(base_url, href)
                     try:
                         media_file = downloader.download_file({
@@ -1,9 +1,9 @@
-from .base import BaseStep
+from .base import BaseStep, MediaPrefetchMixin
 from typing import Any, Dict, Optional, List
 from content_import.services.media_downloader import MediaDownloader
 from file_manager.models import MediaTag
 
-class MediaImportStep(BaseStep):
+class MediaImportStep(MediaPrefetchMixin, BaseStep):
     """
     Step to import media files (images/files) from URLs.
     config: {
@@ -14,6 +14,10 @@ class MediaImportStep(BaseStep):
         "target_var": "media_id"
     }
     """
+    def get_media_urls(self, context: Dict[str, Any], config: Dict[str, Any]) -> List[str]:
+        url = context.get("variables", {}).get(config.get("url_var"))
+        return [url] if url else []
+
     def execute(self, context: Dict[str, Any], config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         variables = context.get("variables", {})
         job = context.get("job")
@@ -29,6 +33,7 @@ class MediaImportStep(BaseStep):
         downloader = MediaDownloader(
             user=job.created_by or job.plan.created_by,
             namespace=namespace,
+            prefetched=context.get("prefetched_media"),
             page_metadata={
                 "title": variables.get(config.get("title_var", "")),
                 "tags": config.get("tags", [])
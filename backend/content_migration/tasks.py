@@ -1,63 +1,199 @@
 from celery import shared_task
+from django.db import transaction
+from django.db.models import F, JSONField, Value
 from .models import MigrationJob, MigrationPlan
-from .services.engine import MigrationEngine
+from .services.engine import JSONAppend, MigrationEngine, complete_job_if_finished
 from django.utils import timezone
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_IN_FLIGHT_PAGES = 4
+
+
+def _get_source_engine(job):
+    from data_connections.services.engine import get_engine
+    return get_engine(job.plan.source_connection.connection_type)
+
+
 @shared_task
 def run_migration_job(job_id):
     """
     Coordinator task for a migration job.
-    Fetches items from source and dispatches batch processing tasks.
+
+    Only source cursors are enqueued; each page task fetches its own slice.
+    Calling this again for an interrupted job resumes from its checkpoint:
+    outstanding pages are re-enqueued and dispatch continues from the
+    stored cursor.
     """
     try:
         job = MigrationJob.objects.select_related('plan', 'plan__source_connection').get(id=job_id)
     except MigrationJob.DoesNotExist:
         return
 
-    job.status = "RUNNING"
-    job.started_at = timezone.now()
-    job.save(update_fields=["status", "started_at"])
+    if job.status in ["COMPLETED", "CANCELLED"]:
+        return
 
     try:
-        # 1. Fetch data from source
-        from data_connections.services.engine import get_engine
-        connection = job.plan.source_connection
-        engine = get_engine(connection.connection_type)
-        
-        query_dsl = job.plan.query_dsl
-        items = engine.execute(query_dsl, connection.config)
-        
-        if not items:
-            job.status = "COMPLETED"
-            job.completed_at = timezone.now()
-            job.save(update_fields=["status", "completed_at"])
-            return
-
-        if not isinstance(items, list):
-            items = [items]
-            
-        job.total_items = len(items)
-        job.save(update_fields=["total_items"])
-        
-        # 2. Split into batches and queue processing
-        batch_size = job.plan.config.get("batch_size", 50)
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
-            process_migration_batch.delay(str(job.id), batch)
-            
+        with transaction.atomic():
+            job = MigrationJob.objects.select_for_update().select_related(
+                'plan', 'plan__source_connection'
+            ).get(id=job_id)
+            pending = list(job.pending_cursors)
+            job.status = "RUNNING"
+            update_fields = ["status"]
+            if not job.started_at:
+                job.started_at = timezone.now()
+                update_fields.append("started_at")
+            if not job.source_cursor and not pending and not job.source_exhausted:
+                engine = _get_source_engine(job)
+                job.source_cursor = engine.initial_cursor(
+                    job.plan.query_dsl, job.plan.source_connection.config
+                )
+                update_fields.append("source_cursor")
+            job.save(update_fields=update_fields)
+
+        # Pages that were dispatched before an interruption are fetched again;
+        # items already recorded as completed are skipped by the engine.
+        for cursor in pending:
+            process_migration_page.delay(str(job.id), cursor)
+
+        dispatch_migration_pages(str(job.id))
+        complete_job_if_finished(job.id)
+
     except Exception as e:
         logger.exception(f"Migration job {job_id} initialization failed")
         job.status = "FAILED"
         job.error_log.append({
-            "error": f"Initialization failed: {str(e)}", 
+            "error": f"Initialization failed: {str(e)}",
             "timestamp": timezone.now().isoformat()
         })
         job.completed_at = timezone.now()
         job.save(update_fields=["status", "error_log", "completed_at"])
 
+
+def dispatch_migration_pages(job_id):
+    """
+    Enqueue page tasks until the in-flight window is full.
+
+    The window size comes from the plan's ``max_in_flight_pages`` config,
+    so a slow target applies backpressure to source fetching instead of
+    the whole source being queued at once. Dispatch stops once a page has
+    reported the end of the source.
+
+    Returns:
+        Number of page tasks enqueued
+    """
+    cursors = []
+    with transaction.atomic():
+        job = MigrationJob.objects.select_for_update().select_related(
+            'plan', 'plan__source_connection'
+        ).get(id=job_id)
+        if job.status != "RUNNING" or job.source_exhausted:
+            return 0
+
+        engine = _get_source_engine(job)
+        batch_size = job.plan.config.get("batch_size", DEFAULT_BATCH_SIZE)
+        max_in_flight = job.plan.config.get("max_in_flight_pages", DEFAULT_MAX_IN_FLIGHT_PAGES)
+
+        pending = list(job.pending_cursors)
+        cursor = job.source_cursor
+        while len(pending) < max_in_flight:
+            pending.append(cursor)
+            cursors.append(cursor)
+            cursor = engine.advance_cursor(cursor, batch_size)
+
+        job.pending_cursors = pending
+        job.source_cursor = cursor
+        job.save(update_fields=["pending_cursors", "source_cursor"])
+
+    # Enqueued after the checkpoint commits so workers find their cursor pending
+    for cursor in cursors:
+        process_migration_page.delay(str(job_id), cursor)
+    return len(cursors)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def process_migration_page(self, job_id, cursor):
+    """
+    Executor task for one page of source items.
+
+    Fetches the page for ``cursor``, processes it, then checkpoints the
+    job and refills the dispatch window.
+    """
+    try:
+        job = MigrationJob.objects.select_related('plan', 'plan__source_connection', 'plan__target_object_type').get(id=job_id)
+    except MigrationJob.DoesNotExist:
+        return
+
+    if job.status != "RUNNING" or cursor not in job.pending_cursors:
+        return
+
+    try:
+        engine = _get_source_engine(job)
+        batch_size = job.plan.config.get("batch_size", DEFAULT_BATCH_SIZE)
+        page = engine.fetch_page(
+            job.plan.query_dsl, job.plan.source_connection.config, cursor, batch_size
+        )
+    except Exception as e:
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=e)
+        logger.exception(f"Migration job {job_id} failed to fetch page {cursor}")
+        _fail_job(job_id, f"Failed to fetch page {cursor}: {str(e)}")
+        return
+
+    migration = MigrationEngine(job)
+    try:
+        if page.items:
+            migration.process_batch(page.items)
+    except Exception as e:
+        logger.exception(f"Migration job {job_id} failed to process page {cursor}")
+        _fail_job(job_id, f"Failed to process page {cursor}: {str(e)}")
+        return
+
+    with transaction.atomic():
+        locked = MigrationJob.objects.select_for_update().get(id=job_id)
+        if cursor in locked.pending_cursors:
+            position = locked.pending_cursors.index(cursor)
+            if page.is_last:
+                # Cursors dispatched after the last page lie past the end of
+                # the source; their tasks find them gone and skip the fetch
+                locked.pending_cursors = locked.pending_cursors[:position]
+                locked.source_exhausted = True
+            else:
+                locked.pending_cursors.pop(position)
+            # Fetched items are added once per page, when its cursor is
+            # retired; the batches keep the completion counters themselves
+            locked.total_items = F("total_items") + len(
+                {migration.get_source_id(item) for item in page.items}
+            )
+            locked.save(
+                update_fields=["pending_cursors", "source_exhausted", "total_items"]
+            )
+        if locked.source_exhausted and not locked.pending_cursors:
+            # Every page was recorded before its cursor was retired
+            MigrationJob.objects.filter(pk=job_id, status="RUNNING").update(
+                status="COMPLETED", completed_at=timezone.now()
+            )
+
+    dispatch_migration_pages(job_id)
+
+
+def _fail_job(job_id, message):
+    """
+    Stop a running job after an unrecoverable page error.
+
+    The page's cursor stays pending, so resuming the job fetches it again.
+    """
+    error = {"error": message, "timestamp": timezone.now().isoformat()}
+    MigrationJob.objects.filter(pk=job_id, status="RUNNING").update(
+        status="FAILED",
+        completed_at=timezone.now(),
+        error_log=JSONAppend(F("error_log"), Value([error], output_field=JSONField())),
+    )
+
+
 @shared_task
 def process_migration_batch(job_id, items):
     """
@@ -68,17 +204,6 @@ def process_migration_batch(job_id, items):
     except MigrationJob.DoesNotExist:
         return
 
+    # Task rows, job counters and completion are recorded once per batch
     engine = MigrationEngine(job)
-    for item in items:
-        engine.process_item(item)
-        
-    # Check if job is finished
-    # Note: This simple completion check might have race conditions 
-    # but works for most cases where total items is known upfront.
-    job.refresh_from_db()
-    if job.processed_items + job.failed_items + job.skipped_items >= job.total_items:
-        if job.status == "RUNNING":
-            job.status = "COMPLETED"
-            job.completed_at = timezone.now()
-            job.save(update_fields=["status", "completed_at"])
-
+    engine.process_batch(items)
@@ -1,3 +1,360 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import Tenant
+from data_connections.models import DataConnection
+from data_connections.services.engine import BaseQueryEngine
+from object_storage.models import ObjectTypeDefinition
+
+from .models import MigrationJob, MigrationPlan, MigrationTask
+from .services.engine import MigrationEngine
+from .tasks import process_migration_page, run_migration_job
+from .views import MigrationJobViewSet
+
+
+class FailingStep:
+    """Step that raises for items flagged as broken."""
+
+    def execute(self, context, config):
+        if context["variables"].get("kind") == "broken":
+            raise ValueError("broken item")
+        return context
+
+
+class RecordingBatchStep:
+    """Batch step that records how many contexts it received per call."""
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def execute_batch(self, contexts, config):
+        self.calls.append(("batch", len(contexts)))
+        return contexts
+
+
+class RecordingStep:
+    """Per-item step that records its invocations."""
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def execute(self, context, config):
+        self.calls.append(("item", context["source"]["id"]))
+        return context
+
+
+class ListQueryEngine(BaseQueryEngine):
+    """Source engine over an in-memory list that records fetched cursors."""
+
+    def __init__(self, items):
+        self.items = items
+        self.fetched = []
+
+    def execute(self, query_dsl, config):
+        return self.items
+
+    def fetch_page(self, query_dsl, config, cursor, page_size):
+        self.fetched.append(cursor)
+        return super().fetch_page(query_dsl, config, cursor, page_size)
+
+
+class MigrationEngineBatchTest(TestCase):
+    """Test batch-level bookkeeping in MigrationEngine"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="migrator", password="testpass")
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant", identifier="test-tenant-migration", created_by=self.user
+        )
+        connection = DataConnection.objects.create(
+            name="Source", connection_type="INTERNAL", created_by=self.user
+        )
+        object_type = ObjectTypeDefinition.objects.create(
+            name="article",
+            label="Article",
+            plural_label="Articles",
+            schema={"type": "object", "properties": {}},
+            slot_configuration={"slots": []},
+            created_by=self.user,
+        )
+        self.plan = MigrationPlan.objects.create(
+            name="Articles",
+            source_connection=connection,
+            target_object_type=object_type,
+            workflow=[
+                {"type": "extract_variables", "config": {"mapping": {"kind": "kind"}}},
+                {"type": "check", "config": {}},
+                {
+                    "type": "condition",
+                    "config": {"variable": "kind", "operator": "!=", "value": "skip"},
+                },
+            ],
+            created_by=self.user,
+        )
+        # Source fully dispatched with four items, as with a single-page source
+        self.job = MigrationJob.objects.create(
+            plan=self.plan,
+            status="RUNNING",
+            total_items=4,
+            source_exhausted=True,
+            created_by=self.user,
+        )
+
+    def _engine(self):
+        engine = MigrationEngine(self.job)
+        engine.register_handler("check", FailingStep())
+        return engine
+
+    def test_process_batch_records_tasks_and_counters(self):
+        """Test that one batch writes all task rows and counters together"""
+        items = [
+            {"id": 1, "kind": "ok"},
+            {"id": 2, "kind": "skip"},
+            {"id": 3, "kind": "broken"},
+        ]
+
+        counts = self._engine().process_batch(items)
+
+        self.assertEqual(counts, {"completed": 1, "failed": 1, "skipped": 1})
+        statuses = dict(
+            MigrationTask.objects.filter(job=self.job).values_list("source_id", "status")
+        )
+        self.assertEqual(statuses, {"1": "COMPLETED", "2": "SKIPPED", "3": "FAILED"})
+        self.assertNotIn("job", MigrationTask.objects.get(source_id="1").context_data)
+
+        self.job.refresh_from_db()
+        self.assertEqual(
+            (self.job.processed_items, self.job.failed_items, self.job.skipped_items),
+            (1, 1, 1),
+        )
+        self.assertEqual(self.job.error_log[0]["source_id"], "3")
+        self.assertEqual(self.job.status, "RUNNING")
+
+    def test_last_batch_completes_job(self):
+        """Test that completion is detected when the final batch is recorded"""
+        self._engine().process_batch([{"id": 1, "kind": "ok"}, {"id": 2, "kind": "ok"}])
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "RUNNING")
+
+        # A second worker with its own stale job instance finishes the job
+        stale_job = MigrationJob.objects.get(pk=self.job.pk)
+        engine = MigrationEngine(stale_job)
+        engine.register_handler("check", FailingStep())
+        engine.process_batch([{"id": 3, "kind": "ok"}, {"id": 4, "kind": "broken"}])
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.processed_items, 3)
+        self.assertEqual(self.job.failed_items, 1)
+        self.assertEqual(self.job.status, "COMPLETED")
+        self.assertIsNotNone(self.job.completed_at)
+
+    def test_completed_tasks_are_skipped_on_rerun(self):
+        """Test that already completed items are skipped without reprocessing"""
+        engine = self._engine()
+        engine.process_batch([{"id": 1, "kind": "ok"}])
+
+        counts = engine.process_batch([{"id": 1, "kind": "ok"}, {"id": 5, "kind": "ok"}])
+
+        self.assertEqual(counts, {"completed": 1, "failed": 0, "skipped": 1})
+        self.assertEqual(MigrationTask.objects.filter(job=self.job).count(), 2)
+
+    def test_reprocessed_items_are_counted_once(self):
+        """Test that processing an item again moves it between counters"""
+        self._engine().process_batch([{"id": 1, "kind": "ok"}, {"id": 3, "kind": "broken"}])
+        self.plan.config = {"reprocess_existing": True}
+        self.plan.save(update_fields=["config"])
+
+        self._engine().process_batch([{"id": 1, "kind": "ok"}, {"id": 3, "kind": "ok"}])
+
+        self.job.refresh_from_db()
+        self.assertEqual(
+            (self.job.processed_items, self.job.failed_items, self.job.skipped_items),
+            (2, 0, 0),
+        )
+
+    def test_process_item_reports_completed_items_as_successful(self):
+        """Test that process_item returns True for an already completed item"""
+        engine = self._engine()
+        self.assertTrue(engine.process_item({"id": 1, "kind": "ok"}))
+        self.assertTrue(engine.process_item({"id": 1, "kind": "ok"}))
+        self.assertFalse(engine.process_item({"id": 2, "kind": "skip"}))
+
+    def test_batch_steps_run_for_whole_batch_before_next_step(self):
+        """Test that a batch-capable step sees every item before later steps run"""
+        calls = []
+        self.plan.workflow = [{"type": "fetch"}, {"type": "map"}]
+        self.plan.save(update_fields=["workflow"])
+        engine = MigrationEngine(self.job)
+        engine.register_handler("fetch", RecordingBatchStep(calls))
+        engine.register_handler("map", RecordingStep(calls))
+
+        engine.process_batch([{"id": 1}, {"id": 2}, {"id": 3}])
+
+        self.assertEqual(calls, [("batch", 3), ("item", 1), ("item", 2), ("item", 3)])
+
+
+class MigrationJobPagingTest(TestCase):
+    """Test cursor-based source iteration in the migration tasks"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="pager", password="testpass")
+        connection = DataConnection.objects.create(
+            name="Source", connection_type="INTERNAL", created_by=self.user
+        )
+        object_type = ObjectTypeDefinition.objects.create(
+            name="event",
+            label="Event",
+            plural_label="Events",
+            schema={"type": "object", "properties": {}},
+            slot_configuration={"slots": []},
+            created_by=self.user,
+        )
+        plan = MigrationPlan.objects.create(
+            name="Events",
+            source_connection=connection,
+            target_object_type=object_type,
+            workflow=[],
+            config={"batch_size": 2, "max_in_flight_pages": 2},
+            created_by=self.user,
+        )
+        self.job = MigrationJob.objects.create(plan=plan, created_by=self.user)
+        self.source = ListQueryEngine([{"id": i} for i in range(1, 8)])
+        self.queue = []
+
+        engine_patch = patch(
+            "content_migration.tasks._get_source_engine", return_value=self.source
+        )
+        delay_patch = patch.object(
+            process_migration_page,
+            "delay",
+            side_effect=lambda job_id, cursor: self.queue.append((job_id, cursor)),
+        )
+        engine_patch.start()
+        delay_patch.start()
+        self.addCleanup(engine_patch.stop)
+        self.addCleanup(delay_patch.stop)
+
+    def _drain(self):
+        while self.queue:
+            process_migration_page(*self.queue.pop(0))
+
+    def test_coordinator_enqueues_cursors_within_window(self):
+        """Test that only cursors are enqueued and at most the window size"""
+        run_migration_job(str(self.job.id))
+
+        self.assertEqual(
+            [cursor for _, cursor in self.queue], [{"offset": 0}, {"offset": 2}]
+        )
+        self.assertEqual(self.source.fetched, [])
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "RUNNING")
+        self.assertEqual(self.job.source_cursor, {"offset": 4})
+        self.assertEqual(len(self.job.pending_cursors), 2)
+
+    def test_pages_complete_job(self):
+        """Test that workers fetch their own pages until the source is exhausted"""
+        run_migration_job(str(self.job.id))
+        self._drain()
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "COMPLETED")
+        self.assertEqual(self.job.total_items, 7)
+        self.assertEqual(self.job.processed_items, 7)
+        self.assertTrue(self.job.source_exhausted)
+        self.assertEqual(self.job.pending_cursors, [])
+        self.assertEqual(MigrationTask.objects.filter(job=self.job).count(), 7)
+
+    def test_total_counts_fetched_items_separately(self):
+        """Test that the total grows with fetched pages, not with the counters"""
+        run_migration_job(str(self.job.id))
+        process_migration_page(*self.queue.pop(0))
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "RUNNING")
+        self.assertEqual(self.job.total_items, 2)
+        self.assertFalse(self.job.source_exhausted)
+
+    def test_repeated_source_items_complete_job(self):
+        """Test that an item repeated on a later page does not stall the job"""
+        self.source.items.append({"id": 1})
+        run_migration_job(str(self.job.id))
+        self._drain()
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "COMPLETED")
+        self.assertEqual(self.job.processed_items, 7)
+
+    def test_interrupted_job_resumes_from_checkpoint(self):
+        """Test that rerunning the coordinator re-enqueues outstanding pages"""
+        run_migration_job(str(self.job.id))
+        process_migration_page(*self.queue.pop(0))
+        # Simulate losing the queued messages when workers stop
+        self.queue.clear()
+
+        run_migration_job(str(self.job.id))
+
+        self.assertEqual(self.queue[0][1], {"offset": 2})
+        self._drain()
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "COMPLETED")
+        self.assertEqual(self.job.processed_items, 7)
+        self.assertEqual(self.source.fetched.count({"offset": 0}), 1)
+
+    def test_no_pages_are_fetched_past_the_last_page(self):
+        """Test that cursors dispatched beyond the last page are dropped"""
+        run_migration_job(str(self.job.id))
+        self._drain()
+
+        self.assertEqual(
+            self.source.fetched,
+            [{"offset": 0}, {"offset": 2}, {"offset": 4}, {"offset": 6}],
+        )
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "COMPLETED")
+
+    def test_failed_fetch_fails_job_for_resume(self):
+        """Test that a page failing its last retry fails the job, keeping its cursor"""
+        run_migration_job(str(self.job.id))
+        job_id, cursor = self.queue.pop(0)
+
+        with patch.object(self.source, "fetch_page", side_effect=IOError("down")):
+            process_migration_page.apply(args=(job_id, cursor), retries=3)
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "FAILED")
+        self.assertIn(cursor, self.job.pending_cursors)
+        self.assertIn("down", self.job.error_log[-1]["error"])
+
+        self.queue.clear()
+        self._resume()
+        self._drain()
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, "COMPLETED")
+        self.assertEqual(self.job.processed_items, 7)
+
+    def test_only_failed_or_cancelled_jobs_can_be_resumed(self):
+        """Test that resuming a running job doesn't start a second coordinator"""
+        run_migration_job(str(self.job.id))
+        self.queue.clear()
+
+        with patch.object(run_migration_job, "delay") as delay:
+            response = self._resume()
+
+        self.assertEqual(response.status_code, 400)
+        delay.assert_not_called()
 
-# Create your tests here.
+    def _resume(self):
+        tenant = Tenant.objects.create(
+            name="Pager Tenant", identifier="pager-tenant", created_by=self.user
+        )
+        MigrationJob.objects.filter(pk=self.job.pk).update(tenant=tenant)
+        request = APIRequestFactory().post(f"/jobs/{self.job.pk}/resume/")
+        force_authenticate(request, user=self.user)
+        request.tenant = tenant
+        with self.captureOnCommitCallbacks(execute=True):
+            return MigrationJobViewSet.as_view({"post": "resume"})(
+                request, pk=str(self.job.pk)
+            )
@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -41,6 +42,24 @@ class MigrationJobViewSet(viewsets.ReadOnlyModelViewSet):
             return Response({"status": "cancelled"})
         return Response({"error": "Job is already finished"}, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=True, methods=['post'])
+    def resume(self, request, pk=None):
+        """Continue a failed or cancelled job from its last source checkpoint."""
+        job = self.get_object()
+        with transaction.atomic():
+            # Locked so two resumes can't both start a coordinator
+            job = MigrationJob.objects.select_for_update().get(pk=job.pk)
+            if job.status not in ["FAILED", "CANCELLED"]:
+                return Response(
+                    {"error": "Only failed or cancelled jobs can be resumed"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            job.status = "PENDING"
+            job.completed_at = None
+            job.save(update_fields=["status", "completed_at"])
+            transaction.on_commit(lambda: run_migration_job.delay(str(job.id)))
+        return Response({"status": "resumed"})
+
 
 class MigrationTaskViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = MigrationTaskSerializer
@@ -1,14 +1,79 @@
 """
 Tenant Context Middleware
 
-Extracts tenant from request and sets PostgreSQL session variable for RLS policies.
+Extracts tenant from request and scopes its database queries for RLS policies.
 Also adds tenant object to request for use in views.
 """
 
+import copy
+import threading
+import time
+import uuid
+
 from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpResponseForbidden
 from core.models import Tenant
-from core.rls import set_tenant_context, clear_tenant_context
+from core.rls import tenant_context
+
+DEFAULT_TENANT_CACHE_TTL = 60
+DEFAULT_TENANT_CACHE_CHECK_INTERVAL = 5
+TENANT_CACHE_GENERATION_KEY = "tenant_cache_generation"
+
+_tenant_cache = {}
+_tenant_cache_lock = threading.Lock()
+_tenant_cache_state = {"generation": None, "checked_at": 0.0}
+
+
+def _sync_tenant_cache(now):
+    """Drop the memo if another process changed a tenant since the last check."""
+    interval = getattr(
+        settings, "TENANT_CACHE_CHECK_INTERVAL", DEFAULT_TENANT_CACHE_CHECK_INTERVAL
+    )
+    if now - _tenant_cache_state["checked_at"] < interval:
+        return
+    generation = cache.get(TENANT_CACHE_GENERATION_KEY)
+    with _tenant_cache_lock:
+        if generation != _tenant_cache_state["generation"]:
+            _tenant_cache.clear()
+            _tenant_cache_state["generation"] = generation
+        _tenant_cache_state["checked_at"] = now
+
+
+def get_cached_tenant(key, loader):
+    """
+    Resolve a tenant through the in-process memo.
+
+    Resolutions (including misses) are kept for TENANT_CACHE_TTL seconds.
+    A tenant change clears the memo at once in the saving process and, via a
+    generation in the shared cache checked at most every
+    TENANT_CACHE_CHECK_INTERVAL seconds, in every other one. Callers get their
+    own copy, so per-request changes never leak into the memo.
+
+    Args:
+        key: Hashable description of the lookup
+        loader: Callable returning a Tenant or None on a cache miss
+    """
+    now = time.monotonic()
+    _sync_tenant_cache(now)
+    entry = _tenant_cache.get(key)
+    if entry is None or entry[0] <= now:
+        tenant = loader()
+        ttl = getattr(settings, "TENANT_CACHE_TTL", DEFAULT_TENANT_CACHE_TTL)
+        with _tenant_cache_lock:
+            _tenant_cache[key] = (now + ttl, tenant)
+    else:
+        tenant = entry[1]
+    return copy.copy(tenant) if tenant is not None else None
+
+
+def clear_tenant_cache():
+    """Forget cached tenant resolutions in this and all other processes."""
+    generation = uuid.uuid4().hex
+    cache.set(TENANT_CACHE_GENERATION_KEY, generation, None)
+    with _tenant_cache_lock:
+        _tenant_cache.clear()
+        _tenant_cache_state["generation"] = generation
 
 
 class TenantContextMiddleware:
@@ -19,6 +84,10 @@ class TenantContextMiddleware:
     1. X-Tenant-ID header (for API requests, theme-sync, etc.)
     2. User's tenant association (if users are linked to tenants in future)
     3. Fallback: DEFAULT_TENANT_ID (dev) or 403 error (prod)
+
+    Resolved tenants are memoized per process, and the RLS variable is only
+    sent, along with the first query, when the connection carries another
+    tenant, so a request for a known tenant costs no extra round trips.
     """
     
     def __init__(self, get_response):
@@ -29,40 +98,34 @@ class TenantContextMiddleware:
     def __call__(self, request):
         if any(request.path.startswith(p) for p in self.EXEMPT_PATHS):
             request.tenant = None
-            return self.get_response(request)
+            with tenant_context(None):
+                return self.get_response(request)
 
         tenant = self.get_tenant(request)
 
         if tenant is None:
-            default_tenant_id = getattr(settings, 'DEFAULT_TENANT_ID', None)
-            if default_tenant_id:
-                try:
-                    tenant = Tenant.objects.get(id=default_tenant_id)
-                except Tenant.DoesNotExist:
-                    tenant = Tenant.objects.filter(is_active=True).first()
-            else:
-                tenant = Tenant.objects.filter(is_active=True).first()
+            tenant = get_cached_tenant(("default",), self.get_default_tenant)
 
             if tenant is None and getattr(settings, 'REQUIRE_TENANT', not settings.DEBUG):
                 return HttpResponseForbidden(
                     "No active tenant found. Create a tenant or configure DEFAULT_TENANT_ID."
                 )
-        
-        # Set tenant context for RLS
-        if tenant:
-            set_tenant_context(tenant.id)
-            request.tenant = tenant
-        else:
-            # No tenant available - clear context
-            clear_tenant_context()
-            request.tenant = None
-        
-        response = self.get_response(request)
-        
-        # Clear tenant context after request
-        clear_tenant_context()
-        
-        return response
+
+        request.tenant = tenant
+
+        # Scope every query made while handling the request to the tenant
+        with tenant_context(tenant.id if tenant else None):
+            return self.get_response(request)
+
+    def get_default_tenant(self):
+        """Return DEFAULT_TENANT_ID's tenant, falling back to the first active one."""
+        default_tenant_id = getattr(settings, 'DEFAULT_TENANT_ID', None)
+        if default_tenant_id:
+            try:
+                return Tenant.objects.get(id=default_tenant_id)
+            except Tenant.DoesNotExist:
+                pass
+        return Tenant.objects.filter(is_active=True).first()
     
     def get_tenant(self, request):
         """
@@ -76,19 +139,12 @@ class TenantContextMiddleware:
         # 1. Check X-Tenant-ID header
         tenant_id_header = request.headers.get('X-Tenant-ID')
         if tenant_id_header:
-            try:
-                # Try by UUID ID first
-                import uuid
-                tenant_uuid = uuid.UUID(tenant_id_header)
-                tenant = Tenant.objects.get(id=tenant_uuid, is_active=True)
+            tenant = get_cached_tenant(
+                ("header", tenant_id_header),
+                lambda: self.get_tenant_by_header(tenant_id_header),
+            )
+            if tenant is not None:
                 return tenant
-            except (ValueError, Tenant.DoesNotExist):
-                # Try by identifier
-                try:
-                    tenant = Tenant.objects.get(identifier=tenant_id_header, is_active=True)
-                    return tenant
-                except Tenant.DoesNotExist:
-                    pass
         
         # 2. Check user's tenant association (future - when user-tenant model exists)
         # if request.user.is_authenticated:
@@ -99,3 +155,14 @@ class TenantContextMiddleware:
         # 3. No tenant found
         return None
 
+    def get_tenant_by_header(self, value):
+        """Look up an active tenant by UUID, then by identifier."""
+        try:
+            # Try by UUID ID first
+            return Tenant.objects.get(id=uuid.UUID(value), is_active=True)
+        except (ValueError, Tenant.DoesNotExist):
+            # Try by identifier
+            try:
+                return Tenant.objects.get(identifier=value, is_active=True)
+            except Tenant.DoesNotExist:
+                return None
@@ -5,6 +5,9 @@ These functions manage PostgreSQL session variables to set tenant context
 for RLS policies.
 """
 
+import uuid
+from contextlib import contextmanager
+
 from django.db import connection
 
 
@@ -57,3 +60,82 @@ def clear_tenant_context():
     with connection.cursor() as cursor:
         cursor.execute("RESET app.current_tenant_id")
 
+
+
+class TenantContextWrapper:
+    """
+    Database execute wrapper that scopes a connection's statements to a tenant.
+
+    Each connection remembers the tenant last applied to it, so the RLS
+    variable is only sent when it changes: on the first statement of a new
+    connection, when a request for another tenant (or for none) reuses the
+    connection, or after the transaction it was set in has ended, since a
+    rollback reverts it. ``set_config`` then rides along as a prefix of that
+    statement, so a request whose tenant is already set costs no extra
+    round trip. Server-side cursors, executemany and ``SET TRANSACTION``
+    cannot carry a prefix and get a separate statement instead.
+    """
+
+    def __init__(self, tenant_id):
+        # Empty string clears the variable for requests without a tenant
+        self.tenant_id = str(uuid.UUID(str(tenant_id))) if tenant_id else ""
+
+    @staticmethod
+    def _is_current(db, tenant_id: str) -> bool:
+        applied = getattr(db, "_rls_tenant", None)
+        if applied is None or applied[0] is not db.connection:
+            # New connection: nothing set yet, which is right for no tenant
+            return not tenant_id
+        _, applied_tenant, savepoints = applied
+        if applied_tenant != tenant_id:
+            return False
+        if savepoints is None:
+            return True
+        # Set inside a transaction: valid while that transaction (and the
+        # savepoint it was set in) is still open
+        return db.in_atomic_block and db.savepoint_ids[: len(savepoints)] == savepoints
+
+    def __call__(self, execute, sql, params, many, context):
+        db = context["connection"]
+        if db.vendor != "postgresql" or self._is_current(db, self.tenant_id):
+            return execute(sql, params, many, context)
+
+        # Only the innermost tenant context applies its tenant
+        for wrapper in reversed(db.execute_wrappers):
+            if isinstance(wrapper, TenantContextWrapper):
+                if wrapper is not self:
+                    return execute(sql, params, many, context)
+                break
+
+        db._rls_tenant = (
+            db.connection,
+            self.tenant_id,
+            list(db.savepoint_ids) if db.in_atomic_block else None,
+        )
+        set_config = f"SELECT set_config('app.current_tenant_id', '{self.tenant_id}', false)"
+        if (
+            many
+            or getattr(context["cursor"].cursor, "name", None)
+            or sql.lstrip()[:15].upper() == "SET TRANSACTION"
+        ):
+            with db.connection.cursor() as raw_cursor:
+                raw_cursor.execute(set_config)
+            return execute(sql, params, many, context)
+        # Validated UUID text is safe to inline and keeps params untouched
+        return execute(f"{set_config}; {sql}", params, many, context)
+
+
+@contextmanager
+def tenant_context(tenant_id):
+    """
+    Scope all queries on the default connection to a tenant.
+
+    Nothing is sent to the database until the first query, and the variable
+    is left set afterwards: the next context on the connection replaces it
+    only if its tenant differs.
+
+    Args:
+        tenant_id: UUID of the tenant, or None for no tenant context
+    """
+    with connection.execute_wrapper(TenantContextWrapper(tenant_id)):
+        yield
@@ -0,0 +1,17 @@
+"""
+Keep cached tenant resolutions in sync with the Tenant table.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .middleware import clear_tenant_cache
+from .models import Tenant
+
+
+@receiver([post_save, post_delete], sender=Tenant)
+def invalidate_tenant_cache(sender, **kwargs):
+    # Again on commit: another process may cache the old row until then
+    clear_tenant_cache()
+    transaction.on_commit(clear_tenant_cache)
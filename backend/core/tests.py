@@ -1,3 +1,119 @@
-from django.test import TestCase
+from unittest.mock import MagicMock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from .middleware import (
+    TENANT_CACHE_GENERATION_KEY,
+    TenantContextMiddleware,
+    clear_tenant_cache,
+    get_cached_tenant,
+)
+from .models import Tenant
+from .rls import tenant_context
+
+
+def _current_tenant_setting():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT current_setting('app.current_tenant_id', true)")
+        return cursor.fetchone()[0]
+
+
+class TenantContextMiddlewareTest(TestCase):
+    """Test cached tenant resolution and per-query RLS context"""
+
+    def setUp(self):
+        clear_tenant_cache()
+        self.addCleanup(clear_tenant_cache)
+        user = User.objects.create_user(username="tenant_owner", password="testpass")
+        self.tenant = Tenant.objects.create(
+            name="Cached Tenant", identifier="cached-tenant", created_by=user
+        )
+        self.factory = RequestFactory()
+        self.sent = []
+        self.middleware = TenantContextMiddleware(self._view)
+
+    def _record(self, execute, sql, params, many, context):
+        self.sent.append(sql)
+        return execute(sql, params, many, context)
+
+    def _view(self, request):
+        with connection.execute_wrapper(self._record):
+            return HttpResponse(_current_tenant_setting())
+
+    def _get(self, path="/"):
+        return self.middleware(self.factory.get(path, HTTP_X_TENANT_ID="cached-tenant"))
+
+    def test_known_tenant_costs_no_extra_round_trips(self):
+        """Test that a cached tenant already set on the connection adds nothing"""
+        response = self._get()
+        self.assertEqual(response.content.decode(), str(self.tenant.id))
+        self.assertIn("set_config", self.sent[0])
+
+        self.sent.clear()
+        with self.assertNumQueries(1):
+            response = self._get()
+
+        self.assertEqual(response.content.decode(), str(self.tenant.id))
+        self.assertNotIn("set_config", self.sent[0])
+
+    def test_request_without_tenant_clears_variable(self):
+        """Test that a connection reused without a tenant does not keep the last one"""
+        self._get()
+
+        response = self._get("/health/")
+
+        self.assertEqual(response.content.decode(), "")
+
+    def test_set_transaction_is_not_prefixed(self):
+        """Test that statements which must come first are sent unchanged"""
+        with tenant_context(self.tenant.id):
+            with connection.execute_wrapper(self._record):
+                with connection.cursor() as cursor:
+                    cursor.execute("SET TRANSACTION ISOLATION LEVEL READ COMMITTED")
+            self.assertEqual(_current_tenant_setting(), str(self.tenant.id))
+
+        self.assertEqual(self.sent, ["SET TRANSACTION ISOLATION LEVEL READ COMMITTED"])
+
+    def test_other_process_change_reaches_memo(self):
+        """Test that the memo follows tenant changes made by other processes"""
+        loader = MagicMock(return_value=self.tenant)
+        get_cached_tenant(("probe",), loader)
+        get_cached_tenant(("probe",), loader)
+        self.assertEqual(loader.call_count, 1)
+
+        cache.set(TENANT_CACHE_GENERATION_KEY, "changed-elsewhere", None)
+        with override_settings(TENANT_CACHE_CHECK_INTERVAL=0):
+            get_cached_tenant(("probe",), loader)
+
+        self.assertEqual(loader.call_count, 2)
+
+    def test_nested_context_restores_outer_tenant(self):
+        """Test that leaving an inner tenant context re-applies the outer tenant"""
+        other = Tenant.objects.create(
+            name="Other Tenant", identifier="other-tenant", created_by=self.tenant.created_by
+        )
+        with tenant_context(self.tenant.id):
+            with tenant_context(other.id):
+                self.assertEqual(_current_tenant_setting(), str(other.id))
+            self.assertEqual(_current_tenant_setting(), str(self.tenant.id))
+
+    def test_tenant_change_clears_cache(self):
+        """Test that saving a tenant forces the next request to resolve it again"""
+        self._get()
+        self.tenant.is_active = False
+        self.tenant.save()
+
+        request = self.factory.get("/", HTTP_X_TENANT_ID="cached-tenant")
+        self.assertIsNone(self.middleware.get_tenant(request))
+
+    def test_server_side_cursor_sees_tenant(self):
+        """Test that iterator() querysets run with the tenant context applied"""
+        with tenant_context(self.tenant.id):
+            identifiers = [t.identifier for t in Tenant.objects.all().iterator(chunk_size=10)]
+            self.assertEqual(_current_tenant_setting(), str(self.tenant.id))
+
+        self.assertIn("cached-tenant", identifiers)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class DataConnectionsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "data_connections"
+
+    def ready(self):
+        import data_connections.signals  # noqa: F401
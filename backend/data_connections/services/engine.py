@@ -1,18 +1,110 @@
+import hashlib
 import json
+import logging
+import math
+import threading
 import requests
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
-from django.db.models import Q
-from object_storage.models import ObjectInstance, ObjectTypeDefinition
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Exists, F, JSONField, OuterRef, Q, Subquery
+from object_storage.models import ObjectInstance, ObjectTypeDefinition, ObjectVersion
 from webpages.models.web_page import WebPage
 from content.models import Tag
 from file_manager.models import MediaFile
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_REST_PAGE_CONCURRENCY = 4
+DEFAULT_REST_RETRIES = 3
+DEFAULT_REST_BACKOFF = 0.5  # Seconds, doubled on each retry
+DEFAULT_VALIDATOR_TIMEOUT = 24 * 3600
+ROW_CHUNK_SIZE = 500
+
+_rest_sessions: Dict[str, requests.Session] = {}
+_rest_sessions_lock = threading.Lock()
+
+
+@dataclass
+class SourcePage:
+    """One page of source items and the cursor of the page after it."""
+
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[Dict[str, Any]] = None
+
+    @property
+    def is_last(self) -> bool:
+        return self.next_cursor is None
+
+
 class BaseQueryEngine(ABC):
     @abstractmethod
     def execute(self, query_dsl: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
         pass
 
+    def initial_cursor(self, query_dsl: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Cursor of the first page. Cursors are small JSON-serialisable dicts."""
+        return {"offset": 0}
+
+    def advance_cursor(self, cursor: Dict[str, Any], page_size: int) -> Dict[str, Any]:
+        """Cursor of the page following ``cursor`` without fetching it."""
+        return {"offset": cursor.get("offset", 0) + page_size}
+
+    def fetch_page(
+        self, query_dsl: str, config: Dict[str, Any], cursor: Dict[str, Any], page_size: int
+    ) -> SourcePage:
+        """
+        Fetch a single page of source items.
+
+        Engines without native paging fall back to slicing ``execute``.
+        """
+        offset = cursor.get("offset", 0)
+        results = self.execute(query_dsl, config)
+        if not isinstance(results, list):
+            results = [results] if results else []
+        items = results[offset:offset + page_size]
+        has_more = offset + page_size < len(results)
+        return SourcePage(items, self.advance_cursor(cursor, page_size) if has_more else None)
+
+
+def _published_versions(now):
+    """Versions of the outer ObjectInstance that are published at ``now``."""
+    return ObjectVersion.objects.filter(
+        object_instance=OuterRef('pk'), effective_date__lte=now
+    ).filter(Q(expiry_date__isnull=True) | Q(expiry_date__gt=now))
+
+
+def _published_version_column(now, column: str) -> Subquery:
+    """Column of the current published version, as used by get_current_published_version."""
+    return Subquery(
+        _published_versions(now).order_by('-version_number').values(column)[:1],
+        output_field=JSONField(),
+    )
+
+
+def _is_plain_column(model, name: str) -> bool:
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return field.concrete and not field.is_relation
+
+
+def _is_relation(model, name: str) -> bool:
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return field.is_relation and field.concrete and not field.many_to_many
+
+
 class InternalQueryEngine(BaseQueryEngine):
     """
     Query engine for internal system data.
@@ -36,6 +128,7 @@ class InternalQueryEngine(BaseQueryEngine):
         model_name = query.get('model', 'ObjectInstance')
         filters = query.get('filters', {})
         limit = query.get('limit', 100)
+        offset = query.get('offset', 0)
         order_by = query.get('order_by', '-id')
         version = query.get('version', 'latest')
         fields = query.get('fields', [])
@@ -52,56 +145,46 @@ class InternalQueryEngine(BaseQueryEngine):
                 processed_filters[k] = v
 
         if model_name == 'ObjectInstance':
+            from django.utils import timezone
+            now = timezone.now()
             if version == 'published':
-                from django.utils import timezone
-                now = timezone.now()
                 queryset = ObjectInstance.published.published_only(now)
             else:
                 queryset = ObjectInstance.objects.all()
-            
-            # For ObjectInstance, 'data' and 'widgets' are properties from the version
-            # If these are requested, we must fetch objects and extract them
-            has_properties = any(f in ['data', 'widgets'] for f in fields)
-            
+
             queryset = queryset.filter(**processed_filters)
             if order_by:
                 queryset = queryset.order_by(order_by)
-            
-            results = queryset[:limit]
-            
+
+            # 'data' and 'widgets' are properties backed by a version row, so
+            # they are projected from a join (latest) or a subquery (published)
+            if version == 'published':
+                queryset = queryset.annotate(
+                    published_data=_published_version_column(now, 'data'),
+                    published_widgets=_published_version_column(now, 'widgets'),
+                )
+                content_columns = {'data': 'published_data', 'widgets': 'published_widgets'}
+            else:
+                content_columns = {'data': 'current_version__data', 'widgets': 'current_version__widgets'}
+
+            if fields:
+                return self._select_fields(
+                    ObjectInstance, queryset[offset:offset + limit], fields, content_columns
+                )
+
+            # Full serialization with related rows and publication state joined
+            queryset = queryset.select_related(
+                'object_type', 'created_by', 'current_version'
+            ).prefetch_related('object_type__allowed_child_types').annotate(
+                has_published_version=Exists(_published_versions(now))
+            )
             output = []
-            for obj in results:
-                # If specific fields are requested, construct a dict
-                if fields:
-                    item = {}
-                    for f in fields:
-                        if hasattr(obj, f):
-                            val = getattr(obj, f)
-                            # Handle version properties
-                            if f in ['data', 'widgets'] and version == 'published':
-                                pub_version = obj.get_current_published_version()
-                                val = getattr(pub_version, f) if pub_version else {}
-                            
-                            # Simple serialization
-                            if hasattr(val, 'to_dict'):
-                                item[f] = val.to_dict()
-                            else:
-                                item[f] = val
-                        else:
-                            item[f] = None
-                    # Always include ID
-                    if 'id' not in item:
-                        item['id'] = obj.id
-                    output.append(item)
-                else:
-                    # Full serialization
-                    data_dict = obj.to_dict()
-                    if version == 'published':
-                        pub_version = obj.get_current_published_version()
-                        if pub_version:
-                            data_dict['data'] = pub_version.data
-                            data_dict['widgets'] = pub_version.widgets
-                    output.append(data_dict)
+            for obj in queryset[offset:offset + limit].iterator(chunk_size=ROW_CHUNK_SIZE):
+                data_dict = obj.to_dict()
+                if version == 'published':
+                    data_dict['data'] = obj.published_data or {}
+                    data_dict['widgets'] = obj.published_widgets or {}
+                output.append(data_dict)
             return output
 
         elif model_name == 'WebPage':
@@ -111,40 +194,32 @@ class InternalQueryEngine(BaseQueryEngine):
             
             if order_by:
                 queryset = queryset.order_by(order_by)
-            
-            results = queryset[:limit]
-            output = []
-            for obj in results:
-                v = obj.current_published_version if version == 'published' else obj.latest_version
-                
-                if fields:
-                    item = {}
-                    for f in fields:
-                        if f == 'content': # Map content to version data
-                            item[f] = v.page_data if v else {}
-                        elif hasattr(obj, f):
-                            val = getattr(obj, f)
-                            item[f] = val.to_dict() if hasattr(val, 'to_dict') else val
-                        else:
-                            item[f] = None
-                    if 'id' not in item:
-                        item['id'] = obj.id
-                    output.append(item)
-                else:
-                    # Default serialization
-                    item = {
-                        'id': obj.id,
-                        'title': obj.title,
-                        'slug': obj.slug,
-                        'path': obj.cached_path,
-                        'hostnames': obj.hostnames,
-                        'content': v.page_data if v else {},
-                        'is_published': obj.is_currently_published,
-                        'created_at': obj.created_at,
-                        'updated_at': obj.updated_at
-                    }
-                    output.append(item)
-            return output
+
+            version_field = (
+                'current_published_version' if version == 'published' else 'latest_version'
+            )
+            content_columns = {'content': f'{version_field}__page_data'}
+            queryset = queryset[offset:offset + limit]
+
+            if fields:
+                return self._select_fields(WebPage, queryset, fields, content_columns)
+
+            # Default serialization
+            return self._project(
+                queryset,
+                {
+                    'id': 'id',
+                    'title': 'title',
+                    'slug': 'slug',
+                    'path': 'cached_path',
+                    'hostnames': 'hostnames',
+                    'content': f'{version_field}__page_data',
+                    'is_published': 'is_currently_published',
+                    'created_at': 'created_at',
+                    'updated_at': 'updated_at',
+                },
+                json_columns={'content'},
+            )
 
         elif model_name == 'Tag':
             queryset = Tag.objects.filter(**processed_filters)
@@ -162,9 +237,9 @@ class InternalQueryEngine(BaseQueryEngine):
         if fields:
             if 'id' not in fields:
                 fields.append('id')
-            return list(queryset.values(*fields)[:limit])
+            return list(queryset.values(*fields)[offset:offset + limit])
         
-        results = queryset[:limit]
+        results = queryset[offset:offset + limit]
         output = []
         for obj in results:
             if hasattr(obj, 'to_dict'):
@@ -176,13 +251,159 @@ class InternalQueryEngine(BaseQueryEngine):
                 output.append(item)
         return output
 
+    def _project(self, queryset, columns: Dict[str, str], json_columns=()) -> List[Dict[str, Any]]:
+        """
+        Read rows as a ``values()`` projection and rename the columns.
+
+        Args:
+            queryset: Sliced queryset to read
+            columns: Mapping of output key to ``values()`` lookup
+            json_columns: Output keys whose missing values default to {}
+        """
+        lookups = list(dict.fromkeys(columns.values()))
+        output = []
+        for row in queryset.values(*lookups).iterator(chunk_size=ROW_CHUNK_SIZE):
+            item = {name: row[lookup] for name, lookup in columns.items()}
+            for name in json_columns:
+                if item.get(name) is None:
+                    item[name] = {}
+            output.append(item)
+        return output
+
+    def _select_fields(self, model, queryset, fields: List[str], content_columns: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Return the requested fields of each row, always including 'id'.
+
+        Plain columns and version content are projected in one query. Other
+        attributes (relations, properties) need model instances, which are
+        loaded with their relations joined and version content annotated.
+        """
+        columns = {}
+        for f in fields:
+            if f in content_columns:
+                columns[f] = content_columns[f]
+            elif _is_plain_column(model, f):
+                columns[f] = f
+            else:
+                columns = None
+                break
+
+        if columns is not None:
+            columns.setdefault('id', 'id')
+            return self._project(queryset, columns, json_columns=set(content_columns) & set(fields))
+
+        relations = [f for f in fields if _is_relation(model, f)]
+        content_lookups = {}
+        for f, lookup in content_columns.items():
+            if f in fields:
+                queryset = queryset.annotate(**{f'_projected_{f}': F(lookup)})
+                content_lookups[f] = f'_projected_{f}'
+
+        output = []
+        for obj in queryset.select_related(*relations).iterator(chunk_size=ROW_CHUNK_SIZE):
+            item = {}
+            for f in fields:
+                if f in content_lookups:
+                    val = getattr(obj, content_lookups[f])
+                    item[f] = val if val is not None else {}
+                elif hasattr(obj, f):
+                    val = getattr(obj, f)
+                    item[f] = val.to_dict() if hasattr(val, 'to_dict') else val
+                else:
+                    item[f] = None
+            if 'id' not in item:
+                item['id'] = obj.id
+            output.append(item)
+        return output
+
+    def fetch_page(
+        self, query_dsl: str, config: Dict[str, Any], cursor: Dict[str, Any], page_size: int
+    ) -> SourcePage:
+        """Fetch one page with an offset cursor, honouring the query's total limit."""
+        try:
+            query = json.loads(query_dsl)
+        except json.JSONDecodeError:
+            return SourcePage([])
+
+        total_limit = query.get('limit', 100)
+        offset = cursor.get('offset', 0)
+        page_limit = min(page_size, total_limit - offset)
+        if page_limit <= 0:
+            return SourcePage([])
+
+        page_query = dict(query, offset=offset, limit=page_limit)
+        items = self.execute(json.dumps(page_query), config)
+        has_more = len(items) == page_limit and offset + page_limit < total_limit
+        return SourcePage(items, {'offset': offset + page_limit} if has_more else None)
+
+
+def get_rest_session(
+    base_url: str, pool_size: int = DEFAULT_REST_PAGE_CONCURRENCY
+) -> requests.Session:
+    """
+    Return the pooled session for a REST connection.
+
+    Sessions are shared per scheme, host and pool size so repeated stream
+    refreshes reuse keep-alive connections, and a connection fetching N
+    pages at once gets a pool of N. Idempotent requests are retried with
+    exponential backoff on connection errors and 429/5xx responses.
+
+    Args:
+        base_url: URL of the request; only the scheme and host are used
+        pool_size: Connections kept open per host, normally the paging
+            concurrency of the data connection
+    """
+    parsed = urlparse(base_url)
+    pool_size = max(1, pool_size)
+    key = f"{parsed.scheme}://{parsed.netloc}#{pool_size}"
+    session = _rest_sessions.get(key)
+    if session is None:
+        with _rest_sessions_lock:
+            session = _rest_sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                retry = Retry(
+                    total=getattr(settings, 'DATA_CONNECTION_REST_RETRIES', DEFAULT_REST_RETRIES),
+                    backoff_factor=getattr(settings, 'DATA_CONNECTION_REST_BACKOFF', DEFAULT_REST_BACKOFF),
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(['GET']),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_maxsize=pool_size, max_retries=retry
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _rest_sessions[key] = session
+    return session
+
+
+def get_validator_cache_key(url: str, params: Dict[str, Any], headers: Dict[str, Any]) -> str:
+    """Return the cache key holding the ETag/Last-Modified and body of a request."""
+    request_id = json.dumps([url, params, headers], sort_keys=True, default=str)
+    return f"rest_validator_{hashlib.sha256(request_id.encode('utf-8')).hexdigest()}"
+
+
+@dataclass
+class _RestPage:
+    """Parsed response for one REST page."""
+
+    items: List[Dict[str, Any]]
+    has_more: bool
+    total_pages: Optional[int] = None
+
+
 class ExternalRestEngine(BaseQueryEngine):
     """
     Query engine for external REST APIs with paging support and authentication.
+
+    Requests go through a pooled session per host and are conditional:
+    validators from earlier responses are sent back and a 304 reuses the
+    stored body. When the first page reports a total, the remaining pages
+    are fetched concurrently.
     """
-    def execute(self, query_dsl: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
-        base_url = config.get('base_url') or config.get('baseUrl', '')
-        endpoint = query_dsl
+    def _build_request(self, config: Dict[str, Any]):
+        """Return headers, params and auth for a request from the connection config."""
         headers = (config.get('headers') or {}).copy()
         params = (config.get('params') or {}).copy()
         
@@ -199,59 +420,209 @@ class ExternalRestEngine(BaseQueryEngine):
         elif auth_type == 'apiKey':
             header_name = config.get('apiKeyHeader', 'X-API-KEY')
             headers[header_name] = config.get('apiKeyValue', '')
-        
-        paging_config = config.get('paging', {})
+        return headers, params, auth
+
+    def _apply_paging(self, params: Dict[str, Any], paging_config: Dict[str, Any], page: int):
         paging_type = paging_config.get('type')
+        if paging_type == 'page':
+            params[paging_config.get('pageParam', 'page')] = page
+        elif paging_type == 'limit_offset':
+            page_size = paging_config.get('pageSize', 20)
+            params[paging_config.get('limitParam', 'limit')] = page_size
+            params[paging_config.get('offsetParam', 'offset')] = (page - 1) * page_size
+
+    def _get_json(
+        self, url: str, headers: Dict[str, Any], params: Dict[str, Any], auth, pool_size: int
+    ) -> Any:
+        """GET a JSON body, revalidating any stored copy with the server."""
+        cache_key = get_validator_cache_key(url, params, headers)
+        stored = cache.get(cache_key)
+
+        request_headers = dict(headers)
+        if stored:
+            if stored.get('etag'):
+                request_headers['If-None-Match'] = stored['etag']
+            if stored.get('last_modified'):
+                request_headers['If-Modified-Since'] = stored['last_modified']
+
+        response = get_rest_session(url, pool_size).get(
+            url, headers=request_headers, params=params, auth=auth, timeout=10
+        )
+        if stored and response.status_code == 304:
+            return stored['data']
+
+        response.raise_for_status()
+        data = response.json()
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            cache.set(
+                cache_key,
+                {'etag': etag, 'last_modified': last_modified, 'data': data},
+                getattr(settings, 'DATA_CONNECTION_VALIDATOR_TIMEOUT', DEFAULT_VALIDATOR_TIMEOUT),
+            )
+        return data
+
+    def _request_page(self, query_dsl: str, config: Dict[str, Any], page: int) -> _RestPage:
+        """Request and parse a single source page."""
+        base_url = config.get('base_url') or config.get('baseUrl', '')
+        headers, params, auth = self._build_request(config)
+        paging_config = config.get('paging', {})
+        self._apply_paging(params, paging_config, page)
+
+        url = f"{base_url.rstrip('/')}/{query_dsl.lstrip('/')}"
+        data = self._get_json(url, headers, params, auth, self._page_concurrency(config))
         
-        all_results = []
-        max_pages = paging_config.get('maxPages', paging_config.get('max_pages', 1))
-        
-        current_page = 1
-        while current_page <= max_pages:
-            if paging_type == 'page':
-                params[paging_config.get('pageParam', 'page')] = current_page
-            elif paging_type == 'limit_offset':
-                page_size = paging_config.get('pageSize', 20)
-                params[paging_config.get('limitParam', 'limit')] = page_size
-                params[paging_config.get('offsetParam', 'offset')] = (current_page - 1) * page_size
-            
-            url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-            
-            try:
-                response = requests.get(url, headers=headers, params=params, auth=auth, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-                
-                page_results = []
-                if isinstance(data, list):
-                    page_results = data
-                elif isinstance(data, dict):
-                    found = False
-                    for key in ['results', 'items', 'data']:
-                        if key in data and isinstance(data[key], list):
-                            page_results = data[key]
-                            found = True
-                            break
-                    if not found:
-                        page_results = [data]
-                
-                if not page_results:
+        page_results = []
+        if isinstance(data, list):
+            page_results = data
+        elif isinstance(data, dict):
+            found = False
+            for key in ['results', 'items', 'data']:
+                if key in data and isinstance(data[key], list):
+                    page_results = data[key]
+                    found = True
                     break
-                    
-                all_results.extend(page_results)
-                
-                # Check if we have more pages
-                if paging_type == 'page' and isinstance(data, dict):
-                    if 'next' in data and not data['next']:
-                        break
-                
-                current_page += 1
-            except Exception as e:
-                # Log error
+            if not found:
+                page_results = [data]
+
+        has_more = bool(page_results)
+        if paging_config.get('type') == 'page' and isinstance(data, dict):
+            if 'next' in data and not data['next']:
+                has_more = False
+        return _RestPage(page_results, has_more, self._total_pages(data, page_results, paging_config))
+
+    def _total_pages(self, data: Any, page_results: List, paging_config: Dict[str, Any]) -> Optional[int]:
+        """Page count reported by the API, either directly or from an item total."""
+        if not paging_config.get('type') or not isinstance(data, dict):
+            return None
+        for key in ['total_pages', 'totalPages', 'num_pages', 'pageCount']:
+            if isinstance(data.get(key), int):
+                return data[key]
+        page_size = (
+            paging_config.get('pageSize', 20)
+            if paging_config.get('type') == 'limit_offset'
+            else len(page_results)
+        )
+        for key in ['count', 'total', 'totalCount', 'total_count']:
+            if isinstance(data.get(key), int) and page_size:
+                return math.ceil(data[key] / page_size)
+        return None
+
+    def _max_pages(self, config: Dict[str, Any]) -> Optional[int]:
+        """
+        Configured page limit, or None to follow the API until its last page.
+
+        Without a paging type the API can't report its last page, so only
+        the first page is read unless a limit is configured.
+        """
+        paging_config = config.get('paging', {})
+        max_pages = paging_config.get('maxPages') or paging_config.get('max_pages')
+        if max_pages:
+            return max_pages
+        return None if self._paging_enabled(config) else 1
+
+    @staticmethod
+    def _page_concurrency(config: Dict[str, Any]) -> int:
+        """Pages fetched at the same time, which also sizes the session's pool."""
+        return config.get('paging', {}).get('concurrency', DEFAULT_REST_PAGE_CONCURRENCY)
+
+    @staticmethod
+    def _paging_enabled(config: Dict[str, Any]) -> bool:
+        return config.get('paging', {}).get('type') not in (None, '', 'none')
+
+    def execute(self, query_dsl: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        max_pages = self._max_pages(config)
+        try:
+            first = self._request_page(query_dsl, config, 1)
+        except Exception:
+            logger.warning("REST query %s failed", query_dsl, exc_info=True)
+            return []
+
+        all_results = list(first.items)
+        if not first.has_more or (max_pages is not None and max_pages <= 1):
+            return all_results
+
+        if first.total_pages:
+            last_page = first.total_pages
+            if max_pages is not None:
+                last_page = min(max_pages, last_page)
+            pages = range(2, last_page + 1)
+            all_results.extend(self._fetch_pages_concurrently(query_dsl, config, pages))
+            return all_results
+
+        # Page count unknown: walk pages until the API runs out
+        current_page = 2
+        while max_pages is None or current_page <= max_pages:
+            try:
+                page = self._request_page(query_dsl, config, current_page)
+            except Exception:
+                logger.warning(
+                    "REST query %s failed on page %s", query_dsl, current_page, exc_info=True
+                )
                 break
+
+            all_results.extend(page.items)
+            if not page.has_more:
+                break
+            current_page += 1
                 
         return all_results
 
+    def _fetch_pages_concurrently(
+        self, query_dsl: str, config: Dict[str, Any], pages: range
+    ) -> List[Dict[str, Any]]:
+        """Fetch known pages in parallel, keeping results in page order up to any failure."""
+        if not pages:
+            return []
+        concurrency = self._page_concurrency(config)
+        results = []
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(pages)))) as executor:
+            futures = [
+                executor.submit(self._request_page, query_dsl, config, page) for page in pages
+            ]
+            for page_number, future in zip(pages, futures):
+                try:
+                    page = future.result()
+                except Exception:
+                    logger.warning(
+                        "REST query %s failed on page %s", query_dsl, page_number, exc_info=True
+                    )
+                    break
+                results.extend(page.items)
+        return results
+
+    def initial_cursor(self, query_dsl: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        return {'page': 1}
+
+    def advance_cursor(self, cursor: Dict[str, Any], page_size: int) -> Dict[str, Any]:
+        return {'page': cursor.get('page', 1) + 1}
+
+    def fetch_page(
+        self, query_dsl: str, config: Dict[str, Any], cursor: Dict[str, Any], page_size: int
+    ) -> SourcePage:
+        """
+        Fetch one API page. The page size is set by the connection's paging
+        config, so ``page_size`` is ignored and request errors propagate to
+        the caller for retrying.
+        """
+        page = cursor.get('page', 1)
+        max_pages = self._max_pages(config)
+        if max_pages is not None and page > max_pages:
+            return SourcePage([])
+
+        result = self._request_page(query_dsl, config, page)
+        has_more = result.has_more and self._paging_enabled(config)
+        if result.total_pages is not None and page >= result.total_pages:
+            has_more = False
+        if max_pages is not None and page >= max_pages:
+            has_more = False
+        return SourcePage(
+            result.items, self.advance_cursor(cursor, page_size) if has_more else None
+        )
+
+
 class ExternalDatabaseEngine(BaseQueryEngine):
     """
     Query engine for external databases.
@@ -262,6 +633,7 @@ class ExternalDatabaseEngine(BaseQueryEngine):
         # Using config.get('host'), config.get('port'), config.get('username'), config.get('password'), config.get('databaseName')
         return []
 
+
 def get_engine(connection_type: str) -> BaseQueryEngine:
     if connection_type == 'INTERNAL':
         return InternalQueryEngine()
@@ -12,7 +12,25 @@ class DataConnectionManager:
         self.transformer_service = DataTransformerService()
         self.workflow_engine = WorkflowEngine()
 
-    def execute_stream(self, stream_id: int, bypass_cache: bool = False, query_params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    def execute_stream(
+        self,
+        stream_id: int,
+        bypass_cache: bool = False,
+        query_params: Dict[str, Any] = None,
+        refresh: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return stream data, serving cached results where possible.
+
+        Args:
+            stream_id: DataStream ID
+            bypass_cache: Neither read nor write the cache
+            query_params: Parameters that select a cached variant
+            refresh: Skip the cache read but store the fresh result
+
+        Returns:
+            List of stream items
+        """
         try:
             stream = DataStream.objects.select_related('connection', 'transformer').get(id=stream_id)
         except DataStream.DoesNotExist:
@@ -26,7 +44,8 @@ class DataConnectionManager:
             stream.cache_ttl,
             stream_id,
             bypass_cache,
-            query_params
+            query_params,
+            refresh,
         )
 
     def preview_stream(self, connection_id: int, stream_data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -66,12 +85,22 @@ class DataConnectionManager:
         cache_ttl, 
         stream_id=None, 
         bypass_cache=False, 
-        query_params=None
+        query_params=None,
+        refresh=False,
     ) -> List[Dict[str, Any]]:
-        # 1. Check Cache
+        # 1. Check Cache; stale data is served while a worker refreshes it.
+        # The key is resolved once, before the query runs, so a result fetched
+        # across an invalidation is stored under the old generation.
+        cache_key = None
         if not bypass_cache and stream_id:
-            cached_data = ConnectionCacheService.get(stream_id, query_params)
+            cache_key = ConnectionCacheService.get_cache_key(stream_id, query_params)
+        if cache_key and not refresh:
+            cached_data, is_stale = ConnectionCacheService.get_entry(
+                stream_id, query_params, cache_key
+            )
             if cached_data is not None:
+                if is_stale:
+                    ConnectionCacheService.schedule_refresh(stream_id, query_params, cache_key)
                 return cached_data
 
         # 2. Execute Query
@@ -91,8 +120,10 @@ class DataConnectionManager:
             transformed_data = processed_data
 
         # 5. Set Cache
-        if not bypass_cache and stream_id and cache_ttl > 0:
-            ConnectionCacheService.set(stream_id, transformed_data, cache_ttl, query_params)
+        if cache_key and cache_ttl > 0:
+            ConnectionCacheService.set(
+                stream_id, transformed_data, cache_ttl, query_params, cache_key
+            )
 
         return transformed_data
 
@@ -1,11 +1,15 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from django.conf import settings
 from django.core.cache import cache
+import hashlib
 import json
+import time
 
-import requests
-from bs4 import BeautifulSoup
 import uuid
 
+DEFAULT_STALE_TTL = 24 * 3600  # Serve expired stream data this long while refreshing
+REFRESH_LOCK_TIMEOUT = 300
+
 class DataTransformerService:
     """
     Handles data transformation based on a configuration.
@@ -30,6 +34,8 @@ class DataTransformerService:
         """
         Checks if file URLs exist.
         """
+        import requests
+
         for item in data:
             for field in fields:
                 url = self._get_nested_value(item, field)
@@ -47,6 +53,8 @@ class DataTransformerService:
         """
         Extracts images and links from HTML fields.
         """
+        from bs4 import BeautifulSoup
+
         for item in data:
             for field in fields:
                 html_content = self._get_nested_value(item, field)
@@ -168,27 +176,120 @@ class DataTransformerService:
 class ConnectionCacheService:
     """
     Handles caching for data streams.
+
+    Keys are deterministic digests of the query parameters, so every worker
+    process reads and writes the same entries. Each stream has a generation
+    counter that is part of its keys; bumping it invalidates all cached
+    parameter variants at once. Entries outlive their TTL by a stale window
+    during which they are still served while a background refresh runs.
+
+    Callers that execute a query should resolve the key with get_cache_key()
+    before running it and pass that key to set(), so a result fetched while
+    the stream was invalidated is stored under the old generation and never
+    served as current.
     """
+    @staticmethod
+    def get_generation_key(stream_id: int) -> str:
+        return f"data_stream_generation_{stream_id}"
+
+    @staticmethod
+    def get_generation(stream_id: int) -> int:
+        key = ConnectionCacheService.get_generation_key(stream_id)
+        generation = cache.get(key)
+        if generation is None:
+            cache.add(key, 1, None)
+            generation = cache.get(key, 1)
+        return generation
+
     @staticmethod
     def get_cache_key(stream_id: int, query_params: Dict[str, Any] = None) -> str:
-        params_str = json.dumps(query_params, sort_keys=True) if query_params else ""
-        return f"data_stream_{stream_id}_{hash(params_str)}"
+        params_str = json.dumps(query_params, sort_keys=True, default=str) if query_params else ""
+        digest = hashlib.sha256(params_str.encode("utf-8")).hexdigest()
+        generation = ConnectionCacheService.get_generation(stream_id)
+        return f"data_stream_{stream_id}_{generation}_{digest}"
+
+    @staticmethod
+    def get_refresh_lock_key(
+        stream_id: int, query_params: Dict[str, Any] = None, cache_key: str = None
+    ) -> str:
+        cache_key = cache_key or ConnectionCacheService.get_cache_key(stream_id, query_params)
+        return f"{cache_key}_refreshing"
+
+    @staticmethod
+    def get_entry(
+        stream_id: int, query_params: Dict[str, Any] = None, cache_key: str = None
+    ) -> Tuple[Optional[List[Dict[str, Any]]], bool]:
+        """
+        Return cached data and whether it is past its TTL.
+
+        Args:
+            cache_key: Key from get_cache_key(), resolved if omitted
+
+        Returns:
+            Tuple of (data or None on a miss, is_stale)
+        """
+        key = cache_key or ConnectionCacheService.get_cache_key(stream_id, query_params)
+        entry = cache.get(key)
+        if not isinstance(entry, dict) or "data" not in entry:
+            return None, False
+        return entry["data"], time.time() >= entry.get("fresh_until", 0)
 
     @staticmethod
     def get(stream_id: int, query_params: Dict[str, Any] = None) -> Optional[List[Dict[str, Any]]]:
-        key = ConnectionCacheService.get_cache_key(stream_id, query_params)
-        return cache.get(key)
+        """Return cached data that is still within its TTL."""
+        data, is_stale = ConnectionCacheService.get_entry(stream_id, query_params)
+        return None if is_stale else data
 
     @staticmethod
-    def set(stream_id: int, data: List[Dict[str, Any]], ttl: int, query_params: Dict[str, Any] = None):
-        key = ConnectionCacheService.get_cache_key(stream_id, query_params)
-        cache.set(key, data, ttl)
+    def set(
+        stream_id: int,
+        data: List[Dict[str, Any]],
+        ttl: int,
+        query_params: Dict[str, Any] = None,
+        cache_key: str = None,
+    ):
+        """
+        Store a stream result.
+
+        Args:
+            cache_key: Key resolved before the query ran; the current
+                generation's key is used if omitted
+        """
+        key = cache_key or ConnectionCacheService.get_cache_key(stream_id, query_params)
+        stale_ttl = getattr(settings, "DATA_STREAM_STALE_TTL", DEFAULT_STALE_TTL)
+        cache.set(key, {"data": data, "fresh_until": time.time() + ttl}, ttl + stale_ttl)
 
     @staticmethod
     def invalidate(stream_id: int):
-        # This is tricky because of the hash. 
-        # For simplicity, we might want to store a list of keys per stream or use a pattern.
-        # Redis supports pattern deletion.
-        # For now, let's just use a versioned key if we need easy invalidation.
-        pass
+        """Invalidate every cached variant of a stream by bumping its generation."""
+        key = ConnectionCacheService.get_generation_key(stream_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # No generation yet: any new value orphans entries written under the default
+            cache.set(key, 2, None)
 
+    @staticmethod
+    def schedule_refresh(
+        stream_id: int, query_params: Dict[str, Any] = None, cache_key: str = None
+    ) -> bool:
+        """
+        Queue a background refresh for a stale entry.
+
+        Only one refresh per stream and parameters is queued at a time.
+
+        Args:
+            cache_key: Key of the stale entry, resolved if omitted
+
+        Returns:
+            True if a refresh task was queued
+        """
+        cache_key = cache_key or ConnectionCacheService.get_cache_key(stream_id, query_params)
+        lock_key = ConnectionCacheService.get_refresh_lock_key(
+            stream_id, query_params, cache_key
+        )
+        if not cache.add(lock_key, 1, REFRESH_LOCK_TIMEOUT):
+            return False
+        from ..tasks import refresh_data_stream
+        refresh_data_stream.delay(stream_id, query_params, cache_key)
+        return True
@@ -0,0 +1,26 @@
+"""
+Invalidate cached stream data when a stream or its dependencies change.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import DataConnection, DataStream, DataTransformer
+from .services.transformers import ConnectionCacheService
+
+
+@receiver([post_save, post_delete], sender=DataStream)
+def invalidate_stream_cache(sender, instance, **kwargs):
+    ConnectionCacheService.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=DataConnection)
+def invalidate_connection_streams(sender, instance, **kwargs):
+    for stream_id in instance.streams.values_list("id", flat=True):
+        ConnectionCacheService.invalidate(stream_id)
+
+
+@receiver(post_save, sender=DataTransformer)
+def invalidate_transformer_streams(sender, instance, **kwargs):
+    for stream_id in DataStream.objects.filter(transformer=instance).values_list("id", flat=True):
+        ConnectionCacheService.invalidate(stream_id)
@@ -0,0 +1,30 @@
+from celery import shared_task
+from django.core.cache import cache
+import logging
+
+from .services.manager import DataConnectionManager
+from .services.transformers import ConnectionCacheService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_data_stream(stream_id, query_params=None, cache_key=None):
+    """
+    Re-execute a data stream and replace its cached result.
+
+    Queued when a request is served stale data, so the external source is
+    queried outside the request cycle. ``cache_key`` is the stale entry's key
+    and identifies the refresh lock taken by schedule_refresh().
+    """
+    lock_key = ConnectionCacheService.get_refresh_lock_key(
+        stream_id, query_params, cache_key
+    )
+    try:
+        DataConnectionManager().execute_stream(
+            stream_id, query_params=query_params, refresh=True
+        )
+    except Exception:
+        logger.exception(f"Refreshing data stream {stream_id} failed")
+    finally:
+        cache.delete(lock_key)
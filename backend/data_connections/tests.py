@@ -1,3 +1,223 @@
-from django.test import TestCase
+import json
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from core.models import Tenant
+from object_storage.models import ObjectInstance, ObjectTypeDefinition
+
+from .services.engine import ExternalRestEngine, InternalQueryEngine
+from .services.manager import DataConnectionManager
+from .services.transformers import ConnectionCacheService
+
+
+class InternalQueryEnginePagingTest(TestCase):
+    """Test page-at-a-time iteration of internal queries"""
+
+    def setUp(self):
+        user = User.objects.create_user(username="querier", password="testpass")
+        for i in range(5):
+            ObjectTypeDefinition.objects.create(
+                name=f"type_{i}",
+                label=f"Type {i}",
+                plural_label=f"Types {i}",
+                schema={"type": "object", "properties": {}},
+                created_by=user,
+            )
+
+    def test_fetch_page_walks_query_with_offset_cursor(self):
+        """Test that pages follow each other and stop at the query limit"""
+        engine = InternalQueryEngine()
+        query = json.dumps(
+            {"model": "ObjectTypeDefinition", "order_by": "name", "limit": 4, "fields": ["name"]}
+        )
+
+        names = []
+        cursor = engine.initial_cursor(query, {})
+        while cursor is not None:
+            page = engine.fetch_page(query, {}, cursor, 3)
+            names.extend(item["name"] for item in page.items)
+            cursor = page.next_cursor
+
+        self.assertEqual(names, ["type_0", "type_1", "type_2", "type_3"])
+
+
+
+class InternalQueryEngineProjectionTest(TestCase):
+    """Test that published content is projected without per-row queries"""
+
+    def setUp(self):
+        user = User.objects.create_user(username="projector", password="testpass")
+        tenant = Tenant.objects.create(
+            name="Projection Tenant", identifier="projection-tenant", created_by=user
+        )
+        object_type = ObjectTypeDefinition.objects.create(
+            name="news",
+            label="News",
+            plural_label="News",
+            schema={"type": "object", "properties": {}},
+            created_by=user,
+        )
+        now = timezone.now()
+        for i in range(3):
+            obj = ObjectInstance.objects.create(
+                object_type=object_type, title=f"News {i}", created_by=user, tenant=tenant
+            )
+            published = obj.create_version(user, data={"rev": "published", "n": i}, widgets={"main": []})
+            published.effective_date = now - timedelta(days=1)
+            published.save()
+            # A newer draft that is not yet effective must not leak into results
+            obj.create_version(user, data={"rev": "draft", "n": i})
+
+    def test_published_fields_use_single_query(self):
+        """Test that data and widgets of published versions come from one query"""
+        query = json.dumps(
+            {
+                "model": "ObjectInstance",
+                "version": "published",
+                "order_by": "title",
+                "fields": ["title", "data", "widgets"],
+            }
+        )
+
+        with self.assertNumQueries(1):
+            results = InternalQueryEngine().execute(query, {})
+
+        self.assertEqual([item["title"] for item in results], ["News 0", "News 1", "News 2"])
+        self.assertEqual({item["data"]["rev"] for item in results}, {"published"})
+        self.assertEqual(results[0]["widgets"], {"main": []})
+        self.assertIn("id", results[0])
+
+    def test_full_serialization_query_count_is_constant(self):
+        """Test that full serialization does not query per row"""
+        query = json.dumps({"model": "ObjectInstance", "version": "published"})
+
+        with self.assertNumQueries(2):
+            results = InternalQueryEngine().execute(query, {})
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual({item["data"]["rev"] for item in results}, {"published"})
+        self.assertTrue(all(item["is_published"] for item in results))
+        self.assertEqual(results[0]["object_type"]["name"], "news")
+
+
+def _json_response(body, status_code=200, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body
+    response.raise_for_status.return_value = None
+    return response
+
+
+class ExternalRestEngineTest(SimpleTestCase):
+    """Test pooled, conditional and concurrent REST fetching"""
+
+    def setUp(self):
+        cache.clear()
+        self.session = MagicMock()
+        session_patch = patch(
+            "data_connections.services.engine.get_rest_session", return_value=self.session
+        )
+        session_patch.start()
+        self.addCleanup(session_patch.stop)
+
+    def test_not_modified_reuses_stored_body(self):
+        """Test that a 304 response serves the body stored with its ETag"""
+        config = {"base_url": "https://api.test"}
+        self.session.get.return_value = _json_response(
+            {"results": [{"id": 1}]}, headers={"ETag": '"v1"'}
+        )
+        self.assertEqual(ExternalRestEngine().execute("/items", config), [{"id": 1}])
+
+        self.session.get.return_value = _json_response(None, status_code=304)
+        self.assertEqual(ExternalRestEngine().execute("/items", config), [{"id": 1}])
+        self.assertEqual(
+            self.session.get.call_args.kwargs["headers"]["If-None-Match"], '"v1"'
+        )
+
+    def test_known_total_fetches_remaining_pages(self):
+        """Test that a reported total fetches every remaining page in order"""
+        config = {
+            "base_url": "https://api.test",
+            "paging": {"type": "limit_offset", "pageSize": 2, "maxPages": 10},
+        }
+
+        def get(url, params=None, **kwargs):
+            offset = params["offset"]
+            return _json_response(
+                {"count": 5, "results": [{"id": i} for i in range(offset, min(offset + 2, 5))]}
+            )
+
+        self.session.get.side_effect = get
+
+        results = ExternalRestEngine().execute("/items", config)
+
+        self.assertEqual([item["id"] for item in results], [0, 1, 2, 3, 4])
+        self.assertEqual(self.session.get.call_count, 3)
+
+    def test_errors_return_partial_results(self):
+        """Test that a failing page stops iteration without losing earlier pages"""
+        config = {"base_url": "https://api.test", "paging": {"type": "page", "maxPages": 5}}
+        self.session.get.side_effect = [
+            _json_response({"next": "p2", "results": [{"id": 1}]}),
+            ConnectionError("down"),
+        ]
+
+        self.assertEqual(ExternalRestEngine().execute("/items", config), [{"id": 1}])
+
+
+class ConnectionCacheServiceTest(SimpleTestCase):
+    """Test stream cache keys, invalidation and stale-while-revalidate"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cache_key_is_deterministic(self):
+        """Test that keys do not depend on per-process hash randomisation"""
+        key = ConnectionCacheService.get_cache_key(7, {"b": 2, "a": 1})
+        self.assertEqual(key, ConnectionCacheService.get_cache_key(7, {"a": 1, "b": 2}))
+        self.assertRegex(key, r"^data_stream_7_1_[0-9a-f]{64}$")
+
+    def test_invalidate_drops_all_variants(self):
+        """Test that bumping the generation misses every parameter variant"""
+        ConnectionCacheService.set(7, [{"id": 1}], 60)
+        ConnectionCacheService.set(7, [{"id": 2}], 60, {"page": 2})
+
+        ConnectionCacheService.invalidate(7)
+
+        self.assertIsNone(ConnectionCacheService.get(7))
+        self.assertIsNone(ConnectionCacheService.get(7, {"page": 2}))
+
+    def test_stale_entry_is_served_and_refreshed_once(self):
+        """Test that expired data is returned while one refresh is queued"""
+        ConnectionCacheService.set(7, [{"id": 1}], 0)
+
+        data, is_stale = ConnectionCacheService.get_entry(7)
+        self.assertEqual(data, [{"id": 1}])
+        self.assertTrue(is_stale)
+
+        with patch("data_connections.tasks.refresh_data_stream.delay") as delay:
+            self.assertTrue(ConnectionCacheService.schedule_refresh(7))
+            self.assertFalse(ConnectionCacheService.schedule_refresh(7))
+        delay.assert_called_once_with(7, None, ConnectionCacheService.get_cache_key(7))
+
+    def test_result_fetched_across_invalidation_is_not_served(self):
+        """Test that a query racing an invalidation stores under the old generation"""
+        engine = MagicMock()
+
+        def execute(query_dsl, config):
+            ConnectionCacheService.invalidate(7)
+            return [{"id": 1}]
+
+        engine.execute.side_effect = execute
+        with patch("data_connections.services.manager.get_engine", return_value=engine):
+            DataConnectionManager()._run_engine_workflow_transformer(
+                MagicMock(), {}, None, None, cache_ttl=60, stream_id=7
+            )
+
+        self.assertIsNone(ConnectionCacheService.get(7))
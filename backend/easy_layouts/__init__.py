@@ -2,14 +2,6 @@
 EASY Layouts App
 
 This app contains layout implementations for the easy_v4 CMS.
-Layouts are automatically registered when this app is imported.
+Layouts are registered when layout autodiscovery imports the layouts
+submodule, on the first layout registry lookup.
 """
-
-# Import the layout registry to ensure all layouts are registered
-from . import layout_registry
-
-# Import all layout classes to trigger their registration
-from .layouts import (
-    MainLayoutLayout,
-    LandingPageLayout,
-)
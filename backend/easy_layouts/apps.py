@@ -2,14 +2,11 @@ from django.apps import AppConfig
 
 
 class DefaultLayoutsConfig(AppConfig):
+    """
+    Layouts in this app are registered lazily by webpages' layout
+    autodiscovery, which imports easy_layouts.layouts on first lookup.
+    """
+
     default_auto_field = "django.db.models.BigAutoField"
     name = "easy_layouts"
     verbose_name = "Easy Layouts"
-
-    def ready(self):
-        """
-        Called when the app is ready.
-        Import layouts to trigger automatic registration.
-        """
-        # Import layouts to trigger registration
-        from . import layouts
@@ -2,8 +2,6 @@
 EASY Widgets App
 
 This app contains widget implementations for the easy_v4 CMS.
-Widgets are automatically registered when this app is imported.
+Widgets are registered when widget autodiscovery imports the widgets
+submodule, on the first widget type registry lookup.
 """
-
-# Import the widget registry to ensure all widgets are registered
-from . import widget_registry
@@ -2,14 +2,11 @@ from django.apps import AppConfig
 
 
 class DefaultWidgetsConfig(AppConfig):
+    """
+    Widgets in this app are registered lazily by webpages' widget
+    autodiscovery, which imports easy_widgets.widgets on first lookup.
+    """
+
     default_auto_field = "django.db.models.BigAutoField"
     name = "easy_widgets"
     verbose_name = "Easy Widgets"
-
-    def ready(self):
-        """
-        Called when the app is ready.
-        Import widgets to trigger automatic registration.
-        """
-        # Import widgets to trigger registration
-        from . import widgets
@@ -5,7 +5,6 @@ Content widget implementation.
 from typing import Type
 from pydantic import BaseModel, Field, ConfigDict
 from pydantic.alias_generators import to_camel
-from bs4 import BeautifulSoup
 import logging
 
 from webpages.widget_registry import BaseWidget, register_widget_type
@@ -311,6 +310,8 @@ class ContentWidget(BaseWidget):
         if not content_html:
             return template_config
 
+        from bs4 import BeautifulSoup
+
         # Parse HTML
         soup = BeautifulSoup(content_html, "html.parser")
 
@@ -360,66 +360,15 @@ class ImageWidget(BaseWidget):
             return []
 
         try:
-            from file_manager.models import MediaCollection, MediaFile
-
-            # Get the collection
-            collection = MediaCollection.objects.get(id=collection_id)
-
-            # Get all files in the collection (using reverse relationship mediafile_set)
-            collection_files = collection.mediafile_set.filter(
-                is_deleted=False  # Only get non-deleted files
-            ).order_by("created_at")
-
-            # Convert to the format expected by the template (snake_case)
-            media_items = []
-            for media_file in collection_files:
-                # Determine media type
-                media_type = "video" if media_file.file_type == "video" else "image"
-
-                # Get URL - use get_file_url() method to generate URL from file_path
-                file_url = (
-                    media_file.get_file_url()
-                    if hasattr(media_file, "get_file_url")
-                    else (media_file.file_url or "")
-                )
+            from file_manager.services import CollectionManifestService
 
-                if media_file.file_type == "image" and hasattr(
-                    media_file, "get_imgproxy_url"
-                ):
-                    # Use imgproxy for thumbnail (e.g., 800px wide)
-                    thumbnail_url = media_file.get_imgproxy_url(width=800)
-                    full_url = file_url
-                else:
-                    thumbnail_url = file_url
-                    full_url = file_url
-
-                # Get annotation from metadata
-                annotation = ""
-                if (
-                    hasattr(media_file, "metadata")
-                    and media_file.metadata
-                    and isinstance(media_file.metadata, dict)
-                ):
-                    annotation = media_file.metadata.get("annotation", "")
-
-                media_items.append(
-                    {
-                        "id": str(media_file.id),
-                        "url": full_url or "",
-                        "type": media_type,
-                        "alt_text": media_file.title or "",  # Use title as alt text
-                        "caption": media_file.description or "",
-                        "annotation": annotation,
-                        "title": media_file.title or "",
-                        "photographer": "",  # Not available in MediaFile model
-                        "source": "",  # Not available in MediaFile model
-                        "width": media_file.width,
-                        "height": media_file.height,
-                        "thumbnail_url": thumbnail_url or full_url or "",
-                    }
-                )
+            # Items are precomputed per collection and cached until membership
+            # or file metadata changes
+            manifest = CollectionManifestService.get_manifest(collection_id)
+            if not manifest:
+                return []
 
-            return media_items
+            return list(manifest["items"])
 
         except Exception as e:
             # Log error and return empty list to prevent template crashes
@@ -8,5 +8,5 @@ class FileManagerConfig(AppConfig):
 
     def ready(self):
         """Initialize app when Django starts."""
-        # Import signals if any
-        pass
+        # Import signals for collection manifest invalidation
+        import file_manager.signals  # noqa: F401
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.26 on 2026-10-18 12:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_content_usages(apps, schema_editor):
+    """Create MediaUsage rows for references stored in MediaFile.referenced_in."""
+    MediaFile = apps.get_model('file_manager', 'MediaFile')
+    MediaUsage = apps.get_model('file_manager', 'MediaUsage')
+
+    usages = []
+    media_files = MediaFile.objects.exclude(referenced_in={}).values_list(
+        'id', 'referenced_in'
+    )
+    for media_id, referenced_in in media_files.iterator():
+        for content_type, content_ids in (referenced_in or {}).items():
+            for content_id in content_ids:
+                usages.append(
+                    MediaUsage(
+                        media_file_id=media_id,
+                        usage_type='content',
+                        object_type=content_type,
+                        object_id=str(content_id),
+                    )
+                )
+        if len(usages) >= 1000:
+            MediaUsage.objects.bulk_create(usages, ignore_conflicts=True)
+            usages = []
+
+    if usages:
+        MediaUsage.objects.bulk_create(usages, ignore_conflicts=True)
+
+
+def remove_content_usages(apps, schema_editor):
+    """Remove backfilled content usage rows that have no creator."""
+    MediaUsage = apps.get_model('file_manager', 'MediaUsage')
+    MediaUsage.objects.filter(usage_type='content', created_by__isnull=True).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('file_manager', '0013_make_tenant_required_on_mediafile'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='mediausage',
+            name='created_by',
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='media_usage_records',
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='mediausage',
+            index=models.Index(
+                fields=['usage_type', 'object_type', 'object_id'],
+                name='mediausage_object_idx',
+            ),
+        ),
+        migrations.RunPython(backfill_content_usages, remove_content_usages),
+    ]
@@ -697,20 +697,14 @@ class MediaFile(models.Model):
             content_type: The type of content (e.g., 'webpage', 'widget')
             content_id: The ID of the content
         """
-        from django.utils import timezone
+        from .utils import apply_media_reference_changes
 
-        refs = self.referenced_in
-        if content_type not in refs:
-            refs[content_type] = []
-
-        if content_id not in refs[content_type]:
-            refs[content_type].append(content_id)
-            self.reference_count = self.reference_count + 1
-            self.last_referenced = timezone.now()
-            self.referenced_in = refs
-            self.save(
-                update_fields=["reference_count", "last_referenced", "referenced_in"]
-            )
+        apply_media_reference_changes(
+            content_type, {str(content_id): ({str(self.id)}, set())}
+        )
+        self.refresh_from_db(
+            fields=["reference_count", "last_referenced", "referenced_in"]
+        )
 
     def remove_reference(self, content_type, content_id):
         """
@@ -723,17 +717,19 @@ class MediaFile(models.Model):
         Returns:
             bool: True if reference was removed, False if not found
         """
-        refs = self.referenced_in
-        if content_type not in refs or content_id not in refs[content_type]:
+        from .utils import CONTENT_USAGE_TYPE, refresh_reference_counts
+
+        deleted, _ = MediaUsage.objects.filter(
+            media_file=self,
+            usage_type=CONTENT_USAGE_TYPE,
+            object_type=content_type,
+            object_id=str(content_id),
+        ).delete()
+        if not deleted:
             return False
 
-        refs[content_type].remove(content_id)
-        if not refs[content_type]:
-            del refs[content_type]
-
-        self.reference_count = self.reference_count - 1
-        self.referenced_in = refs
-        self.save(update_fields=["reference_count", "referenced_in"])
+        refresh_reference_counts([self.id])
+        self.refresh_from_db(fields=["reference_count", "referenced_in"])
         return True
 
     def get_references(self):
@@ -824,7 +820,11 @@ class MediaFile(models.Model):
 
     def _generate_unique_slug(self):
         """Generate a unique, SEO-friendly slug for the media file."""
-        import re
+        # Ensure uniqueness within namespace
+        return self._ensure_unique_slug(self._generate_base_slug())
+
+    def _generate_base_slug(self):
+        """Generate the SEO-friendly base slug before uniqueness suffixes."""
         import os
         from django.utils.text import slugify
 
@@ -841,8 +841,7 @@ class MediaFile(models.Model):
         if len(base_slug) < 3:
             base_slug = f"file-{base_slug}" if base_slug else "media-file"
 
-        # Ensure uniqueness within namespace
-        return self._ensure_unique_slug(base_slug)
+        return base_slug
 
     def _clean_text_for_seo(self, text):
         """Clean text for SEO-friendly slug generation."""
@@ -1162,7 +1161,11 @@ class MediaUsage(models.Model):
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     created_by = models.ForeignKey(
-        User, on_delete=models.PROTECT, related_name="media_usage_records"
+        User,
+        on_delete=models.PROTECT,
+        related_name="media_usage_records",
+        null=True,
+        blank=True,
     )
 
     class Meta:
@@ -1172,6 +1175,10 @@ class MediaUsage(models.Model):
             models.Index(fields=["media_file"]),
             models.Index(fields=["usage_type", "object_id"]),
             models.Index(fields=["object_type"]),
+            models.Index(
+                fields=["usage_type", "object_type", "object_id"],
+                name="mediausage_object_idx",
+            ),
         ]
 
     def __str__(self):
@@ -1,25 +1,38 @@
 """
 Services package for file manager application.
+
+Exports are resolved on first access, so importing one service module (as the
+signal handlers do at startup) does not import DRF, AI clients and the rest
+of the package with it.
 """
 
-from .upload_service import FileUploadService, UploadResult
-from .duplicate_handler import DuplicateFileHandler, DuplicateCheckResult
-from .validation_service import FileValidationService, ValidationResult
-from .response_builder import UploadResponseBuilder, UploadResponseData
-from .namespace_service import NamespaceAccessService, NamespaceResult
-from .zip_service import ZipExtractionService, ZipExtractionResult
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "FileUploadService": ".upload_service",
+    "UploadResult": ".upload_service",
+    "DuplicateFileHandler": ".duplicate_handler",
+    "DuplicateCheckResult": ".duplicate_handler",
+    "FileValidationService": ".validation_service",
+    "ValidationResult": ".validation_service",
+    "UploadResponseBuilder": ".response_builder",
+    "UploadResponseData": ".response_builder",
+    "NamespaceAccessService": ".namespace_service",
+    "NamespaceResult": ".namespace_service",
+    "ZipExtractionService": ".zip_service",
+    "ZipExtractionResult": ".zip_service",
+    "ZipImportProgress": ".zip_service",
+    "get_zip_import_progress": ".zip_service",
+    "CollectionManifestService": ".collection_manifest",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
 
-__all__ = [
-    "FileUploadService",
-    "UploadResult",
-    "DuplicateFileHandler",
-    "DuplicateCheckResult",
-    "FileValidationService",
-    "ValidationResult",
-    "UploadResponseBuilder",
-    "UploadResponseData",
-    "NamespaceAccessService",
-    "NamespaceResult",
-    "ZipExtractionService",
-    "ZipExtractionResult",
-]
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,189 @@
+"""
+Cached gallery manifests for media collections.
+
+A manifest is the ordered list of render-ready items for a collection
+(URLs, dimensions, captions, annotations). It is built once, cached, and
+shared by the image widget, the gallery/carousel Mustache contexts and the
+collections API. Signals in ``file_manager.signals`` invalidate it when
+collection membership or file metadata changes.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from ..imgproxy import get_image_url
+from ..models import MediaCollection, MediaFile
+from ..storage import storage
+
+logger = logging.getLogger(__name__)
+
+# MediaFile fields that affect manifest items; saves touching only other
+# fields (counters, reference tracking) leave manifests untouched.
+MANIFEST_FIELDS = frozenset(
+    {
+        "title",
+        "description",
+        "metadata",
+        "width",
+        "height",
+        "file_path",
+        "file_hash",
+        "file_type",
+        "is_deleted",
+    }
+)
+
+
+def get_collection_manifest_key(collection_id) -> str:
+    """Return the cache key used for a collection manifest."""
+    return f"collection_manifest_{collection_id}"
+
+
+class CollectionManifestService:
+    """Build, cache and invalidate per-collection gallery manifests."""
+
+    THUMBNAIL_WIDTH = 800
+    DEFAULT_TIMEOUT = 24 * 3600
+
+    @classmethod
+    def get_timeout(cls) -> int:
+        return getattr(settings, "MEDIA_COLLECTION_MANIFEST_TIMEOUT", cls.DEFAULT_TIMEOUT)
+
+    @classmethod
+    def get_manifest(
+        cls, collection_id, collection: Optional[MediaCollection] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the manifest for a collection, building it on a cache miss.
+
+        Args:
+            collection_id: ID of the collection
+            collection: Optional already-loaded collection instance
+
+        Returns:
+            Manifest dict, or None if the collection does not exist
+        """
+        if not collection_id:
+            return None
+
+        key = get_collection_manifest_key(collection_id)
+        manifest = cache.get(key)
+        if manifest is not None:
+            return manifest
+
+        if collection is None:
+            try:
+                collection = MediaCollection.objects.get(id=collection_id)
+            except (MediaCollection.DoesNotExist, ValidationError, ValueError):
+                return None
+
+        manifest = cls.build_manifest(collection)
+        cache.set(key, manifest, cls.get_timeout())
+        return manifest
+
+    @classmethod
+    def build_manifest(cls, collection: MediaCollection) -> Dict[str, Any]:
+        """
+        Build the manifest for a collection with a single file query.
+
+        Args:
+            collection: Collection to build the manifest for
+
+        Returns:
+            Manifest dict with ordered items in the widget template format
+        """
+        media_files = (
+            MediaFile.objects.filter(collections=collection, is_deleted=False)
+            .order_by("created_at")
+            .only(
+                "id",
+                "title",
+                "description",
+                "metadata",
+                "file_type",
+                "file_path",
+                "file_hash",
+                "width",
+                "height",
+            )
+        )
+        items = [cls._build_item(media_file) for media_file in media_files]
+
+        return {
+            "collection_id": str(collection.id),
+            "title": collection.title,
+            "item_count": len(items),
+            "built_at": timezone.now().isoformat(),
+            "items": items,
+        }
+
+    @classmethod
+    def _build_item(cls, media_file: MediaFile) -> Dict[str, Any]:
+        """Convert a media file to a manifest item."""
+        file_url = storage.get_public_url(media_file.file_path) or ""
+        if media_file.file_type == "image":
+            thumbnail_url = get_image_url(
+                source_url=file_url,
+                width=cls.THUMBNAIL_WIDTH,
+                version=media_file.file_hash,
+            )
+        else:
+            thumbnail_url = file_url
+
+        annotation = ""
+        if isinstance(media_file.metadata, dict):
+            annotation = media_file.metadata.get("annotation", "")
+
+        return {
+            "id": str(media_file.id),
+            "url": file_url,
+            "type": "video" if media_file.file_type == "video" else "image",
+            "alt_text": media_file.title or "",
+            "caption": media_file.description or "",
+            "annotation": annotation,
+            "title": media_file.title or "",
+            "photographer": "",  # Not available in MediaFile model
+            "source": "",  # Not available in MediaFile model
+            "width": media_file.width,
+            "height": media_file.height,
+            "thumbnail_url": thumbnail_url or file_url,
+        }
+
+    @classmethod
+    def invalidate(cls, collection_ids: Iterable) -> None:
+        """
+        Drop cached manifests once the current transaction commits.
+
+        Args:
+            collection_ids: IDs of the collections whose manifests are stale
+        """
+        keys = [get_collection_manifest_key(cid) for cid in set(collection_ids) if cid]
+        if not keys:
+            return
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+    @classmethod
+    def invalidate_for_files(cls, media_file_ids: Iterable) -> None:
+        """
+        Invalidate manifests of every collection containing the given files.
+
+        Args:
+            media_file_ids: IDs of media files whose metadata changed
+        """
+        media_file_ids = list(media_file_ids)
+        if not media_file_ids:
+            return
+        collection_ids = (
+            MediaFile.collections.through.objects.filter(
+                mediafile_id__in=media_file_ids
+            )
+            .values_list("mediacollection_id", flat=True)
+            .distinct()
+        )
+        cls.invalidate(list(collection_ids))
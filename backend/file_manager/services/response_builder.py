@@ -2,7 +2,7 @@
 Service for building consistent API responses for file upload operations.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Any
 from rest_framework import status
 from rest_framework.response import Response
@@ -18,13 +18,17 @@ class UploadResponseData:
     success_count: int
     rejected_count: int
     error_count: int
+    zip_imports: List[dict] = field(default_factory=list)
 
 
 class UploadResponseBuilder:
     """Service class to build consistent API responses for file uploads."""
 
     def build_response(
-        self, uploaded_files: List[dict], errors: List[dict]
+        self,
+        uploaded_files: List[dict],
+        errors: List[dict],
+        zip_imports: List[dict] = None,
     ) -> Response:
         """
         Build a response object for a file upload operation.
@@ -32,6 +36,7 @@ class UploadResponseBuilder:
         Args:
             uploaded_files: List of successfully uploaded files
             errors: List of errors encountered during upload
+            zip_imports: Progress of ZIP archives queued for background import
 
         Returns:
             Response object with appropriate status code and formatted data
@@ -49,6 +54,7 @@ class UploadResponseBuilder:
             success_count=len(uploaded_files),
             rejected_count=len(rejected_files),
             error_count=len(other_errors),
+            zip_imports=zip_imports or [],
         )
 
         return self._create_response(response_data)
@@ -74,10 +80,16 @@ class UploadResponseBuilder:
         if data.errors:
             response_dict["errors"] = data.errors
 
+        if data.zip_imports:
+            response_dict["zip_imports"] = data.zip_imports
+
         # Determine appropriate status code
         if data.success_count > 0:
             # Some files were successfully uploaded
             return Response(response_dict, status=status.HTTP_201_CREATED)
+        elif data.zip_imports:
+            # ZIP archives are still being imported in the background
+            return Response(response_dict, status=status.HTTP_202_ACCEPTED)
         elif data.rejected_count > 0 and data.error_count == 0:
             # All files were rejected due to duplicates (not an error)
             return Response(response_dict, status=status.HTTP_200_OK)
@@ -1,24 +1,53 @@
 """
 Service for handling ZIP file extraction and upload.
+
+Archives are never extracted to disk: members are streamed straight out of the
+ZIP, hashed while they are read, uploaded to object storage by a bounded
+thread pool and inserted into the database in batches.
 """
 
 import os
+import uuid
+import hashlib
+import threading
 import zipfile
-import tempfile
-import shutil
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from operator import or_
+from typing import List, Dict, Any, Optional, Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import timedelta
 from django.conf import settings
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connections, transaction, IntegrityError
+from django.db.models import Q
+from django.utils import timezone
 import logging
 
 from ..models import MediaFile, MediaCollection, MediaTag, PendingMediaFile
-from ..services.upload_service import FileUploadService, UploadResult
+from ..services.upload_service import FileUploadService
 from ..services.validation_service import FileValidationService
+from ..services.collection_manifest import CollectionManifestService
+from ..storage import storage
+from ..ai_services import ai_service
 from content.models import Namespace
 
 logger = logging.getLogger(__name__)
 
+ZIP_IMPORT_PROGRESS_TIMEOUT = 6 * 3600  # Keep progress for 6 hours
+
+
+def get_zip_import_progress_key(task_id: str) -> str:
+    """Cache key holding the progress of a background ZIP import."""
+    return f"zip_import_progress_{task_id}"
+
+
+def get_zip_import_progress(task_id: str) -> Optional[Dict[str, Any]]:
+    """Return the cached progress dict of a background ZIP import, if any."""
+    return cache.get(get_zip_import_progress_key(task_id))
+
 
 @dataclass
 class ZipExtractionResult:
@@ -32,36 +61,129 @@ class ZipExtractionResult:
     skipped_count: int = 0
 
 
+@dataclass
+class ZipImportProgress:
+    """Track progress of a (background) ZIP import."""
+    task_id: Optional[str] = None
+    archive_name: str = ""
+    requested_by: Optional[int] = None
+    status: str = "queued"  # queued, running, completed, failed
+    total_files: int = 0
+    processed_files: int = 0
+    imported_count: int = 0
+    duplicate_count: int = 0
+    skipped_count: int = 0
+    collection_id: Optional[str] = None
+    file_ids: List[str] = field(default_factory=list)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "task_id": self.task_id,
+            "archive_name": self.archive_name,
+            "requested_by": self.requested_by,
+            "status": self.status,
+            "total_files": self.total_files,
+            "processed_files": self.processed_files,
+            "imported_count": self.imported_count,
+            "duplicate_count": self.duplicate_count,
+            "skipped_count": self.skipped_count,
+            "collection_id": self.collection_id,
+            "file_ids": self.file_ids,
+            "errors": self.errors,
+            "warnings": self.warnings,
+        }
+
+    def save(self) -> None:
+        """Store progress in cache for status polling."""
+        if self.task_id:
+            cache.set(
+                get_zip_import_progress_key(self.task_id),
+                self.to_dict(),
+                ZIP_IMPORT_PROGRESS_TIMEOUT,
+            )
+
+
+@dataclass
+class _ZipMember:
+    """A single archive member travelling through the import pipeline."""
+    filename: str
+    file_size: int
+    content_type: str
+    file_hash: str = ""
+    zip_info: Optional[zipfile.ZipInfo] = None
+    file_path: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    ai_analysis: Dict[str, Any] = field(default_factory=dict)
+    existing_pending: Optional[PendingMediaFile] = None
+    create_pending: bool = True
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+
 class ZipExtractionService:
     """Service for extracting and processing ZIP files."""
-    
+
     # Default max ZIP size: 100MB (can be overridden)
     DEFAULT_MAX_ZIP_SIZE = 100 * 1024 * 1024
-    
+
     # Maximum uncompressed size to prevent zip bombs
     MAX_UNCOMPRESSED_SIZE = 500 * 1024 * 1024  # 500MB
-    
+
     # Maximum number of files in a ZIP
     MAX_FILES_IN_ZIP = 100
-    
+
     def __init__(self):
         self.upload_service = FileUploadService()
         self.validation_service = FileValidationService()
-    
-    def validate_zip(self, zip_file, max_size: Optional[int] = None) -> Dict[str, Any]:
+        self.upload_workers = getattr(settings, "MEDIA_ZIP_IMPORT_UPLOAD_WORKERS", 8)
+        self.batch_size = getattr(settings, "MEDIA_ZIP_IMPORT_BATCH_SIZE", 50)
+
+    def get_background_limits(self) -> Dict[str, int]:
+        """Limits applied to archives imported as a background job."""
+        return {
+            "max_size": getattr(
+                settings, "MEDIA_ZIP_IMPORT_MAX_SIZE", 2 * 1024 * 1024 * 1024
+            ),
+            "max_files": getattr(settings, "MEDIA_ZIP_IMPORT_MAX_FILES", 5000),
+            "max_uncompressed_size": getattr(
+                settings,
+                "MEDIA_ZIP_IMPORT_MAX_UNCOMPRESSED_SIZE",
+                10 * 1024 * 1024 * 1024,
+            ),
+        }
+
+    def validate_zip(
+        self,
+        zip_file,
+        max_size: Optional[int] = None,
+        max_files: Optional[int] = None,
+        max_uncompressed_size: Optional[int] = None,
+        verify_crc: bool = True,
+    ) -> Dict[str, Any]:
         """
         Validate ZIP file before extraction.
-        
+
+        Only the central directory is read unless ``verify_crc`` is set, in
+        which case every member is decompressed once to check its CRC.
+
         Args:
             zip_file: The uploaded ZIP file
             max_size: Maximum allowed ZIP file size in bytes
-            
+            max_files: Maximum number of files in the archive
+            max_uncompressed_size: Maximum total uncompressed size in bytes
+            verify_crc: Decompress all members to detect corruption up front
+
         Returns:
             Dict with validation result
         """
         errors = []
         warnings = []
-        
+        max_files = max_files or self.MAX_FILES_IN_ZIP
+        max_uncompressed_size = max_uncompressed_size or self.MAX_UNCOMPRESSED_SIZE
+
         # Check file size
         max_allowed = max_size or self.DEFAULT_MAX_ZIP_SIZE
         if zip_file.size > max_allowed:
@@ -71,67 +193,61 @@ class ZipExtractionService:
                 f"ZIP file too large: {actual_mb:.1f}MB exceeds limit of {max_mb:.0f}MB"
             )
             return {"is_valid": False, "errors": errors, "warnings": warnings}
-        
-        # Try to open as ZIP
+
+        # Try to open as ZIP (uploaded files are seekable, no temp copy needed)
         try:
-            # Save to temp file for validation
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
-            try:
-                for chunk in zip_file.chunks():
-                    temp_file.write(chunk)
-                temp_file.close()
-                
-                # Validate ZIP structure
-                with zipfile.ZipFile(temp_file.name, 'r') as zf:
-                    # Check if it's a valid ZIP
+            zip_file.seek(0)
+            with zipfile.ZipFile(zip_file, 'r') as zf:
+                # Check if it's a valid ZIP
+                if verify_crc:
                     bad_file = zf.testzip()
                     if bad_file:
                         errors.append(f"Corrupted file in ZIP: {bad_file}")
                         return {"is_valid": False, "errors": errors, "warnings": warnings}
-                    
-                    # Get file list
-                    file_list = zf.namelist()
-                    
-                    # Check number of files
-                    actual_files = [f for f in file_list if not f.endswith('/')]
-                    if len(actual_files) > self.MAX_FILES_IN_ZIP:
-                        errors.append(
-                            f"Too many files in ZIP: {len(actual_files)} exceeds limit of {self.MAX_FILES_IN_ZIP}"
-                        )
-                        return {"is_valid": False, "errors": errors, "warnings": warnings}
-                    
-                    # Check for empty ZIP
-                    if len(actual_files) == 0:
-                        errors.append("ZIP file contains no files")
-                        return {"is_valid": False, "errors": errors, "warnings": warnings}
-                    
-                    # Check uncompressed size (zip bomb protection)
-                    total_uncompressed = sum(zf.getinfo(f).file_size for f in actual_files)
-                    if total_uncompressed > self.MAX_UNCOMPRESSED_SIZE:
-                        max_mb = self.MAX_UNCOMPRESSED_SIZE / (1024 * 1024)
-                        actual_mb = total_uncompressed / (1024 * 1024)
-                        errors.append(
-                            f"Uncompressed size too large: {actual_mb:.1f}MB exceeds limit of {max_mb:.0f}MB"
-                        )
+
+                # Get file list
+                infos = zf.infolist()
+                file_list = [info.filename for info in infos]
+
+                # Check number of files
+                actual_files = [info for info in infos if not info.is_dir()]
+                if len(actual_files) > max_files:
+                    errors.append(
+                        f"Too many files in ZIP: {len(actual_files)} exceeds limit of {max_files}"
+                    )
+                    return {"is_valid": False, "errors": errors, "warnings": warnings}
+
+                # Check for empty ZIP
+                if len(actual_files) == 0:
+                    errors.append("ZIP file contains no files")
+                    return {"is_valid": False, "errors": errors, "warnings": warnings}
+
+                # Check uncompressed size (zip bomb protection)
+                total_uncompressed = sum(info.file_size for info in actual_files)
+                if total_uncompressed > max_uncompressed_size:
+                    max_mb = max_uncompressed_size / (1024 * 1024)
+                    actual_mb = total_uncompressed / (1024 * 1024)
+                    errors.append(
+                        f"Uncompressed size too large: {actual_mb:.1f}MB exceeds limit of {max_mb:.0f}MB"
+                    )
+                    return {"is_valid": False, "errors": errors, "warnings": warnings}
+
+                # Check for path traversal attempts
+                for filename in file_list:
+                    if '..' in filename or filename.startswith('/'):
+                        errors.append(f"Invalid file path in ZIP: {filename}")
                         return {"is_valid": False, "errors": errors, "warnings": warnings}
-                    
-                    # Check for path traversal attempts
-                    for filename in file_list:
-                        if '..' in filename or filename.startswith('/'):
-                            errors.append(f"Invalid file path in ZIP: {filename}")
-                            return {"is_valid": False, "errors": errors, "warnings": warnings}
-                    
-                    # Warn about hidden files
-                    hidden_files = [f for f in actual_files if os.path.basename(f).startswith('.')]
-                    if hidden_files:
-                        warnings.append(
-                            f"ZIP contains {len(hidden_files)} hidden file(s) that will be skipped"
-                        )
-                
-            finally:
-                # Clean up temp file
-                os.unlink(temp_file.name)
-                
+
+                # Warn about hidden files
+                hidden_files = [
+                    info for info in actual_files
+                    if os.path.basename(info.filename).startswith('.')
+                ]
+                if hidden_files:
+                    warnings.append(
+                        f"ZIP contains {len(hidden_files)} hidden file(s) that will be skipped"
+                    )
+
         except zipfile.BadZipFile:
             errors.append("File is not a valid ZIP archive")
             return {"is_valid": False, "errors": errors, "warnings": warnings}
@@ -139,14 +255,85 @@ class ZipExtractionService:
             logger.error(f"Error validating ZIP: {e}")
             errors.append(f"Failed to validate ZIP: {str(e)}")
             return {"is_valid": False, "errors": errors, "warnings": warnings}
-        
+        finally:
+            zip_file.seek(0)
+
         return {
             "is_valid": True,
             "errors": errors,
             "warnings": warnings,
             "file_count": len(actual_files)
         }
-    
+
+    def enqueue_import(
+        self,
+        zip_file,
+        namespace: Namespace,
+        user,
+        collection: Optional[MediaCollection] = None,
+        collection_slug: Optional[str] = None,
+        max_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Validate a ZIP upload, stage it in object storage and start a
+        background import job.
+
+        Args:
+            zip_file: The uploaded ZIP file
+            namespace: Target namespace
+            user: User performing the upload
+            collection: Existing collection to add files to (optional)
+            collection_slug: Slug for new collection if creating one
+            max_size: Maximum ZIP size override
+
+        Returns:
+            Progress dict of the queued job, or a dict with ``errors`` if the
+            archive was rejected
+        """
+        from ..tasks import import_zip_archive
+
+        limits = self.get_background_limits()
+        validation = self.validate_zip(
+            zip_file,
+            max_size=max_size or limits["max_size"],
+            max_files=limits["max_files"],
+            max_uncompressed_size=limits["max_uncompressed_size"],
+            verify_crc=False,  # CRCs are checked while members are streamed
+        )
+        if not validation["is_valid"]:
+            return {
+                "status": "failed",
+                "errors": [
+                    {"filename": zip_file.name, "error": err, "status": "error"}
+                    for err in validation["errors"]
+                ],
+            }
+
+        task_id = str(uuid.uuid4())
+        archive_path = f"zip-imports/{task_id}.zip"
+        archive_path = storage.save(archive_path, zip_file)
+
+        progress = ZipImportProgress(
+            task_id=task_id,
+            archive_name=zip_file.name,
+            requested_by=user.id,
+            total_files=validation["file_count"],
+            collection_id=str(collection.id) if collection else None,
+            warnings=validation["warnings"],
+        )
+        progress.save()
+
+        import_zip_archive.delay(
+            task_id,
+            archive_path,
+            zip_file.name,
+            str(namespace.id),
+            user.id,
+            collection_id=str(collection.id) if collection else None,
+            collection_slug=collection_slug,
+        )
+        return progress.to_dict()
+
     def extract_zip(
         self,
         zip_file,
@@ -159,7 +346,10 @@ class ZipExtractionService:
     ) -> ZipExtractionResult:
         """
         Extract ZIP file and upload contents to media library.
-        
+
+        Runs the streaming import synchronously; use ``enqueue_import`` for
+        large archives.
+
         Args:
             zip_file: The uploaded ZIP file
             namespace: Target namespace
@@ -168,7 +358,7 @@ class ZipExtractionService:
             collection_slug: Slug for new collection if creating one
             tags: List of tag IDs to apply to files
             max_size: Maximum ZIP size override
-            
+
         Returns:
             ZipExtractionResult with extracted files and any errors
         """
@@ -183,164 +373,576 @@ class ZipExtractionService:
                 file_count=0,
                 skipped_count=0
             )
-        
-        warnings = validation.get("warnings", [])
-        extracted_files = []
-        errors = []
-        skipped_count = 0
-        temp_dir = None
-        
+
+        progress = ZipImportProgress(
+            archive_name=zip_file.name, warnings=validation.get("warnings", [])
+        )
+        return self.import_archive(
+            zip_file,
+            namespace,
+            user,
+            progress,
+            collection=collection,
+            collection_slug=collection_slug,
+            tags=tags,
+        )
+
+    def import_archive(
+        self,
+        archive,
+        namespace: Namespace,
+        user,
+        progress: ZipImportProgress,
+        collection: Optional[MediaCollection] = None,
+        collection_slug: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        on_progress: Optional[Callable[[ZipImportProgress], None]] = None,
+    ) -> ZipExtractionResult:
+        """
+        Stream an archive into the media library.
+
+        Each member is decompressed once to be hashed, validated and uploaded
+        on a thread pool. Uploads are then de-duplicated against existing media,
+        analyzed and inserted with ``bulk_create`` one batch at a time.
+
+        Args:
+            archive: Seekable binary file object containing the ZIP
+            namespace: Target namespace
+            user: User performing the import
+            progress: Progress object updated after every batch
+            collection: Existing collection to add files to (optional)
+            collection_slug: Slug for new collection if creating one
+            tags: List of tag IDs to apply when no collection is used
+            on_progress: Optional callback invoked after every batch
+
+        Returns:
+            ZipExtractionResult with imported files and any errors
+        """
+        extracted_files: List[MediaFile] = []
+        created_collection = None
+        progress.status = "running"
+        self._report(progress, on_progress)
+
         try:
-            # Create temporary directory for extraction
-            temp_dir = tempfile.mkdtemp(prefix='zip_extract_')
-            
-            # Save ZIP to temp file
-            temp_zip = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
-            try:
-                for chunk in zip_file.chunks():
-                    temp_zip.write(chunk)
-                temp_zip.close()
-                
-                # Extract ZIP
-                with zipfile.ZipFile(temp_zip.name, 'r') as zf:
-                    zf.extractall(temp_dir)
-                    
-                    # Get list of extracted files
-                    file_list = []
-                    for root, dirs, files in os.walk(temp_dir):
-                        for filename in files:
-                            # Skip hidden files and system files
-                            if filename.startswith('.') or filename.startswith('__'):
-                                skipped_count += 1
-                                continue
-                            
-                            file_path = os.path.join(root, filename)
-                            file_list.append((filename, file_path))
-                    
-                    # Create or get collection
-                    created_collection = None
-                    if collection is None and collection_slug:
-                        # Create new collection from ZIP filename
-                        created_collection = self._create_collection_from_zip(
-                            zip_file.name,
-                            collection_slug,
-                            namespace,
-                            user,
-                            tags
-                        )
-                        collection = created_collection
-                    
-                    # Get tags for files
-                    file_tags = []
-                    if collection:
-                        # Use collection's tags
-                        file_tags = list(collection.tags.values_list('id', flat=True))
-                    elif tags:
-                        # Use provided tags
-                        file_tags = tags
-                    
-                    # Process each extracted file
-                    pending_files_to_approve = []
-                    
-                    for original_filename, file_path in file_list:
-                        try:
-                            # Open extracted file
-                            with open(file_path, 'rb') as f:
-                                file_content = f.read()
-                            
-                            # Create an in-memory uploaded file
-                            from django.core.files.uploadedfile import SimpleUploadedFile
-                            uploaded_file = SimpleUploadedFile(
-                                original_filename,
-                                file_content,
-                                content_type=self._guess_content_type(original_filename)
-                            )
-                            
-                            # Validate file
-                            validation_result = self.validation_service.validate(
-                                uploaded_file,
-                                user,
-                                force_upload=False
-                            )
-                            
-                            if not validation_result.is_valid:
-                                errors.extend(validation_result.errors)
-                                continue
-                            
-                            # Upload to pending
-                            upload_result = self.upload_service.upload(
-                                uploaded_file,
-                                "",  # No folder path
+            archive.seek(0)
+            with zipfile.ZipFile(archive, 'r') as zf:
+                members = []
+                for info in zf.infolist():
+                    if info.is_dir():
+                        continue
+                    # Skip hidden files and system files
+                    basename = os.path.basename(info.filename)
+                    if basename.startswith('.') or basename.startswith('__'):
+                        progress.skipped_count += 1
+                        continue
+                    members.append(info)
+                progress.total_files = len(members)
+
+                # Create or get collection
+                if collection is None and collection_slug:
+                    created_collection = self._create_collection_from_zip(
+                        progress.archive_name or "archive.zip",
+                        collection_slug,
+                        namespace,
+                        user,
+                        tags
+                    )
+                    collection = created_collection
+                if collection:
+                    progress.collection_id = str(collection.id)
+
+                # Get tags for files
+                file_tags = []
+                if collection:
+                    # Use collection's tags
+                    file_tags = list(collection.tags.values_list('id', flat=True))
+                elif tags:
+                    # Use provided tags
+                    file_tags = list(tags)
+
+                seen_hashes = set()
+                with ThreadPoolExecutor(
+                    max_workers=self.upload_workers,
+                    thread_name_prefix="zip-import",
+                ) as executor:
+                    for batch in self._batched(members, self.batch_size):
+                        extracted_files.extend(
+                            self._import_batch(
+                                zf,
+                                batch,
+                                executor,
+                                seen_hashes,
                                 namespace,
                                 user,
-                                skip_ai_analysis=False
-                            )
-                            
-                            if upload_result.errors:
-                                errors.extend(upload_result.errors)
-                                continue
-                            
-                            # Store pending files for approval
-                            pending_files_to_approve.extend(upload_result.files)
-                            
-                        except Exception as e:
-                            logger.error(f"Error processing extracted file {original_filename}: {e}")
-                            errors.append({
-                                "filename": original_filename,
-                                "error": str(e),
-                                "status": "error"
-                            })
-                    
-                    # Auto-approve all pending files
-                    for pending_file in pending_files_to_approve:
-                        try:
-                            media_file = pending_file.approve_and_create_media_file(
-                                title=pending_file.ai_suggested_title or pending_file.original_filename,
-                                slug=None,  # Auto-generate
-                                description=pending_file.ai_suggested_description or "",
-                                tags=file_tags,
-                                access_level="public"
+                                collection,
+                                file_tags,
+                                progress,
                             )
-                            
-                            # Add to collection if provided
-                            if collection:
-                                collection.mediafile_set.add(media_file)
-                            
-                            extracted_files.append(media_file)
-                            
-                        except Exception as e:
-                            logger.error(f"Error approving file {pending_file.original_filename}: {e}")
-                            errors.append({
-                                "filename": pending_file.original_filename,
-                                "error": f"Failed to approve: {str(e)}",
-                                "status": "error"
-                            })
-                
-            finally:
-                # Clean up temp ZIP file
-                os.unlink(temp_zip.name)
-            
+                        )
+                        self._report(progress, on_progress)
+
+            progress.status = "completed"
+
         except Exception as e:
             logger.error(f"Error extracting ZIP: {e}")
-            errors.append({
+            progress.status = "failed"
+            progress.errors.append({
                 "error": f"Failed to extract ZIP: {str(e)}",
                 "status": "error"
             })
-        finally:
-            # Clean up temp directory
-            if temp_dir and os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir, ignore_errors=True)
-        
+
+        self._report(progress, on_progress)
+
         return ZipExtractionResult(
             success=len(extracted_files) > 0,
             files=extracted_files,
-            errors=errors,
-            warnings=warnings,
+            errors=progress.errors,
+            warnings=progress.warnings,
             collection=created_collection or collection,
             file_count=len(extracted_files),
-            skipped_count=skipped_count
+            skipped_count=progress.skipped_count
+        )
+
+    def _import_batch(
+        self,
+        zf: zipfile.ZipFile,
+        infos: List[zipfile.ZipInfo],
+        executor: ThreadPoolExecutor,
+        seen_hashes: set,
+        namespace: Namespace,
+        user,
+        collection: Optional[MediaCollection],
+        file_tags: List,
+        progress: ZipImportProgress,
+    ) -> List[MediaFile]:
+        """Read, de-duplicate, upload, analyze and insert one batch of archive members."""
+        claim_lock = threading.Lock()
+
+        def claim(file_hash: str) -> bool:
+            with claim_lock:
+                if file_hash in seen_hashes:
+                    return False
+                seen_hashes.add(file_hash)
+                return True
+
+        entries = []
+        for info in infos:
+            filename = os.path.basename(info.filename)
+            entries.append(
+                _ZipMember(
+                    filename=filename,
+                    file_size=info.file_size,
+                    content_type=self._guess_content_type(filename),
+                    zip_info=info,
+                )
+            )
+
+        uploaded = []
+        for entry in executor.map(
+            lambda entry: self._upload_member(entry, zf, user, claim), entries
+        ):
+            if entry.errors:
+                progress.errors.extend(entry.errors)
+            elif entry.file_path is None:
+                # Same content appears earlier in the archive
+                progress.duplicate_count += 1
+            else:
+                uploaded.append(entry)
+        progress.processed_files += len(infos)
+
+        if not uploaded:
+            return []
+
+        hashes = [entry.file_hash for entry in uploaded]
+        existing_media = {
+            media.file_hash: media
+            for media in MediaFile.objects.with_deleted().filter(file_hash__in=hashes)
+        }
+        existing_pending = {
+            pending.file_hash: pending
+            for pending in PendingMediaFile.objects.filter(file_hash__in=hashes)
+        }
+
+        new_entries = []
+        linked_media_ids = []
+        redundant_paths = []
+        for entry in uploaded:
+            media = existing_media.get(entry.file_hash)
+            if media is not None and not media.is_deleted:
+                # Content already in the library: link it instead
+                progress.duplicate_count += 1
+                linked_media_ids.append(media.id)
+                redundant_paths.append(entry.file_path)
+                continue
+            if media is not None:
+                # Soft-deleted copy, purge it like create_with_hash_cleanup does
+                media.delete(force=True)
+
+            pending = existing_pending.get(entry.file_hash)
+            if pending is None:
+                pass
+            elif pending.namespace_id == namespace.pk and pending.uploaded_by_id == user.pk:
+                # This user's earlier upload of the same bytes to this namespace
+                entry.existing_pending = pending
+                redundant_paths.append(entry.file_path)
+                entry.file_path = pending.file_path
+            else:
+                # Someone else's upload is waiting for approval; leave it alone
+                entry.create_pending = False
+            new_entries.append(entry)
+        self._delete_uploads(redundant_paths)
+
+        analyzed = list(
+            executor.map(lambda entry: self._analyze_member(entry, zf), new_entries)
         )
-    
+
+        try:
+            media_files = self._bulk_create_media(
+                analyzed, namespace, user, collection, file_tags, linked_media_ids
+            )
+        except IntegrityError as e:
+            # A concurrent upload claimed a hash or slug, fall back per file
+            logger.warning(f"Bulk insert of ZIP batch failed, retrying per file: {e}")
+            media_files = self._create_media_individually(
+                analyzed, namespace, user, collection, file_tags, progress
+            )
+
+        documents = [media.id for media in media_files if media.file_type == "document"]
+        if documents:
+            transaction.on_commit(lambda: self._schedule_document_processing(documents))
+
+        progress.imported_count += len(media_files)
+        progress.file_ids.extend(str(media.id) for media in media_files)
+        return media_files
+
+    def _upload_member(
+        self,
+        entry: _ZipMember,
+        zf: zipfile.ZipFile,
+        user,
+        claim: Callable[[str], bool],
+    ) -> _ZipMember:
+        """
+        Decompress a member once, then hash, validate and upload it from memory.
+
+        Members whose hash is already claimed by another member of the archive
+        are returned without a file_path. Runs on a pool thread, so it must not
+        touch the database.
+        """
+        try:
+            with zf.open(entry.zip_info) as member:
+                content = member.read()
+            entry.file_hash = hashlib.sha256(content).hexdigest()
+            if not claim(entry.file_hash):
+                return entry
+
+            uploaded_file = SimpleUploadedFile(
+                entry.filename, content, content_type=entry.content_type
+            )
+            validation_result = self.validation_service.validate(
+                uploaded_file, user, force_upload=False
+            )
+            if not validation_result.is_valid:
+                entry.errors.extend(validation_result.errors)
+                return entry
+
+            if entry.content_type.startswith("image/"):
+                metadata = storage.extract_metadata(content, entry.content_type)
+                entry.width = metadata.get("width")
+                entry.height = metadata.get("height")
+
+            extension = os.path.splitext(entry.filename)[1]
+            uploaded_file.seek(0)
+            entry.file_path = storage.save(
+                f"uploads/{uuid.uuid4()}{extension}", uploaded_file
+            )
+
+        except Exception as e:
+            logger.error(f"Error processing extracted file {entry.filename}: {e}")
+            entry.errors.append({
+                "filename": entry.filename,
+                "error": str(e),
+                "status": "error"
+            })
+        finally:
+            connections.close_all()
+
+        return entry
+
+    def _analyze_member(self, entry: _ZipMember, zf: zipfile.ZipFile) -> _ZipMember:
+        """
+        Run AI analysis for a member that is new to the library.
+
+        Only images are decompressed again, as other types are analyzed by
+        name. Runs on a pool thread, so it must not touch the database.
+        """
+        try:
+            content = b""
+            if entry.content_type.startswith("image/"):
+                with zf.open(entry.zip_info) as member:
+                    content = member.read()
+            entry.ai_analysis = ai_service.analyze_media_file(
+                content, entry.filename, entry.content_type
+            )
+        except Exception as e:
+            logger.error(f"AI analysis failed for {entry.filename}: {e}")
+        finally:
+            connections.close_all()
+
+        return entry
+
+    def _delete_uploads(self, file_paths: List[str]) -> None:
+        """Remove uploads that turned out to duplicate stored content."""
+        for file_path in file_paths:
+            try:
+                storage.delete(file_path)
+            except Exception as e:
+                logger.warning(f"Failed to delete duplicate upload {file_path}: {e}")
+
+    def _build_pending(
+        self,
+        entry: _ZipMember,
+        namespace: Namespace,
+        user,
+        expires_at,
+    ) -> PendingMediaFile:
+        """Fill in the caller's pending row, or a new one, from an archive member."""
+        ai_analysis = entry.ai_analysis
+        pending = entry.existing_pending or PendingMediaFile(file_hash=entry.file_hash)
+        pending.original_filename = entry.filename
+        pending.file_path = entry.file_path
+        pending.file_size = entry.file_size
+        pending.content_type = entry.content_type
+        pending.file_type = self.upload_service._determine_file_type(entry.content_type)
+        pending.width = entry.width
+        pending.height = entry.height
+        pending.ai_generated_tags = ai_analysis.get("suggested_tags", [])
+        pending.ai_suggested_title = ai_analysis.get("suggested_title", "")
+        pending.ai_extracted_text = ai_analysis.get("extracted_text", "")
+        pending.ai_confidence_score = ai_analysis.get("confidence_score", 0.0)
+        pending.namespace = namespace
+        pending.folder_path = ""
+        pending.uploaded_by = user
+        pending.expires_at = expires_at
+        pending.status = "approved"
+        return pending
+
+    def _media_file_from_pending(
+        self, pending: PendingMediaFile, namespace: Namespace, user
+    ) -> MediaFile:
+        """Build an unsaved, public MediaFile for a pending row."""
+        return MediaFile(
+            title=pending.ai_suggested_title or pending.original_filename,
+            description="",
+            original_filename=pending.original_filename,
+            file_path=pending.file_path,
+            file_size=pending.file_size,
+            content_type=pending.content_type,
+            file_hash=pending.file_hash,
+            file_type=pending.file_type,
+            width=pending.width,
+            height=pending.height,
+            ai_generated_tags=pending.ai_generated_tags,
+            ai_suggested_title=pending.ai_suggested_title,
+            ai_extracted_text=pending.ai_extracted_text,
+            ai_confidence_score=pending.ai_confidence_score,
+            namespace=namespace,
+            tenant_id=namespace.tenant_id,
+            access_level="public",
+            created_by=user,
+            last_modified_by=user,
+            uploaded_by=user,
+        )
+
+    def _bulk_create_media(
+        self,
+        entries: List[_ZipMember],
+        namespace: Namespace,
+        user,
+        collection: Optional[MediaCollection],
+        file_tags: List,
+        linked_media_ids: List,
+    ) -> List[MediaFile]:
+        """Insert pending rows, media files and relations for a batch."""
+        expires_at = timezone.now() + timedelta(hours=24)
+
+        with transaction.atomic():
+            new_pending = []
+            reused_pending = []
+            # Members whose hash is held by another user's pending row
+            unrecorded = []
+            for entry in entries:
+                pending = self._build_pending(entry, namespace, user, expires_at)
+                if entry.existing_pending is not None:
+                    reused_pending.append(pending)
+                elif entry.create_pending:
+                    new_pending.append(pending)
+                else:
+                    unrecorded.append(pending)
+
+            PendingMediaFile.objects.bulk_create(new_pending)
+            if reused_pending:
+                PendingMediaFile.objects.bulk_update(
+                    reused_pending,
+                    [
+                        "original_filename",
+                        "file_path",
+                        "file_size",
+                        "content_type",
+                        "file_type",
+                        "width",
+                        "height",
+                        "ai_generated_tags",
+                        "ai_suggested_title",
+                        "ai_extracted_text",
+                        "ai_confidence_score",
+                        "namespace",
+                        "folder_path",
+                        "uploaded_by",
+                        "expires_at",
+                        "status",
+                    ],
+                )
+
+            media_files = [
+                self._media_file_from_pending(pending, namespace, user)
+                for pending in new_pending + reused_pending + unrecorded
+            ]
+            self._assign_unique_slugs(media_files, namespace)
+            MediaFile.objects.bulk_create(media_files)
+
+            if file_tags:
+                MediaFile.tags.through.objects.bulk_create(
+                    [
+                        MediaFile.tags.through(mediafile_id=media.id, mediatag_id=tag_id)
+                        for media in media_files
+                        for tag_id in file_tags
+                    ],
+                    ignore_conflicts=True,
+                )
+            if collection:
+                MediaFile.collections.through.objects.bulk_create(
+                    [
+                        MediaFile.collections.through(
+                            mediafile_id=media_id, mediacollection_id=collection.id
+                        )
+                        for media_id in [m.id for m in media_files] + linked_media_ids
+                    ],
+                    ignore_conflicts=True,
+                )
+                # Bulk inserts bypass m2m_changed, so invalidate explicitly
+                CollectionManifestService.invalidate([collection.id])
+
+        return media_files
+
+    def _create_media_individually(
+        self,
+        entries: List[_ZipMember],
+        namespace: Namespace,
+        user,
+        collection: Optional[MediaCollection],
+        file_tags: List,
+        progress: ZipImportProgress,
+    ) -> List[MediaFile]:
+        """Slow path used when a batch insert collides with concurrent uploads."""
+        media_files = []
+        for entry in entries:
+            try:
+                with transaction.atomic():
+                    pending = PendingMediaFile.objects.filter(
+                        file_hash=entry.file_hash,
+                        namespace=namespace,
+                        uploaded_by=user,
+                    ).first()
+                    if pending is None and not PendingMediaFile.objects.filter(
+                        file_hash=entry.file_hash
+                    ).exists():
+                        pending = self._build_pending(
+                            entry, namespace, user, timezone.now() + timedelta(hours=24)
+                        )
+                        pending.status = "pending"
+                        pending.save()
+
+                    if pending is not None:
+                        media_file = pending.approve_and_create_media_file(
+                            title=pending.ai_suggested_title or pending.original_filename,
+                            slug=None,  # Auto-generate
+                            description="",
+                            tags=file_tags,
+                            access_level="public"
+                        )
+                    else:
+                        # Another user's pending row holds these bytes
+                        media_file = self._media_file_from_pending(
+                            self._build_pending(entry, namespace, user, None),
+                            namespace,
+                            user,
+                        )
+                        media_file.save()
+                        if file_tags:
+                            media_file.tags.set(file_tags)
+                if collection:
+                    collection.mediafile_set.add(media_file)
+                media_files.append(media_file)
+            except Exception as e:
+                logger.error(f"Error approving file {entry.filename}: {e}")
+                progress.errors.append({
+                    "filename": entry.filename,
+                    "error": f"Failed to approve: {str(e)}",
+                    "status": "error"
+                })
+        return media_files
+
+    def _assign_unique_slugs(self, media_files: List[MediaFile], namespace: Namespace):
+        """Allocate namespace-unique slugs for a batch with a single query."""
+        base_slugs = [media._generate_base_slug() for media in media_files]
+        if not base_slugs:
+            return
+
+        conditions = reduce(
+            or_,
+            [Q(slug=base) | Q(slug__startswith=f"{base}-") for base in set(base_slugs)],
+        )
+        taken = set(
+            MediaFile.objects.with_deleted()
+            .filter(namespace=namespace)
+            .filter(conditions)
+            .values_list("slug", flat=True)
+        )
+
+        for media, base_slug in zip(media_files, base_slugs):
+            slug = base_slug
+            counter = 1
+            while slug in taken:
+                slug = f"{base_slug}-{counter}"
+                counter += 1
+            taken.add(slug)
+            media.slug = slug
+
+    def _schedule_document_processing(self, media_file_ids: List) -> None:
+        """Queue text extraction and thumbnails for imported documents."""
+        from ..tasks import process_document_text, generate_document_thumbnail
+
+        for media_file_id in media_file_ids:
+            generate_document_thumbnail.delay(str(media_file_id), is_pending=False)
+            process_document_text.delay(str(media_file_id), is_pending=False)
+
+    def _report(
+        self,
+        progress: ZipImportProgress,
+        on_progress: Optional[Callable[[ZipImportProgress], None]],
+    ) -> None:
+        """Publish progress to the cache and the optional callback."""
+        progress.save()
+        if on_progress:
+            on_progress(progress)
+
+    @staticmethod
+    def _batched(items: List, size: int) -> Iterator[List]:
+        """Yield successive fixed-size batches from a list."""
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
+
     def _create_collection_from_zip(
         self,
         zip_filename: str,
@@ -352,12 +954,12 @@ class ZipExtractionService:
         """Create a new collection from ZIP filename."""
         # Get title from filename (remove .zip extension)
         title = os.path.splitext(zip_filename)[0]
-        
+
         # Clean up title
         title = title.replace('_', ' ').replace('-', ' ').strip()
         if not title:
             title = "Imported Collection"
-        
+
         # Create collection
         collection = MediaCollection.objects.create(
             title=title,
@@ -367,17 +969,15 @@ class ZipExtractionService:
             last_modified_by=user,
             description=f"Imported from {zip_filename}"
         )
-        
+
         # Add tags if provided
         if tags:
             tag_objects = MediaTag.objects.filter(id__in=tags, namespace=namespace)
             collection.tags.set(tag_objects)
-        
+
         return collection
-    
+
     def _guess_content_type(self, filename: str) -> str:
         """Guess content type from filename."""
-        import mimetypes
         content_type, _ = mimetypes.guess_type(filename)
         return content_type or 'application/octet-stream'
-
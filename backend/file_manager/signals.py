@@ -0,0 +1,57 @@
+"""
+Collection Manifest Invalidation Signals
+
+Invalidates cached collection manifests when membership or file metadata changes.
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import MediaCollection, MediaFile
+from .services.collection_manifest import MANIFEST_FIELDS, CollectionManifestService
+
+
+@receiver(m2m_changed, sender=MediaFile.collections.through)
+def invalidate_manifest_on_membership_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """Invalidate manifests when files are added to or removed from collections"""
+    if reverse:
+        # collection.mediafile_set.add/remove/clear
+        if action in ("post_add", "post_remove", "post_clear"):
+            CollectionManifestService.invalidate([instance.pk])
+        return
+
+    if action == "pre_clear":
+        instance._manifest_collection_ids = list(
+            instance.collections.values_list("id", flat=True)
+        )
+    elif action == "post_clear":
+        CollectionManifestService.invalidate(
+            getattr(instance, "_manifest_collection_ids", [])
+        )
+    elif action in ("post_add", "post_remove"):
+        CollectionManifestService.invalidate(pk_set or [])
+
+
+@receiver(post_save, sender=MediaFile)
+def invalidate_manifest_on_file_save(sender, instance, created, update_fields, **kwargs):
+    """Invalidate manifests of collections containing a file whose metadata changed"""
+    if created:
+        return
+    if update_fields is not None and not MANIFEST_FIELDS.intersection(update_fields):
+        return
+    CollectionManifestService.invalidate_for_files([instance.pk])
+
+
+@receiver(pre_delete, sender=MediaFile)
+def invalidate_manifest_on_file_delete(sender, instance, **kwargs):
+    """Invalidate manifests before a file's membership rows are cascaded away"""
+    CollectionManifestService.invalidate_for_files([instance.pk])
+
+
+@receiver(post_save, sender=MediaCollection)
+@receiver(post_delete, sender=MediaCollection)
+def invalidate_manifest_on_collection_change(sender, instance, **kwargs):
+    """Invalidate a collection's manifest when the collection itself changes"""
+    CollectionManifestService.invalidate([instance.pk])
@@ -11,7 +11,6 @@ including features like:
 """
 
 import os
-import boto3
 import logging
 import hashlib
 import uuid
@@ -21,8 +20,6 @@ from django.core.files.storage import Storage
 from django.core.files.uploadedfile import UploadedFile
 from django.utils.deconstruct import deconstructible
 from botocore.exceptions import ClientError
-from botocore.config import Config
-from PIL import Image, ExifTags
 import io
 
 logger = logging.getLogger(__name__)
@@ -67,20 +64,35 @@ class S3MediaStorage(Storage):
             },
         )
 
-        # Initialize S3 client with proper config for Linode/AWS compatibility
-        s3_config = Config(
-            signature_version=self.signature_version,
-            s3={"addressing_style": self.addressing_style},
-        )
+        self._client = None
 
-        self.client = boto3.client(
-            "s3",
-            aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key,
-            region_name=self.region_name,
-            endpoint_url=self.internal_endpoint_url,
-            config=s3_config,
-        )
+    @property
+    def client(self):
+        """
+        S3 client, created on first use.
+
+        The module-level storages are instantiated at import time, so boto3
+        is imported and the client built only when S3 is actually accessed.
+        """
+        if self._client is None:
+            import boto3
+            from botocore.config import Config
+
+            # Initialize S3 client with proper config for Linode/AWS compatibility
+            s3_config = Config(
+                signature_version=self.signature_version,
+                s3={"addressing_style": self.addressing_style},
+            )
+
+            self._client = boto3.client(
+                "s3",
+                aws_access_key_id=self.access_key,
+                aws_secret_access_key=self.secret_key,
+                region_name=self.region_name,
+                endpoint_url=self.internal_endpoint_url,
+                config=s3_config,
+            )
+        return self._client
 
     def make_public(self, name):
         """
@@ -432,6 +444,21 @@ class S3MediaStorage(Storage):
             logger.error(f"Failed to save file {name} to S3: {e}")
             raise
 
+    def download_fileobj(self, name: str, fileobj: BinaryIO) -> None:
+        """
+        Stream a file from S3 into a writable file object.
+
+        Args:
+            name: File name or path
+            fileobj: Writable binary file object (e.g. a temporary file)
+        """
+        key = self._get_key(name)
+        try:
+            self.client.download_fileobj(self.bucket_name, key, fileobj)
+        except ClientError as e:
+            logger.error(f"Failed to download file {name} from S3: {e}")
+            raise
+
     def delete(self, name: str) -> None:
         """
         Delete a file from S3.
@@ -566,6 +593,8 @@ class S3MediaStorage(Storage):
         }
 
         if content_type.startswith("image/"):
+            from PIL import Image, ExifTags
+
             try:
                 image = Image.open(io.BytesIO(file_content))
                 metadata.update(
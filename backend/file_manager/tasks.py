@@ -233,3 +233,85 @@ def generate_document_thumbnail(self, file_id, is_pending=True):
 
         # Retry the task
         raise self.retry(exc=e)
+
+
+@shared_task(bind=True)
+def import_zip_archive(
+    self,
+    task_id,
+    archive_path,
+    archive_name,
+    namespace_id,
+    user_id,
+    collection_id=None,
+    collection_slug=None,
+):
+    """
+    Import a staged ZIP archive into the media library in the background.
+
+    The archive is downloaded once into an anonymous temp file and streamed
+    member by member; progress is published to the cache under
+    ``zip_import_progress_<task_id>``.
+
+    Args:
+        task_id: Import job ID used for progress reporting
+        archive_path: Object storage key of the staged ZIP
+        archive_name: Original filename of the uploaded ZIP
+        namespace_id: UUID of the target Namespace
+        user_id: ID of the user who uploaded the archive
+        collection_id: Existing collection to add files to (optional)
+        collection_slug: Slug for a new collection if creating one
+
+    Returns:
+        Final progress dict
+    """
+    from django.contrib.auth.models import User
+    from content.models import Namespace
+    from .models import MediaCollection
+    from .storage import storage
+    from .services.zip_service import ZipExtractionService, ZipImportProgress
+
+    progress = ZipImportProgress(
+        task_id=task_id, archive_name=archive_name, requested_by=user_id
+    )
+
+    try:
+        namespace = Namespace.objects.get(id=namespace_id)
+        user = User.objects.get(id=user_id)
+        collection = None
+        if collection_id:
+            collection = MediaCollection.objects.get(
+                id=collection_id, namespace=namespace
+            )
+
+        with tempfile.TemporaryFile(suffix=".zip") as archive:
+            storage.download_fileobj(archive_path, archive)
+            ZipExtractionService().import_archive(
+                archive,
+                namespace,
+                user,
+                progress,
+                collection=collection,
+                collection_slug=collection_slug,
+            )
+
+        logger.info(
+            f"ZIP import {task_id} finished: {progress.imported_count} imported, "
+            f"{progress.duplicate_count} duplicates, {len(progress.errors)} errors"
+        )
+
+    except Exception as e:
+        logger.error(f"ZIP import {task_id} failed: {e}")
+        progress.status = "failed"
+        progress.errors.append(
+            {"error": f"Failed to import ZIP: {str(e)}", "status": "error"}
+        )
+        progress.save()
+
+    finally:
+        try:
+            storage.delete(archive_path)
+        except Exception as e:
+            logger.warning(f"Failed to remove staged ZIP {archive_path}: {e}")
+
+    return progress.to_dict()
@@ -0,0 +1,128 @@
+"""
+Tests for the CollectionManifestService class.
+"""
+
+import uuid
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+
+from content.models import Namespace
+from file_manager.models import MediaCollection, MediaFile
+from file_manager.services import CollectionManifestService
+from file_manager.services.collection_manifest import get_collection_manifest_key
+
+
+class CollectionManifestServiceTests(TestCase):
+    """Test cases for cached collection manifests."""
+
+    def setUp(self):
+        from core.models import Tenant
+
+        cache.clear()
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant", identifier="test-tenant-manifest", created_by=self.user
+        )
+        self.namespace = Namespace.objects.create(
+            name="Manifest Namespace",
+            slug="manifest-namespace",
+            created_by=self.user,
+            tenant=self.tenant,
+        )
+        self.collection = MediaCollection.objects.create(
+            title="Gallery",
+            namespace=self.namespace,
+            created_by=self.user,
+            last_modified_by=self.user,
+        )
+
+    def _create_file(self, title, **kwargs):
+        return MediaFile.objects.create(
+            title=title,
+            slug=f"{title.lower()}-{uuid.uuid4().hex[:6]}",
+            original_filename=f"{title}.jpg",
+            file_path=f"test/{title}.jpg",
+            file_size=1000,
+            content_type="image/jpeg",
+            file_type="image",
+            file_hash=uuid.uuid4().hex,
+            width=1200,
+            height=800,
+            namespace=self.namespace,
+            tenant=self.tenant,
+            created_by=self.user,
+            last_modified_by=self.user,
+            **kwargs,
+        )
+
+    def test_manifest_lists_ordered_items(self):
+        """Test that the manifest contains render-ready items in upload order."""
+        first = self._create_file("First", metadata={"annotation": "Note"})
+        second = self._create_file("Second", description="Caption")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.collection.mediafile_set.add(first, second)
+
+        manifest = CollectionManifestService.get_manifest(self.collection.id)
+
+        self.assertEqual(manifest["item_count"], 2)
+        items = manifest["items"]
+        self.assertEqual([item["id"] for item in items], [str(first.id), str(second.id)])
+        self.assertEqual(items[0]["annotation"], "Note")
+        self.assertEqual(items[1]["caption"], "Caption")
+        self.assertEqual(items[0]["width"], 1200)
+        self.assertTrue(items[0]["url"])
+        self.assertTrue(items[0]["thumbnail_url"])
+
+    def test_manifest_is_served_from_cache(self):
+        """Test that a cached manifest is returned without querying."""
+        CollectionManifestService.get_manifest(self.collection.id)
+
+        with self.assertNumQueries(0):
+            manifest = CollectionManifestService.get_manifest(self.collection.id)
+        self.assertEqual(manifest["collection_id"], str(self.collection.id))
+
+    def test_membership_change_invalidates_manifest(self):
+        """Test that adding a file to the collection drops the cached manifest."""
+        CollectionManifestService.get_manifest(self.collection.id)
+        media_file = self._create_file("Added")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.collection.mediafile_set.add(media_file)
+
+        self.assertIsNone(cache.get(get_collection_manifest_key(self.collection.id)))
+        manifest = CollectionManifestService.get_manifest(self.collection.id)
+        self.assertEqual(manifest["item_count"], 1)
+
+    def test_metadata_change_invalidates_manifest(self):
+        """Test that editing a member file's title rebuilds the manifest."""
+        media_file = self._create_file("Original")
+        with self.captureOnCommitCallbacks(execute=True):
+            media_file.collections.add(self.collection)
+        CollectionManifestService.get_manifest(self.collection.id)
+
+        media_file.title = "Renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            media_file.save(update_fields=["title"])
+
+        manifest = CollectionManifestService.get_manifest(self.collection.id)
+        self.assertEqual(manifest["items"][0]["title"], "Renamed")
+
+    def test_unrelated_field_update_keeps_manifest(self):
+        """Test that counter updates do not invalidate the manifest."""
+        media_file = self._create_file("Counted")
+        with self.captureOnCommitCallbacks(execute=True):
+            media_file.collections.add(self.collection)
+        CollectionManifestService.get_manifest(self.collection.id)
+
+        media_file.download_count = 5
+        with self.captureOnCommitCallbacks(execute=True):
+            media_file.save(update_fields=["download_count"])
+
+        self.assertIsNotNone(cache.get(get_collection_manifest_key(self.collection.id)))
+
+    def test_missing_collection_returns_none(self):
+        """Test that unknown collection IDs return None."""
+        self.assertIsNone(CollectionManifestService.get_manifest(uuid.uuid4()))
+        self.assertIsNone(CollectionManifestService.get_manifest("not-a-uuid"))
@@ -103,6 +103,20 @@ class TestUploadResponseBuilder:
         assert response.data["error_count"] == 1
         assert len(response.data["errors"]) == 1
 
+    def test_queued_zip_import_response(self):
+        """Test response when ZIP archives were queued for background import."""
+        builder = UploadResponseBuilder()
+        zip_imports = [
+            {"task_id": "abc", "archive_name": "photos.zip", "status": "queued"}
+        ]
+
+        response = builder.build_response([], [], zip_imports=zip_imports)
+
+        assert isinstance(response, Response)
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data["success_count"] == 0
+        assert response.data["zip_imports"] == zip_imports
+
     def test_validation_error_response(self):
         """Test response for validation errors."""
         builder = UploadResponseBuilder()
@@ -243,11 +243,11 @@ class DocumentTasksTestCase(TestCase):
 class S3ThumbnailStorageTestCase(TestCase):
     """Test cases for S3 thumbnail upload."""
 
-    @patch('file_manager.storage.boto3')
-    def test_upload_thumbnail(self, mock_boto3):
+    @patch('boto3.client')
+    def test_upload_thumbnail(self, mock_boto3_client):
         """Test thumbnail upload to S3."""
         mock_client = MagicMock()
-        mock_boto3.client.return_value = mock_client
+        mock_boto3_client.return_value = mock_client
 
         storage = S3MediaStorage()
         thumbnail_bytes = b"fake thumbnail data"
@@ -7,8 +7,9 @@ from django.test import TestCase
 from django.contrib.auth.models import User
 from django.utils import timezone
 from content.models import Namespace
-from ..models import MediaFile
+from ..models import MediaFile, MediaUsage
 from ..utils import (
+    apply_media_reference_changes,
     extract_media_references,
     update_media_references,
     cleanup_content_references,
@@ -154,6 +155,113 @@ class MediaFileReferenceTrackingTests(TestCase):
         success = self.file.remove_reference(content_type, str(uuid.uuid4()))
         self.assertFalse(success)
 
+    def test_apply_media_reference_changes_for_many_contents(self):
+        """Test that reference deltas for several contents are applied as rows."""
+        first_id = str(uuid.uuid4())
+        second_id = str(uuid.uuid4())
+
+        apply_media_reference_changes(
+            "webpage",
+            {
+                first_id: ({str(self.file.id), str(uuid.uuid4())}, set()),
+                second_id: ({str(self.file.id)}, set()),
+            },
+        )
+
+        self.file.refresh_from_db()
+        self.assertEqual(self.file.reference_count, 2)
+        self.assertEqual(
+            sorted(self.file.referenced_in["webpage"]), sorted([first_id, second_id])
+        )
+        self.assertEqual(
+            MediaUsage.objects.filter(media_file=self.file, usage_type="content").count(),
+            2,
+        )
+
+        apply_media_reference_changes(
+            "webpage", {first_id: (set(), {str(self.file.id)})}
+        )
+
+        self.file.refresh_from_db()
+        self.assertEqual(self.file.reference_count, 1)
+        self.assertEqual(self.file.referenced_in, {"webpage": [second_id]})
+
+    def test_page_version_save_diffs_loaded_content(self):
+        """Test that saving a loaded version updates references from its old content."""
+        from webpages.models import PageVersion, WebPage
+
+        page = WebPage.objects.create(
+            title="Reference Page",
+            slug="reference-page",
+            tenant=self.tenant,
+            created_by=self.user,
+            last_modified_by=self.user,
+        )
+        version = PageVersion.objects.create(
+            page=page,
+            version_number=1,
+            widgets={
+                "main": [
+                    {
+                        "type": "Content",
+                        "data": {"content": f'<img src="/media/{self.file.id}/a.jpg">'},
+                    }
+                ]
+            },
+            created_by=self.user,
+        )
+
+        self.file.refresh_from_db()
+        self.assertEqual(self.file.referenced_in, {"webpage": [str(page.id)]})
+
+        version = PageVersion.objects.get(pk=version.pk)
+        version.widgets = {"main": [{"type": "Content", "data": {"content": "<p></p>"}}]}
+        version.save()
+
+        self.file.refresh_from_db()
+        self.assertEqual(self.file.reference_count, 0)
+        self.assertEqual(self.file.referenced_in, {})
+
+    def test_draft_dropping_image_keeps_published_reference(self):
+        """Test that media still shown by the published version keeps its usage row."""
+        from datetime import timedelta
+        from webpages.models import PageVersion, WebPage
+
+        page = WebPage.objects.create(
+            title="Published Page",
+            slug="published-page",
+            tenant=self.tenant,
+            created_by=self.user,
+            last_modified_by=self.user,
+        )
+        with_image = {
+            "main": [
+                {
+                    "type": "Content",
+                    "data": {"content": f'<img src="/media/{self.file.id}/a.jpg">'},
+                }
+            ]
+        }
+        PageVersion.objects.create(
+            page=page,
+            version_number=1,
+            widgets=with_image,
+            effective_date=timezone.now() - timedelta(days=1),
+            created_by=self.user,
+        )
+        draft = PageVersion.objects.create(
+            page=page, version_number=2, widgets=with_image, created_by=self.user
+        )
+
+        draft.widgets = {"main": [{"type": "Content", "data": {"content": "<p></p>"}}]}
+        draft.save()
+
+        self.file.refresh_from_db()
+        self.assertEqual(self.file.referenced_in, {"webpage": [str(page.id)]})
+        self.assertTrue(
+            MediaUsage.objects.filter(media_file=self.file, object_id=str(page.id)).exists()
+        )
+
     def test_reference_deletion_protection(self):
         """Test that files with references cannot be deleted."""
         # Add a reference
@@ -320,6 +320,7 @@ class ZipUploadEndpointTestCase(TestCase):
         self.assertIn(response.status_code, [
             status.HTTP_200_OK,
             status.HTTP_201_CREATED,
+            status.HTTP_202_ACCEPTED,
             status.HTTP_400_BAD_REQUEST  # May fail validation in test environment
         ])
     
@@ -357,6 +358,7 @@ class ZipUploadEndpointTestCase(TestCase):
         self.assertIn(response.status_code, [
             status.HTTP_200_OK,
             status.HTTP_201_CREATED,
+            status.HTTP_202_ACCEPTED,
             status.HTTP_400_BAD_REQUEST
         ])
     
@@ -379,6 +381,7 @@ class ZipUploadEndpointTestCase(TestCase):
         self.assertIn(response.status_code, [
             status.HTTP_200_OK,
             status.HTTP_201_CREATED,
+            status.HTTP_202_ACCEPTED,
             status.HTTP_400_BAD_REQUEST
         ])
 
@@ -408,3 +411,188 @@ class ZipSizeLimitTestCase(TestCase):
         """Test maximum number of files in ZIP."""
         self.assertEqual(self.service.MAX_FILES_IN_ZIP, 100)
 
+
+
+class ZipStreamingImportTestCase(TestCase):
+    """Tests for the streaming, batched ZIP import pipeline."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        from core.models import Tenant
+        self.user = User.objects.create_user(
+            username='testuser_stream',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.tenant = Tenant.objects.create(
+            name="Test Tenant",
+            identifier="test-tenant-stream",
+            created_by=self.user
+        )
+        self.namespace, _ = Namespace.objects.get_or_create(
+            slug="test-namespace-stream",
+            defaults={
+                "name": "Test Namespace",
+                "is_active": True,
+                "created_by": self.user,
+                "tenant": self.tenant,
+            },
+        )
+        self.service = ZipExtractionService()
+        self.service.batch_size = 2
+
+    def create_png(self, color):
+        """Create a small PNG image as bytes."""
+        import io
+        from PIL import Image
+        buffer = io.BytesIO()
+        Image.new('RGB', (4, 3), color).save(buffer, format='PNG')
+        return buffer.getvalue()
+
+    def create_archive(self, files_dict):
+        """Create an in-memory ZIP archive."""
+        import io
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w') as zf:
+            for filename, content in files_dict.items():
+                zf.writestr(filename, content)
+        archive.seek(0)
+        return archive
+
+    def test_import_archive_streams_and_deduplicates(self):
+        """Members are imported in batches and duplicate content is skipped."""
+        from unittest.mock import patch
+        from file_manager.services import ZipImportProgress
+
+        red = self.create_png('red')
+        archive = self.create_archive({
+            'red.png': red,
+            'copy/red-again.png': red,
+            'blue.png': self.create_png('blue'),
+            'green.png': self.create_png('green'),
+            '.DS_Store': b'junk',
+        })
+        collection = MediaCollection.objects.create(
+            title='Photos',
+            namespace=self.namespace,
+            created_by=self.user,
+            last_modified_by=self.user
+        )
+        progress = ZipImportProgress(archive_name='photos.zip')
+
+        with patch('file_manager.services.zip_service.storage.save', side_effect=lambda name, content: name) as mock_save:
+            result = self.service.import_archive(
+                archive, self.namespace, self.user, progress, collection=collection
+            )
+
+        self.assertEqual(progress.status, 'completed')
+        self.assertEqual(progress.total_files, 4)
+        self.assertEqual(progress.processed_files, 4)
+        self.assertEqual(progress.imported_count, 3)
+        self.assertEqual(progress.duplicate_count, 1)
+        self.assertEqual(progress.skipped_count, 1)
+        self.assertEqual(mock_save.call_count, 3)
+        self.assertEqual(result.file_count, 3)
+        self.assertEqual(collection.mediafile_set.count(), 3)
+        self.assertEqual(len({f.slug for f in result.files}), 3)
+        self.assertTrue(all(f.width == 4 and f.height == 3 for f in result.files))
+
+    def test_import_archive_links_existing_media(self):
+        """Content already in the library is linked, not uploaded again."""
+        from unittest.mock import patch
+        from file_manager.services import ZipImportProgress
+
+        red = self.create_png('red')
+        first = ZipImportProgress()
+        with patch('file_manager.services.zip_service.storage.save', side_effect=lambda name, content: name):
+            self.service.import_archive(
+                self.create_archive({'red.png': red}),
+                self.namespace,
+                self.user,
+                first,
+            )
+
+        collection = MediaCollection.objects.create(
+            title='Again',
+            namespace=self.namespace,
+            created_by=self.user,
+            last_modified_by=self.user
+        )
+        second = ZipImportProgress()
+        with patch('file_manager.services.zip_service.storage.save', side_effect=lambda name, content: name) as mock_save, \
+                patch('file_manager.services.zip_service.storage.delete') as mock_delete:
+            self.service.import_archive(
+                self.create_archive({'red.png': red}),
+                self.namespace,
+                self.user,
+                second,
+                collection=collection,
+            )
+
+        # Hashing happens while uploading, so the duplicate upload is removed
+        mock_delete.assert_called_once_with(mock_save.call_args.args[0])
+        self.assertEqual(second.imported_count, 0)
+        self.assertEqual(second.duplicate_count, 1)
+        self.assertEqual(MediaFile.objects.filter(namespace=self.namespace).count(), 1)
+        self.assertEqual(collection.mediafile_set.count(), 1)
+
+    def test_import_archive_leaves_other_users_pending_file(self):
+        """Another user's pending upload of the same bytes is not taken over."""
+        import hashlib
+        from datetime import timedelta
+        from unittest.mock import patch
+        from django.utils import timezone
+        from file_manager.models import PendingMediaFile
+        from file_manager.services import ZipImportProgress
+
+        red = self.create_png('red')
+        other = User.objects.create_user(username='other_uploader', password='testpass123')
+        pending = PendingMediaFile.objects.create(
+            original_filename='theirs.png',
+            file_path='uploads/theirs.png',
+            file_size=len(red),
+            content_type='image/png',
+            file_hash=hashlib.sha256(red).hexdigest(),
+            file_type='image',
+            namespace=self.namespace,
+            uploaded_by=other,
+            expires_at=timezone.now() + timedelta(hours=24),
+        )
+
+        progress = ZipImportProgress()
+        with patch('file_manager.services.zip_service.storage.save', side_effect=lambda name, content: name):
+            result = self.service.import_archive(
+                self.create_archive({'red.png': red}),
+                self.namespace,
+                self.user,
+                progress,
+            )
+
+        self.assertEqual(result.file_count, 1)
+        self.assertEqual(result.files[0].uploaded_by, self.user)
+        self.assertNotEqual(result.files[0].file_path, 'uploads/theirs.png')
+        pending.refresh_from_db()
+        self.assertEqual(pending.uploaded_by, other)
+        self.assertEqual(pending.status, 'pending')
+        self.assertEqual(pending.original_filename, 'theirs.png')
+
+    def test_background_limits_allow_large_archives(self):
+        """Background imports accept more files than synchronous extraction."""
+        archive = self.create_archive(
+            {f'file{i}.png': b'x' for i in range(150)}
+        )
+        zip_file = SimpleUploadedFile(
+            'big.zip', archive.getvalue(), content_type='application/zip'
+        )
+        limits = self.service.get_background_limits()
+
+        result = self.service.validate_zip(
+            zip_file,
+            max_size=limits['max_size'],
+            max_files=limits['max_files'],
+            max_uncompressed_size=limits['max_uncompressed_size'],
+            verify_crc=False,
+        )
+
+        self.assertTrue(result['is_valid'])
+        self.assertEqual(result['file_count'], 150)
@@ -9,6 +9,7 @@ from .views import (
     MediaTagViewSet,
     MediaCollectionViewSet,
     MediaUploadView,
+    ZipImportStatusView,
     MediaSearchView,
     MediaAISuggestionsView,
     MediaFileBySlugView,
@@ -37,6 +38,11 @@ urlpatterns = [
     path("", include(router.urls)),
     # Upload and search endpoints
     path("upload/", MediaUploadView.as_view(), name="media-upload"),
+    path(
+        "zip-imports/<uuid:task_id>/",
+        ZipImportStatusView.as_view(),
+        name="zip-import-status",
+    ),
     path("search/", MediaSearchView.as_view(), name="media-search"),
     # AI and bulk operation endpoints
     path("ai-suggestions/", MediaAISuggestionsView.as_view(), name="ai-suggestions"),
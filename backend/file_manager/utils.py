@@ -4,9 +4,15 @@ Utility functions for file manager operations.
 
 import re
 from bs4 import BeautifulSoup
-from typing import Set, Dict, List, Tuple
+from collections import defaultdict
+from typing import Set, Dict, Iterable, List, Optional, Tuple
 from django.db import transaction
-from .models import MediaFile
+from django.db.models import Q
+from django.utils import timezone
+from .models import MediaFile, MediaUsage
+
+# MediaUsage.usage_type used for references found in rich-text content
+CONTENT_USAGE_TYPE = "content"
 
 
 def extract_media_references(html_content: str) -> Set[str]:
@@ -19,7 +25,7 @@ def extract_media_references(html_content: str) -> Set[str]:
     Returns:
         Set of media file IDs found in the content
     """
-    if not html_content:
+    if not html_content or "/media/" not in html_content:
         return set()
 
     soup = BeautifulSoup(html_content, "html.parser")
@@ -37,7 +43,11 @@ def extract_media_references(html_content: str) -> Set[str]:
 
 
 def update_media_references(
-    content_type: str, content_id: str, old_content: str, new_content: str
+    content_type: str,
+    content_id: str,
+    old_content: str,
+    new_content: str,
+    retained_refs: Optional[Set[str]] = None,
 ) -> Tuple[List[str], List[str]]:
     """
     Update media references when content changes.
@@ -47,6 +57,8 @@ def update_media_references(
         content_id: ID of the content being updated
         old_content: Previous HTML content
         new_content: New HTML content
+        retained_refs: Media IDs the same content still references elsewhere
+            (e.g. in another version of a page), which are never removed
 
     Returns:
         Tuple of (added_refs, removed_refs) - lists of media IDs
@@ -55,28 +67,128 @@ def update_media_references(
     new_refs = extract_media_references(new_content)
 
     added_refs = new_refs - old_refs
-    removed_refs = old_refs - new_refs
+    removed_refs = old_refs - new_refs - set(retained_refs or ())
 
-    with transaction.atomic():
-        # Add new references
-        for media_id in added_refs:
-            try:
-                media = MediaFile.objects.get(id=media_id)
-                media.add_reference(content_type, content_id)
-            except MediaFile.DoesNotExist:
-                continue
-
-        # Remove old references
-        for media_id in removed_refs:
-            try:
-                media = MediaFile.objects.get(id=media_id)
-                media.remove_reference(content_type, content_id)
-            except MediaFile.DoesNotExist:
-                continue
+    apply_media_reference_changes(
+        content_type, {content_id: (added_refs, removed_refs)}
+    )
 
     return list(added_refs), list(removed_refs)
 
 
+def apply_media_reference_changes(
+    content_type: str,
+    changes: Dict[str, Tuple[Iterable[str], Iterable[str]]],
+    user=None,
+) -> None:
+    """
+    Apply reference deltas for many pieces of content in a fixed number of queries.
+
+    References are stored as MediaUsage rows; reference_count and
+    referenced_in on the affected media files are recomputed from those rows.
+
+    Args:
+        content_type: Type of content the changes belong to (e.g., 'webpage')
+        changes: Mapping of content ID to (added media IDs, removed media IDs)
+        user: Optional user recorded as creator of new usage rows
+    """
+    added_pairs = set()
+    removed_pairs = set()
+    for content_id, (added, removed) in changes.items():
+        content_id = str(content_id)
+        added_pairs.update((str(media_id), content_id) for media_id in added)
+        removed_pairs.update((str(media_id), content_id) for media_id in removed)
+
+    candidate_ids = {media_id for media_id, _ in added_pairs | removed_pairs}
+    if not candidate_ids:
+        return
+
+    with transaction.atomic():
+        existing_ids = {
+            str(media_id)
+            for media_id in MediaFile.objects.filter(id__in=candidate_ids).values_list(
+                "id", flat=True
+            )
+        }
+        added_pairs = {pair for pair in added_pairs if pair[0] in existing_ids}
+        removed_pairs = {pair for pair in removed_pairs if pair[0] in existing_ids}
+
+        if removed_pairs:
+            removed_by_content = defaultdict(set)
+            for media_id, content_id in removed_pairs:
+                removed_by_content[content_id].add(media_id)
+            condition = Q()
+            for content_id, media_ids in removed_by_content.items():
+                condition |= Q(object_id=content_id, media_file_id__in=media_ids)
+            MediaUsage.objects.filter(
+                condition, usage_type=CONTENT_USAGE_TYPE, object_type=content_type
+            ).delete()
+
+        if added_pairs:
+            MediaUsage.objects.bulk_create(
+                [
+                    MediaUsage(
+                        media_file_id=media_id,
+                        usage_type=CONTENT_USAGE_TYPE,
+                        object_type=content_type,
+                        object_id=content_id,
+                        created_by=user,
+                    )
+                    for media_id, content_id in sorted(added_pairs)
+                ],
+                ignore_conflicts=True,
+            )
+
+        refresh_reference_counts(
+            {media_id for media_id, _ in added_pairs | removed_pairs},
+            referenced_ids={media_id for media_id, _ in added_pairs},
+        )
+
+
+def refresh_reference_counts(
+    media_ids: Iterable[str], referenced_ids: Optional[Set[str]] = None
+) -> None:
+    """
+    Recompute reference_count and referenced_in from MediaUsage rows.
+
+    Args:
+        media_ids: IDs of the media files to refresh
+        referenced_ids: IDs whose last_referenced should be set to now
+    """
+    media_ids = {str(media_id) for media_id in media_ids}
+    if not media_ids:
+        return
+    referenced_ids = referenced_ids or set()
+
+    references = defaultdict(dict)
+    rows = (
+        MediaUsage.objects.filter(
+            usage_type=CONTENT_USAGE_TYPE, media_file_id__in=media_ids
+        )
+        .order_by("created_at", "object_id")
+        .values_list("media_file_id", "object_type", "object_id")
+    )
+    for media_id, object_type, object_id in rows:
+        references[str(media_id)].setdefault(object_type, []).append(object_id)
+
+    now = timezone.now()
+    media_files = list(
+        MediaFile.objects.filter(id__in=media_ids).only(
+            "id", "reference_count", "referenced_in", "last_referenced"
+        )
+    )
+    for media in media_files:
+        refs = references.get(str(media.id), {})
+        media.referenced_in = refs
+        media.reference_count = sum(len(ids) for ids in refs.values())
+        if str(media.id) in referenced_ids:
+            media.last_referenced = now
+
+    MediaFile.objects.bulk_update(
+        media_files, ["reference_count", "referenced_in", "last_referenced"]
+    )
+
+
 def cleanup_content_references(content_type: str, content_id: str) -> None:
     """
     Remove all media references for a piece of content (e.g., when content is deleted).
@@ -86,8 +198,13 @@ def cleanup_content_references(content_type: str, content_id: str) -> None:
         content_id: ID of the content being deleted
     """
     with transaction.atomic():
-        media_files = MediaFile.objects.filter(
-            referenced_in__contains={content_type: [content_id]}
+        usages = MediaUsage.objects.filter(
+            usage_type=CONTENT_USAGE_TYPE,
+            object_type=content_type,
+            object_id=str(content_id),
         )
-        for media in media_files:
-            media.remove_reference(content_type, content_id)
+        media_ids = set(usages.values_list("media_file_id", flat=True))
+        if not media_ids:
+            return
+        usages.delete()
+        refresh_reference_counts(media_ids)
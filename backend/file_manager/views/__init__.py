@@ -7,7 +7,7 @@ logical modules for better maintainability.
 
 from .media_file import MediaFileViewSet
 from .pending_media import PendingMediaFileViewSet
-from .upload import MediaUploadView
+from .upload import MediaUploadView, ZipImportStatusView
 from .search import MediaSearchView, MediaAISuggestionsView
 from .collections import MediaTagViewSet, MediaCollectionViewSet
 from .utils import (
@@ -23,6 +23,7 @@ __all__ = [
     "MediaFileViewSet",
     "PendingMediaFileViewSet",
     "MediaUploadView",
+    "ZipImportStatusView",
     "MediaSearchView",
     "MediaAISuggestionsView",
     "MediaTagViewSet",
@@ -25,6 +25,7 @@ from ..serializers import (
     MediaFileDetailSerializer,
 )
 from ..services import (
+    CollectionManifestService,
     FileUploadService,
     FileValidationService,
     UploadResponseBuilder,
@@ -416,6 +417,15 @@ class MediaCollectionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @action(detail=True, methods=["get"])
+    def manifest(self, request, pk=None):
+        """Get the cached gallery manifest (ordered render-ready items)."""
+        collection = self.get_object()
+        manifest = CollectionManifestService.get_manifest(
+            collection.id, collection=collection
+        )
+        return Response(manifest)
+
     @action(detail=True, methods=["post"])
     def add_files(self, request, pk=None):
         """Add files to a collection."""
@@ -9,7 +9,7 @@ from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 
 from ..models import MediaFile, PendingMediaFile, MediaCollection
-from ..serializers import MediaUploadSerializer, MediaFileDetailSerializer, PendingMediaFileListSerializer
+from ..serializers import MediaUploadSerializer
 from ..services import (
     FileUploadService,
     DuplicateFileHandler,
@@ -17,6 +17,7 @@ from ..services import (
     UploadResponseBuilder,
     NamespaceAccessService,
     ZipExtractionService,
+    get_zip_import_progress,
 )
 
 logger = logging.getLogger(__name__)
@@ -84,7 +85,8 @@ class MediaUploadView(APIView):
             else:
                 regular_files.append(uploaded_file)
         
-        # Process ZIP files first
+        # Queue ZIP files as background imports
+        zip_imports = []
         for zip_file in zip_files:
             try:
                 # Get collection if specified
@@ -102,7 +104,7 @@ class MediaUploadView(APIView):
                             "status": "error"
                         })
                         continue
-                
+
                 # Create collection slug from ZIP filename if not providing existing collection
                 collection_slug = None
                 if not collection:
@@ -110,44 +112,33 @@ class MediaUploadView(APIView):
                     from django.utils.text import slugify
                     base_name = os.path.splitext(zip_file.name)[0]
                     collection_slug = slugify(base_name)
-                
-                # Extract ZIP
-                extraction_result = self.zip_service.extract_zip(
+
+                # Stage the archive and hand it to a worker
+                zip_import = self.zip_service.enqueue_import(
                     zip_file,
                     namespace,
                     request.user,
                     collection=collection,
                     collection_slug=collection_slug,
-                    tags=None,  # Tags from collection will be used if available
                     max_size=max_zip_size
                 )
-                
-                if extraction_result.success:
-                    # Serialize MediaFile instances to dicts
-                    for media_file in extraction_result.files:
-                        if isinstance(media_file, PendingMediaFile):
-                            serializer = PendingMediaFileListSerializer(media_file)
-                            uploaded_files.append(serializer.data)
-                        elif isinstance(media_file, dict):
-                            uploaded_files.append(media_file)
-                        else:
-                            # MediaFile instance - serialize it
-                            serializer = MediaFileDetailSerializer(media_file)
-                            uploaded_files.append(serializer.data)
-                    
-                if extraction_result.errors:
-                    errors.extend(extraction_result.errors)
-                
+
+                if zip_import.get("status") == "failed":
+                    errors.extend(zip_import["errors"])
+                    continue
+
+                zip_imports.append(zip_import)
+
                 # Add warnings as info messages
-                for warning in extraction_result.warnings:
+                for warning in zip_import.get("warnings", []):
                     errors.append({
                         "filename": zip_file.name,
                         "error": warning,
                         "status": "warning"
                     })
-                    
+
             except Exception as e:
-                logger.error(f"Error extracting ZIP {zip_file.name}: {e}")
+                logger.error(f"Error queueing ZIP import {zip_file.name}: {e}")
                 errors.append({
                     "filename": zip_file.name,
                     "error": f"Failed to extract ZIP: {str(e)}",
@@ -247,4 +238,34 @@ class MediaUploadView(APIView):
                 )
 
         # Build and return response
-        return self.response_builder.build_response(uploaded_files, errors)
+        return self.response_builder.build_response(
+            uploaded_files, errors, zip_imports=zip_imports
+        )
+
+
+class ZipImportStatusView(APIView):
+    """Get status of a background ZIP import."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, task_id):
+        """
+        Get ZIP import progress.
+
+        GET /api/v1/media/zip-imports/{task_id}/
+
+        Returns the progress dict stored by the import worker, e.g.
+        status, total_files, processed_files, imported_count,
+        duplicate_count, file_ids and errors.
+        """
+        progress = get_zip_import_progress(str(task_id))
+
+        if not progress or (
+            progress.get("requested_by") != request.user.id
+            and not request.user.is_staff
+        ):
+            return Response(
+                {"error": "ZIP import not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response(progress, status=status.HTTP_200_OK)
@@ -0,0 +1,29 @@
+# Migration 0014 only added ObjectVersion.updated_at to the model state because
+# the column already existed in older databases. Databases created from the
+# migrations alone never got the column, so create it where it is missing.
+
+from django.db import migrations
+
+
+def add_missing_updated_at_column(apps, schema_editor):
+    ObjectVersion = apps.get_model("object_storage", "ObjectVersion")
+    table = ObjectVersion._meta.db_table
+    with schema_editor.connection.cursor() as cursor:
+        columns = {
+            column.name
+            for column in schema_editor.connection.introspection.get_table_description(
+                cursor, table
+            )
+        }
+    if "updated_at" not in columns:
+        schema_editor.add_field(ObjectVersion, ObjectVersion._meta.get_field("updated_at"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("object_storage", "0022_alter_objectinstance_metadata_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_missing_updated_at_column, migrations.RunPython.noop),
+    ]
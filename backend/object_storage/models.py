@@ -858,6 +858,10 @@ class ObjectInstance(MPTTModel):
 
         NEW: Object is published if it has a currently published version (date-based).
         """
+        if now is None and hasattr(self, "has_published_version"):
+            # Annotated by PublishedObjectManager.with_published_versions (fast path)
+            return self.has_published_version
+
         current_version = self.get_current_published_version(now)
         return current_version is not None
 
@@ -1023,7 +1027,7 @@ class ObjectInstance(MPTTModel):
             "slug": self.slug,
             "data": self.data,
             "status": self.status,
-            "parent": self.parent.id if self.parent else None,
+            "parent": self.parent_id,
             "level": self.level,
             "tree_id": self.tree_id,
             "widgets": self.widgets,
@@ -5,24 +5,34 @@ This module handles sending real-time updates to the frontend using
 WebSocket connections or Server-Sent Events (SSE).
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional
 from django.core.cache import cache
 from django.conf import settings
 from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
+from asgiref.sync import async_to_sync, sync_to_async
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EVENT_BUFFER_SIZE = 100  # Events kept per task for Last-Event-ID replay
+DEFAULT_EVENT_BUFFER_TIMEOUT = 3600
+DEFAULT_SSE_HEARTBEAT_INTERVAL = 15
+# Streams are closed after this many seconds; EventSource reconnects with
+# Last-Event-ID, so no update is lost and abandoned streams do not linger
+DEFAULT_SSE_MAX_DURATION = 300
+
 
 class TaskNotificationManager:
     """
     Manager for sending real-time task notifications to connected clients.
     """
 
-    def __init__(self):
-        self.channel_layer = get_channel_layer()
+    @property
+    def channel_layer(self):
+        return get_channel_layer()
 
     def send_to_user(self, user_id: int, message: Dict[str, Any]):
         """Send notification to a specific user."""
@@ -40,7 +50,9 @@ class TaskNotificationManager:
         except Exception as e:
             logger.error(f"Failed to send notification to user {user_id}: {e}")
 
-    def send_to_task_subscribers(self, task_id: str, message: Dict[str, Any]):
+    def send_to_task_subscribers(
+        self, task_id: str, message: Dict[str, Any], event_id: Optional[int] = None
+    ):
         """Send notification to all subscribers of a specific task."""
         if not self.channel_layer:
             logger.warning("Channel layer not configured - notifications disabled")
@@ -50,7 +62,8 @@ class TaskNotificationManager:
 
         try:
             async_to_sync(self.channel_layer.group_send)(
-                group_name, {"type": "task_notification", "message": message}
+                group_name,
+                {"type": "task_notification", "message": message, "event_id": event_id},
             )
             logger.debug(
                 f"Sent notification to task {task_id} subscribers: {message['type']}"
@@ -87,11 +100,14 @@ def send_task_update(task_id: str, update_data: Dict[str, Any]):
             "timestamp": update_data.get("timestamp"),
         }
 
+        # Buffer the update so reconnecting SSE clients can replay it
+        event_id = record_task_event(str(task_id), message)
+
         # Send to task owner
         notification_manager.send_to_user(task.created_by.id, message)
 
         # Send to task-specific subscribers
-        notification_manager.send_to_task_subscribers(str(task_id), message)
+        notification_manager.send_to_task_subscribers(str(task_id), message, event_id)
 
         # Cache the latest update for new connections
         cache_key = f"task_latest_update_{task_id}"
@@ -109,64 +125,140 @@ def get_cached_task_update(task_id: str) -> Optional[Dict[str, Any]]:
     return cache.get(cache_key)
 
 
-class SSETaskNotificationView:
+def record_task_event(task_id: str, message: Dict[str, Any]) -> int:
     """
-    Server-Sent Events view for real-time task notifications.
+    Append an update to the task's bounded event buffer.
 
-    This provides a fallback for clients that don't support WebSockets.
-    """
+    Args:
+        task_id: The UUID of the AI agent task
+        message: The notification message
 
-    def __init__(self, user_id: int, task_id: Optional[str] = None):
-        self.user_id = user_id
-        self.task_id = task_id
-        self.connection_key = f"sse_connection_{user_id}_{task_id or 'all'}"
+    Returns:
+        The event ID, increasing per task
+    """
+    timeout = getattr(settings, "TASK_EVENT_BUFFER_TIMEOUT", DEFAULT_EVENT_BUFFER_TIMEOUT)
+    size = getattr(settings, "TASK_EVENT_BUFFER_SIZE", DEFAULT_EVENT_BUFFER_SIZE)
 
-    def get_event_stream(self):
-        """Generator that yields SSE-formatted events."""
-        import time
+    sequence_key = f"task_event_seq_{task_id}"
+    cache.add(sequence_key, 0, timeout=timeout)
+    try:
+        event_id = cache.incr(sequence_key)
+    except ValueError:
+        # Sequence expired between add() and incr()
+        event_id = 1
+        cache.set(sequence_key, event_id, timeout=timeout)
 
-        # Send initial connection event
-        yield f"data: {json.dumps({'type': 'connected', 'timestamp': time.time()})}\n\n"
+    buffer_key = f"task_events_{task_id}"
+    events = cache.get(buffer_key, [])
+    events.append({"id": event_id, "message": message})
+    cache.set(buffer_key, events[-size:], timeout=timeout)
+    return event_id
 
-        # If specific task requested, send cached update
-        if self.task_id:
-            cached_update = get_cached_task_update(self.task_id)
-            if cached_update:
-                yield f"data: {json.dumps(cached_update)}\n\n"
 
-        # Keep connection alive and check for updates
-        last_check = time.time()
+def get_task_events(task_id: str, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Get buffered updates of a task.
 
-        while True:
-            # Check for new updates in cache
-            if self.task_id:
-                cache_key = f"sse_updates_{self.task_id}_{last_check}"
-                updates = cache.get(cache_key, [])
+    Args:
+        task_id: The UUID of the AI agent task
+        after_id: Only return events after this ID (the SSE Last-Event-ID);
+            if None, only the latest event is returned
 
-                for update in updates:
-                    yield f"data: {json.dumps(update)}\n\n"
+    Returns:
+        List of {"id": ..., "message": ...} dicts, oldest first
+    """
+    events = cache.get(f"task_events_{task_id}", [])
+    if after_id is None:
+        return events[-1:]
+    return [event for event in events if event["id"] > after_id]
 
-            # Send heartbeat every 30 seconds
-            if time.time() - last_check > 30:
-                yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': time.time()})}\n\n"
-                last_check = time.time()
 
-            time.sleep(1)
+class SSETaskNotificationView:
+    """
+    Server-Sent Events view for real-time task notifications.
 
+    This provides a fallback for clients that don't support WebSockets. The
+    stream is an async generator subscribed to the task's channel layer
+    group, so under ASGI an open stream holds no worker thread. Buffered
+    events after the client's Last-Event-ID are replayed on connect.
+    """
 
-def cache_sse_update(task_id: str, update_data: Dict[str, Any]):
-    """Cache an update for SSE clients."""
-    import time
+    def __init__(
+        self,
+        user_id: int,
+        task_id: Optional[str] = None,
+        last_event_id: Optional[int] = None,
+    ):
+        self.user_id = user_id
+        self.task_id = task_id
+        self.last_event_id = last_event_id
+        self.heartbeat_interval = getattr(
+            settings, "TASK_SSE_HEARTBEAT_INTERVAL", DEFAULT_SSE_HEARTBEAT_INTERVAL
+        )
+        self.max_duration = getattr(
+            settings, "TASK_SSE_MAX_DURATION", DEFAULT_SSE_MAX_DURATION
+        )
+
+    @staticmethod
+    def format_event(message: Dict[str, Any], event_id: Optional[int] = None) -> str:
+        """Format a message as an SSE event."""
+        header = f"id: {event_id}\n" if event_id is not None else ""
+        return f"{header}data: {json.dumps(message)}\n\n"
+
+    async def get_event_stream(self):
+        """Async generator that yields SSE-formatted events."""
+        # Send initial connection event
+        yield self.format_event({"type": "connected", "timestamp": time.time()})
+        if not self.task_id:
+            return
 
-    timestamp = time.time()
-    cache_key = f"sse_updates_{task_id}_{timestamp}"
+        channel_layer = get_channel_layer()
+        group_name = f"task_{self.task_id}"
+        channel_name = None
+        if channel_layer:
+            # Subscribe before replaying so no update falls in between
+            channel_name = await channel_layer.new_channel()
+            await channel_layer.group_add(group_name, channel_name)
+        else:
+            logger.warning("Channel layer not configured - SSE replays buffer only")
 
-    # Get existing updates
-    existing_updates = cache.get(cache_key, [])
-    existing_updates.append(update_data)
+        try:
+            sent_id = self.last_event_id or 0
+            for event in await sync_to_async(get_task_events)(
+                self.task_id, self.last_event_id
+            ):
+                yield self.format_event(event["message"], event["id"])
+                sent_id = max(sent_id, event["id"])
+
+            if channel_name is None:
+                return
 
-    # Cache for 5 minutes
-    cache.set(cache_key, existing_updates, timeout=300)
+            deadline = time.monotonic() + self.max_duration
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    event = await asyncio.wait_for(
+                        channel_layer.receive(channel_name),
+                        timeout=min(self.heartbeat_interval, remaining),
+                    )
+                except asyncio.TimeoutError:
+                    # Comment line: keeps proxies from closing the connection
+                    yield ": heartbeat\n\n"
+                    continue
+
+                if event.get("type") != "task_notification":
+                    continue
+                event_id = event.get("event_id")
+                if event_id is not None:
+                    if event_id <= sent_id:
+                        continue  # Already replayed from the buffer
+                    sent_id = event_id
+                yield self.format_event(event["message"], event_id)
+        finally:
+            if channel_name:
+                await channel_layer.group_discard(group_name, channel_name)
 
 
 # WebSocket Consumer for real-time notifications
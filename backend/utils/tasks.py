@@ -16,10 +16,8 @@ from django.utils import timezone
 from django.conf import settings
 from django.core.cache import cache
 
-# Import AI services
-import openai
-import requests
-from bs4 import BeautifulSoup
+# AI and scraping libraries (openai, requests, bs4) are imported inside the
+# task helpers; importing openai alone adds a large share of worker start time
 
 logger = logging.getLogger(__name__)
 
@@ -238,6 +236,9 @@ def _execute_summary_task(
 
     # Fetch content from URLs if provided
     if urls:
+        import requests
+        from bs4 import BeautifulSoup
+
         manager.update_progress(20, f"Fetching content from {len(urls)} URLs")
         fetched_content = []
 
@@ -273,6 +274,8 @@ def _execute_summary_task(
     if not settings.OPENAI_API_KEY:
         raise ValueError("OpenAI API key not configured")
 
+    import openai
+
     openai.api_key = settings.OPENAI_API_KEY
 
     try:
@@ -325,6 +328,9 @@ def _execute_research_task(
 
     # Research from provided URLs
     if urls:
+        import requests
+        from bs4 import BeautifulSoup
+
         manager.update_progress(20, f"Researching {len(urls)} sources")
 
         for i, url in enumerate(urls):
@@ -356,6 +362,8 @@ def _execute_research_task(
     if not settings.OPENAI_API_KEY:
         raise ValueError("OpenAI API key not configured")
 
+    import openai
+
     openai.api_key = settings.OPENAI_API_KEY
 
     research_content = "\n\n".join(
@@ -418,6 +426,8 @@ def _execute_content_generation_task(
     if not settings.OPENAI_API_KEY:
         raise ValueError("OpenAI API key not configured")
 
+    import openai
+
     openai.api_key = settings.OPENAI_API_KEY
 
     # Build prompt
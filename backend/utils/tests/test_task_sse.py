@@ -0,0 +1,99 @@
+"""
+Tests for the pub/sub driven task progress SSE stream
+"""
+
+import asyncio
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from utils.models import AIAgentTask
+from utils.notifications import (
+    SSETaskNotificationView,
+    get_task_events,
+    send_task_update,
+)
+from utils.views import task_sse_stream
+
+
+IN_MEMORY_CHANNEL_LAYERS = {
+    "default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}
+}
+
+
+@override_settings(
+    CHANNEL_LAYERS=IN_MEMORY_CHANNEL_LAYERS,
+    TASK_EVENT_BUFFER_SIZE=3,
+    TASK_SSE_HEARTBEAT_INTERVAL=0.05,
+)
+class TaskSSEStreamTest(TestCase):
+    """Test live delivery, Last-Event-ID replay and heartbeats"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="sse_user", password="testpass")
+        self.task = AIAgentTask.objects.create(
+            title="Summarize", task_type="summary", created_by=self.user
+        )
+        self.task_id = str(self.task.id)
+
+    def _stream(self, last_event_id=None):
+        return SSETaskNotificationView(
+            self.user.id, self.task_id, last_event_id
+        ).get_event_stream()
+
+    def test_update_is_pushed_to_open_stream(self):
+        """Test that an update sent after connecting arrives without polling"""
+
+        async def scenario():
+            stream = self._stream()
+            connected = await stream.__anext__()
+            pending = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0.01)  # Let the stream subscribe
+            await sync_to_async(send_task_update)(self.task_id, {"type": "progress"})
+            event = await asyncio.wait_for(pending, timeout=1)
+            await stream.aclose()
+            return connected, event
+
+        connected, event = async_to_sync(scenario)()
+
+        self.assertIn('"connected"', connected)
+        self.assertTrue(event.startswith("id: 1\ndata: "))
+        self.assertIn('"progress"', event)
+
+    def test_last_event_id_replays_buffered_events(self):
+        """Test that reconnecting clients receive only the events they missed"""
+        for step in range(5):
+            send_task_update(self.task_id, {"type": "progress", "step": step})
+
+        self.assertEqual([e["id"] for e in get_task_events(self.task_id, 0)], [3, 4, 5])
+        self.assertEqual([e["id"] for e in get_task_events(self.task_id)], [5])
+
+        async def scenario():
+            stream = self._stream(last_event_id=3)
+            events = [await stream.__anext__() for _ in range(4)]
+            await stream.aclose()
+            return events
+
+        connected, fourth, fifth, heartbeat = async_to_sync(scenario)()
+
+        self.assertIn('"connected"', connected)
+        self.assertTrue(fourth.startswith("id: 4\n"))
+        self.assertTrue(fifth.startswith("id: 5\n"))
+        self.assertEqual(heartbeat, ": heartbeat\n\n")
+
+    def test_view_returns_async_stream(self):
+        """Test that the endpoint streams asynchronously"""
+        request = APIRequestFactory().get(
+            f"/api/v1/utils/tasks/{self.task_id}/stream/", HTTP_LAST_EVENT_ID="7"
+        )
+        force_authenticate(request, user=self.user)
+
+        response = task_sse_stream(request, task_id=self.task_id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertTrue(response.is_async)
@@ -493,6 +493,11 @@ def task_sse_stream(request, task_id):
     Server-Sent Events endpoint for real-time task updates.
 
     GET /api/v1/utils/tasks/{task_id}/stream/
+
+    The view itself only checks access; the returned stream is asynchronous
+    and, when served under ASGI, does not occupy a worker thread. Clients
+    reconnecting with a Last-Event-ID header (or ?lastEventId=) get the
+    buffered updates they missed.
     """
     from django.http import StreamingHttpResponse
     from .notifications import SSETaskNotificationView
@@ -501,8 +506,16 @@ def task_sse_stream(request, task_id):
         # Verify task exists and user has access
         task = get_object_or_404(AIAgentTask, id=task_id, created_by=request.user)
 
+        last_event_id = request.headers.get(
+            "Last-Event-ID", request.query_params.get("lastEventId")
+        )
+        try:
+            last_event_id = int(last_event_id) if last_event_id else None
+        except ValueError:
+            last_event_id = None
+
         # Create SSE stream
-        sse_view = SSETaskNotificationView(request.user.id, task_id)
+        sse_view = SSETaskNotificationView(request.user.id, task_id, last_event_id)
 
         response = StreamingHttpResponse(
             sse_view.get_event_stream(), content_type="text/event-stream"
@@ -513,6 +526,7 @@ def task_sse_stream(request, task_id):
         response["Connection"] = "keep-alive"
         response["Access-Control-Allow-Origin"] = "*"
         response["Access-Control-Allow-Headers"] = "Cache-Control"
+        response["X-Accel-Buffering"] = "no"  # Don't let nginx buffer events
 
         return response
 
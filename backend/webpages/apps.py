@@ -1,5 +1,9 @@
+import logging
+
 from django.apps import AppConfig
 
+logger = logging.getLogger(__name__)
+
 
 class WebpagesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
@@ -8,57 +12,77 @@ class WebpagesConfig(AppConfig):
     def ready(self):
         """
         Called when the app is ready.
-        Triggers layout and widget type autodiscovery and imports cache invalidation signals.
+        Imports cache invalidation signals and hooks layout, widget type and
+        path pattern autodiscovery into the registries, which run it on their
+        first lookup (or right away when REGISTRY_EAGER_DISCOVERY is set).
         """
         # Import signals for cache invalidation and cached_path maintenance
         import webpages.signals
 
         # Import here to avoid circular imports
-        from .layout_autodiscovery import (
-            autodiscover_layouts,
-            validate_layout_configuration,
-            LAYOUT_AUTODISCOVERY_ENABLED,
-            LAYOUT_VALIDATION_ON_STARTUP,
-        )
-        from .widget_autodiscovery import (
-            autodiscover_widgets,
-            validate_widget_types,
-        )
-        from .path_pattern_autodiscovery import (
-            autodiscover_path_patterns,
-            validate_path_patterns,
-        )
+        from .layout_autodiscovery import LAYOUT_AUTODISCOVERY_ENABLED
+        from .layout_registry import layout_registry
+        from .path_pattern_registry import path_pattern_registry
+        from .registry_discovery import eager_discovery_enabled
+        from .widget_registry import widget_type_registry
 
+        registries = [widget_type_registry, path_pattern_registry]
         if LAYOUT_AUTODISCOVERY_ENABLED:
-            autodiscover_layouts()
+            layout_registry.set_discovery(discover_layouts)
+            registries.append(layout_registry)
+
+        widget_type_registry.set_discovery(discover_widgets)
+        path_pattern_registry.set_discovery(discover_path_patterns)
+
+        if eager_discovery_enabled():
+            for registry in registries:
+                registry.ensure_discovered()
+
+
+def discover_layouts():
+    """Import app layout modules and validate them if configured to."""
+    from .layout_autodiscovery import (
+        autodiscover_layouts,
+        validate_layout_configuration,
+        LAYOUT_VALIDATION_ON_STARTUP,
+    )
+
+    autodiscover_layouts()
+
+    if LAYOUT_VALIDATION_ON_STARTUP:
+        validate_layout_configuration()
+
+
+def discover_widgets():
+    """Import app widget modules, validating the widget types in debug mode."""
+    from django.conf import settings
 
-            if LAYOUT_VALIDATION_ON_STARTUP:
-                validate_layout_configuration()
+    from .widget_autodiscovery import autodiscover_widgets, validate_widget_types
 
-        # Always autodiscover widget types
-        autodiscover_widgets()
+    autodiscover_widgets()
 
-        # Always autodiscover path patterns
-        autodiscover_path_patterns()
+    if settings.DEBUG:
+        validation_results = validate_widget_types()
+        if not validation_results["valid"]:
+            logger.warning(
+                f"Widget type validation issues found: {validation_results['issues']}"
+            )
 
-        # Validate widget types and path patterns on startup in debug mode
-        from django.conf import settings
 
-        if settings.DEBUG:
-            validation_results = validate_widget_types()
-            if not validation_results["valid"]:
-                import logging
+def discover_path_patterns():
+    """Import app path pattern modules, validating them in debug mode."""
+    from django.conf import settings
 
-                logger = logging.getLogger(__name__)
-                logger.warning(
-                    f"Widget type validation issues found: {validation_results['issues']}"
-                )
+    from .path_pattern_autodiscovery import (
+        autodiscover_path_patterns,
+        validate_path_patterns,
+    )
 
-            pattern_validation = validate_path_patterns()
-            if not pattern_validation["valid"]:
-                import logging
+    autodiscover_path_patterns()
 
-                logger = logging.getLogger(__name__)
-                logger.warning(
-                    f"Path pattern validation issues found: {pattern_validation['issues']}"
-                )
+    if settings.DEBUG:
+        pattern_validation = validate_path_patterns()
+        if not pattern_validation["valid"]:
+            logger.warning(
+                f"Path pattern validation issues found: {pattern_validation['issues']}"
+            )
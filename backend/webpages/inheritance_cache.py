@@ -1,20 +1,30 @@
 """
 Widget Inheritance Tree Caching
 
-Provides efficient caching for inheritance trees with smart invalidation.
+Provides efficient caching for inheritance trees with generation-based invalidation.
 """
 
-import hashlib
-from typing import Optional
+import time
+from typing import Dict, List, Optional
 from django.core.cache import cache
+from django.db.models import Min, Q
 from django.utils import timezone
-from .models import WebPage
+from .models import PageVersion, WebPage
 from .inheritance_tree import InheritanceTreeBuilder
 from .inheritance_types import InheritanceTreeNode
+from .services.page_subtree import get_ancestor_ids
 
 
 class InheritanceTreeCache:
-    """Caching manager for inheritance trees"""
+    """
+    Caching manager for inheritance trees.
+
+    A page's tree depends only on the page and its ancestors. Every page has
+    a generation counter that is bumped when it changes; cached trees store
+    the generations of their ancestor chain and a reader treats the entry
+    as stale when any of them moved on. Invalidating a page is therefore a
+    single cache write, however many descendants it has.
+    """
 
     CACHE_PREFIX = "inheritance_tree"
     DEFAULT_TIMEOUT = 3600  # 1 hour
@@ -22,52 +32,37 @@ class InheritanceTreeCache:
     @classmethod
     def get_cache_key(cls, page_id: int) -> str:
         """Generate cache key for a page's inheritance tree"""
-        version_hash = cls._get_version_hash(page_id)
-        return f"{cls.CACHE_PREFIX}:{page_id}:{version_hash}"
+        return f"{cls.CACHE_PREFIX}:{page_id}"
 
     @classmethod
-    def _get_version_hash(cls, page_id: int) -> str:
-        """Generate hash based on page and all ancestor versions"""
-        try:
-            page = WebPage.objects.get(id=page_id)
-            version_data = []
-
-            # Collect version data from entire inheritance chain
-            current = page
-            while current:
-                version = (
-                    current.get_current_published_version()
-                    or current.get_latest_version()
-                )
-                if version:
-                    # Include version timestamp and widget data hash
-                    version_data.append(
-                        {
-                            "page_id": current.id,
-                            "version_id": version.id,
-                            "updated_at": (
-                                version.updated_at.isoformat()
-                                if version.updated_at
-                                else ""
-                            ),
-                            "widgets_hash": hashlib.md5(
-                                str(version.widgets).encode()
-                                if version.widgets
-                                else b""
-                            ).hexdigest(),
-                        }
-                    )
-                current = current.parent if current.parent_id else None
-
-            # Create hash from all version data
-            version_string = str(sorted(version_data, key=lambda x: x["page_id"]))
-            return hashlib.md5(version_string.encode()).hexdigest()[:16]
+    def get_generation_key(cls, page_id: int) -> str:
+        return f"{cls.CACHE_PREFIX}:gen:{page_id}"
 
-        except WebPage.DoesNotExist:
-            # Return timestamp-based hash if page not found
-            return hashlib.md5(str(timezone.now().timestamp()).encode()).hexdigest()[
-                :16
-            ]
+    @classmethod
+    def _get_generations(cls, page_ids: List[int]) -> Dict[int, int]:
+        keys = {cls.get_generation_key(page_id): page_id for page_id in page_ids}
+        found = cache.get_many(list(keys))
+        return {page_id: found.get(key, 0) for key, page_id in keys.items()}
+
+    @classmethod
+    def _chain_ids(cls, tree: InheritanceTreeNode) -> List[int]:
+        ids = []
+        node = tree
+        while node:
+            ids.append(node.page_id)
+            node = node.parent
+        return ids
+
+    @classmethod
+    def _next_transition(cls, page_ids: List[int]):
+        """Earliest upcoming publish or expiry date among the chain's versions."""
+        now = timezone.now()
+        dates = PageVersion.objects.filter(page_id__in=page_ids).aggregate(
+            next_effective=Min("effective_date", filter=Q(effective_date__gt=now)),
+            next_expiry=Min("expiry_date", filter=Q(expiry_date__gt=now)),
+        )
+        upcoming = [d for d in dates.values() if d]
+        return min(upcoming).timestamp() if upcoming else None
 
     @classmethod
     def get_tree(cls, page_id: int, force_rebuild: bool = False) -> InheritanceTreeNode:
@@ -81,12 +76,15 @@ class InheritanceTreeCache:
         Returns:
             InheritanceTreeNode: Cached or newly built tree
         """
+        cache_key = cls.get_cache_key(page_id)
         if not force_rebuild:
-            cache_key = cls.get_cache_key(page_id)
-            cached_tree = cache.get(cache_key)
+            entry = cache.get(cache_key)
+            if entry and cls._is_fresh(entry):
+                return entry["tree"]
 
-            if cached_tree:
-                return cached_tree
+        # Read the chain's generations before building, so a change made
+        # while the tree is built leaves the entry stale rather than current
+        generations = cls._get_generations(get_ancestor_ids(page_id))
 
         # Build new tree
         try:
@@ -94,94 +92,73 @@ class InheritanceTreeCache:
             builder = InheritanceTreeBuilder()
             tree = builder.build_tree(page)
 
-            # Cache the tree
-            cache_key = cls.get_cache_key(page_id)
-            cache.set(cache_key, tree, cls.DEFAULT_TIMEOUT)
+            # Cache the tree with the generations it was built against,
+            # unless the page moved while it was built
+            chain_ids = cls._chain_ids(tree)
+            if set(chain_ids) == set(generations):
+                cache.set(
+                    cache_key,
+                    {
+                        "tree": tree,
+                        "generations": generations,
+                        "valid_until": cls._next_transition(chain_ids),
+                    },
+                    cls.DEFAULT_TIMEOUT,
+                )
 
             return tree
 
         except WebPage.DoesNotExist:
             raise ValueError(f"Page with ID {page_id} not found")
 
+    @classmethod
+    def _is_fresh(cls, entry: dict) -> bool:
+        """Check a cached entry against current generations and publish dates."""
+        valid_until = entry.get("valid_until")
+        if valid_until is not None and time.time() >= valid_until:
+            return False
+        generations = entry.get("generations", {})
+        return cls._get_generations(list(generations)) == generations
+
     @classmethod
     def invalidate_page(cls, page_id: int) -> int:
         """
         Invalidate cache for a page and all its descendants.
 
+        Descendant trees include this page in their chain, so bumping its
+        generation makes all of them stale without visiting them.
+
         Args:
             page_id: Page ID to invalidate
 
         Returns:
-            Number of cache keys invalidated
+            Number of cache keys written
         """
-        invalidated_count = 0
-
+        key = cls.get_generation_key(page_id)
         try:
-            page = WebPage.objects.get(id=page_id)
-
-            # Invalidate this page
-            cache_key = cls.get_cache_key(page_id)
-            cache.delete(cache_key)
-            invalidated_count += 1
-
-            # Invalidate all descendants recursively
-            invalidated_count += cls._invalidate_descendants(page)
-
-        except WebPage.DoesNotExist:
-            pass
-
-        return invalidated_count
-
-    @classmethod
-    def _invalidate_descendants(cls, page: WebPage) -> int:
-        """Recursively invalidate all descendant pages"""
-        count = 0
-
-        # Get direct children
-        children = WebPage.objects.filter(parent=page)
-
-        for child in children:
-            # Invalidate child
-            cache_key = cls.get_cache_key(child.id)
-            cache.delete(cache_key)
-            count += 1
-
-            # Recursively invalidate child's descendants
-            count += cls._invalidate_descendants(child)
-
-        return count
+            cache.incr(key)
+        except ValueError:
+            # Start from the clock so an evicted counter never repeats a value
+            if not cache.add(key, time.time_ns(), None):
+                cache.incr(key)
+        return 1
 
     @classmethod
     def invalidate_hierarchy(cls, page_id: int) -> int:
         """
-        Invalidate cache for entire page hierarchy (ancestors + descendants).
+        Invalidate cache for a page hierarchy.
+
+        Trees are built from a page up through its ancestors, so ancestors
+        never depend on the page; bumping its generation covers the page and
+        every descendant.
 
         Args:
             page_id: Page ID to start invalidation from
 
         Returns:
-            Number of cache keys invalidated
+            Number of cache keys written
         """
-        invalidated_count = 0
-
-        try:
-            page = WebPage.objects.select_related("parent").get(id=page_id)
-
-            # Invalidate ancestors (they might inherit from changed page)
-            current = page
-            while current:
-                cache_key = cls.get_cache_key(current.id)
-                cache.delete(cache_key)
-                invalidated_count += 1
-                current = current.parent
-
-            # Invalidate descendants (they inherit from this page)
-            invalidated_count += cls._invalidate_descendants(page)
-
-        except WebPage.DoesNotExist:
-            pass
-
-        return invalidated_count
+        return cls.invalidate_page(page_id)
 
     @classmethod
     def warm_cache(cls, page_id: int) -> bool:
@@ -87,6 +87,7 @@ def validate_layout_configuration() -> None:
 
     This is useful for checking layouts during app startup or in management commands.
     """
+    layout_registry.ensure_discovered()
 
     invalid_layouts = []
 
@@ -0,0 +1,252 @@
+"""
+Precompiled Layout Artifacts
+
+Serializing a code layout parses its Django template with BeautifulSoup and
+regex cleanup, once for the template JSON used by the page editor and once
+for the simplified React layout. The layout catalog does this for every
+registered layout at deploy time (see the build_layout_artifacts command) and
+stores the result as a versioned JSON artifact on disk, loaded once per
+process. Layout endpoints read from the artifact instead of parsing templates
+on the request thread.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.template import engines
+from django.utils import timezone
+
+from .layout_registry import LayoutRegistry, layout_registry
+
+logger = logging.getLogger(__name__)
+
+
+class LayoutCatalog:
+    """
+    Versioned, content-addressed artifact of all registered layouts.
+
+    The artifact file name carries a fingerprint of the layout classes and
+    template files, so a deploy that changes a layout writes a new artifact
+    while unchanged deploys reuse the existing one. Within a process the
+    artifact is memoized until the registry changes (or re-fingerprinted on
+    every call in DEBUG, to pick up template edits).
+    """
+
+    # Bump when the artifact structure changes
+    ARTIFACT_VERSION = 1
+    FILE_PREFIX = "layouts-"
+
+    _memo: Optional[tuple] = None
+
+    @staticmethod
+    def artifact_dir() -> Path:
+        return Path(
+            getattr(
+                settings,
+                "LAYOUT_ARTIFACT_DIR",
+                Path(settings.BASE_DIR) / "build" / "layouts",
+            )
+        )
+
+    @classmethod
+    def artifact_path(cls, fingerprint: str) -> Path:
+        return cls.artifact_dir() / f"{cls.FILE_PREFIX}{fingerprint}.json"
+
+    @staticmethod
+    def _file_digest(path: Optional[str]) -> str:
+        if not path:
+            return ""
+        try:
+            with open(path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return path
+
+    @staticmethod
+    def _template_path(template_name: Optional[str]) -> Optional[str]:
+        """Locate a template file without compiling it."""
+        if not template_name:
+            return None
+        for loader in engines["django"].engine.template_loaders:
+            for origin in loader.get_template_sources(template_name):
+                if os.path.exists(origin.name):
+                    return origin.name
+        return None
+
+    @classmethod
+    def fingerprint(cls, registry: LayoutRegistry = layout_registry) -> str:
+        """
+        Hash everything the artifact is built from.
+
+        Covers this module, the registry module (which serializes layouts),
+        both template serializers, each layout class and its template file.
+        """
+        from . import layout_registry as registry_module
+        from .utils import simplified_layout_serializer, template_parser
+
+        parts = [
+            str(cls.ARTIFACT_VERSION),
+            cls._file_digest(__file__),
+            cls._file_digest(inspect.getfile(registry_module)),
+            cls._file_digest(inspect.getfile(template_parser)),
+            cls._file_digest(inspect.getfile(simplified_layout_serializer)),
+        ]
+        layouts = sorted(
+            registry.list_layouts(active_only=False), key=lambda layout: layout.name
+        )
+        for layout in layouts:
+            try:
+                source = inspect.getfile(layout.__class__)
+            except TypeError:
+                source = None
+            parts.append(
+                "|".join(
+                    [
+                        layout.name,
+                        layout.__class__.__qualname__,
+                        cls._file_digest(source),
+                        cls._file_digest(cls._template_path(layout.template_name)),
+                    ]
+                )
+            )
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:32]
+
+    @classmethod
+    def build(cls, registry: LayoutRegistry = layout_registry) -> dict:
+        """
+        Serialize every registered layout into an artifact.
+
+        Returns:
+            dict with "version", "hash" (the fingerprint), "built_at" and
+            "layouts", mapping each layout name to its to_dict() data, template
+            JSON (or template_error) and simplified layout JSON
+        """
+        from .utils.simplified_layout_serializer import SimplifiedLayoutSerializer
+        from .utils.template_parser import LayoutSerializer as TemplateLayoutSerializer
+
+        template_serializer = TemplateLayoutSerializer(use_cache=False)
+        simplified_serializer = SimplifiedLayoutSerializer()
+        simplified_serializer.cache_enabled = False
+
+        layouts = {}
+        for layout in registry.list_layouts(active_only=False):
+            entry = {
+                "data": layout.to_dict(),
+                "template": None,
+                "template_error": None,
+                "simplified": simplified_serializer.serialize_layout(layout.name),
+            }
+            try:
+                entry["template"] = template_serializer.serialize_layout(layout)
+            except Exception as e:
+                logger.warning(f"Failed to serialize layout '{layout.name}': {e}")
+                entry["template_error"] = str(e)
+            layouts[layout.name] = entry
+
+        return {
+            "version": cls.ARTIFACT_VERSION,
+            "hash": cls.fingerprint(registry),
+            "built_at": timezone.now().isoformat(),
+            "layouts": layouts,
+        }
+
+    @classmethod
+    def save(cls, artifact: dict) -> Path:
+        """
+        Write an artifact to the artifact directory, replacing older ones.
+
+        Args:
+            artifact: Artifact returned by build()
+
+        Returns:
+            Path of the written artifact file
+        """
+        directory = cls.artifact_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        path = cls.artifact_path(artifact["hash"])
+
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(artifact, default=str), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+        for stale in directory.glob(f"{cls.FILE_PREFIX}*.json"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        return path
+
+    @classmethod
+    def load(cls, fingerprint: str) -> Optional[dict]:
+        """Read the artifact for a fingerprint from disk, if it exists."""
+        try:
+            artifact = json.loads(cls.artifact_path(fingerprint).read_text("utf-8"))
+        except (OSError, ValueError):
+            return None
+        if artifact.get("version") != cls.ARTIFACT_VERSION:
+            return None
+        return artifact
+
+    @classmethod
+    def get(cls, registry: LayoutRegistry = layout_registry) -> dict:
+        """
+        Get the layout artifact, loading or building it if needed.
+
+        A missing artifact is built and saved on the spot, which parses the
+        templates; run build_layout_artifacts at deploy to avoid this.
+
+        Args:
+            registry: Layout registry to catalog
+
+        Returns:
+            The layout artifact (see build())
+        """
+        memo = cls._memo
+        if (
+            not settings.DEBUG
+            and memo
+            and memo[0] is registry
+            and memo[1] == registry.version
+        ):
+            return memo[2]
+
+        fingerprint = cls.fingerprint(registry)
+        if memo and memo[0] is registry and memo[2]["hash"] == fingerprint:
+            artifact = memo[2]
+        else:
+            artifact = cls.load(fingerprint)
+            if artifact is None:
+                logger.warning(
+                    f"No layout artifact for {fingerprint}, building on demand; "
+                    "run build_layout_artifacts at deploy"
+                )
+                artifact = cls.build(registry)
+                try:
+                    cls.save(artifact)
+                except OSError as e:
+                    logger.warning(f"Failed to save layout artifact: {e}")
+
+        cls._memo = (registry, registry.version, artifact)
+        return artifact
+
+    @classmethod
+    def get_entry(
+        cls, layout_name: str, registry: LayoutRegistry = layout_registry
+    ) -> Optional[Dict[str, Any]]:
+        """Get one layout's artifact entry by name."""
+        return cls.get(registry)["layouts"].get(layout_name)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop the in-process memo (artifacts on disk are keyed by content)."""
+        cls._memo = None
+
+
+def get_layout_artifact() -> dict:
+    """Get the precompiled layout artifact"""
+    return LayoutCatalog.get()
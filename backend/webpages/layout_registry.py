@@ -11,6 +11,8 @@ from django.template.loader import get_template
 from django.core.exceptions import ImproperlyConfigured
 import logging
 
+from .registry_discovery import LazyDiscoveryMixin
+
 logger = logging.getLogger(__name__)
 
 
@@ -132,16 +134,27 @@ class BaseLayout(ABC):
         }
 
 
-class LayoutRegistry:
+class LayoutRegistry(LazyDiscoveryMixin):
     """
     Global registry for layout classes.
 
     Provides methods to register layouts and retrieve them by name.
+    Layout modules are discovered on the first lookup.
     """
 
+    discovery_name = "layouts"
+
     def __init__(self):
         self._layouts: Dict[str, Type[BaseLayout]] = {}
         self._instances: Dict[str, BaseLayout] = {}
+        self._version = 0
+        self._init_discovery()
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every registration change, for derived caches."""
+        self.ensure_discovered()
+        return self._version
 
     def register(self, layout_class: Type[BaseLayout]) -> None:
         """
@@ -167,6 +180,7 @@ class LayoutRegistry:
 
         self._layouts[name] = layout_class
         self._instances[name] = instance
+        self._version += 1
 
 
         # Invalidate caches when layout changes
@@ -177,24 +191,29 @@ class LayoutRegistry:
         if name in self._layouts:
             del self._layouts[name]
             del self._instances[name]
+            self._version += 1
 
             # Invalidate caches when layout is removed
             self._invalidate_layout_caches(name)
 
     def get_layout(self, name: str) -> Optional[BaseLayout]:
         """Get a layout instance by name."""
+        self.ensure_discovered()
         return self._instances.get(name)
 
     def get_layout_class(self, name: str) -> Optional[Type[BaseLayout]]:
         """Get a layout class by name."""
+        self.ensure_discovered()
         return self._layouts.get(name)
 
     def is_registered(self, name: str) -> bool:
         """Check if a layout is registered by name."""
+        self.ensure_discovered()
         return name in self._layouts
 
     def list_layouts(self, active_only: bool = True) -> List[BaseLayout]:
         """Get all registered layouts."""
+        self.ensure_discovered()
         layouts = list(self._instances.values())
         if active_only:
             layouts = [layout for layout in layouts if layout.is_active]
@@ -214,6 +233,8 @@ class LayoutRegistry:
         """Clear all registered layouts."""
         self._layouts.clear()
         self._instances.clear()
+        self._version += 1
+        self._mark_discovered()
 
         # Invalidate all layout caches
         self._invalidate_all_layout_caches()
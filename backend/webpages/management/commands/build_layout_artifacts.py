@@ -0,0 +1,34 @@
+"""
+Management command to precompile layout serialization.
+
+Parses every registered layout template into the versioned layout artifact
+that the layout APIs and page editor read. Run it at deploy (the Docker image
+build does) so no request has to parse a template.
+"""
+
+from django.core.management.base import BaseCommand
+
+from webpages.layout_catalog import LayoutCatalog
+
+
+class Command(BaseCommand):
+    help = "Build the precompiled layout artifact used by the layout APIs"
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        LayoutCatalog.clear()
+        artifact = LayoutCatalog.build()
+        path = LayoutCatalog.save(artifact)
+
+        for name, entry in artifact["layouts"].items():
+            if entry["template_error"]:
+                self.stdout.write(
+                    self.style.WARNING(f"Layout '{name}': {entry['template_error']}")
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Built layout artifact {artifact['hash']} "
+                f"({len(artifact['layouts'])} layouts) at {path}"
+            )
+        )
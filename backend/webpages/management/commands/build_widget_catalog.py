@@ -0,0 +1,24 @@
+"""
+Management command to compile the widget type catalog.
+
+Run at deploy time so the first editor load does not pay for parsing every
+widget template.
+"""
+
+from django.core.management.base import BaseCommand
+
+from webpages.widget_catalog import WidgetCatalog
+
+
+class Command(BaseCommand):
+    help = "Compile the widget type catalog and store it in the cache"
+
+    def handle(self, *args, **options):
+        WidgetCatalog.clear()
+        artifact = WidgetCatalog.get()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Widget catalog {artifact['hash']} ready "
+                f"({len(artifact['widgets'])} widget types)"
+            )
+        )
@@ -49,15 +49,15 @@ class Command(BaseCommand):
                 )
 
                 changes_made = 0
+                changed_pages = []
                 for index, page in enumerate(siblings):
                     new_sort_order = (index + 1) * 10  # 10, 20, 30, 40, etc.
 
                     if page.sort_order != new_sort_order:
                         old_sort_order = page.sort_order
 
-                        if not dry_run:
-                            page.sort_order = new_sort_order
-                            page.save(update_fields=["sort_order"])
+                        page.sort_order = new_sort_order
+                        changed_pages.append(page)
 
                         self.stdout.write(
                             f"  - {page.title}: {old_sort_order} → {new_sort_order}"
@@ -69,6 +69,12 @@ class Command(BaseCommand):
                             f"  ✓ {page.title}: {page.sort_order} (no change needed)"
                         )
 
+                if changed_pages and not dry_run:
+                    # One statement per sibling group, without per-page signals
+                    WebPage.objects.bulk_update(
+                        changed_pages, ["sort_order"], batch_size=500
+                    )
+
                 if changes_made == 0:
                     self.stdout.write(f"  No changes needed for {parent_name}")
 
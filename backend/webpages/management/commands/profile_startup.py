@@ -0,0 +1,172 @@
+"""
+Management command to profile process startup.
+
+Runs django.setup() and registry discovery in a fresh interpreter with
+`-X importtime`, then reports the slowest module imports and the time spent
+in each phase. Use it to find what a Celery worker or management command pays
+for before doing any work.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+PHASE_MARKER = "profile_startup:phase:"
+
+IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<indent>\s*)(?P<module>\S+)$"
+)
+
+PROFILE_SCRIPT = f"""
+import json
+import sys
+import time
+
+started = time.perf_counter()
+import django
+
+django.setup()
+timings = {{"setup": time.perf_counter() - started}}
+
+if sys.argv[1:] == ["discover"]:
+    sys.stderr.write("{PHASE_MARKER}discovery\\n")
+    from webpages.layout_registry import layout_registry
+    from webpages.path_pattern_registry import path_pattern_registry
+    from webpages.registry_discovery import discovery_timings
+    from webpages.widget_registry import widget_type_registry
+
+    for registry in (layout_registry, widget_type_registry, path_pattern_registry):
+        registry.ensure_discovered()
+    timings.update(discovery_timings)
+
+print(json.dumps(timings))
+"""
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    phase: str
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    Parse `python -X importtime` stderr into per-module timings.
+
+    Args:
+        output: stderr of the profiled interpreter, optionally containing
+            phase marker lines
+
+    Returns:
+        List of ImportTiming, in the order the imports completed
+    """
+    phase = "setup"
+    timings = []
+    for line in output.splitlines():
+        if line.startswith(PHASE_MARKER):
+            phase = line[len(PHASE_MARKER) :].strip()
+            continue
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        timings.append(
+            ImportTiming(
+                module=match["module"],
+                self_us=int(match["self"]),
+                cumulative_us=int(match["cumulative"]),
+                depth=len(match["indent"]) // 2,
+                phase=phase,
+            )
+        )
+    return timings
+
+
+def group_by_package(timings: List[ImportTiming]) -> Dict[str, int]:
+    """Sum self time per top-level package, in microseconds."""
+    totals = defaultdict(int)
+    for timing in timings:
+        totals[timing.module.split(".")[0]] += timing.self_us
+    return dict(totals)
+
+
+class Command(BaseCommand):
+    help = "Profile startup import cost and registry autodiscovery time"
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=25,
+            help="Number of modules or packages to list (default: 25)",
+        )
+        parser.add_argument(
+            "--by",
+            choices=["cumulative", "self", "package"],
+            default="cumulative",
+            help="Rank imports by cumulative time, self time, or per package",
+        )
+        parser.add_argument(
+            "--no-discovery",
+            action="store_true",
+            help="Only profile django.setup(), not layout/widget/pattern discovery",
+        )
+
+    def handle(self, *args, **options):
+        discover = not options["no_discovery"]
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                PROFILE_SCRIPT,
+                "discover" if discover else "setup-only",
+            ],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        if result.returncode != 0:
+            raise CommandError(f"Profiled startup failed:\n{result.stderr[-2000:]}")
+
+        phases = json.loads(result.stdout.strip().splitlines()[-1])
+        timings = parse_importtime(result.stderr)
+
+        self.stdout.write(self.style.SUCCESS("\n=== Startup Phases ==="))
+        for phase, seconds in phases.items():
+            self.stdout.write(f"  {phase:<16} {seconds * 1000:9.1f} ms")
+        self.stdout.write(
+            f"  {'imports':<16} {len(timings):9d} modules, "
+            f"{sum(t.self_us for t in timings) / 1000:.1f} ms self time"
+        )
+
+        limit = options["limit"]
+        if options["by"] == "package":
+            self.stdout.write(self.style.SUCCESS("\n=== Import Time by Package ==="))
+            ranked = sorted(
+                group_by_package(timings).items(), key=lambda item: -item[1]
+            )
+            for package, self_us in ranked[:limit]:
+                self.stdout.write(f"  {self_us / 1000:9.1f} ms  {package}")
+            return
+
+        key = "cumulative_us" if options["by"] == "cumulative" else "self_us"
+        self.stdout.write(self.style.SUCCESS(f"\n=== Slowest Imports ({options['by']}) ==="))
+        ranked = sorted(timings, key=lambda t: -getattr(t, key))
+        for timing in ranked[:limit]:
+            self.stdout.write(
+                f"  {getattr(timing, key) / 1000:9.1f} ms  "
+                f"[{timing.phase}] {timing.module}"
+            )
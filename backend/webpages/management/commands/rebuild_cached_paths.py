@@ -16,6 +16,7 @@ Usage:
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from webpages.models import WebPage
+from webpages.services.page_paths import cascade_cached_paths
 
 
 class Command(BaseCommand):
@@ -100,65 +101,19 @@ class Command(BaseCommand):
                 )
             )
 
-    def update_tree(self, page, dry_run=False, root_page=None):
-        """Recursively update page and its children, returns count of updated pages"""
-        count = 0
-        
-        # Determine root page
-        if root_page is None:
-            root_page = page if not page.parent else None
-        
-        # Calculate new path
-        if page.parent:
-            parent_path = page.parent.cached_path
-            slug_part = (page.slug or "").strip("/")
-            new_path = f"{parent_path.rstrip('/')}/{slug_part}/"
-        else:
-            # Root page
-            if page.hostnames:
-                new_path = "/"
-            else:
-                slug_part = (page.slug or "").strip("/")
-                new_path = f"/{slug_part}/"
-        
-        # Calculate root info
-        if root_page:
-            new_root_id = root_page.id
-            new_root_hostnames = root_page.hostnames or []
-        else:
-            new_root_id = page.id
-            new_root_hostnames = page.hostnames or []
-        
-        # Check if update needed
-        needs_update = (
-            page.cached_path != new_path or
-            page.cached_root_id != new_root_id or
-            page.cached_root_hostnames != new_root_hostnames
-        )
-        
-        if needs_update:
+    def update_tree(self, page, dry_run=False):
+        """Rewrite cached paths for a page and its subtree, returns count of updated pages"""
+        with transaction.atomic():
+            updated_ids = cascade_cached_paths(page.id, invalidate=not dry_run)
             if dry_run:
-                self.stdout.write(
-                    f"  Would update page {page.id} ({page.slug}): "
-                    f"path: '{page.cached_path}' → '{new_path}', "
-                    f"root_id: {page.cached_root_id} → {new_root_id}"
-                )
-            else:
-                page.cached_path = new_path
-                page.cached_root_id = new_root_id
-                page.cached_root_hostnames = new_root_hostnames
-                page.save(update_fields=['cached_path', 'cached_root_id', 'cached_root_hostnames'])
-                self.stdout.write(
-                    f"  Updated page {page.id} ({page.slug}): "
-                    f"path: '{new_path}', root_id: {new_root_id}"
-                )
-            count += 1
-        
-        # Update children with same root
-        for child in page.children.all():
-            count += self.update_tree(child, dry_run, root_page or page)
-        
-        return count
+                # Compute the changes set-wise, then discard them
+                transaction.set_rollback(True)
+
+        for page_id in updated_ids:
+            verb = "Would update" if dry_run else "Updated"
+            self.stdout.write(f"  {verb} page {page_id}")
+
+        return len(updated_ids)
 
     def verify_cached_paths(self):
         """Verify that all cached paths are correct"""
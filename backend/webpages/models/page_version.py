@@ -137,37 +137,114 @@ class PageVersion(models.Model):
 
         return "\n".join(html_content)
 
-    def update_media_references(self):
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Keep the loaded widgets so save() can usually diff media references
+        # without re-reading the row; content is only extracted on save.
+        if "widgets" in instance.__dict__:
+            instance._loaded_widgets = instance.widgets
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        # Snapshots describe the replaced widgets; diff against the row again
+        self.__dict__.pop("_saved_widget_content", None)
+        self.__dict__.pop("_loaded_widgets", None)
+
+    def _get_previous_widget_content(self):
+        """
+        Return the widget content this version had before the current save.
+
+        Returns:
+            str: Combined HTML content as stored in the database
+        """
+        if self._state.adding:
+            return ""
+        if hasattr(self, "_saved_widget_content"):
+            return self._saved_widget_content
+        loaded = getattr(self, "_loaded_widgets", None)
+        if loaded is not None and loaded is not self.widgets:
+            # Widgets were replaced, so the loaded value is still unchanged
+            return PageVersion(widgets=loaded).extract_widget_content()
+
+        widgets = (
+            PageVersion.objects.filter(pk=self.pk)
+            .values_list("widgets", flat=True)
+            .first()
+        )
+        return PageVersion(widgets=widgets or {}).extract_widget_content()
+
+    def _get_other_live_media_references(self):
+        """
+        Return media referenced by the page's other live versions.
+
+        Live versions are the current published version plus drafts and
+        scheduled versions; usage rows are keyed by page, so media they
+        still show must keep its row when this version drops it.
+        """
+        from django.utils import timezone
+        from file_manager.utils import extract_media_references
+
+        now = timezone.now()
+        live = models.Q(effective_date__isnull=True) | models.Q(effective_date__gt=now)
+        current = self.page.get_current_published_version(now)
+        if current is not None:
+            live |= models.Q(pk=current.pk)
+
+        refs = set()
+        other_widgets = (
+            PageVersion.objects.filter(live, page_id=self.page_id)
+            .exclude(pk=self.pk)
+            .values_list("widgets", flat=True)
+        )
+        for widgets in other_widgets:
+            refs |= extract_media_references(
+                PageVersion(widgets=widgets or {}).extract_widget_content()
+            )
+        return refs
+
+    def update_media_references(self, old_content="", new_content=None):
         """
         Update media references for this version's content.
         Should be called whenever widget content changes.
+
+        Args:
+            old_content: Widget content before the change
+            new_content: Widget content after the change (defaults to current)
         """
-        from file_manager.utils import update_media_references
+        from file_manager.utils import extract_media_references, update_media_references
 
-        # Get old content before save
-        if self.pk:
-            old_version = PageVersion.objects.get(pk=self.pk)
-            old_content = old_version.extract_widget_content()
-        else:
-            old_content = ""
+        if new_content is None:
+            new_content = self.extract_widget_content()
 
-        new_content = self.extract_widget_content()
+        retained_refs = set()
+        if extract_media_references(old_content) - extract_media_references(new_content):
+            retained_refs = self._get_other_live_media_references()
 
-        # Update references
         update_media_references(
             content_type="webpage",
-            content_id=str(self.page.id),
+            content_id=str(self.page_id),
             old_content=old_content,
             new_content=new_content,
+            retained_refs=retained_refs,
         )
 
     def save(self, *args, **kwargs):
         """Override save to handle media references"""
-        # First do the actual save
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "widgets" not in update_fields:
+            super().save(*args, **kwargs)
+            return
+
+        old_content = self._get_previous_widget_content()
+        new_content = self.extract_widget_content()
+
         super().save(*args, **kwargs)
 
-        # Then update media references
-        self.update_media_references()
+        if new_content != old_content:
+            self.update_media_references(old_content, new_content)
+        self._saved_widget_content = new_content
 
     def clean(self):
         """Validate the version data"""
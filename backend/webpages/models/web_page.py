@@ -1531,22 +1531,114 @@ class WebPage(models.Model):
 
         Args:
             parent_id: ID of parent page, or None for root pages
+
+        Returns:
+            int: Number of pages whose sort order changed
         """
-        if parent_id:
-            siblings = cls.objects.filter(parent_id=parent_id).order_by(
-                "sort_order", "title"
-            )
-        else:
-            siblings = cls.objects.filter(parent__isnull=True).order_by(
-                "sort_order", "title"
-            )
+        siblings = cls.objects.filter(parent_id=parent_id).order_by(
+            "sort_order", "title"
+        )
+        return cls.reorder_siblings(
+            parent_id, list(siblings.values_list("id", flat=True))
+        )
+
+    @classmethod
+    def reorder_siblings(cls, parent_id, page_ids, queryset=None):
+        """
+        Put siblings in the given order with a single bulk update.
+
+        Listed pages get sort orders 10, 20, 30, ...; siblings that are not
+        listed keep their relative order after them. Sort order does not
+        affect paths or inheritance, so no signals or cache invalidation
+        are needed.
+
+        Args:
+            parent_id: ID of parent page, or None for root pages
+            page_ids: Sibling page IDs in their new order
+            queryset: Optional queryset limiting the siblings, e.g. to a tenant
+
+        Returns:
+            int: Number of pages whose sort order changed
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+        siblings = {
+            page.id: page
+            for page in queryset.filter(parent_id=parent_id)
+            .only("id", "sort_order", "title")
+            .order_by("sort_order", "title")
+        }
+        ordered_ids = [page_id for page_id in page_ids if page_id in siblings]
+        listed = set(ordered_ids)
+        ordered_ids += [page_id for page_id in siblings if page_id not in listed]
 
-        # Update sort orders with proper spacing
-        for index, page in enumerate(siblings):
+        changed = []
+        for index, page_id in enumerate(ordered_ids):
+            page = siblings[page_id]
             new_sort_order = (index + 1) * 10  # 10, 20, 30, 40, etc.
             if page.sort_order != new_sort_order:
                 page.sort_order = new_sort_order
-                page.save(update_fields=["sort_order"])
+                changed.append(page)
+
+        cls.objects.bulk_update(changed, ["sort_order"], batch_size=500)
+        return len(changed)
+
+    @classmethod
+    def move_pages(cls, pages, parent, user, sort_order=0):
+        """
+        Move pages under a new parent with set-based updates.
+
+        Parent and sort order are written with one bulk update, the moved
+        subtrees' cached paths with one recursive update, and each moved
+        page's inheritance cache is bumped once. No per-page save signals
+        are sent.
+
+        Args:
+            pages: Pages to move
+            parent: New parent page, or None for root level
+            user: User performing the move
+            sort_order: Sort order of the first page; later pages follow in steps of 10
+
+        Returns:
+            list: The moved pages
+
+        Raises:
+            ValidationError: If a page would be moved into itself or its descendant
+        """
+        from django.utils import timezone
+        from ..inheritance_cache import InheritanceTreeCache
+        from ..services.page_paths import cascade_cached_paths_many
+        from ..services.page_subtree import get_ancestor_ids
+
+        pages = list(pages)
+        if parent:
+            ancestor_ids = set(get_ancestor_ids(parent.id))
+            for page in pages:
+                if page.id in ancestor_ids:
+                    raise ValidationError(
+                        f"Cannot move page '{page.title}' into its own descendant"
+                    )
+
+        now = timezone.now()
+        for index, page in enumerate(pages):
+            page.parent = parent
+            page.sort_order = sort_order + index * 10  # Space out pages
+            page.last_modified_by = user
+            page.updated_at = now
+
+        with transaction.atomic():
+            cls.objects.bulk_update(
+                pages,
+                ["parent", "sort_order", "last_modified_by", "updated_at"],
+                batch_size=500,
+            )
+            cascade_cached_paths_many([page.id for page in pages], invalidate=False)
+
+        # Moved trees store their old ancestor chain, so bump each moved page
+        for page in pages:
+            InheritanceTreeCache.invalidate_page(page.id)
+
+        return pages
 
     def normalize_siblings_sort_orders(self):
         """Normalize sort orders for this page's siblings"""
@@ -1816,17 +1908,17 @@ class WebPage(models.Model):
         """
         from django.utils import timezone
 
-        metadata = {
-            "parent_id": self.parent_id,
-            "slug": self.slug,
-            "title": self.title,
-            "sort_order": self.sort_order,
-            "deleted_at": timezone.now().isoformat(),
-            "deleted_by_id": user.id,
-            "deleted_by_username": user.username,
-        }
+        parent_chain, parent_path_display = self._get_parent_chain()
+
+        # Count children for display
+        children_count = self.children.filter(is_deleted=False).count()
+
+        self.deletion_metadata = self._build_deletion_metadata(
+            user, timezone.now(), parent_chain, parent_path_display, children_count
+        )
 
-        # Store parent ID chain for finding nearest ancestor
+    def _get_parent_chain(self):
+        """Return ancestor IDs and display names, nearest parent first."""
         parent_chain = []
         parent_path_display = []
         current = self.parent
@@ -1836,22 +1928,36 @@ class WebPage(models.Model):
                 current.title or current.slug or f"Page {current.id}"
             )
             current = current.parent
+        return parent_chain, parent_path_display
 
-        metadata["parent_id_chain"] = parent_chain
-        metadata["parent_path_display"] = (
-            " > ".join(reversed(parent_path_display)) if parent_path_display else "Root"
-        )
-
-        # Count children for display
-        children_count = self.children.filter(is_deleted=False).count()
-        metadata["children_count"] = children_count
-
-        self.deletion_metadata = metadata
+    def _build_deletion_metadata(
+        self, user, deleted_at, parent_chain, parent_path_display, children_count
+    ):
+        """Build the deletion metadata dict from precomputed hierarchy information."""
+        return {
+            "parent_id": self.parent_id,
+            "slug": self.slug,
+            "title": self.title,
+            "sort_order": self.sort_order,
+            "deleted_at": deleted_at.isoformat(),
+            "deleted_by_id": user.id,
+            "deleted_by_username": user.username,
+            "parent_id_chain": parent_chain,
+            "parent_path_display": (
+                " > ".join(reversed(parent_path_display))
+                if parent_path_display
+                else "Root"
+            ),
+            "children_count": children_count,
+        }
 
     def soft_delete(self, user, recursive=False):
         """
         Mark this page as deleted (soft delete).
 
+        Descendants are collected with one subtree query and marked deleted
+        with set-based updates, so large sections are not saved one by one.
+
         Args:
             user: User performing the deletion
             recursive: If True, also soft delete all descendant pages
@@ -1866,27 +1972,64 @@ class WebPage(models.Model):
                     ]
                 }
         """
+        from django.db.models import Count
         from django.utils import timezone
+        from ..inheritance_cache import InheritanceTreeCache
+        from ..services.page_subtree import get_descendant_ids
 
         deleted_pages = []
+        was_deleted = self.is_deleted
 
-        if recursive:
-            # Get all descendants
-            descendants = self.get_all_descendants()
-            for descendant in descendants:
-                if not descendant.is_deleted:
-                    descendant._store_deletion_metadata(user)
+        with transaction.atomic():
+            # Delete the page itself
+            if not was_deleted:
+                self._store_deletion_metadata(user)
+                self.is_deleted = True
+                self.deleted_at = timezone.now()
+                self.deleted_by = user
+                self.save(
+                    update_fields=[
+                        "is_deleted",
+                        "deleted_at",
+                        "deleted_by",
+                        "deletion_metadata",
+                    ]
+                )
+
+            if recursive:
+                descendant_ids = get_descendant_ids([self.id])
+                descendants = WebPage.objects.in_bulk(descendant_ids)
+                children_counts = dict(
+                    WebPage.objects.filter(
+                        parent_id__in=[self.id, *descendant_ids], is_deleted=False
+                    )
+                    .values_list("parent_id")
+                    .annotate(count=Count("id"))
+                )
+
+                # Parents come first, so each chain extends its parent's
+                chains = {self.id: self._get_parent_chain()}
+                now = timezone.now()
+
+                for descendant_id in descendant_ids:
+                    descendant = descendants[descendant_id]
+                    parent = descendants.get(descendant.parent_id, self)
+                    parent_ids, parent_names = chains[parent.id]
+                    parent_name = parent.title or parent.slug or f"Page {parent.id}"
+                    chains[descendant_id] = (
+                        [parent.id, *parent_ids],
+                        [parent_name, *parent_names],
+                    )
+
+                    descendant.deletion_metadata = descendant._build_deletion_metadata(
+                        user,
+                        now,
+                        *chains[descendant_id],
+                        children_counts.get(descendant_id, 0),
+                    )
                     descendant.is_deleted = True
-                    descendant.deleted_at = timezone.now()
+                    descendant.deleted_at = now
                     descendant.deleted_by = user
-                    descendant.save(
-                        update_fields=[
-                            "is_deleted",
-                            "deleted_at",
-                            "deleted_by",
-                            "deletion_metadata",
-                        ]
-                    )
                     deleted_pages.append(
                         {
                             "id": descendant.id,
@@ -1895,20 +2038,17 @@ class WebPage(models.Model):
                         }
                     )
 
-        # Delete the page itself
-        if not self.is_deleted:
-            self._store_deletion_metadata(user)
-            self.is_deleted = True
-            self.deleted_at = timezone.now()
-            self.deleted_by = user
-            self.save(
-                update_fields=[
-                    "is_deleted",
-                    "deleted_at",
-                    "deleted_by",
-                    "deletion_metadata",
-                ]
-            )
+                WebPage.objects.bulk_update(
+                    list(descendants.values()),
+                    ["is_deleted", "deleted_at", "deleted_by", "deletion_metadata"],
+                    batch_size=500,
+                )
+
+        if recursive and deleted_pages:
+            # Descendant trees all include this page, so one bump covers them
+            InheritanceTreeCache.invalidate_page(self.id)
+
+        if not was_deleted:
             deleted_pages.append(
                 {
                     "id": self.id,
@@ -1922,6 +2062,18 @@ class WebPage(models.Model):
             "deleted_pages": deleted_pages,
         }
 
+    @staticmethod
+    def _first_free_slug(slug, taken):
+        """Return slug, or slug with the first numeric suffix not in taken."""
+        if not slug or slug not in taken:
+            return slug
+        counter = 2
+        candidate = f"{slug}-{counter}"
+        while candidate in taken:
+            counter += 1
+            candidate = f"{slug}-{counter}"
+        return candidate
+
     def restore(self, user, recursive=False, child_ids=None):
         """
         Restore a soft-deleted page with intelligent parent validation.
@@ -1934,6 +2086,10 @@ class WebPage(models.Model):
         Returns:
             dict: Restoration result with warnings and counts
         """
+        from ..inheritance_cache import InheritanceTreeCache
+        from ..services.page_paths import cascade_cached_paths
+        from ..services.page_subtree import get_descendant_ids
+
         result = {
             "restored_count": 0,
             "warnings": [],
@@ -1988,34 +2144,61 @@ class WebPage(models.Model):
 
         # Handle children restoration
         if recursive:
-            # Restore all descendants
-            descendants = self.get_all_descendants(include_deleted=True)
-            for descendant in descendants:
-                if descendant.is_deleted:
-                    # Validate parent still exists after restoration
-                    if descendant.parent and not descendant.parent.is_deleted:
-                        descendant.is_deleted = False
-                        descendant.deleted_at = None
-                        descendant.deleted_by = None
-                        descendant.last_modified_by = user
-
-                        # Check for slug conflicts
-                        child_slug_result = descendant.ensure_unique_slug()
-                        if child_slug_result["modified"]:
-                            result["warnings"].append(
-                                f"Child page slug renamed: '{child_slug_result['original_slug']}' → '{child_slug_result['new_slug']}'"
-                            )
+            # Load the whole subtree once; its live pages are every sibling
+            # a restored descendant can collide with
+            descendant_ids = get_descendant_ids([self.id], include_deleted=True)
+            descendants = WebPage.objects.in_bulk(descendant_ids)
+            live_ids = {self.id}
+            taken_slugs = {}
+            for descendant in descendants.values():
+                if not descendant.is_deleted:
+                    live_ids.add(descendant.id)
+                    taken_slugs.setdefault(descendant.parent_id, set()).add(
+                        descendant.slug
+                    )
 
-                        descendant.save(
-                            update_fields=[
-                                "is_deleted",
-                                "deleted_at",
-                                "deleted_by",
-                                "last_modified_by",
-                                "slug",
-                            ]
-                        )
-                        result["restored_count"] += 1
+            restored = []
+            for descendant_id in descendant_ids:
+                descendant = descendants[descendant_id]
+                # Parents come first, so a restorable parent is already live
+                if not descendant.is_deleted or descendant.parent_id not in live_ids:
+                    continue
+
+                descendant.is_deleted = False
+                descendant.deleted_at = None
+                descendant.deleted_by = None
+                descendant.last_modified_by = user
+
+                # Check for slug conflicts
+                siblings = taken_slugs.setdefault(descendant.parent_id, set())
+                new_slug = self._first_free_slug(descendant.slug, siblings)
+                if new_slug != descendant.slug:
+                    result["warnings"].append(
+                        f"Child page slug renamed: '{descendant.slug}' → '{new_slug}'"
+                    )
+                    descendant.slug = new_slug
+                siblings.add(descendant.slug)
+
+                live_ids.add(descendant.id)
+                restored.append(descendant)
+
+            if restored:
+                with transaction.atomic():
+                    WebPage.objects.bulk_update(
+                        restored,
+                        [
+                            "is_deleted",
+                            "deleted_at",
+                            "deleted_by",
+                            "last_modified_by",
+                            "slug",
+                        ],
+                        batch_size=500,
+                    )
+                    # Renamed descendants change the paths below them
+                    cascade_cached_paths(self.id, invalidate=False)
+                InheritanceTreeCache.invalidate_page(self.id)
+                result["restored_count"] += len(restored)
         elif child_ids:
             # Restore only specific children
             children = self.children.filter(id__in=child_ids, is_deleted=True)
@@ -2140,20 +2323,19 @@ class WebPage(models.Model):
         deleted_pages = []
 
         if recursive:
-            # Get all descendants (including deleted ones)
-            descendants = self.get_all_descendants(include_deleted=True)
-            for descendant in descendants:
-                # Only delete if already soft-deleted
-                if descendant.is_deleted:
-                    deleted_pages.append(
-                        {
-                            "id": descendant.id,
-                            "title": descendant.title,
-                            "slug": descendant.slug,
-                        }
-                    )
-                    # Actually delete from database
-                    descendant.delete()
+            from ..services.page_subtree import get_descendant_ids
+
+            # Only descendants that are already soft-deleted are reported
+            descendant_ids = get_descendant_ids([self.id], include_deleted=True)
+            descendants = WebPage.objects.filter(
+                id__in=descendant_ids, is_deleted=True
+            )
+            rows = {row["id"]: row for row in descendants.values("id", "title", "slug")}
+            deleted_pages.extend(
+                rows[page_id] for page_id in descendant_ids if page_id in rows
+            )
+            # Actually delete from database
+            descendants.delete()
 
         # Delete the page itself
         deleted_pages.append(
@@ -2177,27 +2359,19 @@ class WebPage(models.Model):
 
     def get_all_descendants(self, include_deleted=False):
         """
-        Get all descendant pages recursively.
+        Get all descendant pages with a single subtree query.
 
         Args:
             include_deleted: If True, include soft-deleted pages in results
 
         Returns:
-            QuerySet: All descendant pages
+            list: All descendant pages, parents before their children
         """
-        descendants = []
-
-        def collect_descendants(page):
-            queryset = page.children.all()
-            if not include_deleted:
-                queryset = queryset.filter(is_deleted=False)
-
-            for child in queryset:
-                descendants.append(child)
-                collect_descendants(child)
+        from ..services.page_subtree import get_descendant_ids
 
-        collect_descendants(self)
-        return descendants
+        descendant_ids = get_descendant_ids([self.id], include_deleted)
+        pages = WebPage.objects.in_bulk(descendant_ids)
+        return [pages[page_id] for page_id in descendant_ids if page_id in pages]
 
     def save(self, *args, **kwargs):
         """Override save to clear hostname cache when hostnames change."""
@@ -14,6 +14,8 @@ from django.core.exceptions import ImproperlyConfigured
 import re
 import logging
 
+from .registry_discovery import LazyDiscoveryMixin
+
 logger = logging.getLogger(__name__)
 
 
@@ -114,16 +116,20 @@ class BasePathPattern(ABC):
         return f"<{self.__class__.__name__}: {self.key}>"
 
 
-class PathPatternRegistry:
+class PathPatternRegistry(LazyDiscoveryMixin):
     """
     Global registry for path pattern classes.
 
     Provides methods to register path patterns and retrieve them by key.
+    Path pattern modules are discovered on the first lookup.
     """
 
+    discovery_name = "path_patterns"
+
     def __init__(self):
         self._patterns: Dict[str, Type[BasePathPattern]] = {}
         self._instances: Dict[str, BasePathPattern] = {}
+        self._init_discovery()
 
     def register(self, pattern_class: Type[BasePathPattern]) -> None:
         """
@@ -159,14 +165,17 @@ class PathPatternRegistry:
 
     def get_pattern(self, key: str) -> Optional[BasePathPattern]:
         """Get a path pattern instance by key."""
+        self.ensure_discovered()
         return self._instances.get(key)
 
     def get_pattern_class(self, key: str) -> Optional[Type[BasePathPattern]]:
         """Get a path pattern class by key."""
+        self.ensure_discovered()
         return self._patterns.get(key)
 
     def is_registered(self, key: str) -> bool:
         """Check if a pattern is registered by key."""
+        self.ensure_discovered()
         return key in self._patterns
 
     def list_patterns(self) -> List[BasePathPattern]:
@@ -176,6 +185,7 @@ class PathPatternRegistry:
         Returns:
             List of BasePathPattern instances
         """
+        self.ensure_discovered()
         return list(self._instances.values())
 
     def list_pattern_keys(self) -> List[str]:
@@ -185,6 +195,7 @@ class PathPatternRegistry:
         Returns:
             List of pattern keys
         """
+        self.ensure_discovered()
         return list(self._patterns.keys())
 
     def to_dict(self) -> List[Dict[str, Any]]:
@@ -194,6 +205,7 @@ class PathPatternRegistry:
         Returns:
             List of pattern dictionaries
         """
+        self.ensure_discovered()
         return [pattern.to_dict() for pattern in self._instances.values()]
 
     def validate_path(self, pattern_key: str, path: str) -> Optional[Dict[str, str]]:
@@ -218,6 +230,7 @@ class PathPatternRegistry:
         """Clear all registered patterns. Primarily for testing."""
         self._patterns.clear()
         self._instances.clear()
+        self._mark_discovered()
 
 
 # Global registry instance
@@ -218,48 +218,82 @@ class PublishingService:
 
         return expired_count, errors
 
-    def bulk_publish_pages(
-        self, page_ids: List[int], change_summary: str = "Bulk publish operation"
+    def _update_latest_versions(
+        self, pages, change_summary: str, error_prefix: str, **dates
     ) -> Tuple[int, List[str]]:
         """
-        Publish multiple pages at once using date-based logic.
+        Set publishing dates on the latest version of each page in one UPDATE.
 
-        NEW: Sets effective_date to now on the latest version of each page.
+        Pages without versions get a new version first. Version signals are
+        deferred, so publication caches and inheritance trees are refreshed
+        once for all pages instead of once per saved version.
+
+        Args:
+            pages: Pages whose latest versions to update
+            change_summary: Title for versions created for pages without one
+            error_prefix: Prefix for per-page error messages
+            **dates: PageVersion date fields to set
 
         Returns:
-            Tuple of (count_published, error_messages)
+            Tuple of (count_updated, error_messages)
         """
         # Import here to avoid circular imports
-        from .models import WebPage, PageVersion
+        from .models import PageVersion
+        from .signals import deferred_version_updates
 
-        pages = WebPage.objects.filter(id__in=page_ids)
-        published_count = 0
+        pages = list(pages)
         errors = []
 
-        for page in pages:
-            try:
-                # Get or create the latest version for this page
-                latest_version = page.versions.order_by("-version_number").first()
+        with deferred_version_updates() as pending:
+            # Latest version per page in one query
+            latest_ids = dict(
+                PageVersion.objects.filter(page__in=pages)
+                .order_by("page_id", "-version_number")
+                .distinct("page_id")
+                .values_list("page_id", "id")
+            )
 
-                if not latest_version:
+            for page in pages:
+                if page.id in latest_ids:
+                    continue
+                try:
                     # Create a new version if none exists
-                    latest_version = page.create_version(
-                        self.user, change_summary, status="draft"  # Legacy field
-                    )
+                    latest_ids[page.id] = page.create_version(
+                        self.user, change_summary
+                    ).id
+                except Exception as e:
+                    error_msg = f"{error_prefix} {page.title}: {str(e)}"
+                    errors.append(error_msg)
+                    self.logger.error(error_msg)
 
-                # Set effective_date to now to publish immediately
-                latest_version.effective_date = timezone.now()
-                # Don't set expiry_date - let it remain null for indefinite publishing
-                latest_version.save(update_fields=["effective_date"])
+            PageVersion.objects.filter(id__in=latest_ids.values()).update(**dates)
+            pending.update(latest_ids)
 
-                published_count += 1
+        return len(latest_ids), errors
 
-            except Exception as e:
-                error_msg = f"Failed to bulk publish {page.title}: {str(e)}"
-                errors.append(error_msg)
-                self.logger.error(error_msg)
+    def bulk_publish_pages(
+        self, page_ids: List[int], change_summary: str = "Bulk publish operation"
+    ) -> Tuple[int, List[str]]:
+        """
+        Publish multiple pages at once using date-based logic.
 
-        return published_count, errors
+        NEW: Sets effective_date to now on the latest version of each page.
+
+        Returns:
+            Tuple of (count_published, error_messages)
+        """
+        # Import here to avoid circular imports
+        from .models import WebPage
+
+        pages = WebPage.objects.filter(id__in=page_ids)
+
+        # Don't set expiry_date - let it remain null for indefinite publishing
+        return self._update_latest_versions(
+            pages,
+            change_summary,
+            "Failed to bulk publish",
+            effective_date=timezone.now(),
+        )
 
     def publish_page_with_subpages(
         self, page_id: int, change_summary: str = "Publish with subpages"
@@ -277,7 +311,8 @@ class PublishingService:
             Tuple of (count_published, error_messages)
         """
         # Import here to avoid circular imports
-        from .models import WebPage, PageVersion
+        from .models import WebPage
+        from .services.page_subtree import get_descendant_ids
 
         try:
             page = WebPage.objects.get(id=page_id)
@@ -285,37 +320,16 @@ class PublishingService:
             return 0, [f"Page with ID {page_id} does not exist"]
 
         # Collect all pages to publish: the parent and all descendants
-        pages_to_publish = [page]
-        descendants = page.get_all_descendants(include_deleted=False)
-        pages_to_publish.extend(descendants)
-
-        published_count = 0
-        errors = []
-
-        for page_item in pages_to_publish:
-            try:
-                # Get the latest version for this page
-                latest_version = page_item.versions.order_by("-version_number").first()
-
-                if not latest_version:
-                    # Create a new version if none exists
-                    latest_version = page_item.create_version(
-                        self.user, change_summary, status="draft"  # Legacy field
-                    )
-
-                # Set effective_date to now to publish immediately
-                latest_version.effective_date = timezone.now()
-                # Don't set expiry_date - let it remain null for indefinite publishing
-                latest_version.save(update_fields=["effective_date"])
-
-                published_count += 1
-
-            except Exception as e:
-                error_msg = f"Failed to publish {page_item.title}: {str(e)}"
-                errors.append(error_msg)
-                self.logger.error(error_msg)
-
-        return published_count, errors
+        page_ids = [page.id, *get_descendant_ids([page.id])]
+        pages_to_publish = WebPage.objects.filter(id__in=page_ids)
+
+        # Don't set expiry_date - let it remain null for indefinite publishing
+        return self._update_latest_versions(
+            pages_to_publish,
+            change_summary,
+            "Failed to publish",
+            effective_date=timezone.now(),
+        )
 
     def bulk_publish_pages_legacy(
         self, page_ids: List[int], change_summary: str = "Bulk publish operation"
@@ -356,39 +370,20 @@ class PublishingService:
             Tuple of (count_scheduled, error_messages)
         """
         # Import here to avoid circular imports
-        from .models import WebPage, PageVersion
+        from .models import WebPage
 
         if not schedule.is_valid():
             return 0, ["Invalid schedule: effective date must be before expiry date"]
 
         pages = WebPage.objects.filter(id__in=page_ids)
-        scheduled_count = 0
-        errors = []
-
-        for page in pages:
-            try:
-                # Get or create the latest version for this page
-                latest_version = page.versions.order_by("-version_number").first()
-
-                if not latest_version:
-                    # Create a new version if none exists
-                    latest_version = page.create_version(
-                        self.user, change_summary, status="draft"  # Legacy field
-                    )
-
-                # Set the schedule dates
-                latest_version.effective_date = schedule.effective_date
-                latest_version.expiry_date = schedule.expiry_date
-                latest_version.save(update_fields=["effective_date", "expiry_date"])
 
-                scheduled_count += 1
-
-            except Exception as e:
-                error_msg = f"Failed to bulk schedule {page.title}: {str(e)}"
-                errors.append(error_msg)
-                self.logger.error(error_msg)
-
-        return scheduled_count, errors
+        return self._update_latest_versions(
+            pages,
+            change_summary,
+            "Failed to bulk schedule",
+            effective_date=schedule.effective_date,
+            expiry_date=schedule.expiry_date,
+        )
 
     def bulk_schedule_pages_legacy(
         self,
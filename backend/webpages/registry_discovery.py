@@ -0,0 +1,86 @@
+"""
+Lazy Registry Discovery
+
+Layout, widget type and path pattern registries are populated by importing
+the matching module ('layouts', 'widgets', 'path_patterns') of every installed
+app. Doing that in AppConfig.ready() makes every process pay for it, including
+Celery workers and management commands that never render a page. Registries
+using LazyDiscoveryMixin are instead given a discovery function at startup and
+run it on their first lookup.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds spent in each registry's discovery, for the startup profiler
+discovery_timings: Dict[str, float] = {}
+
+
+class LazyDiscoveryMixin:
+    """
+    Mixin for registries that populate themselves on first lookup.
+
+    Lookup methods call ensure_discovered() before reading the registry.
+    Registration never triggers discovery, so the modules being imported by
+    the discovery function can register freely.
+    """
+
+    discovery_name = "registry"
+
+    def _init_discovery(self) -> None:
+        self._discover: Optional[Callable[[], None]] = None
+        self._discovered = False
+        self._discovering = False
+        self._discovery_lock = threading.RLock()
+
+    def set_discovery(self, discover: Callable[[], None]) -> None:
+        """
+        Set the function that populates this registry on first lookup.
+
+        Args:
+            discover: Callable importing the modules that register entries
+        """
+        self._discover = discover
+        self._discovered = False
+
+    @property
+    def is_discovered(self) -> bool:
+        return self._discovered
+
+    def ensure_discovered(self) -> None:
+        """Run the discovery function once, if one is set and it has not run."""
+        if self._discovered or self._discover is None:
+            return
+
+        with self._discovery_lock:
+            # Re-entrant lookups from modules being imported see the partial
+            # registry; other threads wait for discovery to finish
+            if self._discovered or self._discovering:
+                return
+            self._discovering = True
+            started = time.perf_counter()
+            try:
+                self._discover()
+            finally:
+                self._discovering = False
+                self._discovered = True
+                elapsed = time.perf_counter() - started
+                discovery_timings[self.discovery_name] = elapsed
+                logger.debug(
+                    f"Discovered {self.discovery_name} registry in {elapsed * 1000:.1f}ms"
+                )
+
+    def _mark_discovered(self) -> None:
+        """Keep an explicitly cleared registry from repopulating itself."""
+        self._discovered = True
+
+
+def eager_discovery_enabled() -> bool:
+    """Whether registries should be populated in AppConfig.ready()."""
+    return getattr(settings, "REGISTRY_EAGER_DISCOVERY", False)
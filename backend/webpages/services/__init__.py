@@ -2,26 +2,32 @@
 Webpages Services
 
 Business logic services for webpages app.
+
+Exports are resolved on first access, so importing one service module (as the
+signal handlers do at startup) does not import bs4, AI clients and the rest
+of the package with it.
 """
 
-from .theme_css_generator import ThemeCSSGenerator
-from .style_ai_helper import StyleAIHelper
-from .link_resolver import (
-    is_link_object,
-    parse_link_string,
-    resolve_link,
-    resolve_links_in_html,
-    resolve_links_in_config,
-    get_link_display_info,
-)
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "ThemeCSSGenerator": ".theme_css_generator",
+    "StyleAIHelper": ".style_ai_helper",
+    "is_link_object": ".link_resolver",
+    "parse_link_string": ".link_resolver",
+    "resolve_link": ".link_resolver",
+    "resolve_links_in_html": ".link_resolver",
+    "resolve_links_in_config": ".link_resolver",
+    "get_link_display_info": ".link_resolver",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
 
-__all__ = [
-    "ThemeCSSGenerator",
-    "StyleAIHelper",
-    "is_link_object",
-    "parse_link_string",
-    "resolve_link",
-    "resolve_links_in_html",
-    "resolve_links_in_config",
-    "get_link_display_info",
-]
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
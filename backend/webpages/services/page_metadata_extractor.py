@@ -28,8 +28,19 @@ class PageMetadataExtractor:
                 - slug: URL-safe slug
                 - tags: List of tag names
         """
-        soup = BeautifulSoup(html, "html.parser")
+        return self.extract_from_soup(BeautifulSoup(html, "html.parser"), url)
 
+    def extract_from_soup(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+        """
+        Extract page metadata from an already parsed page.
+
+        Args:
+            soup: BeautifulSoup object of the page
+            url: The page URL (used for slug fallback)
+
+        Returns:
+            Metadata dictionary (see extract())
+        """
         metadata = {
             "title": self._extract_title(soup, url),
             "description": self._extract_description(soup),
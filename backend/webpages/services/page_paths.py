@@ -0,0 +1,170 @@
+"""
+Set-based maintenance of denormalized page paths.
+
+``cached_path``, ``cached_root_id`` and ``cached_root_hostnames`` are derived
+from the page hierarchy. When a page moves, is renamed or a root changes its
+hostnames, the whole subtree is rewritten with one recursive-CTE UPDATE
+instead of re-saving every descendant.
+"""
+
+from typing import Iterable, List
+
+from django.db import connection
+
+from ..models import WebPage
+
+# Guards against parent cycles in corrupt data
+MAX_TREE_DEPTH = 100
+
+CASCADE_SQL = """
+WITH RECURSIVE ancestors AS (
+    SELECT id AS seed, id, parent_id, hostnames, 0 AS depth
+    FROM {table} WHERE id = ANY(%(page_ids)s)
+    UNION ALL
+    SELECT a.seed, p.id, p.parent_id, p.hostnames, a.depth + 1
+    FROM {table} p JOIN ancestors a ON p.id = a.parent_id
+    WHERE a.depth < %(max_depth)s
+),
+root AS (
+    SELECT DISTINCT ON (seed) seed, id, COALESCE(hostnames, '{{}}') AS hostnames
+    FROM ancestors WHERE parent_id IS NULL
+    ORDER BY seed
+),
+subtree AS (
+    SELECT
+        p.id,
+        CASE
+            WHEN p.parent_id IS NOT NULL
+                THEN rtrim(COALESCE(parent.cached_path, ''), '/') || '/' || btrim(COALESCE(p.slug, ''), '/') || '/'
+            WHEN cardinality(COALESCE(p.hostnames, '{{}}')) > 0 THEN '/'
+            ELSE '/' || btrim(COALESCE(p.slug, ''), '/') || '/'
+        END AS path,
+        root.id AS root_id,
+        root.hostnames AS root_hostnames,
+        0 AS depth
+    FROM {table} p
+    LEFT JOIN {table} parent ON parent.id = p.parent_id
+    LEFT JOIN root ON root.seed = p.id
+    WHERE p.id = ANY(%(page_ids)s)
+    UNION ALL
+    SELECT
+        c.id,
+        rtrim(s.path, '/') || '/' || btrim(COALESCE(c.slug, ''), '/') || '/',
+        s.root_id,
+        s.root_hostnames,
+        s.depth + 1
+    FROM {table} c JOIN subtree s ON c.parent_id = s.id
+    WHERE s.depth < %(max_depth)s
+)
+UPDATE {table} w
+SET cached_path = s.path,
+    cached_root_id = s.root_id,
+    cached_root_hostnames = s.root_hostnames
+FROM subtree s
+WHERE w.id = s.id
+  AND (
+    w.cached_path IS DISTINCT FROM s.path
+    OR w.cached_root_id IS DISTINCT FROM s.root_id
+    OR w.cached_root_hostnames IS DISTINCT FROM s.root_hostnames
+  )
+RETURNING w.id
+"""
+
+
+def cascade_cached_paths(page_id: int, invalidate: bool = True) -> List[int]:
+    """
+    Recompute cached path and root fields for a page and all its descendants.
+
+    The page's own path is derived from its parent's stored ``cached_path``;
+    descendants are derived from the page. Rows that already hold the right
+    values are not touched. No model signals are sent.
+
+    Args:
+        page_id: ID of the subtree root
+        invalidate: Invalidate cached inheritance trees for the subtree
+
+    Returns:
+        IDs of the pages that were updated
+    """
+    return cascade_cached_paths_many([page_id], invalidate)
+
+
+def cascade_cached_paths_many(
+    page_ids: Iterable[int], invalidate: bool = True
+) -> List[int]:
+    """
+    Recompute cached path and root fields for several subtrees in one statement.
+
+    The subtrees must not overlap, e.g. a set of pages just moved under one
+    parent.
+
+    Args:
+        page_ids: IDs of the subtree roots
+        invalidate: Invalidate cached inheritance trees for the subtrees
+
+    Returns:
+        IDs of the pages that were updated
+    """
+    page_ids = list(page_ids)
+    if not page_ids:
+        return []
+
+    if connection.vendor != "postgresql":
+        updated_ids = []
+        for page_id in page_ids:
+            updated_ids.extend(_cascade_without_cte(page_id))
+    else:
+        sql = CASCADE_SQL.format(table=connection.ops.quote_name(WebPage._meta.db_table))
+        with connection.cursor() as cursor:
+            cursor.execute(sql, {"page_ids": page_ids, "max_depth": MAX_TREE_DEPTH})
+            updated_ids = [row[0] for row in cursor.fetchall()]
+
+    if updated_ids and invalidate:
+        from ..inheritance_cache import InheritanceTreeCache
+
+        # Every descendant's tree includes its subtree root, so one bump
+        # per root covers them
+        for page_id in page_ids:
+            InheritanceTreeCache.invalidate_page(page_id)
+
+    return updated_ids
+
+
+def _cascade_without_cte(page_id: int) -> List[int]:
+    """Level-by-level fallback for databases without the PostgreSQL features used above."""
+    try:
+        page = WebPage.objects.select_related("parent").get(id=page_id)
+    except WebPage.DoesNotExist:
+        return []
+
+    root = page.get_root_page() or page
+    root_hostnames = root.hostnames or []
+    if page.parent_id:
+        parent_path = page.parent.cached_path or ""
+        path = f"{parent_path.rstrip('/')}/{(page.slug or '').strip('/')}/"
+    elif page.hostnames:
+        path = "/"
+    else:
+        path = f"/{(page.slug or '').strip('/')}/"
+
+    updated_ids = []
+    level = {page.id: path}
+    for _ in range(MAX_TREE_DEPTH):
+        if not level:
+            break
+        for pk, page_path in level.items():
+            updated = WebPage.objects.filter(pk=pk).update(
+                cached_path=page_path,
+                cached_root_id=root.id,
+                cached_root_hostnames=root_hostnames,
+            )
+            if updated:
+                updated_ids.append(pk)
+        children = WebPage.objects.filter(parent_id__in=list(level)).values_list(
+            "id", "parent_id", "slug"
+        )
+        level = {
+            pk: f"{level[parent_id].rstrip('/')}/{(slug or '').strip('/')}/"
+            for pk, parent_id, slug in children
+        }
+    return updated_ids
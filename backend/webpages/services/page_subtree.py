@@ -0,0 +1,106 @@
+"""
+Subtree queries for the page hierarchy.
+
+Delete, restore and publish operations work on whole sections. Instead of
+walking ``children`` one page at a time, the descendants of any number of
+pages are collected with a single recursive CTE.
+"""
+
+from typing import Iterable, List, Tuple
+
+from django.db import connection
+
+from ..models import WebPage
+from .page_paths import MAX_TREE_DEPTH
+
+SUBTREE_SQL = """
+WITH RECURSIVE subtree(id, depth) AS (
+    SELECT c.id, 1
+    FROM {table} c
+    WHERE c.parent_id IN ({placeholders}) {deleted_filter}
+    UNION ALL
+    SELECT c.id, s.depth + 1
+    FROM {table} c JOIN subtree s ON c.parent_id = s.id
+    WHERE s.depth < %s {deleted_filter}
+)
+SELECT s.id, MIN(s.depth) AS depth
+FROM subtree s JOIN {table} p ON p.id = s.id
+GROUP BY s.id, p.sort_order
+ORDER BY MIN(s.depth), p.sort_order, s.id
+"""
+
+ANCESTORS_SQL = """
+WITH RECURSIVE ancestors(id, parent_id, depth) AS (
+    SELECT p.id, p.parent_id, 0
+    FROM {table} p
+    WHERE p.id = %s
+    UNION ALL
+    SELECT p.id, p.parent_id, a.depth + 1
+    FROM {table} p JOIN ancestors a ON p.id = a.parent_id
+    WHERE a.depth < %s
+)
+SELECT id FROM ancestors ORDER BY depth
+"""
+
+
+def get_subtree(
+    page_ids: Iterable[int], include_deleted: bool = False
+) -> List[Tuple[int, int]]:
+    """
+    Collect all descendants of the given pages in one query.
+
+    Without ``include_deleted`` the walk stops at soft-deleted pages, so
+    neither they nor anything below them is returned. Pages that are
+    descendants of more than one of the given pages are returned once.
+
+    Args:
+        page_ids: IDs of the pages whose descendants to collect
+        include_deleted: If True, include soft-deleted pages and walk through them
+
+    Returns:
+        (page_id, depth) pairs ordered parents-first, children having depth 1
+    """
+    page_ids = list(page_ids)
+    if not page_ids:
+        return []
+
+    sql = SUBTREE_SQL.format(
+        table=connection.ops.quote_name(WebPage._meta.db_table),
+        placeholders=", ".join(["%s"] * len(page_ids)),
+        deleted_filter="" if include_deleted else "AND NOT c.is_deleted",
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*page_ids, MAX_TREE_DEPTH])
+        return [(row[0], row[1]) for row in cursor.fetchall()]
+
+
+def get_descendant_ids(
+    page_ids: Iterable[int], include_deleted: bool = False
+) -> List[int]:
+    """
+    Get the IDs of all descendants of the given pages, parents first.
+
+    Args:
+        page_ids: IDs of the pages whose descendants to collect
+        include_deleted: If True, include soft-deleted pages and walk through them
+
+    Returns:
+        Descendant page IDs
+    """
+    return [page_id for page_id, _ in get_subtree(page_ids, include_deleted)]
+
+
+def get_ancestor_ids(page_id: int) -> List[int]:
+    """
+    Get the IDs of a page and all its ancestors in one query.
+
+    Args:
+        page_id: ID of the page to start from
+
+    Returns:
+        The page's ID followed by its ancestors' IDs, nearest first
+    """
+    sql = ANCESTORS_SQL.format(table=connection.ops.quote_name(WebPage._meta.db_table))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [page_id, MAX_TREE_DEPTH])
+        return [row[0] for row in cursor.fetchall()]
@@ -1,17 +1,37 @@
 """Page tree crawler service for discovering and crawling website hierarchies."""
 
+import json
 import logging
+import re
+import threading
 import time
-from typing import Dict, Any, List, Set
-from urllib.parse import urljoin, urlparse, urlunparse
 from collections import deque
-from bs4 import BeautifulSoup
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+from urllib.robotparser import RobotFileParser
+
 import requests
+from bs4 import BeautifulSoup
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from .page_metadata_extractor import PageMetadataExtractor
 
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_PER_HOST = 4
+ROBOTS_USER_AGENT = "EASY-CMS-Importer"
+RETRY_STATUS_CODES = [503, 502, 504, 429]
+# Query parameters that only track visitors and never change page content
+TRACKING_QUERY_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid|mc_cid|mc_eid)$", re.I)
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
 class CrawledPage:
     """Represents a crawled page in the tree."""
 
@@ -35,34 +55,142 @@ class CrawledPage:
         }
 
 
+class CrawlCheckpoint:
+    """
+    Append-only JSON lines record of a crawl, used to resume it.
+
+    The first line describes the crawl; every page is appended as soon as it
+    has been fetched, with its metadata and the child URLs it added to the
+    tree. Replaying the file rebuilds the tree and the pages still to fetch.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def crawl_dir() -> Path:
+        return Path(
+            getattr(
+                settings,
+                "PAGE_IMPORT_CRAWL_DIR",
+                Path(settings.BASE_DIR) / "build" / "crawls",
+            )
+        )
+
+    @classmethod
+    def for_crawl(cls, crawl_id: str) -> "CrawlCheckpoint":
+        """Get the checkpoint of a crawl by ID (e.g. the import task ID)."""
+        if not re.fullmatch(r"[\w-]+", crawl_id or ""):
+            raise ValueError(f"Invalid crawl ID: {crawl_id!r}")
+        return cls(cls.crawl_dir() / f"{crawl_id}.jsonl")
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Read all records, ignoring a partially written last line."""
+        records = []
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        break
+        except OSError:
+            return []
+        return records
+
+    def append(self, record: Dict[str, Any]):
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+
+    def delete(self):
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
 class PageTreeCrawler:
-    """Crawl a website and build a hierarchical page tree."""
+    """
+    Crawl a website and build a hierarchical page tree.
+
+    Pages are fetched and parsed by a thread pool while the tree itself is
+    built on the calling thread, breadth first. Each host gets a semaphore
+    bounding concurrent requests and a minimum delay between request starts
+    (the larger of request_delay and the robots.txt Crawl-delay), and URLs
+    disallowed by robots.txt are not fetched.
+    """
 
     def __init__(
-        self, max_depth: int = 5, max_pages: int = 100, request_delay: float = 2.0
+        self,
+        max_depth: int = 5,
+        max_pages: int = 100,
+        request_delay: float = 2.0,
+        max_per_host: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        respect_robots: bool = True,
     ):
         """
         Initialize crawler.
 
         Args:
             max_depth: Maximum depth to crawl
-            max_pages: Maximum number of pages to crawl
-            request_delay: Delay in seconds between requests (default 2.0)
+            max_pages: Maximum number of pages in the crawled tree
+            request_delay: Minimum delay in seconds between requests to a host
+                (default 2.0)
+            max_per_host: Maximum concurrent requests per host
+            max_workers: Maximum concurrent requests overall
+            checkpoint: Optional checkpoint to record progress to and resume from
+            respect_robots: Whether to obey robots.txt
         """
         self.max_depth = max_depth
         self.max_pages = max_pages
         self.request_delay = request_delay
+        self.max_per_host = max_per_host or getattr(
+            settings, "PAGE_IMPORT_CRAWL_MAX_PER_HOST", DEFAULT_MAX_PER_HOST
+        )
+        self.max_workers = max_workers or getattr(
+            settings, "PAGE_IMPORT_CRAWL_MAX_WORKERS", DEFAULT_MAX_WORKERS
+        )
+        self.checkpoint = checkpoint
+        self.respect_robots = respect_robots
+
         self.visited_urls: Set[str] = set()
         self.url_to_page: Dict[str, CrawledPage] = {}
+        self.metadata_extractor = PageMetadataExtractor()
 
-    def crawl(self, start_url: str) -> CrawledPage:
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers, pool_maxsize=self.max_per_host
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._lock = threading.Lock()
+        self._host_semaphores: Dict[str, threading.Semaphore] = {}
+        self._host_next_start: Dict[str, float] = {}
+        self._robots: Dict[str, Optional[RobotFileParser]] = {}
+
+    def crawl(
+        self, start_url: str, on_page: Optional[Callable[[CrawledPage], None]] = None
+    ) -> CrawledPage:
         """
         Crawl website starting from start_url.
 
-        Only crawls pages that are subpaths of start_url.
+        Only crawls pages that are subpaths of start_url. If the checkpoint
+        holds an earlier, unfinished crawl of the same URL, it is resumed:
+        recorded pages are not fetched again, failed ones are retried.
 
         Args:
             start_url: The starting URL to crawl from
+            on_page: Optional callback invoked with each page once it has been
+                fetched (or has failed), always after its parent page
 
         Returns:
             Root CrawledPage with children hierarchy
@@ -75,77 +203,204 @@ class PageTreeCrawler:
         logger.info(f"Starting crawl from {start_url}")
         logger.info(f"Will only crawl subpaths of: {start_path}")
 
-        # Create root page
-        root_page = CrawledPage(start_url, None, 0)
-        self.url_to_page[start_url] = root_page
-
-        # Queue for breadth-first crawling
-        queue = deque([root_page])
-        self.visited_urls.add(start_url)
-
-        pages_crawled = 0
-
-        while queue and pages_crawled < self.max_pages:
-            current_page = queue.popleft()
-
-            # Skip if max depth reached
-            if current_page.depth >= self.max_depth:
-                logger.debug(f"Max depth reached for {current_page.url}")
-                continue
+        root_page, frontier = self._restore(start_url, on_page)
 
-            # Fetch and parse the page
-            try:
-                html = self._fetch_page(current_page.url)
-                links = self._extract_links(html, current_page.url)
-
-                # Process each link
-                for link_url in links:
-                    # Normalize the link
-                    link_url = self._normalize_url(link_url)
-
-                    # Skip if already visited
-                    if link_url in self.visited_urls:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
+            while frontier or pending:
+                while frontier and len(pending) < self.max_workers:
+                    page = frontier.popleft()
+                    if not self._is_allowed(page.url):
+                        logger.info(f"Skipping {page.url}: disallowed by robots.txt")
+                        self._complete(page, None, [], "Disallowed by robots.txt", on_page)
                         continue
-
-                    # Check if link is on same domain
-                    if self._get_domain(link_url) != start_domain:
-                        logger.debug(f"Skipping external link: {link_url}")
+                    pending[executor.submit(self._fetch_and_parse, page.url)] = page
+
+                if not pending:
+                    continue
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page = pending.pop(future)
+                    try:
+                        metadata, links = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to crawl {page.url}: {e}")
+                        self._complete(page, None, [], str(e), on_page)
                         continue
 
-                    # Check if link is subpath of start URL
-                    link_path = self._get_url_path(link_url)
-                    if not self._is_subpath(link_path, start_path):
-                        logger.debug(
-                            f"Skipping non-subpath: {link_path} not under {start_path}"
+                    children = []
+                    if page.depth < self.max_depth:
+                        children = self._add_children(
+                            page, links, start_domain, start_path
                         )
-                        continue
+                        frontier.extend(children)
+                    self._complete(page, metadata, children, None, on_page)
 
-                    # Check page limit
-                    if pages_crawled >= self.max_pages:
-                        logger.warning(f"Reached max pages limit ({self.max_pages})")
-                        break
+        logger.info(f"Crawl complete. Crawled {len(self.url_to_page)} pages")
+        return root_page
 
-                    # Create child page
-                    child_page = CrawledPage(
-                        link_url, current_page.url, current_page.depth + 1
-                    )
-                    current_page.children.append(child_page)
-                    self.url_to_page[link_url] = child_page
+    def _restore(
+        self, start_url: str, on_page: Optional[Callable[[CrawledPage], None]]
+    ) -> Tuple[CrawledPage, deque]:
+        """Create the root page, replaying the checkpoint if there is one."""
+        root_page = CrawledPage(start_url, None, 0)
+        self.url_to_page[start_url] = root_page
+        self.visited_urls.add(start_url)
 
-                    # Mark as visited and add to queue
-                    self.visited_urls.add(link_url)
-                    queue.append(child_page)
+        records = self.checkpoint.load() if self.checkpoint else []
+        if records and records[0].get("start_url") != start_url:
+            raise ValueError(
+                f"Checkpoint belongs to a crawl of {records[0].get('start_url')}"
+            )
+        if not records and self.checkpoint:
+            self.checkpoint.append({"start_url": start_url})
+
+        fetched = set()
+        for record in records[1:]:
+            page = self.url_to_page.get(record["url"])
+            if page is None:
+                continue
+            page.error = record.get("error")
+            if page.error:
+                # Failed pages are retried on resume
+                continue
+            page.metadata = record.get("metadata") or {}
+            fetched.add(page.url)
+            for child_url in record.get("children", []):
+                if child_url not in self.url_to_page:
+                    self._add_page(child_url, page)
+            if on_page:
+                on_page(page)
+
+        if fetched:
+            logger.info(f"Resumed crawl of {start_url} with {len(fetched)} pages done")
+
+        frontier = deque(
+            page for url, page in self.url_to_page.items() if url not in fetched
+        )
+        return root_page, frontier
+
+    def _add_page(self, url: str, parent: CrawledPage) -> CrawledPage:
+        page = CrawledPage(url, parent.url, parent.depth + 1)
+        parent.children.append(page)
+        self.url_to_page[url] = page
+        self.visited_urls.add(url)
+        return page
+
+    def _add_children(
+        self, page: CrawledPage, links: List[str], start_domain: str, start_path: str
+    ) -> List[CrawledPage]:
+        """Add the not yet seen, in-scope links of a page as its children."""
+        children = []
+        for link_url in links:
+            # Normalize the link
+            link_url = self._normalize_url(link_url)
+
+            # Skip if already seen
+            if link_url in self.visited_urls:
+                continue
 
-                    logger.debug(f"Queued page: {link_url} (depth {child_page.depth})")
+            # Check if link is on same domain
+            if self._get_domain(link_url) != start_domain:
+                logger.debug(f"Skipping external link: {link_url}")
+                continue
 
-                pages_crawled += 1
+            # Check if link is subpath of start URL
+            link_path = self._get_url_path(link_url)
+            if not self._is_subpath(link_path, start_path):
+                logger.debug(f"Skipping non-subpath: {link_path} not under {start_path}")
+                continue
 
-            except Exception as e:
-                logger.error(f"Failed to crawl {current_page.url}: {e}")
-                current_page.error = str(e)
+            # Check page limit
+            if len(self.url_to_page) >= self.max_pages:
+                logger.warning(f"Reached max pages limit ({self.max_pages})")
+                break
+
+            children.append(self._add_page(link_url, page))
+            logger.debug(f"Queued page: {link_url} (depth {page.depth + 1})")
+        return children
+
+    def _complete(
+        self,
+        page: CrawledPage,
+        metadata: Optional[Dict[str, Any]],
+        children: List[CrawledPage],
+        error: Optional[str],
+        on_page: Optional[Callable[[CrawledPage], None]],
+    ):
+        """Record a fetched (or failed) page and hand it to the callback."""
+        page.metadata = metadata or {}
+        page.error = error
+        if self.checkpoint:
+            self.checkpoint.append(
+                {
+                    "url": page.url,
+                    "metadata": page.metadata,
+                    "error": error,
+                    "children": [child.url for child in children],
+                }
+            )
+        if on_page:
+            on_page(page)
+
+    def _fetch_and_parse(self, url: str) -> Tuple[Dict[str, Any], List[str]]:
+        """Fetch a page and parse its metadata and links in one pass."""
+        html = self._fetch_page(url)
+        soup = BeautifulSoup(html, "html.parser")
+        links = self._extract_links(soup, url)
+        return self.metadata_extractor.extract_from_soup(soup, url), links
+
+    def _host_slot(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.max_per_host)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+
+    def _wait_for_host(self, host: str, delay: float):
+        """Reserve the next start time for a host and sleep until it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_start.get(host, now))
+            self._host_next_start[host] = start + delay
+        if start > now:
+            time.sleep(start - now)
+
+    def _get_robots(self, url: str) -> Optional[RobotFileParser]:
+        """Fetch and cache robots.txt for the URL's host (None allows all)."""
+        domain = self._get_domain(url)
+        with self._lock:
+            if domain in self._robots:
+                return self._robots[domain]
+
+        robots = None
+        try:
+            response = self.session.get(f"{domain}/robots.txt", timeout=10)
+            if response.status_code in (401, 403):
+                robots = RobotFileParser()
+                robots.disallow_all = True
+            elif response.status_code == 200:
+                robots = RobotFileParser()
+                robots.parse(response.text.splitlines())
+        except requests.RequestException as e:
+            logger.debug(f"Could not fetch robots.txt for {domain}: {e}")
+
+        with self._lock:
+            self._robots[domain] = robots
+        return robots
+
+    def _is_allowed(self, url: str) -> bool:
+        if not self.respect_robots:
+            return True
+        robots = self._get_robots(url)
+        return robots is None or robots.can_fetch(ROBOTS_USER_AGENT, url)
 
-        logger.info(f"Crawl complete. Visited {pages_crawled} pages")
-        return root_page
+    def _host_delay(self, url: str) -> float:
+        robots = self._get_robots(url) if self.respect_robots else None
+        crawl_delay = robots.crawl_delay(ROBOTS_USER_AGENT) if robots else None
+        return max(self.request_delay, float(crawl_delay or 0))
 
     def _fetch_page(self, url: str) -> str:
         """
@@ -160,9 +415,6 @@ class PageTreeCrawler:
         Raises:
             Exception: If fetch fails after all retries
         """
-        # Add delay before request to avoid overwhelming server
-        time.sleep(self.request_delay)
-
         # Better headers to appear more like a real browser
         headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -172,30 +424,32 @@ class PageTreeCrawler:
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
         }
+        host = urlparse(url).netloc
+        delay = self._host_delay(url)
 
         # Retry logic for server errors
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                response = requests.get(
-                    url,
-                    timeout=30,
-                    headers=headers,
-                )
+                with self._host_slot(host):
+                    # Space out request starts to avoid overwhelming the server
+                    self._wait_for_host(host, delay)
+                    response = self.session.get(url, timeout=30, headers=headers)
                 response.raise_for_status()
                 return response.text
 
             except requests.HTTPError as e:
                 # Check if it's a server error that we should retry
-                if e.response is not None and e.response.status_code in [
-                    503,
-                    502,
-                    504,
-                    429,
-                ]:
+                if (
+                    e.response is not None
+                    and e.response.status_code in RETRY_STATUS_CODES
+                ):
                     if attempt < max_retries - 1:
-                        # Exponential backoff
-                        wait_time = self.request_delay * (2**attempt)
+                        # Exponential backoff, or the server's Retry-After
+                        wait_time = delay * (2**attempt)
+                        retry_after = e.response.headers.get("Retry-After", "")
+                        if retry_after.isdigit():
+                            wait_time = max(wait_time, int(retry_after))
                         logger.warning(
                             f"HTTP {e.response.status_code} for {url}, "
                             f"retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
@@ -216,18 +470,17 @@ class PageTreeCrawler:
                 logger.error(f"Failed to fetch {url}: {e}")
                 raise
 
-    def _extract_links(self, html: str, base_url: str) -> List[str]:
+    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """
-        Extract all links from HTML.
+        Extract all links from a parsed page.
 
         Args:
-            html: HTML content
+            soup: BeautifulSoup object of the page
             base_url: Base URL for resolving relative links
 
         Returns:
             List of absolute URLs
         """
-        soup = BeautifulSoup(html, "html.parser")
         links = []
 
         for a_tag in soup.find_all("a", href=True):
@@ -250,7 +503,10 @@ class PageTreeCrawler:
 
     def _normalize_url(self, url: str) -> str:
         """
-        Normalize URL by removing fragments and trailing slashes.
+        Normalize URL so that equivalent URLs are only crawled once.
+
+        Lower-cases the scheme and host, drops default ports, fragments and
+        tracking parameters, sorts the query and removes trailing slashes.
 
         Args:
             url: URL to normalize
@@ -258,16 +514,27 @@ class PageTreeCrawler:
         Returns:
             Normalized URL
         """
-        parsed = urlparse(url)
-        # Remove fragment
-        normalized = urlunparse(
-            (parsed.scheme, parsed.netloc, parsed.path, parsed.params, parsed.query, "")
+        parsed = urlparse(url.strip())
+        scheme = parsed.scheme.lower()
+        netloc = parsed.netloc.lower()
+        host, _, port = netloc.rpartition(":")
+        if host and DEFAULT_PORTS.get(scheme) == port:
+            netloc = host
+
+        query = urlencode(
+            sorted(
+                (key, value)
+                for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+                if not TRACKING_QUERY_PARAMS.match(key)
+            )
         )
         # Remove trailing slash (except for root)
-        if normalized.endswith("/") and parsed.path != "/":
-            normalized = normalized[:-1]
+        path = parsed.path
+        if path.endswith("/") and path != "/":
+            path = path[:-1]
 
-        return normalized
+        # Remove fragment
+        return urlunparse((scheme, netloc, path, parsed.params, query, ""))
 
     def _get_domain(self, url: str) -> str:
         """
@@ -1,6 +1,8 @@
 """Page tree importer service for creating WebPage objects from crawled trees."""
 
 import logging
+import queue
+import threading
 from typing import Dict, Any, List, Optional
 from django.db import transaction
 from django.contrib.auth.models import User
@@ -9,8 +11,7 @@ from django.core.cache import cache
 
 from ..models import WebPage, PageVersion
 from content.models import Namespace, Tag
-from .page_metadata_extractor import PageMetadataExtractor
-from .page_tree_crawler import CrawledPage, PageTreeCrawler
+from .page_tree_crawler import CrawlCheckpoint, CrawledPage, PageTreeCrawler
 
 
 logger = logging.getLogger(__name__)
@@ -65,7 +66,6 @@ class PageTreeImporter:
         self.user = user
         self.namespace = namespace
         self.task_id = task_id
-        self.metadata_extractor = PageMetadataExtractor()
         self.progress = ImportProgress()
         self.url_to_webpage: Dict[str, WebPage] = {}
 
@@ -77,10 +77,15 @@ class PageTreeImporter:
         max_depth: int = 5,
         max_pages: int = 100,
         request_delay: float = 2.0,
+        crawl_id: Optional[str] = None,
     ) -> ImportProgress:
         """
         Import page tree from external website.
 
+        The crawler runs in a background thread and hands over each page as
+        soon as it has been fetched, so subtrees are imported while the rest
+        of the site is still being crawled.
+
         Args:
             start_url: Starting URL to crawl
             parent_page: Optional parent page (for subpage import)
@@ -88,6 +93,8 @@ class PageTreeImporter:
             max_depth: Maximum crawl depth
             max_pages: Maximum pages to crawl
             request_delay: Delay between requests in seconds
+            crawl_id: Optional ID to checkpoint the crawl under; importing
+                again with the ID of a failed import resumes its crawl
 
         Returns:
             ImportProgress object with results
@@ -95,25 +102,64 @@ class PageTreeImporter:
         try:
             self.progress.status = "running"
 
-            # Step 1: Crawl the website
-            logger.info(f"Crawling {start_url}...")
+            checkpoint = CrawlCheckpoint.for_crawl(crawl_id) if crawl_id else None
             crawler = PageTreeCrawler(
-                max_depth=max_depth, max_pages=max_pages, request_delay=request_delay
+                max_depth=max_depth,
+                max_pages=max_pages,
+                request_delay=request_delay,
+                checkpoint=checkpoint,
             )
-            root_page = crawler.crawl(start_url)
-
-            # Count discovered pages
-            self.progress.pages_discovered = self._count_pages(root_page)
-            logger.info(f"Discovered {self.progress.pages_discovered} pages")
 
-            # Step 2: Build queue of URLs to import
-            self._build_url_queue(root_page)
-            self._update_cache()  # Update cache with initial queue
+            # Step 1: Crawl the website in the background
+            logger.info(f"Crawling {start_url}...")
+            crawled_pages = queue.Queue()
+            crawl_errors = []
+
+            def run_crawl():
+                try:
+                    crawler.crawl(start_url, on_page=crawled_pages.put)
+                except Exception as e:
+                    crawl_errors.append(e)
+                finally:
+                    crawled_pages.put(None)
+
+            crawl_thread = threading.Thread(
+                target=run_crawl, name="page-tree-crawl", daemon=True
+            )
+            crawl_thread.start()
 
-            # Step 3: Import pages
+            # Step 2: Import pages as they are crawled (parents arrive first)
             logger.info("Importing pages...")
-            with transaction.atomic():
-                self._import_page_recursive(root_page, parent_page, hostname)
+            while True:
+                crawled_page = crawled_pages.get()
+                if crawled_page is None:
+                    break
+
+                self.progress.pages_discovered = len(crawler.url_to_page)
+                self.progress.urls_in_queue.extend(
+                    child.url for child in crawled_page.children
+                )
+
+                if crawled_page.parent_url is None:
+                    self._import_page(crawled_page, parent_page, hostname)
+                elif crawled_page.parent_url in self.url_to_webpage:
+                    self._import_page(
+                        crawled_page, self.url_to_webpage[crawled_page.parent_url]
+                    )
+                else:
+                    self._record_failure(crawled_page, "Parent page was not imported")
+
+                # Update cache to show progress
+                self._update_cache()
+
+            crawl_thread.join()
+            if crawl_errors:
+                raise crawl_errors[0]
+
+            self.progress.pages_discovered = len(crawler.url_to_page)
+            logger.info(f"Discovered {self.progress.pages_discovered} pages")
+            if checkpoint:
+                checkpoint.delete()
 
             self.progress.status = "completed"
             logger.info(
@@ -126,6 +172,7 @@ class PageTreeImporter:
             self.progress.status = "failed"
             self.progress.errors.append(f"Import failed: {str(e)}")
 
+        self._update_cache()
         return self.progress
 
     def _update_cache(self):
@@ -133,32 +180,20 @@ class PageTreeImporter:
         if self.task_id:
             cache.set(f"import_progress_{self.task_id}", self.progress.to_dict(), 3600)
 
-    def _build_url_queue(self, page: CrawledPage):
-        """
-        Build list of URLs to be imported.
-
-        Args:
-            page: Root CrawledPage
-        """
-        self.progress.urls_in_queue.append(page.url)
-        for child in page.children:
-            self._build_url_queue(child)
-
-    def _import_page_recursive(
+    def _import_page(
         self,
         crawled_page: CrawledPage,
         parent_page: Optional[WebPage],
         hostname: Optional[str] = None,
-        html: Optional[str] = None,
     ):
         """
-        Recursively import pages.
+        Import a single crawled page.
 
         Args:
-            crawled_page: CrawledPage to import
+            crawled_page: CrawledPage to import, with the metadata the
+                crawler extracted
             parent_page: Parent WebPage (None for root)
             hostname: Hostname for root page
-            html: Optional cached HTML content
         """
         self.progress.current_url = crawled_page.url
 
@@ -166,118 +201,13 @@ class PageTreeImporter:
         if crawled_page.url in self.progress.urls_in_queue:
             self.progress.urls_in_queue.remove(crawled_page.url)
 
-        try:
-            # Fetch page if not provided
-            if html is None:
-                import requests
-
-                response = requests.get(
-                    crawled_page.url,
-                    timeout=30,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                    },
-                )
-                response.raise_for_status()
-                html = response.text
-
-            # Extract metadata
-            metadata = self.metadata_extractor.extract(html, crawled_page.url)
-            slug = metadata["slug"]
-
-            # Check if slug already exists under same parent
-            existing_page = None
-            if parent_page:
-                existing_page = WebPage.objects.filter(
-                    parent=parent_page, slug=slug, is_deleted=False
-                ).first()
-            else:
-                # Root page
-                existing_page = WebPage.objects.filter(
-                    parent__isnull=True, slug=slug, is_deleted=False
-                ).first()
-
-            if existing_page:
-                # Build full hierarchical path (ignoring silent slugs)
-                path_parts = [existing_page.slug]
-                current = existing_page.parent
-                while current:
-                    path_parts.insert(0, current.slug)
-                    current = current.parent
-                full_path = "/" + "/".join(path_parts) + "/"
-
-                logger.warning(
-                    f"Page already exists at {full_path}, skipping: {crawled_page.url}"
-                )
-                self.progress.pages_skipped += 1
-                # Use existing page as parent for children
-                webpage = existing_page
-            else:
-                # Create new page instance (don't save yet)
-                webpage = WebPage(
-                    parent=parent_page,
-                    slug=slug,
-                    title=metadata["title"],
-                    description=metadata["description"],
-                    created_by=self.user,
-                    last_modified_by=self.user,
-                )
-
-                # Ensure unique slug and track if modified
-                slug_info = webpage.ensure_unique_slug()
-
-                # Set hostname for root pages
-                if not parent_page and hostname:
-                    webpage.hostnames = [hostname]
-
-                # Save the page
-                webpage.save()
-
-                # Track slug warning if modified
-                if slug_info["modified"]:
-                    self.progress.slug_warnings.append(
-                        {
-                            "url": crawled_page.url,
-                            "original_slug": slug_info["original_slug"],
-                            "new_slug": slug_info["new_slug"],
-                            "message": f"Slug '{slug_info['original_slug']}' was modified to '{slug_info['new_slug']}' to ensure uniqueness",
-                        }
-                    )
-                    logger.info(
-                        f"Slug auto-renamed: '{slug_info['original_slug']}' -> '{slug_info['new_slug']}' "
-                        f"for {crawled_page.url}"
-                    )
-
-                # Create initial PageVersion with metadata (version 1 for new page)
-                page_version = PageVersion.objects.create(
-                    page=webpage,
-                    version_number=1,
-                    version_title=f"Imported from {crawled_page.url}",
-                    page_data={
-                        "metaTitle": metadata["title"],
-                        "metaDescription": metadata["description"],
-                    },
-                    widgets={},
-                    code_layout="",
-                    effective_date=timezone.now(),
-                    created_by=self.user,
-                    tags=metadata["tags"],  # tags is an ArrayField of strings
-                )
+        if crawled_page.error:
+            self._record_failure(crawled_page, crawled_page.error)
+            return
 
-                # Create tags in namespace if they don't exist
-                if metadata["tags"]:
-                    for tag_name in metadata["tags"]:
-                        Tag.objects.get_or_create(
-                            name=tag_name,
-                            namespace=self.namespace,
-                            defaults={
-                                "slug": tag_name.lower().replace(" ", "-"),
-                                "created_by": self.user,
-                            },
-                        )
-
-                self.progress.pages_created += 1
-                logger.info(f"Created page: {webpage.slug} (from {crawled_page.url})")
+        try:
+            with transaction.atomic():
+                webpage = self._create_page(crawled_page, parent_page, hostname)
 
             # Store mapping
             self.url_to_webpage[crawled_page.url] = webpage
@@ -286,38 +216,136 @@ class PageTreeImporter:
             if crawled_page.url not in self.progress.urls_completed:
                 self.progress.urls_completed.append(crawled_page.url)
 
-            # Update cache to show progress
-            self._update_cache()
+        except Exception as e:
+            self._record_failure(crawled_page, str(e))
 
-            # Import children
-            for child in crawled_page.children:
-                self._import_page_recursive(child, webpage)
+    def _record_failure(self, crawled_page: CrawledPage, error_msg: str):
+        """Record a page that could not be crawled or imported."""
+        if crawled_page.url in self.progress.urls_in_queue:
+            self.progress.urls_in_queue.remove(crawled_page.url)
 
-        except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Failed to import {crawled_page.url}: {error_msg}")
+        logger.error(f"Failed to import {crawled_page.url}: {error_msg}")
 
-            # Add to failed URLs
-            self.progress.urls_failed.append(
-                {"url": crawled_page.url, "error": error_msg}
-            )
+        # Add to failed URLs
+        self.progress.urls_failed.append({"url": crawled_page.url, "error": error_msg})
 
-            self.progress.errors.append(
-                f"Failed to import {crawled_page.url}: {error_msg}"
-            )
-            self.progress.pages_skipped += 1
+        self.progress.errors.append(f"Failed to import {crawled_page.url}: {error_msg}")
+        self.progress.pages_skipped += 1
 
-    def _count_pages(self, page: CrawledPage) -> int:
+    def _create_page(
+        self,
+        crawled_page: CrawledPage,
+        parent_page: Optional[WebPage],
+        hostname: Optional[str] = None,
+    ) -> WebPage:
         """
-        Count total pages in tree.
+        Create the WebPage for a crawled page, or reuse an existing one.
 
         Args:
-            page: Root page
+            crawled_page: CrawledPage to import
+            parent_page: Parent WebPage (None for root)
+            hostname: Hostname for root page
 
         Returns:
-            Total page count
+            The created or existing WebPage
         """
-        count = 1
-        for child in page.children:
-            count += self._count_pages(child)
-        return count
+        # Metadata was extracted by the crawler
+        metadata = crawled_page.metadata
+        slug = metadata["slug"]
+
+        # Check if slug already exists under same parent
+        existing_page = None
+        if parent_page:
+            existing_page = WebPage.objects.filter(
+                parent=parent_page, slug=slug, is_deleted=False
+            ).first()
+        else:
+            # Root page
+            existing_page = WebPage.objects.filter(
+                parent__isnull=True, slug=slug, is_deleted=False
+            ).first()
+
+        if existing_page:
+            # Build full hierarchical path (ignoring silent slugs)
+            path_parts = [existing_page.slug]
+            current = existing_page.parent
+            while current:
+                path_parts.insert(0, current.slug)
+                current = current.parent
+            full_path = "/" + "/".join(path_parts) + "/"
+
+            logger.warning(
+                f"Page already exists at {full_path}, skipping: {crawled_page.url}"
+            )
+            self.progress.pages_skipped += 1
+            # Use existing page as parent for children
+            webpage = existing_page
+        else:
+            # Create new page instance (don't save yet)
+            webpage = WebPage(
+                parent=parent_page,
+                slug=slug,
+                title=metadata["title"],
+                description=metadata["description"],
+                tenant=parent_page.tenant if parent_page else self.namespace.tenant,
+                created_by=self.user,
+                last_modified_by=self.user,
+            )
+
+            # Ensure unique slug and track if modified
+            slug_info = webpage.ensure_unique_slug()
+
+            # Set hostname for root pages
+            if not parent_page and hostname:
+                webpage.hostnames = [hostname]
+
+            # Save the page
+            webpage.save()
+
+            # Track slug warning if modified
+            if slug_info["modified"]:
+                self.progress.slug_warnings.append(
+                    {
+                        "url": crawled_page.url,
+                        "original_slug": slug_info["original_slug"],
+                        "new_slug": slug_info["new_slug"],
+                        "message": f"Slug '{slug_info['original_slug']}' was modified to '{slug_info['new_slug']}' to ensure uniqueness",
+                    }
+                )
+                logger.info(
+                    f"Slug auto-renamed: '{slug_info['original_slug']}' -> '{slug_info['new_slug']}' "
+                    f"for {crawled_page.url}"
+                )
+
+            # Create initial PageVersion with metadata (version 1 for new page)
+            PageVersion.objects.create(
+                page=webpage,
+                version_number=1,
+                version_title=f"Imported from {crawled_page.url}",
+                page_data={
+                    "metaTitle": metadata["title"],
+                    "metaDescription": metadata["description"],
+                },
+                widgets={},
+                code_layout="",
+                effective_date=timezone.now(),
+                created_by=self.user,
+                tags=metadata["tags"],  # tags is an ArrayField of strings
+            )
+
+            # Create tags in namespace if they don't exist
+            if metadata["tags"]:
+                for tag_name in metadata["tags"]:
+                    Tag.objects.get_or_create(
+                        name=tag_name,
+                        namespace=self.namespace,
+                        defaults={
+                            "slug": tag_name.lower().replace(" ", "-"),
+                            "created_by": self.user,
+                        },
+                    )
+
+            self.progress.pages_created += 1
+            logger.info(f"Created page: {webpage.slug} (from {crawled_page.url})")
+
+        return webpage
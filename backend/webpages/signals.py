@@ -4,10 +4,57 @@ Widget Inheritance Cache Invalidation Signals
 Automatically invalidates inheritance tree caches when pages or widgets change.
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 from .models import WebPage, PageVersion
 from .inheritance_cache import InheritanceTreeCache
+from .services.page_paths import cascade_cached_paths
+
+# Page IDs whose version side effects are deferred by deferred_version_updates()
+_deferred_page_ids = ContextVar("deferred_version_page_ids", default=None)
+
+
+@contextmanager
+def deferred_version_updates():
+    """
+    Defer PageVersion save/delete side effects and apply them set-wise.
+
+    Inside the block, version signals only record the affected page. On
+    normal exit the publication caches of all recorded pages are recomputed
+    with one UPDATE and the inheritance cache is invalidated once per
+    affected subtree. Nested blocks join the outermost one.
+
+    Yields:
+        set: The page IDs recorded so far; callers using queryset updates
+        (which send no signals) add their page IDs to it directly
+    """
+    pending = _deferred_page_ids.get()
+    if pending is not None:
+        yield pending
+        return
+
+    pending = set()
+    token = _deferred_page_ids.set(pending)
+    try:
+        yield pending
+    finally:
+        _deferred_page_ids.reset(token)
+
+    if pending:
+        refresh_publication_caches(pending)
+        invalidate_page_trees(pending)
+
+
+def _defer(page_id):
+    """Record page_id for a surrounding deferred block; False if none is active."""
+    pending = _deferred_page_ids.get()
+    if pending is None:
+        return False
+    pending.add(page_id)
+    return True
 
 
 @receiver(post_save, sender=WebPage)
@@ -31,19 +78,23 @@ def invalidate_page_tree_on_save(sender, instance, created, **kwargs):
             if new_parent_id:
                 InheritanceTreeCache.invalidate_hierarchy(new_parent_id)
 
-    # Update children cached_path if this page's path changed
-    if hasattr(instance, "_skip_children_path_update"):
+    # Rewrite descendants' cached path and root fields in one statement
+    if created or hasattr(instance, "_skip_children_path_update"):
         return
 
     old_path = getattr(instance, "_old_cached_path", None)
-    if old_path and old_path != instance.cached_path:
-        # Path changed - update all children recursively
-        for child in instance.children.all():
-            child._skip_children_path_update = True
-            child.save(
-                update_fields=["cached_path", "cached_root_id", "cached_root_hostnames"]
-            )
-            delattr(child, "_skip_children_path_update")
+    path_changed = old_path is not None and old_path != instance.cached_path
+    parent_changed = (
+        hasattr(instance, "_old_parent_id")
+        and instance._old_parent_id != instance.parent_id
+    )
+    root_hostnames_changed = (
+        instance.parent_id is None
+        and getattr(instance, "_old_hostnames", None) is not None
+        and instance._old_hostnames != instance.hostnames
+    )
+    if path_changed or parent_changed or root_hostnames_changed:
+        cascade_cached_paths(instance.id)
 
 
 @receiver(pre_save, sender=WebPage)
@@ -52,12 +103,16 @@ def track_parent_changes(sender, instance, **kwargs):
     # Track old parent for cache invalidation
     if instance.pk:
         try:
-            old_instance = WebPage.objects.get(pk=instance.pk)
+            old_instance = WebPage.objects.only(
+                "parent_id", "cached_path", "hostnames"
+            ).get(pk=instance.pk)
             instance._old_parent_id = old_instance.parent_id
             instance._old_cached_path = old_instance.cached_path
+            instance._old_hostnames = old_instance.hostnames
         except WebPage.DoesNotExist:
             instance._old_parent_id = None
             instance._old_cached_path = None
+            instance._old_hostnames = None
 
     # Calculate and update cached_path
     if instance.parent:
@@ -102,6 +157,8 @@ def track_parent_changes(sender, instance, **kwargs):
 @receiver(post_save, sender=PageVersion)
 def invalidate_version_tree_on_save(sender, instance, created, **kwargs):
     """Invalidate inheritance tree cache when page version is saved"""
+    if _defer(instance.page_id):
+        return
 
     # Invalidate page and all descendants (they inherit from this page)
     invalidated = InheritanceTreeCache.invalidate_page(instance.page_id)
@@ -121,6 +178,8 @@ def invalidate_tree_on_page_delete(sender, instance, **kwargs):
 @receiver(post_delete, sender=PageVersion)
 def invalidate_tree_on_version_delete(sender, instance, **kwargs):
     """Invalidate inheritance tree cache when page version is deleted"""
+    if _defer(instance.page_id):
+        return
 
     # Invalidate page and descendants
     invalidated = InheritanceTreeCache.invalidate_page(instance.page_id)
@@ -179,6 +238,61 @@ def update_page_publication_cache(page):
     )
 
 
+def refresh_publication_caches(page_ids):
+    """
+    Recompute cached publication fields for many pages with one UPDATE.
+
+    Set-based counterpart of update_page_publication_cache. No WebPage
+    signals are sent.
+
+    Args:
+        page_ids: IDs of the pages to refresh
+
+    Returns:
+        Number of pages updated
+    """
+    from django.utils import timezone
+    from django.db.models import Exists, OuterRef, Q, Subquery
+
+    now = timezone.now()
+    published = (
+        PageVersion.objects.filter(page_id=OuterRef("pk"), effective_date__lte=now)
+        .filter(Q(expiry_date__isnull=True) | Q(expiry_date__gt=now))
+        .order_by("-version_number")
+    )
+    latest = PageVersion.objects.filter(page_id=OuterRef("pk")).order_by(
+        "-version_number"
+    )
+
+    return WebPage.objects.filter(id__in=list(page_ids)).update(
+        is_currently_published=Exists(published),
+        current_published_version=Subquery(published.values("id")[:1]),
+        latest_version=Subquery(latest.values("id")[:1]),
+        cached_effective_date=Subquery(published.values("effective_date")[:1]),
+        cached_expiry_date=Subquery(published.values("expiry_date")[:1]),
+        cache_updated_at=now,
+    )
+
+
+def invalidate_page_trees(page_ids):
+    """
+    Invalidate inheritance trees for a set of pages with as few writes as possible.
+
+    A page whose parent is also in the set is covered by the parent's
+    invalidation, so only the topmost pages of each group are bumped.
+
+    Args:
+        page_ids: IDs of the changed pages
+
+    Returns:
+        Number of cache keys written
+    """
+    page_ids = set(page_ids)
+    parents = WebPage.objects.filter(id__in=page_ids).values_list("id", "parent_id")
+    roots = [page_id for page_id, parent_id in parents if parent_id not in page_ids]
+    return sum(InheritanceTreeCache.invalidate_page(page_id) for page_id in roots)
+
+
 # Utility functions for manual cache management
 
 
@@ -0,0 +1,85 @@
+"""
+Tests for deferred, set-based publishing side effects
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import Tenant
+from webpages.inheritance_cache import InheritanceTreeCache
+from webpages.models import PageVersion, WebPage
+from webpages.publishing import PublishingService
+from webpages.signals import deferred_version_updates
+
+
+class BatchPublishingTest(TestCase):
+    """Test that bulk publishing applies caches and invalidation once"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="batch_user", password="testpass")
+        self.tenant = Tenant.objects.create(
+            name="Batch Tenant", identifier="batch-tenant", created_by=self.user
+        )
+        self.home = self._page("home", hostnames=["batch.example.com"])
+        self.section = self._page("section", parent=self.home)
+        self.articles = [self._page(f"article-{i}", parent=self.section) for i in range(10)]
+        for page in [self.section, *self.articles]:
+            PageVersion.objects.create(
+                page=page, version_number=1, widgets={}, created_by=self.user
+            )
+
+    def _page(self, slug, parent=None, hostnames=None):
+        return WebPage.objects.create(
+            title=slug.title(),
+            slug=slug,
+            parent=parent,
+            hostnames=hostnames or [],
+            tenant=self.tenant,
+            created_by=self.user,
+            last_modified_by=self.user,
+        )
+
+    def _generation(self, page_id):
+        return cache.get(InheritanceTreeCache.get_generation_key(page_id))
+
+    def test_publish_subtree_uses_constant_queries(self):
+        """Test that publishing a subtree does not scale queries with its size"""
+        service = PublishingService(self.user)
+
+        with self.assertNumQueries(7):
+            count, errors = service.publish_page_with_subpages(self.section.id)
+
+        self.assertEqual((count, errors), (11, []))
+        article = WebPage.objects.get(pk=self.articles[7].pk)
+        self.assertTrue(article.is_currently_published)
+        self.assertEqual(
+            article.current_published_version_id,
+            article.versions.get(version_number=1).id,
+        )
+
+    def test_invalidation_is_coalesced_to_subtree_root(self):
+        """Test that only the topmost published page's generation is bumped"""
+        section_generation = self._generation(self.section.id)
+        article_generation = self._generation(self.articles[0].id)
+
+        PublishingService(self.user).publish_page_with_subpages(self.section.id)
+
+        self.assertNotEqual(self._generation(self.section.id), section_generation)
+        self.assertEqual(self._generation(self.articles[0].id), article_generation)
+
+    def test_version_signals_are_deferred_until_exit(self):
+        """Test that version saves inside the block update caches on exit"""
+        version = self.articles[0].versions.get()
+        with deferred_version_updates():
+            version.effective_date = timezone.now() - timedelta(minutes=1)
+            version.save()
+            self.assertFalse(
+                WebPage.objects.get(pk=self.articles[0].pk).is_currently_published
+            )
+
+        self.assertTrue(WebPage.objects.get(pk=self.articles[0].pk).is_currently_published)
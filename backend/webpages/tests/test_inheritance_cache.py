@@ -0,0 +1,101 @@
+"""
+Tests for generation-based inheritance tree caching
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import Tenant
+from webpages.inheritance_cache import InheritanceTreeCache
+from webpages.inheritance_tree import InheritanceTreeBuilder
+from webpages.models import PageVersion, WebPage
+
+
+class InheritanceTreeCacheTest(TestCase):
+    """Test cache reads, O(1) invalidation and publish-date expiry"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="cache_tree_user", password="testpass")
+        tenant = Tenant.objects.create(
+            name="Cache Tenant", identifier="cache-tree", created_by=self.user
+        )
+        self.home = WebPage.objects.create(
+            title="Home", slug="home", hostnames=["cache.example.com"], tenant=tenant,
+            created_by=self.user, last_modified_by=self.user,
+        )
+        self.about = WebPage.objects.create(
+            title="About", slug="about", parent=self.home, tenant=tenant,
+            created_by=self.user, last_modified_by=self.user,
+        )
+        self.team = WebPage.objects.create(
+            title="Team", slug="team", parent=self.about, tenant=tenant,
+            created_by=self.user, last_modified_by=self.user,
+        )
+        for page in (self.home, self.about, self.team):
+            PageVersion.objects.create(
+                page=page,
+                version_number=1,
+                effective_date=timezone.now() - timedelta(days=1),
+                widgets={},
+                created_by=self.user,
+            )
+
+    def test_cached_tree_is_served_without_queries(self):
+        """Test that a warm tree is read from the cache alone"""
+        InheritanceTreeCache.get_tree(self.team.id)
+
+        with self.assertNumQueries(0):
+            tree = InheritanceTreeCache.get_tree(self.team.id)
+
+        self.assertEqual(tree.page_id, self.team.id)
+        self.assertEqual(tree.parent.parent.page_id, self.home.id)
+
+    def test_ancestor_invalidation_is_single_write(self):
+        """Test that invalidating an ancestor stales descendants without visiting them"""
+        InheritanceTreeCache.get_tree(self.team.id)
+        InheritanceTreeCache.get_tree(self.home.id)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(InheritanceTreeCache.invalidate_page(self.about.id), 1)
+
+        entry = cache.get(InheritanceTreeCache.get_cache_key(self.team.id))
+        self.assertFalse(InheritanceTreeCache._is_fresh(entry))
+        home_entry = cache.get(InheritanceTreeCache.get_cache_key(self.home.id))
+        self.assertTrue(InheritanceTreeCache._is_fresh(home_entry))
+
+    def test_invalidation_during_build_leaves_entry_stale(self):
+        """Test that a change made while a tree is built is not cached as current"""
+        build_tree = InheritanceTreeBuilder.build_tree
+
+        def build_then_invalidate(builder, page):
+            tree = build_tree(builder, page)
+            InheritanceTreeCache.invalidate_page(self.home.id)
+            return tree
+
+        with patch.object(InheritanceTreeBuilder, "build_tree", build_then_invalidate):
+            InheritanceTreeCache.get_tree(self.team.id)
+
+        entry = cache.get(InheritanceTreeCache.get_cache_key(self.team.id))
+        self.assertFalse(InheritanceTreeCache._is_fresh(entry))
+
+    def test_scheduled_version_expires_entry(self):
+        """Test that an upcoming publish date bounds the cached entry"""
+        PageVersion.objects.create(
+            page=self.about,
+            version_number=2,
+            effective_date=timezone.now() + timedelta(hours=1),
+            widgets={},
+            created_by=self.user,
+        )
+        InheritanceTreeCache.get_tree(self.team.id)
+
+        entry = cache.get(InheritanceTreeCache.get_cache_key(self.team.id))
+        self.assertAlmostEqual(
+            entry["valid_until"], (timezone.now() + timedelta(hours=1)).timestamp(), delta=5
+        )
@@ -0,0 +1,90 @@
+"""
+Tests for the precompiled layout artifact
+"""
+
+import inspect
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from webpages.layout_catalog import LayoutCatalog
+from webpages.utils.template_parser import TemplateParser
+from webpages.views.rendering_views import layout_json
+
+
+class LayoutCatalogTest(TestCase):
+    """Test building, persisting and serving layout artifacts"""
+
+    def setUp(self):
+        artifact_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, artifact_dir, ignore_errors=True)
+        settings_override = override_settings(LAYOUT_ARTIFACT_DIR=artifact_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        LayoutCatalog.clear()
+        self.addCleanup(LayoutCatalog.clear)
+        self.user = User.objects.create_user(username="layout_user", password="testpass")
+
+    def test_saved_artifact_is_loaded_without_parsing(self):
+        """Test that a fresh process reads the deploy-time artifact from disk"""
+        artifact = LayoutCatalog.build()
+        path = LayoutCatalog.save(artifact)
+        self.assertTrue(path.name.endswith(f"{artifact['hash']}.json"))
+
+        with patch.object(TemplateParser, "parse_template") as parse:
+            loaded = LayoutCatalog.get()
+
+        parse.assert_not_called()
+        self.assertEqual(loaded["hash"], artifact["hash"])
+        self.assertEqual(
+            loaded["layouts"]["main_layout"]["template"],
+            artifact["layouts"]["main_layout"]["template"],
+        )
+
+    def test_missing_artifact_is_built_once(self):
+        """Test that templates are parsed once and then served from memory"""
+        with patch.object(
+            TemplateParser, "parse_template", autospec=True, return_value={}
+        ) as parse:
+            LayoutCatalog.get()
+            calls = parse.call_count
+            LayoutCatalog.get()
+            LayoutCatalog.get_entry("main_layout")
+
+        self.assertGreater(calls, 0)
+        self.assertEqual(parse.call_count, calls)
+        self.assertIsNotNone(LayoutCatalog.load(LayoutCatalog.fingerprint()))
+
+    def test_fingerprint_covers_template_parser(self):
+        """Test that changing the code that parses templates changes the key"""
+        fingerprint = LayoutCatalog.fingerprint()
+        parser_file = inspect.getfile(TemplateParser)
+        real_digest = LayoutCatalog._file_digest
+
+        def edited_digest(path):
+            digest = real_digest(path)
+            return f"{digest}:edited" if path == parser_file else digest
+
+        with patch.object(LayoutCatalog, "_file_digest", side_effect=edited_digest):
+            self.assertNotEqual(LayoutCatalog.fingerprint(), fingerprint)
+
+    def test_layout_json_serves_artifact(self):
+        """Test that the layout JSON endpoint returns the artifact entry"""
+        factory = APIRequestFactory()
+
+        def get(name):
+            request = factory.get(f"/layouts/{name}/json/")
+            force_authenticate(request, user=self.user)
+            return layout_json(request, layout_name=name)
+
+        response = get("main_layout")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data, LayoutCatalog.get_entry("main_layout")["template"]
+        )
+        self.assertEqual(get("missing_layout").status_code, 404)
@@ -0,0 +1,85 @@
+"""
+Tests for set-based page reordering and moves
+"""
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from core.models import Tenant
+from webpages.models import WebPage
+
+
+class PageOrderingTest(TestCase):
+    """Test bulk reorder and move operations on the page tree"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="order_user", password="testpass")
+        self.tenant = Tenant.objects.create(
+            name="Order Tenant", identifier="order-tenant", created_by=self.user
+        )
+        self.home = self._page("home", hostnames=["order.example.com"])
+        self.archive = self._page("archive", parent=self.home)
+        self.news = [self._page(f"news-{i}", parent=self.archive) for i in range(20)]
+        self.target = self._page("target", parent=self.home)
+
+    def _page(self, slug, parent=None, hostnames=None):
+        return WebPage.objects.create(
+            title=slug.title(),
+            slug=slug,
+            parent=parent,
+            hostnames=hostnames or [],
+            tenant=self.tenant,
+            created_by=self.user,
+            last_modified_by=self.user,
+        )
+
+    def test_reorder_is_a_single_update(self):
+        """Test that reordering many siblings costs one read and one write"""
+        new_order = [page.id for page in reversed(self.news)]
+
+        with self.assertNumQueries(2):
+            updated = WebPage.reorder_siblings(self.archive.id, new_order)
+
+        self.assertEqual(updated, 20)
+        ordered = list(
+            WebPage.objects.filter(parent=self.archive)
+            .order_by("sort_order")
+            .values_list("id", flat=True)
+        )
+        self.assertEqual(ordered, new_order)
+
+    def test_normalize_sort_orders_spaces_siblings(self):
+        """Test that normalizing assigns 10, 20, 30... in current order"""
+        WebPage.objects.filter(pk=self.news[5].pk).update(sort_order=-1)
+
+        WebPage.normalize_sort_orders(self.archive.id)
+
+        self.assertEqual(WebPage.objects.get(pk=self.news[5].pk).sort_order, 10)
+        orders = sorted(
+            WebPage.objects.filter(parent=self.archive).values_list(
+                "sort_order", flat=True
+            )
+        )
+        self.assertEqual(orders, list(range(10, 210, 10)))
+
+    def test_move_pages_rewrites_paths_once(self):
+        """Test that moving pages updates parents and subtree paths set-wise"""
+        leaf = self._page("leaf", parent=self.news[3])
+
+        with self.assertNumQueries(5):
+            WebPage.move_pages(self.news[:5], self.target, self.user, sort_order=100)
+
+        moved = WebPage.objects.get(pk=self.news[4].pk)
+        self.assertEqual(moved.parent_id, self.target.id)
+        self.assertEqual(moved.sort_order, 140)
+        self.assertEqual(moved.cached_path, "/target/news-4/")
+        leaf.refresh_from_db()
+        self.assertEqual(leaf.cached_path, "/target/news-3/leaf/")
+
+    def test_move_into_descendant_is_rejected(self):
+        """Test that a page cannot be moved under its own subtree"""
+        with self.assertRaises(ValidationError):
+            WebPage.move_pages([self.archive], self.news[0], self.user)
+
+        self.assertEqual(WebPage.objects.get(pk=self.archive.pk).parent_id, self.home.id)
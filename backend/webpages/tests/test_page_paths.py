@@ -0,0 +1,85 @@
+"""
+Tests for set-based cached path maintenance
+"""
+
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models import Tenant
+from webpages.models import WebPage
+
+
+class CachedPathCascadeTest(TestCase):
+    """Test that subtree paths and root fields are rewritten in one statement"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="path_user", password="testpass")
+        self.tenant = Tenant.objects.create(
+            name="Path Tenant", identifier="path-tenant", created_by=self.user
+        )
+        self.home = self._page("home", hostnames=["paths.example.com"])
+        self.other_root = self._page("other", hostnames=["other.example.com"])
+        self.section = self._page("section", parent=self.home)
+        self.leaves = []
+        for i in range(5):
+            child = self._page(f"child-{i}", parent=self.section)
+            self.leaves.append(self._page("leaf", parent=child))
+
+    def _page(self, slug, parent=None, hostnames=None):
+        return WebPage.objects.create(
+            title=slug.title(),
+            slug=slug,
+            parent=parent,
+            hostnames=hostnames or [],
+            tenant=self.tenant,
+            created_by=self.user,
+            last_modified_by=self.user,
+        )
+
+    def test_rename_rewrites_subtree_with_constant_queries(self):
+        """Test that renaming a section updates every descendant without re-saving them"""
+        self.section.slug = "renamed"
+        with CaptureQueriesContext(connection) as queries:
+            self.section.save()
+
+        updates = [q for q in queries.captured_queries if q["sql"].lstrip().startswith("UPDATE")]
+        self.assertLessEqual(len(updates), 2)
+        self.leaves[3].refresh_from_db()
+        self.assertEqual(self.leaves[3].cached_path, "/renamed/child-3/leaf/")
+
+    def test_move_updates_root_fields(self):
+        """Test that moving a subtree to another root updates root id and hostnames"""
+        self.section.parent = self.other_root
+        self.section.save()
+
+        leaf = WebPage.objects.get(pk=self.leaves[0].pk)
+        self.assertEqual(leaf.cached_root_id, self.other_root.id)
+        self.assertEqual(leaf.cached_root_hostnames, ["other.example.com"])
+        self.assertEqual(leaf.cached_path, "/section/child-0/leaf/")
+
+    def test_root_hostname_change_cascades(self):
+        """Test that a root's new hostnames reach all descendants"""
+        self.home.hostnames = ["paths.example.com", "www.paths.example.com"]
+        self.home.save()
+
+        leaf = WebPage.objects.get(pk=self.leaves[4].pk)
+        self.assertEqual(
+            leaf.cached_root_hostnames, ["paths.example.com", "www.paths.example.com"]
+        )
+
+    def test_rebuild_command_repairs_paths(self):
+        """Test that rebuild_cached_paths fixes stale rows through the cascade"""
+        WebPage.objects.filter(pk__in=[leaf.pk for leaf in self.leaves]).update(
+            cached_path="/stale/", cached_root_id=None
+        )
+
+        call_command("rebuild_cached_paths", page_id=self.home.id, stdout=StringIO())
+
+        leaf = WebPage.objects.get(pk=self.leaves[1].pk)
+        self.assertEqual(leaf.cached_path, "/section/child-1/leaf/")
+        self.assertEqual(leaf.cached_root_id, self.home.id)
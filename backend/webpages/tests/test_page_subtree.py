@@ -0,0 +1,102 @@
+"""
+Tests for subtree queries and set-based delete/restore
+"""
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from core.models import Tenant
+from webpages.models import WebPage
+from webpages.services.page_subtree import get_subtree
+
+
+class PageSubtreeTest(TestCase):
+    """Test single-query descendant collection and the operations built on it"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="subtree_user", password="testpass")
+        self.tenant = Tenant.objects.create(
+            name="Subtree Tenant", identifier="subtree-tenant", created_by=self.user
+        )
+        self.home = self._page("home", hostnames=["subtree.example.com"])
+        self.section = self._page("section", parent=self.home)
+        self.children = [self._page(f"child-{i}", parent=self.section) for i in range(3)]
+        self.grandchildren = [self._page("leaf", parent=child) for child in self.children]
+
+    def _page(self, slug, parent=None, hostnames=None):
+        return WebPage.objects.create(
+            title=slug.title(),
+            slug=slug,
+            parent=parent,
+            hostnames=hostnames or [],
+            tenant=self.tenant,
+            created_by=self.user,
+            last_modified_by=self.user,
+        )
+
+    def test_subtree_returns_depths_in_one_query(self):
+        """Test that descendants come back parents-first with their depth"""
+        with self.assertNumQueries(1):
+            subtree = get_subtree([self.home.id])
+
+        depths = dict(subtree)
+        self.assertEqual(depths[self.section.id], 1)
+        self.assertEqual(depths[self.grandchildren[2].id], 3)
+        self.assertEqual(len(subtree), 7)
+        self.assertEqual([depth for _, depth in subtree], sorted(depths.values()))
+
+    def test_deleted_pages_stop_the_walk(self):
+        """Test that soft-deleted pages and their subtrees are excluded by default"""
+        WebPage.objects.filter(pk=self.children[0].pk).update(is_deleted=True)
+
+        ids = [page_id for page_id, _ in get_subtree([self.section.id])]
+        self.assertNotIn(self.children[0].id, ids)
+        self.assertNotIn(self.grandchildren[0].id, ids)
+
+        all_ids = [page_id for page_id, _ in get_subtree([self.section.id], True)]
+        self.assertIn(self.grandchildren[0].id, all_ids)
+
+    def test_soft_delete_marks_subtree_with_metadata(self):
+        """Test that recursive soft delete updates every descendant in bulk"""
+        with self.assertNumQueries(10):
+            result = self.section.soft_delete(self.user, recursive=True)
+
+        self.assertEqual(result["total_count"], 7)
+        leaf = WebPage.objects.get(pk=self.grandchildren[1].pk)
+        self.assertTrue(leaf.is_deleted)
+        self.assertEqual(
+            leaf.deletion_metadata["parent_id_chain"],
+            [self.children[1].id, self.section.id, self.home.id],
+        )
+        self.assertEqual(
+            leaf.deletion_metadata["parent_path_display"], "Home > Section > Child-1"
+        )
+        child = WebPage.objects.get(pk=self.children[1].pk)
+        self.assertEqual(child.deletion_metadata["children_count"], 1)
+
+    def test_restore_renames_conflicting_slugs(self):
+        """Test that recursive restore revives descendants and resolves slug clashes"""
+        self.section.soft_delete(self.user, recursive=True)
+        # A live sibling now owns the slug of one of the deleted children
+        self._page("child-1", parent=self.section)
+
+        result = WebPage.objects.get(pk=self.section.pk).restore(
+            self.user, recursive=True
+        )
+
+        self.assertEqual(result["restored_count"], 7)
+        child = WebPage.objects.get(pk=self.children[1].pk)
+        self.assertFalse(child.is_deleted)
+        self.assertEqual(child.slug, "child-1-2")
+        leaf = WebPage.objects.get(pk=self.grandchildren[1].pk)
+        self.assertEqual(leaf.cached_path, "/section/child-1-2/leaf/")
+
+    def test_permanent_delete_removes_soft_deleted_subtree(self):
+        """Test that permanent delete reports and removes deleted descendants"""
+        self.section.soft_delete(self.user, recursive=True)
+
+        result = WebPage.objects.get(pk=self.section.pk).permanent_delete(recursive=True)
+
+        self.assertEqual(result["total_count"], 7)
+        self.assertEqual(result["deleted_pages"][0]["id"], self.children[0].id)
+        self.assertFalse(WebPage.objects.filter(pk=self.grandchildren[2].pk).exists())
@@ -0,0 +1,178 @@
+"""
+Tests for the concurrent page tree crawler and streaming importer
+"""
+
+import shutil
+import tempfile
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from content.models import Namespace
+from core.models import Tenant
+from webpages.models import WebPage
+from webpages.services.page_tree_crawler import CrawlCheckpoint, PageTreeCrawler
+from webpages.services.page_tree_importer import PageTreeImporter
+
+
+SITE = {
+    "https://example.com/docs": '<title>Docs</title><a href="/docs/a">A</a>'
+    '<a href="/docs/b?utm_source=x">B</a><a href="https://other.com/">Out</a>',
+    "https://example.com/docs/a": '<title>A</title><a href="/docs/a/deep">Deep</a>',
+    "https://example.com/docs/b": "<title>B</title>",
+    "https://example.com/docs/a/deep": "<title>Deep</title>",
+}
+
+
+def _fake_session(pages, robots=None):
+    """Build a session mock serving pages by URL, recording requested URLs."""
+    session = MagicMock()
+    session.requested = []
+
+    def get(url, **kwargs):
+        response = MagicMock()
+        if url.endswith("/robots.txt"):
+            response.status_code = 200 if robots else 404
+            response.text = robots or ""
+            return response
+        session.requested.append(url)
+        response.status_code = 200
+        response.text = pages[url]
+        response.raise_for_status.return_value = None
+        return response
+
+    session.get.side_effect = get
+    return session
+
+
+class PageTreeCrawlerTest(TestCase):
+    """Test crawling, robots.txt handling and checkpoint resume"""
+
+    def setUp(self):
+        crawl_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, crawl_dir, ignore_errors=True)
+        settings_override = override_settings(PAGE_IMPORT_CRAWL_DIR=crawl_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def _crawler(self, session, **kwargs):
+        crawler = PageTreeCrawler(request_delay=0, **kwargs)
+        crawler.session = session
+        return crawler
+
+    def test_normalize_url(self):
+        """Test that equivalent URLs normalize to the same string"""
+        crawler = PageTreeCrawler()
+        self.assertEqual(
+            crawler._normalize_url("HTTPS://Example.com:443/a/?b=2&utm_source=x&a=1#top"),
+            "https://example.com/a?a=1&b=2",
+        )
+        self.assertEqual(
+            crawler._normalize_url("http://example.com:8080/"),
+            "http://example.com:8080/",
+        )
+
+    def test_crawl_builds_tree_and_reports_parents_first(self):
+        """Test that every page is fetched once and parents are reported first"""
+        session = _fake_session(SITE)
+        crawler = self._crawler(session, max_workers=4)
+        reported = []
+
+        root = crawler.crawl("https://example.com/docs/", on_page=reported.append)
+
+        self.assertEqual(
+            [child.url for child in root.children],
+            ["https://example.com/docs/a", "https://example.com/docs/b"],
+        )
+        self.assertEqual(root.children[0].children[0].metadata["title"], "Deep")
+        self.assertCountEqual(session.requested, SITE.keys())
+        order = [page.url for page in reported]
+        self.assertEqual(order[0], "https://example.com/docs")
+        self.assertLess(
+            order.index("https://example.com/docs/a"),
+            order.index("https://example.com/docs/a/deep"),
+        )
+
+    def test_max_pages_and_depth_bound_the_tree(self):
+        """Test that max_pages caps the tree and max_depth stops expansion"""
+        crawler = self._crawler(_fake_session(SITE), max_pages=2)
+        root = crawler.crawl("https://example.com/docs")
+        self.assertEqual(len(crawler.url_to_page), 2)
+        self.assertEqual(len(root.children), 1)
+
+        crawler = self._crawler(_fake_session(SITE), max_depth=1)
+        root = crawler.crawl("https://example.com/docs")
+        self.assertEqual(root.children[0].children, [])
+
+    def test_robots_disallow_and_crawl_delay(self):
+        """Test that robots.txt rules and Crawl-delay are honoured"""
+        robots = "User-agent: *\nDisallow: /docs/b\nCrawl-delay: 3\n"
+        session = _fake_session(SITE, robots=robots)
+        crawler = self._crawler(session)
+
+        root = crawler.crawl("https://example.com/docs")
+
+        self.assertNotIn("https://example.com/docs/b", session.requested)
+        self.assertEqual(root.children[1].error, "Disallowed by robots.txt")
+        self.assertEqual(crawler._host_delay("https://example.com/docs"), 3)
+
+    def test_checkpoint_resumes_without_refetching(self):
+        """Test that a resumed crawl only fetches pages not yet recorded"""
+        checkpoint = CrawlCheckpoint.for_crawl("resume-test")
+        first = self._crawler(_fake_session(SITE), checkpoint=checkpoint)
+        first.crawl("https://example.com/docs")
+
+        # Drop the records of the last two pages, as if the crawl was interrupted
+        lines = checkpoint.path.read_text().splitlines(keepends=True)
+        checkpoint.path.write_text("".join(lines[:-2]) + '{"url": "https://exa')
+
+        session = _fake_session(SITE)
+        reported = []
+        root = self._crawler(session, checkpoint=checkpoint).crawl(
+            "https://example.com/docs", on_page=reported.append
+        )
+
+        self.assertEqual(len(session.requested), 2)
+        self.assertEqual(len(reported), len(SITE))
+        self.assertEqual(root.metadata["title"], "Docs")
+
+    def test_checkpoint_rejects_invalid_id(self):
+        """Test that crawl IDs cannot escape the checkpoint directory"""
+        with self.assertRaises(ValueError):
+            CrawlCheckpoint.for_crawl("../etc/passwd")
+
+
+class PageTreeImporterTest(TestCase):
+    """Test importing a tree while it is being crawled"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="importer", password="testpass")
+        tenant = Tenant.objects.create(
+            name="Import Tenant", identifier="import-tenant", created_by=self.user
+        )
+        self.namespace = Namespace.objects.create(
+            name="Import", slug="import", created_by=self.user, tenant=tenant
+        )
+
+    def test_import_tree_creates_hierarchy(self):
+        """Test that streamed pages are created under their imported parents"""
+        importer = PageTreeImporter(self.user, self.namespace)
+        with patch(
+            "webpages.services.page_tree_crawler.requests.Session",
+            return_value=_fake_session(SITE),
+        ):
+            progress = importer.import_tree(
+                "https://example.com/docs",
+                hostname="import.example.com",
+                request_delay=0,
+            )
+
+        self.assertEqual(progress.status, "completed")
+        self.assertEqual(progress.pages_created, len(SITE))
+        self.assertEqual(progress.urls_in_queue, [])
+        root = WebPage.objects.get(slug="docs", parent__isnull=True)
+        self.assertEqual(root.hostnames, ["import.example.com"])
+        deep = WebPage.objects.get(slug="deep")
+        self.assertEqual(deep.parent.slug, "a")
+        self.assertEqual(deep.parent.parent, root)
@@ -204,6 +204,7 @@ class PathPatternDecoratorTests(TestCase):
 
     def setUp(self):
         """Save registry state before each test"""
+        path_pattern_registry.ensure_discovered()
         self._original_patterns = path_pattern_registry._patterns.copy()
         self._original_instances = path_pattern_registry._instances.copy()
         path_pattern_registry.clear()
@@ -0,0 +1,76 @@
+"""
+Tests for lazy registry discovery and the startup profiler
+"""
+
+from django.test import SimpleTestCase
+
+from webpages.management.commands.profile_startup import (
+    PHASE_MARKER,
+    group_by_package,
+    parse_importtime,
+)
+from webpages.path_pattern_registry import BasePathPattern, PathPatternRegistry
+
+
+class DiscoveredPattern(BasePathPattern):
+    key = "discovered"
+    name = "Discovered"
+    regex_pattern = r"^(?P<slug>[\w-]+)/$"
+    example_url = "example/"
+
+
+class LazyDiscoveryTest(SimpleTestCase):
+    """Test that registries populate themselves on first lookup"""
+
+    def setUp(self):
+        self.registry = PathPatternRegistry()
+        self.calls = 0
+
+    def _discover(self):
+        self.calls += 1
+        # Lookups made while modules register must not recurse
+        self.assertEqual(self.registry.list_patterns(), [])
+        self.registry.register(DiscoveredPattern)
+
+    def test_discovery_runs_once_on_first_lookup(self):
+        """Test that setting discovery imports nothing until a lookup"""
+        self.registry.set_discovery(self._discover)
+        self.assertEqual(self.calls, 0)
+
+        self.assertTrue(self.registry.is_registered("discovered"))
+        self.assertEqual(len(self.registry.list_patterns()), 1)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(self.registry.is_discovered)
+
+    def test_cleared_registry_stays_empty(self):
+        """Test that an explicitly cleared registry is not repopulated"""
+        self.registry.set_discovery(self._discover)
+        self.registry.clear()
+
+        self.assertEqual(self.registry.list_patterns(), [])
+        self.assertEqual(self.calls, 0)
+
+
+class StartupProfilerTest(SimpleTestCase):
+    """Test parsing of -X importtime output"""
+
+    def test_parse_importtime_tracks_phases(self):
+        """Test that timings are parsed with depth and phase"""
+        output = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       120 |        120 |   bs4.element",
+                "import time:       300 |        420 | bs4",
+                f"{PHASE_MARKER}discovery",
+                "import time:      5000 |       5000 | easy_widgets.widgets",
+                "Widget type validation issues found",
+            ]
+        )
+
+        timings = parse_importtime(output)
+
+        self.assertEqual([t.module for t in timings], ["bs4.element", "bs4", "easy_widgets.widgets"])
+        self.assertEqual(timings[0].depth, 1)
+        self.assertEqual(timings[1].cumulative_us, 420)
+        self.assertEqual(timings[2].phase, "discovery")
+        self.assertEqual(group_by_package(timings), {"bs4": 420, "easy_widgets": 5000})
@@ -0,0 +1,86 @@
+"""
+Tests for the precompiled widget type catalog
+"""
+
+import inspect
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from webpages.views.widget_type_views import WidgetTypeViewSet
+from webpages.widget_catalog import WidgetCatalog
+from webpages.widget_registry import BaseWidget, widget_type_registry
+
+
+class WidgetCatalogTest(TestCase):
+    """Test catalog compilation, reuse and ETag handling"""
+
+    def setUp(self):
+        cache.clear()
+        WidgetCatalog.clear()
+        self.addCleanup(WidgetCatalog.clear)
+        self.user = User.objects.create_user(username="catalog_user", password="testpass")
+        self.factory = APIRequestFactory()
+
+    def _get(self, action, headers=None, **kwargs):
+        request = self.factory.get("/widget-types/", **(headers or {}))
+        force_authenticate(request, user=self.user)
+        view = WidgetTypeViewSet.as_view({"get": action})
+        return view(request, **kwargs)
+
+    def test_templates_are_parsed_once(self):
+        """Test that repeated catalog reads reuse the compiled artifact"""
+        with patch.object(
+            BaseWidget, "get_template_json", autospec=True, return_value={}
+        ) as parse:
+            WidgetCatalog.get()
+            WidgetCatalog.get()
+            self._get("list")
+
+        self.assertEqual(
+            parse.call_count, len(widget_type_registry.list_widget_types(False))
+        )
+
+    def test_shared_artifact_survives_process_memo(self):
+        """Test that a fresh process memo reads the artifact from the cache"""
+        artifact = WidgetCatalog.get()
+        WidgetCatalog.clear()
+
+        with patch.object(WidgetCatalog, "build") as build:
+            self.assertEqual(WidgetCatalog.get()["hash"], artifact["hash"])
+        build.assert_not_called()
+
+    def test_fingerprint_covers_registry_module(self):
+        """Test that changing the code that serializes widgets changes the key"""
+        fingerprint = WidgetCatalog.fingerprint()
+        registry_file = inspect.getfile(BaseWidget)
+        real_stamp = WidgetCatalog._file_stamp
+
+        def edited_stamp(path):
+            stamp = real_stamp(path)
+            return f"{stamp}:edited" if path == registry_file else stamp
+
+        with patch.object(WidgetCatalog, "_file_stamp", side_effect=edited_stamp):
+            self.assertNotEqual(WidgetCatalog.fingerprint(), fingerprint)
+
+    def test_etag_answers_not_modified(self):
+        """Test that a matching If-None-Match returns 304 without a body"""
+        response = self._get("list")
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertIn(WidgetCatalog.get()["hash"], etag)
+
+        response = self._get("list", headers={"HTTP_IF_NONE_MATCH": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertIsNone(response.data)
+
+    def test_detail_slices_catalog(self):
+        """Test that per-widget endpoints serve the catalog entry"""
+        response = self._get("configuration_defaults", pk="Content")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["defaults"].get("sanitize_html"), True)
+        self.assertEqual(self._get("retrieve", pk="Missing Widget").status_code, 404)
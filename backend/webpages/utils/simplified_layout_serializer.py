@@ -396,7 +396,7 @@ class SimplifiedLayoutSerializer:
                     "name": "main",
                     "label": "Main Content",
                     "description": "Primary content area",
-                    "required": true,
+                    "required": True,
                     "maxWidgets": 10,
                     "allowedWidgetTypes": ["*"],
                     "className": "main-slot",
@@ -145,8 +145,9 @@ def sanitize_widget_content(widget_data: Dict[str, Any]) -> Dict[str, Any]:
 class TemplateParser:
     """Parse Django templates into JSON layout representation"""
 
-    def __init__(self, layout=None):
+    def __init__(self, layout=None, use_cache=True):
         self.layout = layout  # Optional layout instance to get slot_configuration
+        self.use_cache = use_cache
         self.default_widgets_pattern = re.compile(
             r"{#\s*default:\s*(\[.*?\])\s*#}", re.DOTALL | re.MULTILINE
         )
@@ -166,7 +167,7 @@ class TemplateParser:
         """
         # Check cache first
         cache_key = f"template_parser:{template_name}"
-        cached_result = cache.get(cache_key)
+        cached_result = cache.get(cache_key) if self.use_cache else None
         if cached_result:
             logger.debug(f"Template parser cache hit for {template_name}")
             return cached_result
@@ -265,8 +266,9 @@ class TemplateParser:
             layout_json = self._parse_element(root_element, template_source)
 
             # Cache the result
-            cache.set(cache_key, layout_json, self.cache_timeout)
-            logger.debug(f"Template parser cached result for {template_name}")
+            if self.use_cache:
+                cache.set(cache_key, layout_json, self.cache_timeout)
+                logger.debug(f"Template parser cached result for {template_name}")
 
             return layout_json
 
@@ -1134,8 +1136,9 @@ class WidgetTemplateParser:
 class LayoutSerializer:
     """Serialize PageLayout objects to JSON"""
 
-    def __init__(self):
+    def __init__(self, use_cache=True):
         self.parser = None  # Will be initialized per layout
+        self.use_cache = use_cache
 
     def serialize_layout(self, layout) -> Dict[str, Any]:
         """
@@ -1149,7 +1152,7 @@ class LayoutSerializer:
         """
         try:
             # Initialize parser with layout for slot_configuration access
-            self.parser = TemplateParser(layout=layout)
+            self.parser = TemplateParser(layout=layout, use_cache=self.use_cache)
 
             # Parse the template file
             # Use the template_name as-is since it now includes the full path
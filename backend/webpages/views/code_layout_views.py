@@ -13,7 +13,6 @@ import time
 from django.core.cache import cache
 
 from ..serializers import LayoutSerializer
-from ..utils.template_parser import LayoutSerializer as TemplateLayoutSerializer
 
 # Setup logging for API metrics
 logger = logging.getLogger("webpages.api")
@@ -98,7 +97,7 @@ class CodeLayoutViewSet(viewsets.ViewSet):
         response["X-API-Features"] = "rate-limiting,metrics,caching"
         return response
 
-    def _add_caching_headers(self, response, layout_name=None):
+    def _add_caching_headers(self, response, layout_name=None, version=None):
         """Add proper HTTP caching headers"""
         from django.utils.http import http_date
         from django.utils import timezone
@@ -114,7 +113,10 @@ class CodeLayoutViewSet(viewsets.ViewSet):
         response["Cache-Control"] = f"public, max-age={cache_max_age}"
         response["Vary"] = "Accept-Encoding, Accept, API-Version"
 
-        if layout_name:
+        if layout_name and version:
+            # Content-addressed data (e.g. a layout artifact hash)
+            response["ETag"] = f'"{layout_name}-{version}"'
+        elif layout_name:
             # Use shorter time intervals in debug mode for more frequent cache invalidation
             time_interval = 60 if settings.DEBUG else 3600  # 1 minute vs 1 hour
             etag = f'"{layout_name}-{int(time.time() // time_interval)}"'
@@ -256,11 +258,12 @@ class CodeLayoutViewSet(viewsets.ViewSet):
     @action(detail=True, methods=["get"])
     def template(self, request, pk=None):
         """Get template data for a specific layout"""
-        from ..layout_registry import layout_registry
-        from ..utils.template_parser import LayoutSerializer as TemplateLayoutSerializer
+        from ..layout_catalog import LayoutCatalog
 
-        layout = layout_registry.get_layout(pk)
-        if not layout:
+        # Template data comes from the precompiled layout artifact
+        artifact = LayoutCatalog.get()
+        entry = artifact["layouts"].get(pk)
+        if not entry:
             error_data = {"error": f"Layout '{pk}' not found"}
             return self._create_formatted_response(
                 error_data, request, status.HTTP_404_NOT_FOUND
@@ -269,37 +272,38 @@ class CodeLayoutViewSet(viewsets.ViewSet):
         # Log metrics for template requests
         logger.info(f"Template data request: {pk}")
 
-        # Get template data
-        serializer = TemplateLayoutSerializer()
-        try:
-            template_data = serializer.serialize_layout(layout)
-            structure = template_data.get("structure", {})
-            
-            # Add some extra metadata for the template endpoint
-            response_data = {
-                "layout_name": pk,
-                "layout_type": layout.type,
-                "template_html": structure.get("html", ""),
-                "template_css": structure.get("css", ""),
-                "parsed_slots": structure.get("slots", []),
-                "template_file": getattr(layout, "template_name", ""),
-                "parsing_errors": [],
-                "cache_info": {"cached": False},
-                "last_modified": timezone.now().isoformat(),
+        if entry["template_error"]:
+            error_data = {
+                "error": f"Failed to parse template: {entry['template_error']}"
             }
-            
-            response = self._create_formatted_response(response_data, request)
-            response = self._add_caching_headers(response, layout_name=pk)
-            response = self._add_rate_limiting_headers(response, request, "template")
-            return response
-        except Exception as e:
-            error_data = {"error": f"Failed to parse template: {str(e)}"}
             response = self._create_formatted_response(
                 error_data, request, status.HTTP_500_INTERNAL_SERVER_ERROR
             )
             response = self._add_rate_limiting_headers(response, request, "template")
             return response
 
+        structure = entry["template"].get("structure", {})
+
+        # Add some extra metadata for the template endpoint
+        response_data = {
+            "layout_name": pk,
+            "layout_type": entry["data"]["type"],
+            "template_html": structure.get("html", ""),
+            "template_css": structure.get("css", ""),
+            "parsed_slots": structure.get("slots", []),
+            "template_file": entry["data"]["template_name"] or "",
+            "parsing_errors": [],
+            "cache_info": {"cached": True, "artifact": artifact["hash"]},
+            "last_modified": artifact["built_at"],
+        }
+
+        response = self._create_formatted_response(response_data, request)
+        response = self._add_caching_headers(
+            response, layout_name=pk, version=artifact["hash"]
+        )
+        response = self._add_rate_limiting_headers(response, request, "template")
+        return response
+
     @action(detail=False, methods=["post"])
     def reload(self, request):
         """Reload all layouts (admin/dev use)"""
@@ -33,7 +33,8 @@ class ImportTreeView(APIView):
             "hostname": "example.com",  # Optional, for root page import
             "namespace": "default",  # Optional, defaults to "default"
             "maxDepth": 5,  # Optional, defaults to 5
-            "maxPages": 100  # Optional, defaults to 100
+            "maxPages": 100,  # Optional, defaults to 100
+            "resumeTaskId": "uuid"  # Optional, resumes the crawl of a failed import
         }
 
         Backend receives (converted to snake_case by CamelCaseJSONParser):
@@ -43,7 +44,8 @@ class ImportTreeView(APIView):
             "hostname": "example.com",
             "namespace": "default",
             "max_depth": 5,
-            "max_pages": 100
+            "max_pages": 100,
+            "resume_task_id": "uuid"
         }
 
         Returns (converted to camelCase by CamelCaseJSONRenderer):
@@ -95,12 +97,12 @@ class ImportTreeView(APIView):
                 {"error": "Invalid namespace"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Create task ID
-        task_id = str(uuid.uuid4())
+        # Create task ID (reusing it resumes the checkpointed crawl)
+        task_id = request.data.get("resume_task_id") or str(uuid.uuid4())
 
         # Start import (synchronously for now - could be async with Celery later)
         try:
-            importer = PageTreeImporter(request.user, namespace)
+            importer = PageTreeImporter(request.user, namespace, task_id=task_id)
             progress = importer.import_tree(
                 start_url=url,
                 parent_page=parent_page,
@@ -108,6 +110,7 @@ class ImportTreeView(APIView):
                 max_depth=max_depth,
                 max_pages=max_pages,
                 request_delay=request_delay,
+                crawl_id=task_id,
             )
 
             # Store progress in cache (expires in 1 hour)
@@ -12,7 +12,6 @@ from rest_framework.response import Response
 from ..models import WebPage, PageVersion
 from ..renderers import WebPageRenderer
 from ..json_models import PageWidgetData
-from ..utils.template_parser import LayoutSerializer as TemplateLayoutSerializer
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -31,34 +30,19 @@ def layout_json(request, layout_name):
         JSON structure representing the layout template
     """
     try:
-        from ..layout_registry import layout_registry
+        from ..layout_catalog import LayoutCatalog
 
-        # Get the layout class from registry
-        layout_class = layout_registry.get_layout_class(layout_name)
-        if not layout_class:
+        # Serve the precompiled artifact instead of parsing the template
+        entry = LayoutCatalog.get_entry(layout_name)
+        if not entry:
             return Response(
                 {"error": f"Layout '{layout_name}' not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        if entry["template_error"]:
+            raise Exception(entry["template_error"])
 
-        # Create layout instance
-        layout_instance = layout_class()
-
-        # Use the template parser to serialize the layout
-        serializer = TemplateLayoutSerializer()
-
-        # Create a mock layout object for the serializer
-        class MockLayout:
-            def __init__(self, name, template_name):
-                self.name = name
-                self.template_name = template_name
-                self.description = getattr(layout_instance, "description", "")
-                self.id = name  # Use name as ID for code-based layouts
-
-        mock_layout = MockLayout(layout_name, layout_instance.template_name)
-        layout_json_data = serializer.serialize_layout(mock_layout)
-
-        return Response(layout_json_data)
+        return Response(entry["template"])
 
     except Exception as e:
         # Log detailed error for debugging (server-side only)
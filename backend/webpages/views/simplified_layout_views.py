@@ -13,6 +13,7 @@ from rest_framework.response import Response
 from django.views.decorators.cache import cache_page
 from django.utils.decorators import method_decorator
 
+from ..layout_catalog import LayoutCatalog
 from ..utils.simplified_layout_serializer import (
     SimplifiedLayoutSerializer,
     create_predefined_layouts,
@@ -63,10 +64,14 @@ def simplified_layout_json(request, layout_name):
                     }
                 )
 
-        # Fall back to template parsing
-        serializer = SimplifiedLayoutSerializer()
-        layout_data = serializer.serialize_layout(layout_name)
-
+        # Fall back to the layout parsed from its template at build time
+        artifact = LayoutCatalog.get()
+        entry = artifact["layouts"].get(layout_name)
+        if entry:
+            layout_data = entry["simplified"]
+        else:
+            # Unknown layout: the serializer returns its fallback layout
+            layout_data = SimplifiedLayoutSerializer().serialize_layout(layout_name)
 
         return Response(
             {
@@ -74,8 +79,8 @@ def simplified_layout_json(request, layout_name):
                 "layout": layout_data,
                 "source": "template_parsed",
                 "cache_info": {
-                    "cached": False,
-                    "cache_key": f"simplified_layout:{layout_name}",
+                    "cached": bool(entry),
+                    "cache_key": f"layout_artifact:{artifact['hash']}",
                 },
             }
         )
@@ -8,6 +8,7 @@ from rest_framework.response import Response
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.throttling import UserRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Q, Exists, OuterRef, F
 from django.utils import timezone
@@ -577,9 +578,14 @@ class WebPageViewSet(viewsets.ModelViewSet):
 
         # Perform soft delete and collect all deleted pages
         all_deleted_pages = []
+        deleted_ids = set()
 
         for page in pages:
+            # Skip pages already removed as a descendant of an earlier page
+            if page.id in deleted_ids:
+                continue
             result = page.soft_delete(user=request.user, recursive=recursive)
+            deleted_ids.update(deleted["id"] for deleted in result["deleted_pages"])
             # Extend the list with all pages deleted by this operation
             all_deleted_pages.extend(result["deleted_pages"])
 
@@ -1293,50 +1299,66 @@ class WebPageViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # Check for circular references
-        if parent_page:
-            for page in pages:
-                # Check if trying to move parent into its own child
-                ancestor = parent_page
-                while ancestor:
-                    if ancestor.id == page.id:
-                        return Response(
-                            {
-                                "error": f"Cannot move page '{page.title}' into its own descendant"
-                            },
-                            status=status.HTTP_400_BAD_REQUEST,
-                        )
-                    ancestor = ancestor.parent
-
-        # Move pages
-        moved_count = 0
-        errors = []
-        current_sort_order = sort_order
-
-        for page in pages:
-            try:
-                page.parent = parent_page
-                page.sort_order = current_sort_order
-                page.last_modified_by = request.user
-                page.save()
+        # Move all pages in one set-based operation
+        try:
+            moved = WebPage.move_pages(
+                pages, parent_page, request.user, sort_order=sort_order
+            )
+        except ValidationError as e:
+            return Response(
+                {"error": " ".join(e.messages)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-                moved_count += 1
-                current_sort_order += 10  # Space out pages
+        return Response(
+            {
+                "message": f"Successfully moved {len(moved)} page(s)",
+                "moved_count": len(moved),
+            },
+            status=status.HTTP_200_OK,
+        )
 
-            except Exception as e:
-                error_msg = f"Failed to move {page.title}: {str(e)}"
-                errors.append(error_msg)
+    @action(detail=False, methods=["post"], url_path="reorder")
+    def reorder(self, request):
+        """
+        Reorder the children of a page in a single request.
 
-        response_data = {
-            "message": f"Successfully moved {moved_count} page(s)",
-            "moved_count": moved_count,
+        Request body:
+        {
+            "parent_id": 5,  // null for root level
+            "page_ids": [3, 1, 2]  // children in their new order
         }
+        """
+        parent_id = request.data.get("parent_id")
+        page_ids = request.data.get("page_ids", [])
 
-        if errors:
-            response_data["errors"] = errors
-            response_data["message"] += f" with {len(errors)} error(s)"
+        if not page_ids:
+            return Response(
+                {"error": "page_ids is required"}, status=status.HTTP_400_BAD_REQUEST
+            )
 
-        return Response(response_data, status=status.HTTP_200_OK)
+        if parent_id and not self.get_queryset().filter(id=parent_id).exists():
+            return Response(
+                {"error": f"Parent page {parent_id} not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # Root level is shared between tenants, so only renumber this one's pages
+        tenant = getattr(request, "tenant", None)
+        siblings = (
+            WebPage.objects.filter(tenant=tenant) if tenant else WebPage.objects.all()
+        )
+        updated_count = WebPage.reorder_siblings(
+            parent_id, page_ids, queryset=siblings
+        )
+
+        return Response(
+            {
+                "message": f"Successfully reordered {updated_count} page(s)",
+                "updated_count": updated_count,
+            },
+            status=status.HTTP_200_OK,
+        )
 
     @action(detail=True, methods=["get"], url_path="anchors")
     def anchors(self, request, pk=None):
@@ -2,9 +2,11 @@
 WidgetType ViewSet for managing code-based widget types.
 """
 
+import hashlib
 import json
 import importlib
 import inspect
+from django.utils.http import parse_etags
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import (
     action,
@@ -13,7 +15,6 @@ from rest_framework.decorators import (
 )
 from rest_framework.response import Response
 from pydantic import ValidationError, BaseModel
-from pydantic.fields import PydanticUndefined
 
 
 def format_pydantic_errors(pydantic_errors):
@@ -57,6 +58,40 @@ def format_pydantic_errors(pydantic_errors):
     return formatted_errors
 
 
+def catalog_response(request, build_data):
+    """
+    Serve data sliced from the widget catalog with a strong ETag.
+
+    The ETag combines the catalog's content hash with the request path and
+    query, so a matching If-None-Match is answered with 304 before any data
+    is assembled.
+    """
+    from ..widget_catalog import get_widget_catalog
+
+    catalog_hash = get_widget_catalog()["hash"]
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.items()))
+    variant = hashlib.sha256(f"{request.path}?{query}".encode("utf-8")).hexdigest()
+    etag = f'"{catalog_hash}-{variant[:16]}"'
+
+    if etag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", "")):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(build_data())
+
+    response["ETag"] = etag
+    # Always revalidate; unchanged catalogs cost a 304
+    response["Cache-Control"] = "private, no-cache"
+    response["Vary"] = "Accept"
+    return response
+
+
+def widget_not_found(pk):
+    return Response(
+        {"error": f"Widget type '{pk}' not found"},
+        status=status.HTTP_404_NOT_FOUND,
+    )
+
+
 class WidgetTypeViewSet(viewsets.ViewSet):
     """ViewSet for code-based widget types."""
 
@@ -64,71 +99,76 @@ class WidgetTypeViewSet(viewsets.ViewSet):
 
     def list(self, request):
         """List all registered widget types"""
-        from ..widget_registry import widget_type_registry
+        from ..widget_catalog import WidgetCatalog
 
         active_only = request.query_params.get("active", "true").lower() == "true"
         include_template_json = (
             request.query_params.get("include_template_json", "true").lower() == "true"
         )
-        widget_types = widget_type_registry.to_dict(
-            active_only=active_only, include_template_json=include_template_json
-        )
 
-        # Apply search filter if provided
-        search = request.query_params.get("search")
-        if search:
-            search_lower = search.lower()
-            widget_types = [
-                wt
-                for wt in widget_types
-                if search_lower in wt["name"].lower()
-                or search_lower in wt["description"].lower()
-            ]
-
-        # Apply ordering
-        ordering = request.query_params.get("ordering", "name")
-        if ordering.startswith("-"):
-            reverse_order = True
-            ordering = ordering[1:]
-        else:
-            reverse_order = False
-
-        if ordering in ["name", "description"]:
-            widget_types.sort(key=lambda x: x.get(ordering, ""), reverse=reverse_order)
+        def build_data():
+            widget_types = WidgetCatalog.list_data(
+                active_only=active_only, include_template_json=include_template_json
+            )
 
-        return Response(widget_types)
+            # Apply search filter if provided
+            search = request.query_params.get("search")
+            if search:
+                search_lower = search.lower()
+                widget_types = [
+                    wt
+                    for wt in widget_types
+                    if search_lower in wt["name"].lower()
+                    or search_lower in wt["description"].lower()
+                ]
+
+            # Apply ordering
+            ordering = request.query_params.get("ordering", "name")
+            if ordering.startswith("-"):
+                reverse_order = True
+                ordering = ordering[1:]
+            else:
+                reverse_order = False
+
+            if ordering in ["name", "description"]:
+                widget_types.sort(
+                    key=lambda x: x.get(ordering, ""), reverse=reverse_order
+                )
+
+            return widget_types
+
+        return catalog_response(request, build_data)
 
     def retrieve(self, request, pk=None):
         """Get a specific widget type by slug or name"""
-
-        from ..widget_registry import widget_type_registry
+        from ..widget_catalog import WidgetCatalog, entry_data
 
         # Try flexible lookup: type, name, or slug
-        widget_type = widget_type_registry.get_widget_type_flexible(pk)
-        if not widget_type:
-            return Response(
-                {"error": f"Widget type '{pk}' not found"},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        entry = WidgetCatalog.get_entry(pk)
+        if not entry:
+            return widget_not_found(pk)
 
         include_template_json = (
             request.query_params.get("include_template_json", "true").lower() == "true"
         )
-        data = widget_type.to_dict(include_template_json=include_template_json)
-        return Response(data)
+        return catalog_response(
+            request, lambda: entry_data(entry, include_template_json)
+        )
 
     @action(detail=False, methods=["get"])
     def active(self, request):
         """Get only active widget types"""
-        from ..widget_registry import widget_type_registry
+        from ..widget_catalog import WidgetCatalog
 
         include_template_json = (
             request.query_params.get("include_template_json", "true").lower() == "true"
         )
-        active_types = widget_type_registry.to_dict(
-            active_only=True, include_template_json=include_template_json
+        return catalog_response(
+            request,
+            lambda: WidgetCatalog.list_data(
+                active_only=True, include_template_json=include_template_json
+            ),
         )
-        return Response(active_types)
 
     @action(detail=True, methods=["post"], url_path="validate")
     def validate_widget_config(self, request, pk=None):
@@ -175,37 +215,38 @@ class WidgetTypeViewSet(viewsets.ViewSet):
     @action(detail=True, methods=["get"], url_path="configuration-defaults")
     def configuration_defaults(self, request, pk=None):
         """Return default configuration values and schema for a widget type"""
-        from ..widget_registry import widget_type_registry
+        from ..widget_catalog import WidgetCatalog
 
         # Try flexible lookup: type, name, or slug
-        widget_type = widget_type_registry.get_widget_type_flexible(pk)
-        if not widget_type:
-            return Response(
-                {"error": f"Widget type '{pk}' not found"},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        defaults = widget_type.get_configuration_defaults()
-        schema = widget_type.configuration_model.model_json_schema()
-        return Response({"defaults": defaults, "schema": schema})
+        entry = WidgetCatalog.get_entry(pk)
+        if not entry:
+            return widget_not_found(pk)
+
+        return catalog_response(
+            request,
+            lambda: {
+                "defaults": entry["defaults"],
+                "schema": entry["data"]["configuration_schema"],
+            },
+        )
 
     @action(detail=True, methods=["get"], url_path="schema")
     def schema(self, request, pk=None):
         """Return JSON schema for a widget type configuration"""
-        from ..widget_registry import widget_type_registry
+        from ..widget_catalog import WidgetCatalog
 
         # Try flexible lookup: type, name, or slug
-        widget_type = widget_type_registry.get_widget_type_flexible(pk)
-        if not widget_type:
-            return Response(
-                {"error": f"Widget type '{pk}' not found"},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        return Response({
-            "widget_type": widget_type.name,
-            "schema": widget_type.configuration_model.model_json_schema()
-        })
+        entry = WidgetCatalog.get_entry(pk)
+        if not entry:
+            return widget_not_found(pk)
+
+        return catalog_response(
+            request,
+            lambda: {
+                "widget_type": entry["name"],
+                "schema": entry["data"]["configuration_schema"],
+            },
+        )
 
     @action(detail=True, methods=["get"], url_path="config-ui-schema")
     def config_ui_schema(self, request, pk=None):
@@ -213,101 +254,20 @@ class WidgetTypeViewSet(viewsets.ViewSet):
         Return enhanced configuration schema with UI metadata for building forms.
         Includes field-level json_schema_extra data for UI component mapping.
         """
+        from ..widget_catalog import WidgetCatalog, build_config_ui_schema
         from ..widget_registry import widget_type_registry
 
         # Try flexible lookup: type, name, or slug
-        widget_type = widget_type_registry.get_widget_type_flexible(pk)
-        if not widget_type:
-            return Response(
-                {"error": f"Widget type '{pk}' not found"},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        entry = WidgetCatalog.get_entry(pk)
+        if not entry:
+            return widget_not_found(pk)
 
-        # Get the base JSON schema
-        base_schema = widget_type.configuration_model.model_json_schema()
-
-        # Check if widget type wants to hide form fields (special editor only)
-        hide_form_fields = getattr(widget_type, "hide_config_form_fields", False)
-
-        # Extract field-level metadata from Pydantic model (skip if hiding form fields)
-        fields_metadata = {}
-        if not hide_form_fields:
-            model_fields = widget_type.configuration_model.model_fields
-
-            for field_name, field_info in model_fields.items():
-                field_meta = {
-                    "name": field_name,
-                    "type": (
-                        field_info.annotation.__name__
-                        if hasattr(field_info.annotation, "__name__")
-                        else str(field_info.annotation)
-                    ),
-                    "required": field_info.is_required(),
-                    "default": (
-                        None
-                        if field_info.default is None
-                        or field_info.default == ...
-                        or field_info.default is PydanticUndefined
-                        else field_info.default
-                    ),
-                    "description": field_info.description or "",
-                }
+        if entry["config_ui_schema"] is not None:
+            return catalog_response(request, lambda: entry["config_ui_schema"])
 
-                # Extract json_schema_extra metadata (UI hints)
-                if field_info.json_schema_extra:
-                    if isinstance(field_info.json_schema_extra, dict):
-                        field_meta["ui"] = field_info.json_schema_extra
-                    elif callable(field_info.json_schema_extra):
-                        # If it's a function, call it with the schema dict
-                        extra_dict = {}
-                        field_info.json_schema_extra(extra_dict, field_info)
-                        field_meta["ui"] = extra_dict
-
-                # Add validation constraints from the schema
-                if (
-                    "properties" in base_schema
-                    and field_name in base_schema["properties"]
-                ):
-                    prop_schema = base_schema["properties"][field_name]
-                    if "minimum" in prop_schema:
-                        field_meta["minimum"] = prop_schema["minimum"]
-                    if "maximum" in prop_schema:
-                        field_meta["maximum"] = prop_schema["maximum"]
-                    if "minLength" in prop_schema:
-                        field_meta["minLength"] = prop_schema["minLength"]
-                    if "maxLength" in prop_schema:
-                        field_meta["maxLength"] = prop_schema["maxLength"]
-                    if "pattern" in prop_schema:
-                        field_meta["pattern"] = prop_schema["pattern"]
-                    if "enum" in prop_schema:
-                        field_meta["enum"] = prop_schema["enum"]
-                    if "minItems" in prop_schema:
-                        field_meta["minItems"] = prop_schema["minItems"]
-                    if "maxItems" in prop_schema:
-                        field_meta["maxItems"] = prop_schema["maxItems"]
-                    if "items" in prop_schema:
-                        field_meta["items"] = prop_schema["items"]
-
-                fields_metadata[field_name] = field_meta
-
-        # Get default values
-        defaults = widget_type.get_configuration_defaults()
-
-        response_data = {
-            "widget_type": widget_type.type,
-            "widget_name": widget_type.name,
-            "schema": base_schema,
-            "fields": fields_metadata,
-            "defaults": defaults,
-            "required": base_schema.get("required", []),
-            "variants": widget_type.variants,
-        }
-
-        # Add flag if form fields should be hidden
-        if hide_form_fields:
-            response_data["hideFormFields"] = True
-
-        return Response(response_data)
+        # Building it failed at compile time; build live so the error surfaces
+        widget_type = widget_type_registry.get_widget_type_flexible(pk)
+        return Response(build_config_ui_schema(widget_type))
 
 
 def find_pydantic_model(model_name: str):
@@ -0,0 +1,313 @@
+"""
+Precompiled Widget Type Catalog
+
+Building a widget type's dictionary parses its Django template into template
+JSON and generates its configuration schema, defaults and UI metadata. The
+catalog does this once for every registered widget type and stores the
+result as a content-hashed artifact, shared through the cache and memoized
+per process. Editor endpoints slice from the artifact and use its hash as a
+strong ETag.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template import engines
+from pydantic.fields import PydanticUndefined
+
+from .widget_registry import BaseWidget, WidgetTypeRegistry, widget_type_registry
+
+logger = logging.getLogger(__name__)
+
+
+def build_config_ui_schema(widget_type: BaseWidget) -> Dict[str, Any]:
+    """
+    Build the configuration schema with UI metadata for building forms.
+
+    Includes field-level json_schema_extra data for UI component mapping.
+    """
+    # Get the base JSON schema
+    base_schema = widget_type.configuration_model.model_json_schema()
+
+    # Check if widget type wants to hide form fields (special editor only)
+    hide_form_fields = getattr(widget_type, "hide_config_form_fields", False)
+
+    # Extract field-level metadata from Pydantic model (skip if hiding form fields)
+    fields_metadata = {}
+    if not hide_form_fields:
+        model_fields = widget_type.configuration_model.model_fields
+
+        for field_name, field_info in model_fields.items():
+            field_meta = {
+                "name": field_name,
+                "type": (
+                    field_info.annotation.__name__
+                    if hasattr(field_info.annotation, "__name__")
+                    else str(field_info.annotation)
+                ),
+                "required": field_info.is_required(),
+                "default": (
+                    None
+                    if field_info.default is None
+                    or field_info.default == ...
+                    or field_info.default is PydanticUndefined
+                    else field_info.default
+                ),
+                "description": field_info.description or "",
+            }
+
+            # Extract json_schema_extra metadata (UI hints)
+            if field_info.json_schema_extra:
+                if isinstance(field_info.json_schema_extra, dict):
+                    field_meta["ui"] = field_info.json_schema_extra
+                elif callable(field_info.json_schema_extra):
+                    # If it's a function, call it with the schema dict
+                    extra_dict = {}
+                    field_info.json_schema_extra(extra_dict, field_info)
+                    field_meta["ui"] = extra_dict
+
+            # Add validation constraints from the schema
+            prop_schema = base_schema.get("properties", {}).get(field_name)
+            if prop_schema:
+                for constraint in (
+                    "minimum",
+                    "maximum",
+                    "minLength",
+                    "maxLength",
+                    "pattern",
+                    "enum",
+                    "minItems",
+                    "maxItems",
+                    "items",
+                ):
+                    if constraint in prop_schema:
+                        field_meta[constraint] = prop_schema[constraint]
+
+            fields_metadata[field_name] = field_meta
+
+    response_data = {
+        "widget_type": widget_type.type,
+        "widget_name": widget_type.name,
+        "schema": base_schema,
+        "fields": fields_metadata,
+        "defaults": widget_type.get_configuration_defaults(),
+        "required": base_schema.get("required", []),
+        "variants": widget_type.variants,
+    }
+
+    # Add flag if form fields should be hidden
+    if hide_form_fields:
+        response_data["hideFormFields"] = True
+
+    return response_data
+
+
+class WidgetCatalog:
+    """
+    Content-hashed catalog of all registered widget types.
+
+    The shared cache entry is keyed by a fingerprint of the registered
+    classes and the files they are built from, so a deploy that changes a
+    widget or template gets a fresh entry while unchanged deploys reuse the
+    compiled one. Within a process the artifact is memoized until the
+    registry changes (or on every call in DEBUG, to pick up template edits).
+    """
+
+    CACHE_PREFIX = "widget_catalog"
+    CACHE_TIMEOUT = 24 * 3600
+
+    _memo: Optional[tuple] = None
+
+    @classmethod
+    def get_cache_key(cls, fingerprint: str) -> str:
+        return f"{cls.CACHE_PREFIX}:{fingerprint}"
+
+    @staticmethod
+    def _file_stamp(path: Optional[str]) -> str:
+        if not path:
+            return ""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return path
+        return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    @staticmethod
+    def _template_path(template_name: Optional[str]) -> Optional[str]:
+        """Locate a template file without compiling it."""
+        if not template_name:
+            return None
+        for loader in engines["django"].engine.template_loaders:
+            for origin in loader.get_template_sources(template_name):
+                if os.path.exists(origin.name):
+                    return origin.name
+        return None
+
+    @classmethod
+    def _source_stamps(cls, klass: type) -> List[str]:
+        """Stamp the source files of a class and its bases."""
+        stamps = []
+        for base in klass.__mro__:
+            try:
+                stamps.append(cls._file_stamp(inspect.getfile(base)))
+            except TypeError:
+                # Built-in classes have no source file
+                continue
+        return stamps
+
+    @classmethod
+    def fingerprint(cls, registry: WidgetTypeRegistry = widget_type_registry) -> str:
+        """
+        Hash everything the artifact is built from.
+
+        Covers this module (which builds the UI schema), the registry module
+        (which serializes widgets), each widget class, its configuration model
+        and their base classes, and the widget templates.
+        """
+        parts = [cls._file_stamp(__file__), *cls._source_stamps(BaseWidget)]
+        for widget in sorted(
+            registry.list_widget_types(active_only=False), key=lambda w: w.type
+        ):
+            try:
+                model_stamps = cls._source_stamps(widget.configuration_model)
+            except Exception:
+                model_stamps = []
+            parts.append(
+                "|".join(
+                    [
+                        widget.type,
+                        widget.name,
+                        *cls._source_stamps(widget.__class__),
+                        *model_stamps,
+                        cls._file_stamp(cls._template_path(widget.template_name)),
+                        cls._file_stamp(
+                            cls._template_path(widget.mustache_template_name)
+                        ),
+                    ]
+                )
+            )
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:32]
+
+    @classmethod
+    def build(cls, registry: WidgetTypeRegistry = widget_type_registry) -> dict:
+        """
+        Compile the catalog artifact for all registered widget types.
+
+        Returns:
+            dict with "hash" (content hash of the widgets) and "widgets", a list
+            of entries holding each widget's to_dict(), defaults and UI schema
+        """
+        widgets = []
+        for widget in registry.list_widget_types(active_only=False):
+            try:
+                config_ui_schema = build_config_ui_schema(widget)
+            except Exception as e:
+                logger.warning(f"Failed to build UI schema for widget '{widget.name}': {e}")
+                config_ui_schema = None
+            widgets.append(
+                {
+                    "type": widget.type,
+                    "name": widget.name,
+                    "data": widget.to_dict(include_template_json=True),
+                    "defaults": widget.get_configuration_defaults(),
+                    "config_ui_schema": config_ui_schema,
+                }
+            )
+
+        content = json.dumps(widgets, sort_keys=True, default=str)
+        return {
+            "hash": hashlib.sha256(content.encode("utf-8")).hexdigest()[:32],
+            "widgets": widgets,
+        }
+
+    @classmethod
+    def get(cls, registry: WidgetTypeRegistry = widget_type_registry) -> dict:
+        """
+        Get the catalog artifact, building and storing it if needed.
+
+        Args:
+            registry: Widget type registry to catalog
+
+        Returns:
+            The catalog artifact (see build())
+        """
+        memo = cls._memo
+        if (
+            not settings.DEBUG
+            and memo
+            and memo[0] is registry
+            and memo[1] == registry.version
+        ):
+            return memo[2]
+
+        fingerprint = cls.fingerprint(registry)
+        if memo and memo[0] is registry and memo[3] == fingerprint:
+            artifact = memo[2]
+        else:
+            cache_key = cls.get_cache_key(fingerprint)
+            artifact = cache.get(cache_key)
+            if artifact is None:
+                artifact = cls.build(registry)
+                # Keyed by the fingerprint; the timeout bounds how long code
+                # the fingerprint does not cover can serve a stale artifact
+                cache.set(
+                    cache_key,
+                    artifact,
+                    getattr(settings, "WIDGET_CATALOG_CACHE_TIMEOUT", cls.CACHE_TIMEOUT),
+                )
+
+        cls._memo = (registry, registry.version, artifact, fingerprint)
+        return artifact
+
+    @classmethod
+    def get_entry(
+        cls, identifier: str, registry: WidgetTypeRegistry = widget_type_registry
+    ) -> Optional[dict]:
+        """
+        Get one widget type's catalog entry by type, case-insensitive type or name.
+        """
+        widget = registry.get_widget_type_flexible(identifier)
+        if not widget:
+            return None
+        for entry in cls.get(registry)["widgets"]:
+            if entry["type"] == widget.type:
+                return entry
+        return None
+
+    @classmethod
+    def list_data(
+        cls,
+        active_only: bool = True,
+        include_template_json: bool = True,
+        registry: WidgetTypeRegistry = widget_type_registry,
+    ) -> List[Dict[str, Any]]:
+        """Widget type dicts as returned by WidgetTypeRegistry.to_dict()."""
+        return [
+            entry_data(entry, include_template_json)
+            for entry in cls.get(registry)["widgets"]
+            if entry["data"]["is_active"] or not active_only
+        ]
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop the in-process memo (the shared entry is keyed by content)."""
+        cls._memo = None
+
+
+def entry_data(entry: dict, include_template_json: bool = True) -> Dict[str, Any]:
+    """Return a catalog entry's widget dict, optionally without template JSON."""
+    data = entry["data"]
+    if include_template_json or "template_json" not in data:
+        return data
+    return {key: value for key, value in data.items() if key != "template_json"}
+
+
+def get_widget_catalog() -> dict:
+    """Get the widget type catalog artifact"""
+    return WidgetCatalog.get()
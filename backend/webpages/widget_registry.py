@@ -21,6 +21,8 @@ from pydantic import BaseModel, ValidationError
 from pydantic.fields import PydanticUndefined
 import logging
 
+from .registry_discovery import LazyDiscoveryMixin
+
 logger = logging.getLogger(__name__)
 
 
@@ -421,16 +423,27 @@ class BaseWidget(ABC):
             return None
 
 
-class WidgetTypeRegistry:
+class WidgetTypeRegistry(LazyDiscoveryMixin):
     """
     Global registry for widget type classes.
 
     Provides methods to register widget types and retrieve them by name.
+    Widget modules are discovered on the first lookup.
     """
 
+    discovery_name = "widgets"
+
     def __init__(self):
         self._widgets: Dict[str, Type[BaseWidget]] = {}
         self._instances: Dict[str, BaseWidget] = {}
+        self._version = 0
+        self._init_discovery()
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every registration change, for derived caches."""
+        self.ensure_discovered()
+        return self._version
 
     def register(self, widget_class: Type[BaseWidget]) -> None:
         """
@@ -455,15 +468,18 @@ class WidgetTypeRegistry:
 
         self._widgets[name] = widget_class
         self._instances[name] = instance
+        self._version += 1
 
     def unregister(self, name: str) -> None:
         """Unregister a widget type by name."""
         if name in self._widgets:
             del self._widgets[name]
             del self._instances[name]
+            self._version += 1
 
     def get_widget_type(self, name: str) -> Optional[BaseWidget]:
         """Get a widget type instance by name."""
+        self.ensure_discovered()
         return self._instances.get(name)
 
     def get_widget_type_by_slug(self, slug: str) -> Optional[BaseWidget]:
@@ -472,6 +488,7 @@ class WidgetTypeRegistry:
         Get a widget type instance by slug.
         This method is kept for backward compatibility only.
         """
+        self.ensure_discovered()
         for widget in self._instances.values():
             if widget.slug == slug:
                 return widget
@@ -479,6 +496,7 @@ class WidgetTypeRegistry:
 
     def get_widget_type_by_type(self, widget_type: str) -> Optional[BaseWidget]:
         """Get a widget type instance by type identifier (e.g., 'easy_widgets.TextBlockWidget')."""
+        self.ensure_discovered()
         for widget in self._instances.values():
             if widget.type == widget_type:
                 return widget
@@ -496,6 +514,7 @@ class WidgetTypeRegistry:
         """
         if not identifier:
             return None
+        self.ensure_discovered()
 
         # Try new format first (easy_widgets.WidgetName) - exact match
         widget = self.get_widget_type_by_type(identifier)
@@ -517,10 +536,12 @@ class WidgetTypeRegistry:
 
     def get_widget_class(self, name: str) -> Optional[Type[BaseWidget]]:
         """Get a widget type class by name."""
+        self.ensure_discovered()
         return self._widgets.get(name)
 
     def list_widget_types(self, active_only: bool = True) -> List[BaseWidget]:
         """Get all registered widget types."""
+        self.ensure_discovered()
         widgets = list(self._instances.values())
         if active_only:
             widgets = [widget for widget in widgets if widget.is_active]
@@ -45,6 +45,7 @@ export const endpoints = {
         bulkPublish: `${BASE_PATH}/webpages/pages/bulk-publish/`,
         bulkUnpublish: `${BASE_PATH}/webpages/pages/bulk-unpublish/`,
         bulkMove: `${BASE_PATH}/webpages/pages/bulk-move/`,
+        reorder: `${BASE_PATH}/webpages/pages/reorder/`,
         bulkDelete: `${BASE_PATH}/webpages/pages/bulk-delete/`,
         bulkRestore: `${BASE_PATH}/webpages/pages/bulk-restore/`,
         duplicate: (id) => `${BASE_PATH}/webpages/pages/${id}/duplicate/`,
@@ -288,6 +288,16 @@ export const pagesApi = {
         return api.post(endpoints.pages.bulkMove, { pageIds, parentId, sortOrder })
     }, 'pages.bulkMove'),
 
+    /**
+     * Reorder the children of a page in one request
+     * @param {number|null} parentId - Parent page ID (null for root level)
+     * @param {number[]} pageIds - Child page IDs in their new order
+     * @returns {Promise<Object>}
+     */
+    reorder: wrapApiCall(async (parentId, pageIds) => {
+        return api.post(endpoints.pages.reorder, { parentId, pageIds })
+    }, 'pages.reorder'),
+
     /**
      * Bulk delete multiple pages
      * @param {number[]} pageIds - Array of page IDs to delete
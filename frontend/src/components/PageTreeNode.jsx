@@ -434,11 +434,8 @@ const PageTreeNode = memo(({
         childrenRef.current = newChildren
 
         try {
-            // Update via API - skicka alla ändringar
-            const updatePromises = newChildren.map(async (child) =>
-                await pagesApi.update(child.id, { sortOrder: child.sortOrder })
-            )
-            await Promise.all(updatePromises)
+            // Update via API - skicka hela ordningen i ett anrop
+            await pagesApi.reorder(page.id, newChildren.map(child => child.id))
             forceUpdate({})
 
             // Invalidate parent's children query to refresh counts
@@ -478,11 +475,8 @@ const PageTreeNode = memo(({
 
         // 2. SEN: Skicka alla uppdaterade sortOrder till backend
         try {
-            // Update via API - skicka alla ändringar
-            const updatePromises = newChildren.map(async (child) =>
-                await pagesApi.update(child.id, { sortOrder: child.sortOrder })
-            )
-            await Promise.all(updatePromises)
+            // Update via API - skicka hela ordningen i ett anrop
+            await pagesApi.reorder(page.id, newChildren.map(child => child.id))
             forceUpdate({})
 
             // Invalidate parent's children query to refresh counts
@@ -373,10 +373,7 @@ const TreePageManager = () => {
         // Update server
         try {
             addNotification('Moving page up...', 'info', 'page-move-up')
-            const updatePromises = newPages.map(async (page) =>
-                await pagesApi.update(page.id, { sortOrder: page.sortOrder })
-            )
-            await Promise.all(updatePromises)
+            await pagesApi.reorder(null, newPages.map(page => page.id))
             forceUpdate({})
             addNotification('Page moved up', 'success', 'page-move-up')
         } catch (error) {
@@ -413,10 +410,7 @@ const TreePageManager = () => {
         // Update server
         try {
             addNotification('Moving page down...', 'info', 'page-move-down')
-            const updatePromises = newPages.map(async (page) =>
-                await pagesApi.update(page.id, { sortOrder: page.sortOrder })
-            )
-            await Promise.all(updatePromises)
+            await pagesApi.reorder(null, newPages.map(page => page.id))
             forceUpdate({})
             addNotification('Page moved down', 'success', 'page-move-down')
         } catch (error) {
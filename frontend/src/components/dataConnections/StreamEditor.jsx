@@ -601,7 +601,8 @@ const StreamEditor = ({ stream, onSave, onCancel, connectionType, connectionId,
                         />
                         <NumberInput 
                             label="Max Pages"
-                            value={formData.config.paging?.maxPages || 1}
+                            value={formData.config.paging?.maxPages ?? ''}
+                            placeholder="Unlimited"
                             onChange={(val) => handleConfigChange('paging', { ...formData.config.paging, maxPages: val })}
                             min={1}
                             max={100}
@@ -6,10 +6,13 @@ designed to run in a Docker container with Playwright pre-installed.
 """
 
 import asyncio
+import atexit
 import logging
 import os
+import threading
 import time
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, Awaitable, Callable, List
 from urllib.parse import urlparse
 import json
 
@@ -34,6 +37,33 @@ DEFAULT_CONFIG = {
     "remove_cookie_warnings": True,  # Automatically handle cookie consent dialogs
 }
 
+# Milliseconds the whole cookie consent pass may take per page
+COOKIE_CONSENT_TIMEOUT = int(os.environ.get("COOKIE_CONSENT_TIMEOUT", 3000))
+
+# Browser pool: one long-lived browser per worker process
+POOL_CONFIG = {
+    # Requests rendering at the same time
+    "max_concurrent": int(os.environ.get("BROWSER_MAX_CONCURRENT", 2)),
+    # Requests waiting for a slot before new ones are rejected with 503
+    "max_queue": int(os.environ.get("BROWSER_MAX_QUEUE", 10)),
+    # Seconds a queued request waits for a slot
+    "queue_timeout": float(os.environ.get("BROWSER_QUEUE_TIMEOUT", 30)),
+    # Browser contexts served before the browser is relaunched
+    "max_uses": int(os.environ.get("BROWSER_MAX_USES", 100)),
+    # Pre-created browser contexts handed to the next requests
+    "warm_contexts": int(os.environ.get("BROWSER_WARM_CONTEXTS", 2)),
+}
+
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+]
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
 # Security: List of blocked domains/patterns
 BLOCKED_DOMAINS = [
     "localhost",
@@ -47,12 +77,59 @@ BLOCKED_DOMAINS = [
 ]
 
 
+# Stylesheet hiding common cookie consent banners, used as a fallback when no
+# consent button could be clicked
+COOKIE_BANNER_CSS = """
+    /* Hide common cookie consent banners */
+    [class*="cookie" i][class*="banner" i],
+    [class*="cookie" i][class*="consent" i],
+    [class*="cookie" i][class*="notice" i],
+    [class*="gdpr" i],
+    [class*="privacy" i][class*="banner" i],
+    [id*="cookie" i][id*="banner" i],
+    [id*="cookie" i][id*="consent" i],
+    [id*="cookie" i][id*="notice" i],
+    [data-testid*="cookie" i],
+    [data-cy*="cookie" i],
+    .onetrust-banner-sdk,
+    #onetrust-consent-sdk,
+    .uc-banner,
+    .cookielaw-banner,
+    .cookie-policy-banner,
+    .gdpr-banner,
+    .privacy-banner {
+        display: none !important;
+        visibility: hidden !important;
+        opacity: 0 !important;
+        height: 0 !important;
+        overflow: hidden !important;
+    }
+
+    /* Remove backdrop/overlay */
+    [class*="cookie" i][class*="overlay" i],
+    [class*="cookie" i][class*="backdrop" i],
+    .modal-backdrop.show {
+        display: none !important;
+    }
+
+    /* Restore body scroll if it was disabled */
+    body {
+        overflow: auto !important;
+    }
+"""
+
 class WebsiteRenderingError(Exception):
     """Custom exception for website rendering errors."""
 
     pass
 
 
+class BrowserPoolBusyError(WebsiteRenderingError):
+    """Raised when the browser pool is at capacity."""
+
+    pass
+
+
 def validate_url(url: str) -> bool:
     """
     Validate URL for security and format compliance.
@@ -95,15 +172,20 @@ def validate_url(url: str) -> bool:
         raise WebsiteRenderingError(f"Invalid URL format: {str(e)}")
 
 
-async def handle_cookie_consent(page: Page) -> bool:
+async def handle_cookie_consent(
+    page: Page, timeout: int = COOKIE_CONSENT_TIMEOUT
+) -> bool:
     """
     Automatically handle cookie consent dialogs and banners.
 
     This function looks for common cookie consent patterns and attempts
-    to accept or dismiss them to get a clean screenshot.
+    to accept or dismiss them to get a clean screenshot. It waits once, at
+    most timeout milliseconds, for any known consent button to show up
+    rather than waiting for each selector in turn.
 
     Args:
         page: The Playwright page object
+        timeout: Maximum time to wait for a consent button in milliseconds
 
     Returns:
         bool: True if any cookie dialogs were handled, False otherwise
@@ -147,11 +229,29 @@ async def handle_cookie_consent(page: Page) -> bool:
         'button:has-text("Accepteren")',  # Dutch
     ]
 
+    dismiss_selectors = [
+        'button:has-text("×")',  # Close button
+        'button:has-text("Close")',
+        'button:has-text("Dismiss")',
+        'button[aria-label="Close"]',
+        'button[aria-label="Dismiss"]',
+        ".close-button",
+        ".dismiss-button",
+        '[data-dismiss="modal"]',
+    ]
+
+    # Wait for any consent button at all; most pages have none
+    try:
+        await page.wait_for_selector(
+            ", ".join(accept_selectors + dismiss_selectors), timeout=timeout
+        )
+        found = True
+    except Exception:
+        found = False
+
     # Try to find and click accept buttons
-    for selector in accept_selectors:
+    for selector in accept_selectors if found else []:
         try:
-            # Wait briefly for the element to appear
-            await page.wait_for_selector(selector, timeout=1000)
             element = await page.query_selector(selector)
             if element:
                 # Check if element is visible and clickable
@@ -167,21 +267,9 @@ async def handle_cookie_consent(page: Page) -> bool:
             continue
 
     # If no accept button found, try to dismiss/close the dialog
-    if not handled:
-        dismiss_selectors = [
-            'button:has-text("×")',  # Close button
-            'button:has-text("Close")',
-            'button:has-text("Dismiss")',
-            'button[aria-label="Close"]',
-            'button[aria-label="Dismiss"]',
-            ".close-button",
-            ".dismiss-button",
-            '[data-dismiss="modal"]',
-        ]
-
+    if found and not handled:
         for selector in dismiss_selectors:
             try:
-                await page.wait_for_selector(selector, timeout=1000)
                 element = await page.query_selector(selector)
                 if element and await element.is_visible():
                     await element.click()
@@ -196,46 +284,7 @@ async def handle_cookie_consent(page: Page) -> bool:
     if not handled:
         try:
             # Hide common cookie banner containers
-            await page.add_style_tag(
-                content="""
-                /* Hide common cookie consent banners */
-                [class*="cookie" i][class*="banner" i],
-                [class*="cookie" i][class*="consent" i],
-                [class*="cookie" i][class*="notice" i],
-                [class*="gdpr" i],
-                [class*="privacy" i][class*="banner" i],
-                [id*="cookie" i][id*="banner" i],
-                [id*="cookie" i][id*="consent" i],
-                [id*="cookie" i][id*="notice" i],
-                [data-testid*="cookie" i],
-                [data-cy*="cookie" i],
-                .onetrust-banner-sdk,
-                #onetrust-consent-sdk,
-                .uc-banner,
-                .cookielaw-banner,
-                .cookie-policy-banner,
-                .gdpr-banner,
-                .privacy-banner {
-                    display: none !important;
-                    visibility: hidden !important;
-                    opacity: 0 !important;
-                    height: 0 !important;
-                    overflow: hidden !important;
-                }
-                
-                /* Remove backdrop/overlay */
-                [class*="cookie" i][class*="overlay" i],
-                [class*="cookie" i][class*="backdrop" i],
-                .modal-backdrop.show {
-                    display: none !important;
-                }
-                
-                /* Restore body scroll if it was disabled */
-                body {
-                    overflow: auto !important;
-                }
-            """
-            )
+            await page.add_style_tag(content=COOKIE_BANNER_CSS)
             handled = True
             logger.info("Applied CSS to hide cookie banners")
         except Exception as e:
@@ -244,119 +293,376 @@ async def handle_cookie_consent(page: Page) -> bool:
     return handled
 
 
-async def render_website_async(
-    url: str, config: Optional[Dict[str, Any]] = None
-) -> bytes:
-    """
-    Asynchronously render a website to PNG bytes.
+def _summarize_durations(samples: List[float]) -> Dict[str, Any]:
+    """Summarize a list of durations in seconds (count, avg, p50, p95, max)."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    count = len(ordered)
+    return {
+        "count": count,
+        "avg": round(sum(ordered) / count, 3),
+        "p50": round(ordered[count // 2], 3),
+        "p95": round(ordered[min(count - 1, int(count * 0.95))], 3),
+        "max": round(ordered[-1], 3),
+    }
 
-    Args:
-        url: The URL of the website to render
-        config: Optional custom configuration overrides
 
-    Returns:
-        bytes: PNG image data
+class _BrowserSlot:
+    """A launched browser and the contexts handed out from it."""
 
-    Raises:
-        WebsiteRenderingError: If rendering fails
-    """
-    # Validate URL first
-    validate_url(url)
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.uses = 0
+        self.active = 0
+        self.refilling = 0
+        self.warm: List[BrowserContext] = []
+        self.retired = False
 
-    # Merge custom config
-    render_config = {**DEFAULT_CONFIG, **(config or {})}
 
-    browser = None
-    context = None
+class BrowserPool:
+    """
+    Long-lived Chromium browser shared by all requests of a worker process.
+
+    Playwright's async API runs on a dedicated event loop thread and request
+    threads hand it work through run(). Every request gets its own browser
+    context, so cookies and storage never leak between requests, taken from a
+    few pre-created warm contexts when possible. At most max_concurrent
+    requests use the browser at once and at most max_queue wait for a slot;
+    further requests are rejected with BrowserPoolBusyError. The browser is
+    relaunched after max_uses contexts to bound memory growth.
+    """
 
-    try:
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
-            ],
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+        max_uses: int,
+        warm_contexts: int,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.max_uses = max_uses
+        self.warm_contexts = warm_contexts
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._playwright = None
+        self._slot: Optional[_BrowserSlot] = None
+        self._tasks = set()
+
+        # Metrics
+        self._waiting = 0
+        self._running = 0
+        self._counters = {
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "warm_contexts_used": 0,
+            "cold_contexts_used": 0,
+            "browser_launches": 0,
+            "browser_recycles": 0,
+        }
+        self._render_times = deque(maxlen=500)
+        self._queue_times = deque(maxlen=500)
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread on first use (after gunicorn forks)."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run_loop():
+                asyncio.set_event_loop(loop)
+                self._semaphore = asyncio.Semaphore(self.max_concurrent)
+                self._launch_lock = asyncio.Lock()
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=run_loop, name="browser-pool", daemon=True)
+            thread.start()
+            ready.wait()
+            self._loop, self._thread = loop, thread
+            return loop
+
+    def run(self, operation: Callable[..., Awaitable[Any]], *args):
+        """
+        Run `await operation(context, *args)` in a fresh browser context.
+
+        Args:
+            operation: Coroutine function taking a BrowserContext first
+            *args: Further arguments for operation
+
+        Returns:
+            The result of operation
+
+        Raises:
+            BrowserPoolBusyError: If the queue is full or no slot freed up
+                within queue_timeout
+        """
+        loop = self._ensure_started()
+        with self._lock:
+            if self._waiting + self._running >= self.max_concurrent + self.max_queue:
+                self._counters["rejected"] += 1
+                raise BrowserPoolBusyError(
+                    f"Renderer is busy ({self._waiting} requests queued), try again later"
+                )
+            self._waiting += 1
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._run(operation, args), loop
         )
-        context = await browser.new_context(
+        return future.result()
+
+    async def _run(self, operation, args):
+        queued_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._waiting -= 1
+                self._counters["rejected"] += 1
+            raise BrowserPoolBusyError(
+                f"No renderer became available within {self.queue_timeout:g} seconds"
+            )
+
+        started = time.perf_counter()
+        with self._lock:
+            self._waiting -= 1
+            self._running += 1
+            self._queue_times.append(started - queued_at)
+
+        slot = context = None
+        succeeded = False
+        try:
+            slot, context = await self._acquire_context()
+            result = await operation(context, *args)
+            succeeded = True
+            return result
+        finally:
+            if context:
+                await self._release_context(slot, context)
+            self._semaphore.release()
+            with self._lock:
+                self._running -= 1
+                self._counters["completed" if succeeded else "failed"] += 1
+                self._render_times.append(time.perf_counter() - started)
+
+    async def _get_slot(self) -> _BrowserSlot:
+        """Get the current browser, launching or recycling it if needed."""
+        async with self._launch_lock:
+            slot = self._slot
+            if slot and slot.browser.is_connected() and slot.uses < self.max_uses:
+                return slot
+
+            if slot:
+                slot.retired = True
+                if slot.browser.is_connected():
+                    logger.info(f"Recycling browser after {slot.uses} contexts")
+                    self._counters["browser_recycles"] += 1
+                else:
+                    logger.warning("Browser disconnected, relaunching")
+                await self._close_if_retired(slot)
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            browser = await self._playwright.chromium.launch(
+                headless=True, args=BROWSER_ARGS
+            )
+            self._slot = _BrowserSlot(browser)
+            self._counters["browser_launches"] += 1
+            self._schedule_refill(self._slot)
+            return self._slot
+
+    async def _new_context(self, slot: _BrowserSlot) -> BrowserContext:
+        context = await slot.browser.new_context(
             viewport={
-                "width": render_config["viewport_width"],
-                "height": render_config["viewport_height"],
+                "width": DEFAULT_CONFIG["viewport_width"],
+                "height": DEFAULT_CONFIG["viewport_height"],
             },
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            user_agent=USER_AGENT,
+            extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
         )
+        return context
 
-        if not context:
-            raise WebsiteRenderingError("Failed to initialize browser context")
-
-        page: Page = await context.new_page()
+    async def _acquire_context(self):
+        slot = await self._get_slot()
+        slot.uses += 1
+        slot.active += 1
+        try:
+            if slot.warm:
+                context = slot.warm.pop()
+                self._counters["warm_contexts_used"] += 1
+            else:
+                context = await self._new_context(slot)
+                self._counters["cold_contexts_used"] += 1
+        except Exception:
+            slot.active -= 1
+            raise
+        self._schedule_refill(slot)
+        return slot, context
 
-        # Set additional page configurations
-        await page.set_extra_http_headers(
-            {
-                "Accept-Language": "en-US,en;q=0.9",
+    async def _release_context(self, slot: _BrowserSlot, context: BrowserContext):
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser context: {e}")
+        slot.active -= 1
+        await self._close_if_retired(slot)
+
+    def _schedule_refill(self, slot: _BrowserSlot):
+        """Top up the warm contexts of a browser in the background."""
+        while not slot.retired and len(slot.warm) + slot.refilling < self.warm_contexts:
+            slot.refilling += 1
+            task = asyncio.ensure_future(self._refill(slot))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _refill(self, slot: _BrowserSlot):
+        try:
+            context = await self._new_context(slot)
+        except Exception as e:
+            logger.debug(f"Failed to create warm browser context: {e}")
+            return
+        finally:
+            slot.refilling -= 1
+        if slot.retired:
+            await context.close()
+        else:
+            slot.warm.append(context)
+
+    async def _close_if_retired(self, slot: _BrowserSlot):
+        """Close a retired browser once its last context has been released."""
+        if not slot.retired or slot.active:
+            return
+        warm, slot.warm = slot.warm, []
+        try:
+            for context in warm:
+                await context.close()
+            await slot.browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing retired browser: {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, counters, browser state and timing summaries."""
+        with self._lock:
+            slot = self._slot
+            return {
+                "queue_depth": self._waiting,
+                "in_flight": self._running,
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                **self._counters,
+                "browser": {
+                    "running": bool(slot and slot.browser.is_connected()),
+                    "uses": slot.uses if slot else 0,
+                    "max_uses": self.max_uses,
+                    "warm_contexts": len(slot.warm) if slot else 0,
+                },
+                "render_seconds": _summarize_durations(list(self._render_times)),
+                "queue_wait_seconds": _summarize_durations(list(self._queue_times)),
             }
-        )
 
-        logger.info(f"Navigating to URL: {url}")
+    def shutdown(self):
+        """Close the browser and stop the event loop thread."""
+        with self._lock:
+            loop, self._loop, self._thread = self._loop, None, None
+        if loop is None:
+            return
 
-        # Navigate to the page with timeout
-        await page.goto(
-            url,
-            wait_until=render_config["wait_for_load_state"],
-            timeout=render_config["timeout"],
-        )
+        async def close():
+            for task in list(self._tasks):
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            if self._slot:
+                self._slot.retired = True
+                self._slot.active = 0
+                await self._close_if_retired(self._slot)
+                self._slot = None
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
 
-        # Wait a bit more for any dynamic content
-        await page.wait_for_timeout(2000)
+        try:
+            asyncio.run_coroutine_threadsafe(close(), loop).result(timeout=10)
+        except Exception as e:
+            logger.debug(f"Error shutting down browser pool: {e}")
+        loop.call_soon_threadsafe(loop.stop)
 
-        # Handle cookie consent dialogs if enabled
-        if render_config.get("remove_cookie_warnings", True):
-            try:
-                handled = await handle_cookie_consent(page)
-                if handled:
-                    # Wait a bit more after handling cookie dialogs
-                    await page.wait_for_timeout(1000)
-            except Exception as e:
-                logger.warning(f"Failed to handle cookie consent: {e}")
 
-        # Take screenshot
-        screenshot_options = {
-            "type": "png",
-            "full_page": render_config["full_page"],
+browser_pool = BrowserPool(**POOL_CONFIG)
+atexit.register(browser_pool.shutdown)
+
+
+async def render_website_async(
+    context: BrowserContext, url: str, render_config: Dict[str, Any]
+) -> bytes:
+    """
+    Render a website to PNG bytes in a browser context.
+
+    Args:
+        context: Browser context from the browser pool
+        url: The URL of the website to render
+        render_config: Rendering configuration (DEFAULT_CONFIG with overrides)
+
+    Returns:
+        bytes: PNG image data
+    """
+    page: Page = await context.new_page()
+    await page.set_viewport_size(
+        {
+            "width": render_config["viewport_width"],
+            "height": render_config["viewport_height"],
         }
+    )
+
+    logger.info(f"Navigating to URL: {url}")
 
-        # Quality is only supported for JPEG, not PNG
-        # if render_config.get("format") == "jpeg":
-        #     screenshot_options["quality"] = render_config["quality"]
+    # Navigate to the page with timeout
+    await page.goto(
+        url,
+        wait_until=render_config["wait_for_load_state"],
+        timeout=render_config["timeout"],
+    )
 
-        logger.info("Taking screenshot...")
-        screenshot_bytes = await page.screenshot(**screenshot_options)
+    # Wait a bit more for any dynamic content
+    await page.wait_for_timeout(2000)
 
-        await page.close()
+    # Handle cookie consent dialogs if enabled
+    if render_config.get("remove_cookie_warnings", True):
+        try:
+            handled = await handle_cookie_consent(page)
+            if handled:
+                # Wait a bit more after handling cookie dialogs
+                await page.wait_for_timeout(1000)
+        except Exception as e:
+            logger.warning(f"Failed to handle cookie consent: {e}")
 
-        logger.info(f"Successfully rendered website: {url}")
-        return screenshot_bytes
+    # Take screenshot
+    screenshot_options = {
+        "type": "png",
+        "full_page": render_config["full_page"],
+    }
 
-    except Exception as e:
-        logger.error(f"Failed to render website {url}: {str(e)}")
-        if isinstance(e, WebsiteRenderingError):
-            raise
-        raise WebsiteRenderingError(f"Failed to render website: {str(e)}")
+    # Quality is only supported for JPEG, not PNG
+    # if render_config.get("format") == "jpeg":
+    #     screenshot_options["quality"] = render_config["quality"]
 
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
+    logger.info("Taking screenshot...")
+    return await page.screenshot(**screenshot_options)
 
 
 def render_website(url: str, config: Optional[Dict[str, Any]] = None) -> bytes:
     """
-    Synchronous wrapper for website rendering.
+    Render a website to PNG bytes using the shared browser pool.
 
     Args:
         url: The URL of the website to render
@@ -366,46 +672,39 @@ def render_website(url: str, config: Optional[Dict[str, Any]] = None) -> bytes:
         bytes: PNG image data
 
     Raises:
+        BrowserPoolBusyError: If the renderer is at capacity
         WebsiteRenderingError: If rendering fails
     """
-    # Always create a new event loop for each request to avoid conflicts
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    # Validate URL first, before taking a renderer slot
+    validate_url(url)
 
-    try:
-        return loop.run_until_complete(render_website_async(url, config))
-    finally:
-        # Always close the loop we created
-        try:
-            # Cancel all pending tasks
-            pending = asyncio.all_tasks(loop)
-            for task in pending:
-                task.cancel()
+    # Merge custom config
+    render_config = {**DEFAULT_CONFIG, **(config or {})}
 
-            # Wait for all tasks to complete cancellation
-            if pending:
-                loop.run_until_complete(
-                    asyncio.gather(*pending, return_exceptions=True)
-                )
+    try:
+        screenshot_bytes = browser_pool.run(
+            render_website_async,
+            url,
+            render_config,
+        )
+    except WebsiteRenderingError:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to render website {url}: {str(e)}")
+        raise WebsiteRenderingError(f"Failed to render website: {str(e)}")
 
-            # Close the loop
-            loop.close()
-        except Exception as e:
-            logger.debug(f"Error cleaning up event loop: {e}")
-            # Force close if normal close fails
-            try:
-                loop.close()
-            except Exception:
-                pass
+    logger.info(f"Successfully rendered website: {url}")
+    return screenshot_bytes
 
 
 async def extract_element_at_coordinates_async(
-    url: str, x: int, y: int, timeout: int = 30000
+    context: BrowserContext, url: str, x: int, y: int, timeout: int = 30000
 ) -> Dict[str, Any]:
     """
     Extract HTML element at specific coordinates on a webpage.
 
     Args:
+        context: Browser context from the browser pool
         url: The URL of the website
         x: X coordinate in pixels
         y: Y coordinate in pixels
@@ -420,118 +719,73 @@ async def extract_element_at_coordinates_async(
             - attributes: Dictionary of element attributes
 
     Raises:
-        WebsiteRenderingError: If extraction fails
+        WebsiteRenderingError: If no element is found at the coordinates
     """
-    # Validate URL first
-    validate_url(url)
+    page: Page = await context.new_page()
 
-    browser = None
-    context = None
+    logger.info(f"Navigating to URL: {url}")
 
-    try:
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
-            ],
-        )
-        context = await browser.new_context(
-            viewport={
-                "width": DEFAULT_CONFIG["viewport_width"],
-                "height": DEFAULT_CONFIG["viewport_height"],
-            },
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        )
-
-        if not context:
-            raise WebsiteRenderingError("Failed to initialize browser context")
-
-        page: Page = await context.new_page()
-
-        logger.info(f"Navigating to URL: {url}")
-
-        # Navigate to the page
-        await page.goto(url, wait_until="networkidle", timeout=timeout)
+    # Navigate to the page
+    await page.goto(url, wait_until="networkidle", timeout=timeout)
 
-        # Wait for dynamic content
-        await page.wait_for_timeout(2000)
+    # Wait for dynamic content
+    await page.wait_for_timeout(2000)
 
-        # Handle cookie consent dialogs
-        try:
-            await handle_cookie_consent(page)
-            await page.wait_for_timeout(1000)
-        except Exception as e:
-            logger.warning(f"Failed to handle cookie consent: {e}")
-
-        # Find element at coordinates using elementFromPoint
-        element_info = await page.evaluate(
-            """
-            ({x, y}) => {
-                const element = document.elementFromPoint(x, y);
-                if (!element) {
-                    return null;
-                }
-                
-                // Get attributes
-                const attributes = {};
-                for (const attr of element.attributes) {
-                    attributes[attr.name] = attr.value;
-                }
-                
-                return {
-                    html: element.outerHTML,
-                    innerHtml: element.innerHTML,
-                    tagName: element.tagName.toLowerCase(),
-                    textContent: element.textContent,
-                    className: element.className,
-                    id: element.id,
-                    attributes: attributes
-                };
+    # Handle cookie consent dialogs
+    try:
+        await handle_cookie_consent(page)
+        await page.wait_for_timeout(1000)
+    except Exception as e:
+        logger.warning(f"Failed to handle cookie consent: {e}")
+
+    # Find element at coordinates using elementFromPoint
+    element_info = await page.evaluate(
+        """
+        ({x, y}) => {
+            const element = document.elementFromPoint(x, y);
+            if (!element) {
+                return null;
             }
-            """,
-            {"x": x, "y": y},
-        )
-
-        if not element_info:
-            raise WebsiteRenderingError(f"No element found at coordinates ({x}, {y})")
-
-        await page.close()
-
-        logger.info(f"Successfully extracted element from {url} at ({x}, {y})")
-
-        return {
-            "html": element_info["html"],
-            "inner_html": element_info["innerHtml"],
-            "tag_name": element_info["tagName"],
-            "text_content": element_info["textContent"],
-            "class_name": element_info["className"],
-            "id": element_info["id"],
-            "attributes": element_info["attributes"],
+            
+            // Get attributes
+            const attributes = {};
+            for (const attr of element.attributes) {
+                attributes[attr.name] = attr.value;
+            }
+            
+            return {
+                html: element.outerHTML,
+                innerHtml: element.innerHTML,
+                tagName: element.tagName.toLowerCase(),
+                textContent: element.textContent,
+                className: element.className,
+                id: element.id,
+                attributes: attributes
+            };
         }
+        """,
+        {"x": x, "y": y},
+    )
 
-    except Exception as e:
-        logger.error(f"Failed to extract element from {url}: {str(e)}")
-        if isinstance(e, WebsiteRenderingError):
-            raise
-        raise WebsiteRenderingError(f"Failed to extract element: {str(e)}")
-
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
+    if not element_info:
+        raise WebsiteRenderingError(f"No element found at coordinates ({x}, {y})")
+
+    return {
+        "html": element_info["html"],
+        "inner_html": element_info["innerHtml"],
+        "tag_name": element_info["tagName"],
+        "text_content": element_info["textContent"],
+        "class_name": element_info["className"],
+        "id": element_info["id"],
+        "attributes": element_info["attributes"],
+    }
 
 
 def extract_element_at_coordinates(
     url: str, x: int, y: int, timeout: int = 30000
 ) -> Dict[str, Any]:
     """
-    Synchronous wrapper for element extraction.
+    Extract the element at coordinates using the shared browser pool.
 
     Args:
         url: The URL of the website
@@ -543,53 +797,47 @@ def extract_element_at_coordinates(
         Dictionary with element information
 
     Raises:
+        BrowserPoolBusyError: If the renderer is at capacity
         WebsiteRenderingError: If extraction fails
     """
-    # Always create a new event loop for each request
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    # Validate URL first, before taking a renderer slot
+    validate_url(url)
 
     try:
-        return loop.run_until_complete(
-            extract_element_at_coordinates_async(url, x, y, timeout)
+        result = browser_pool.run(
+            extract_element_at_coordinates_async, url, x, y, timeout
         )
-    finally:
-        # Always close the loop we created
-        try:
-            # Cancel all pending tasks
-            pending = asyncio.all_tasks(loop)
-            for task in pending:
-                task.cancel()
-
-            # Wait for all tasks to complete cancellation
-            if pending:
-                loop.run_until_complete(
-                    asyncio.gather(*pending, return_exceptions=True)
-                )
+    except WebsiteRenderingError:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to extract element from {url}: {str(e)}")
+        raise WebsiteRenderingError(f"Failed to extract element: {str(e)}")
 
-            # Close the loop
-            loop.close()
-        except Exception as e:
-            logger.debug(f"Error cleaning up event loop: {e}")
-            # Force close if normal close fails
-            try:
-                loop.close()
-            except Exception:
-                pass
+    logger.info(f"Successfully extracted element from {url} at ({x}, {y})")
+    return result
 
 
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint."""
+    metrics = browser_pool.metrics()
     return jsonify(
         {
             "status": "healthy",
             "service": "playwright-website-renderer",
             "version": "1.0.0",
+            "queue_depth": metrics["queue_depth"],
+            "in_flight": metrics["in_flight"],
         }
     )
 
 
+@app.route("/metrics", methods=["GET"])
+def metrics_endpoint():
+    """Browser pool metrics: queue depth, counters and render times."""
+    return jsonify(browser_pool.metrics())
+
+
 @app.route("/render", methods=["POST"])
 def render_website_endpoint():
     """
@@ -667,6 +915,9 @@ def render_website_endpoint():
 
             return response
 
+        except BrowserPoolBusyError as e:
+            logger.warning(f"Rejected render of {url}: {str(e)}")
+            return jsonify({"error": str(e)}), 503, {"Retry-After": "5"}
         except WebsiteRenderingError as e:
             logger.warning(f"Website rendering failed for {url}: {str(e)}")
             return jsonify({"error": str(e)}), 400
@@ -779,6 +1030,9 @@ def extract_element_endpoint():
 
         return jsonify(result)
 
+    except BrowserPoolBusyError as e:
+        logger.warning(f"Rejected element extraction from {url}: {str(e)}")
+        return jsonify({"error": str(e)}), 503, {"Retry-After": "5"}
     except WebsiteRenderingError as e:
         logger.warning(f"Element extraction failed for {url}: {str(e)}")
         return jsonify({"error": str(e)}), 400
@@ -804,6 +1058,7 @@ def index():
             "endpoints": {
                 "GET /": "This documentation",
                 "GET /health": "Health check",
+                "GET /metrics": "Browser pool queue depth and render times",
                 "POST /render": "Render website to PNG",
                 "POST /validate": "Validate URL without rendering",
                 "POST /extract-element": "Extract HTML at click coordinates",
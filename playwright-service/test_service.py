@@ -31,6 +31,25 @@ def test_health_check():
         return False
 
 
+def test_metrics():
+    """Test the browser pool metrics endpoint."""
+    print("\nTesting metrics endpoint...")
+    try:
+        response = requests.get(f"{BASE_URL}/metrics", timeout=10)
+        if response.status_code == 200:
+            data = response.json()
+            print(f"✓ Metrics available")
+            print(f"  Queue depth: {data.get('queue_depth')}")
+            print(f"  Render times: {data.get('render_seconds')}")
+            return "queue_depth" in data and "render_seconds" in data
+        else:
+            print(f"✗ Metrics failed: {response.status_code}")
+            return False
+    except Exception as e:
+        print(f"✗ Metrics error: {e}")
+        return False
+
+
 def test_api_documentation():
     """Test the API documentation endpoint."""
     print("\nTesting API documentation endpoint...")
@@ -195,6 +214,7 @@ def main():
         test_url_validation,
         test_website_rendering,
         test_error_handling,
+        test_metrics,
     ]
 
     passed = 0